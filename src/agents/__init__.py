@@ -4,20 +4,41 @@
 Models, Config, CLI Tools を提供する。
 """
 
-from src.agents.config import get_assessment
-from src.agents.models import (
-    IssueSeverity,
-    PipelineConfig,
-    QualityAssessment,
-    QualityIssue,
-    QualityResult,
-    QualityScore,
-    ReviewIssue,
-    ReviewIssueType,
-    ReviewResult,
-    ReviewStatus,
-    SceneRequirements,
-)
+from typing import TYPE_CHECKING, Any
+
+from src.core.lazy_exports import load_export
+
+if TYPE_CHECKING:
+    from src.agents.config import get_assessment
+    from src.agents.models import (
+        IssueSeverity,
+        PipelineConfig,
+        QualityAssessment,
+        QualityIssue,
+        QualityResult,
+        QualityScore,
+        ReviewIssue,
+        ReviewIssueType,
+        ReviewResult,
+        ReviewStatus,
+        SceneRequirements,
+    )
+
+# Public name -> defining submodule (imported on first access)
+_EXPORTS: dict[str, str] = {
+    "get_assessment": "src.agents.config",
+    "IssueSeverity": "src.agents.models",
+    "PipelineConfig": "src.agents.models",
+    "QualityAssessment": "src.agents.models",
+    "QualityIssue": "src.agents.models",
+    "QualityResult": "src.agents.models",
+    "QualityScore": "src.agents.models",
+    "ReviewIssue": "src.agents.models",
+    "ReviewIssueType": "src.agents.models",
+    "ReviewResult": "src.agents.models",
+    "ReviewStatus": "src.agents.models",
+    "SceneRequirements": "src.agents.models",
+}
 
 __all__ = [
     # Config
@@ -36,3 +57,13 @@ __all__ = [
     "ReviewResult",
     "SceneRequirements",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public name from its submodule on first access."""
+    return load_export(__name__, _EXPORTS, name, globals())
+
+
+def __dir__() -> list[str]:
+    """List public names, including those not imported yet."""
+    return sorted(set(globals()) | set(__all__))
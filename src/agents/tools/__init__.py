@@ -3,14 +3,36 @@
 Claude Code agents が Python ツールを呼び出すための CLI モジュール。
 """
 
-from src.agents.tools.context_tool import (
-    format_context_as_markdown,
-    run_build_context,
-    serialize_context_result,
-)
+from typing import TYPE_CHECKING, Any
+
+from src.core.lazy_exports import load_export
+
+if TYPE_CHECKING:
+    from src.agents.tools.context_tool import (
+        format_context_as_markdown,
+        run_build_context,
+        serialize_context_result,
+    )
+
+# Public name -> defining submodule (imported on first access)
+_EXPORTS: dict[str, str] = {
+    "format_context_as_markdown": "src.agents.tools.context_tool",
+    "run_build_context": "src.agents.tools.context_tool",
+    "serialize_context_result": "src.agents.tools.context_tool",
+}
 
 __all__ = [
     "format_context_as_markdown",
     "run_build_context",
     "serialize_context_result",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public name from its submodule on first access."""
+    return load_export(__name__, _EXPORTS, name, globals())
+
+
+def __dir__() -> list[str]:
+    """List public names, including those not imported yet."""
+    return sorted(set(globals()) | set(__all__))
@@ -2,18 +2,27 @@
 
 Claude Code agents が Python ツールを呼び出すための CLI。
 使用例: python -m src.agents.tools.cli build-context --vault-root vault/作品名 --episode 010
+
+serve でデーモンを起動しておくと、build-context / build-context-batch は
+自動的にデーモンへ転送され、ウォームなキャッシュで処理される（--no-daemon で無効化）。
 """
 
 from __future__ import annotations
 
 import argparse
 import json
+import os
+import signal
 import sys
+import threading
+from contextlib import nullcontext
 from pathlib import Path
+from typing import Any
+
+from src.core.tracing import tracing
 
-from .context_tool import format_context_as_markdown, run_build_context
-from .review_tool import run_algorithmic_review
-from .style_tool import run_analyze_style, run_save_style
+# サブコマンドの実装は各分岐で import する（起動時間短縮のため）。
+# check-review / format-context は L3 ビルダーやリポジトリを読み込まない。
 
 
 def create_parser() -> argparse.ArgumentParser:
@@ -22,6 +31,17 @@ def create_parser() -> argparse.ArgumentParser:
         prog="novel-agent-tools",
         description="L4 Agent CLI ツール",
     )
+    parser.add_argument(
+        "--trace",
+        default=None,
+        metavar="FILE",
+        help="処理のスパンを Chrome trace-event JSON として FILE に書き出す",
+    )
+    parser.add_argument(
+        "--no-daemon",
+        action="store_true",
+        help="起動中のデーモンに転送せず、このプロセスで実行する",
+    )
     subparsers = parser.add_subparsers(dest="command", help="サブコマンド")
 
     # build-context
@@ -32,6 +52,60 @@ def create_parser() -> argparse.ArgumentParser:
     build_parser.add_argument("--chapter", default=None, help="チャプター ID")
     build_parser.add_argument("--phase", default=None, help="フェーズ")
     build_parser.add_argument("--work", default=None, help="作品名（伏線取得に必要）")
+    build_parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="ステージ別の所要時間を計測する（JSON の metrics キーと stderr に出力）",
+    )
+
+    # build-context-batch
+    batch_parser = subparsers.add_parser(
+        "build-context-batch", help="複数シーンのコンテキスト一括構築（JSON Lines 出力）"
+    )
+    batch_parser.add_argument("--vault-root", required=True, help="Vault ルートパス")
+    batch_source = batch_parser.add_mutually_exclusive_group(required=True)
+    batch_source.add_argument(
+        "--episodes", default=None, help="エピソード ID（カンマ区切り）"
+    )
+    batch_source.add_argument(
+        "--input",
+        default=None,
+        help="シーン指定 JSON Lines ファイル（'-' で stdin）。"
+        '各行: {"episode": ..., "sequence": ..., "chapter": ..., "phase": ...}',
+    )
+    batch_parser.add_argument("--work", default=None, help="作品名（伏線取得に必要）")
+    batch_parser.add_argument(
+        "--processes",
+        type=int,
+        default=None,
+        help="ワーカープロセス数（2 以上でマルチプロセス構築）",
+    )
+
+    # audit-foreshadowing
+    audit_parser = subparsers.add_parser(
+        "audit-foreshadowing", help="エピソード範囲の伏線監査（JSON 出力）"
+    )
+    audit_parser.add_argument("--vault-root", required=True, help="Vault ルートパス")
+    audit_parser.add_argument("--start", required=True, help="開始エピソード ID")
+    audit_parser.add_argument("--end", required=True, help="終了エピソード ID")
+    audit_parser.add_argument("--work", default=None, help="作品名")
+    audit_parser.add_argument(
+        "--characters",
+        default=None,
+        help='登場キャラクター JSON ファイル（{"010": ["名前", ...], ...}、HINT 判定用）',
+    )
+    audit_parser.add_argument(
+        "--silence-threshold",
+        type=int,
+        default=5,
+        help="長期未言及アラートのエピソード数",
+    )
+    audit_parser.add_argument(
+        "--payoff-threshold",
+        type=int,
+        default=3,
+        help="回収接近とみなすエピソード数",
+    )
 
     # format-context
     format_parser = subparsers.add_parser(
@@ -83,6 +157,17 @@ def create_parser() -> argparse.ArgumentParser:
         "--input", required=True, help="LLM出力ファイルパス"
     )
 
+    # serve
+    serve_parser = subparsers.add_parser(
+        "serve",
+        help="常駐デーモンを起動（build-context / build-context-batch を転送で受ける）",
+    )
+    serve_parser.add_argument(
+        "--socket",
+        default=None,
+        help="ソケットパス（省略時は $NOVEL_AGENT_SOCKET、$XDG_RUNTIME_DIR またはユーザー専用の一時ディレクトリ）",
+    )
+
     return parser
 
 
@@ -103,61 +188,266 @@ def main(argv: list[str] | None = None) -> int:
         return 1
 
     try:
-        if args.command == "build-context":
-            result = run_build_context(
-                vault_root=args.vault_root,
-                episode=args.episode,
-                sequence=args.sequence,
-                chapter=args.chapter,
-                phase=args.phase,
-                work=args.work,
-            )
-            print(json.dumps(result, ensure_ascii=False, indent=2))
-            return 0
-
-        elif args.command == "format-context":
-            if args.input == "-":
-                data = json.load(sys.stdin)
-            else:
-                with open(args.input, encoding="utf-8") as f:
-                    data = json.load(f)
-            markdown = format_context_as_markdown(data)
-            print(markdown)
-            return 0
-
-        elif args.command == "check-review":
-            if args.draft == "-":
-                draft_text = sys.stdin.read()
-            else:
-                with open(args.draft, encoding="utf-8") as f:
-                    draft_text = f.read()
-            keywords = [k.strip() for k in args.keywords.split(",") if k.strip()]
-            review_result = run_algorithmic_review(draft_text, keywords)
-            print(review_result.model_dump_json(indent=2))
-            return 0
-
-        elif args.command == "analyze-style":
-            vault_root = Path(args.vault)
-            episode_ids = None
-            if args.episodes:
-                episode_ids = [int(e.strip()) for e in args.episodes.split(",") if e.strip()]
-            prompt = run_analyze_style(vault_root, args.work, episode_ids)
-            print(prompt)
-            return 0
-
-        elif args.command == "save-style":
-            vault_root = Path(args.vault)
-            input_path = Path(args.input)
-            run_save_style(vault_root, args.work, args.type, input_path)
-            print(f"Saved {args.type} to {vault_root / args.work}")
-            return 0
+        # stdin は1回しか読めないため、転送とローカル実行で同じシーン指定を使う
+        scene_specs = (
+            _read_scene_specs(args) if args.command == "build-context-batch" else None
+        )
+        if not args.no_daemon and not args.trace:
+            forwarded = _forward_to_daemon(args, scene_specs)
+            if forwarded is not None:
+                return forwarded
+        with tracing(args.trace) if args.trace else nullcontext():
+            return _run_command(parser, args, scene_specs)
+    except Exception as e:
+        print(json.dumps({"error": str(e)}, ensure_ascii=False), file=sys.stderr)
+        return 1
+
+
+def _forward_to_daemon(
+    args: argparse.Namespace, scene_specs: list[dict[str, Any]] | None = None
+) -> int | None:
+    """起動中のデーモンがあればサブコマンドを転送する.
+
+    転送対象は build-context と build-context-batch（--processes なし）。
+    ソケットが現在のユーザーの所有でない場合、デーモンが ping に応答しない
+    場合、転送がタイムアウトした場合は None を返し、呼び出し側でローカル実行する。
+
+    Args:
+        args: パース済みの引数
+        scene_specs: build-context-batch のシーン指定（読み込み済み）
+
+    Returns:
+        終了コード、転送しなかった場合は None
+    """
+    if args.command == "build-context":
+        method = "build-context"
+        params: dict[str, Any] = {
+            "vault_root": str(Path(args.vault_root).resolve()),
+            "episode": args.episode,
+            "sequence": args.sequence,
+            "chapter": args.chapter,
+            "phase": args.phase,
+            "work": args.work,
+            "profile": args.profile,
+        }
+    elif args.command == "build-context-batch" and args.processes is None:
+        method = "build-context-batch"
+        params = {
+            "vault_root": str(Path(args.vault_root).resolve()),
+            "scenes": (
+                scene_specs if scene_specs is not None else _read_scene_specs(args)
+            ),
+            "work": args.work,
+        }
+    else:
+        return None
+
+    from .daemon import (
+        FORWARD_TIMEOUT,
+        PING_TIMEOUT,
+        call_daemon,
+        default_socket_path,
+        is_supported,
+        is_trusted_socket,
+        ping_daemon,
+    )
+
+    socket_path = default_socket_path()
+    if not is_supported() or not is_trusted_socket(socket_path):
+        # 他のユーザーが作成したソケットには転送しない
+        return None
+    if ping_daemon(socket_path, timeout=PING_TIMEOUT) is None:
+        # 停止済みデーモンのソケットが残っている・応答しない場合はローカル実行
+        return None
+    try:
+        result = call_daemon(socket_path, method, params, timeout=FORWARD_TIMEOUT)
+    except OSError:
+        # タイムアウト（TimeoutError）を含め、転送に失敗した場合はローカル実行
+        return None
+
+    if method == "build-context":
+        _print_build_context(result)
+    else:
+        _print_json_lines(result)
+    return 0
+
+
+def _read_scene_specs(args: argparse.Namespace) -> list[dict[str, Any]]:
+    """build-context-batch のシーン指定を読み込む.
+
+    Args:
+        args: パース済みの引数（--episodes または --input）
+
+    Returns:
+        シーン指定 dict のリスト
+    """
+    if args.episodes is not None:
+        return [{"episode": e.strip()} for e in args.episodes.split(",") if e.strip()]
+    if args.input == "-":
+        lines = sys.stdin.read().splitlines()
+    else:
+        with open(args.input, encoding="utf-8") as f:
+            lines = f.read().splitlines()
+    return [json.loads(line) for line in lines if line.strip()]
+
+
+def _print_build_context(result: dict[str, Any]) -> None:
+    """build-context の結果を出力する（計測結果があれば stderr に内訳）."""
+    from src.core.context.build_metrics import BuildMetrics
+
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+    if "metrics" in result:
+        print(BuildMetrics(**result["metrics"]).format_breakdown(), file=sys.stderr)
+
+
+def _print_json_lines(items: list[dict[str, Any]]) -> None:
+    """結果を JSON Lines で出力する."""
+    for item in items:
+        print(json.dumps(item, ensure_ascii=False))
+
+
+def _serve(socket_arg: str | None) -> int:
+    """デーモンを起動し、停止するまでブロックする.
+
+    Args:
+        socket_arg: --socket の値
+
+    Returns:
+        終了コード
+    """
+    from .daemon import ContextDaemon, default_socket_path, is_supported
+
+    if not is_supported():
+        raise RuntimeError("serve requires Unix domain sockets")
+    socket_path = Path(socket_arg) if socket_arg else default_socket_path()
+    daemon = ContextDaemon(socket_path)
+    signal.signal(
+        signal.SIGTERM,
+        lambda _signum, _frame: threading.Thread(target=daemon.shutdown).start(),
+    )
+    print(
+        json.dumps({"socket": str(socket_path), "pid": os.getpid()}),
+        file=sys.stderr,
+        flush=True,
+    )
+    try:
+        daemon.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
 
+
+def _run_command(
+    parser: argparse.ArgumentParser,
+    args: argparse.Namespace,
+    scene_specs: list[dict[str, Any]] | None = None,
+) -> int:
+    """サブコマンドを実行する.
+
+    Args:
+        parser: CLI パーサー（不明なコマンドのヘルプ表示用）
+        args: パース済みの引数
+        scene_specs: build-context-batch のシーン指定（None の場合は読み込む）
+
+    Returns:
+        終了コード (0: 成功, 1: エラー)
+    """
+    if args.command == "build-context":
+        from .context_tool import run_build_context
+
+        result = run_build_context(
+            vault_root=args.vault_root,
+            episode=args.episode,
+            sequence=args.sequence,
+            chapter=args.chapter,
+            phase=args.phase,
+            work=args.work,
+            profile=args.profile,
+        )
+        _print_build_context(result)
+        return 0
+
+    elif args.command == "build-context-batch":
+        from .context_tool import parse_scene_spec, run_build_context_batch
+
+        if scene_specs is None:
+            scene_specs = _read_scene_specs(args)
+        scenes = [parse_scene_spec(spec) for spec in scene_specs]
+        items = run_build_context_batch(
+            args.vault_root, scenes, work=args.work, processes=args.processes
+        )
+        _print_json_lines(items)
+        return 0
+
+    elif args.command == "audit-foreshadowing":
+        from .context_tool import run_foreshadowing_audit
+
+        characters = None
+        if args.characters:
+            with open(args.characters, encoding="utf-8") as f:
+                characters = json.load(f)
+        report = run_foreshadowing_audit(
+            args.vault_root,
+            args.start,
+            args.end,
+            work=args.work,
+            appearing_characters=characters,
+            silence_threshold=args.silence_threshold,
+            payoff_threshold=args.payoff_threshold,
+        )
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+        return 0
+
+    elif args.command == "serve":
+        return _serve(args.socket)
+
+    elif args.command == "format-context":
+        from .context_tool import format_context_as_markdown
+
+        if args.input == "-":
+            data = json.load(sys.stdin)
         else:
-            parser.print_help()
-            return 1
+            with open(args.input, encoding="utf-8") as f:
+                data = json.load(f)
+        markdown = format_context_as_markdown(data)
+        print(markdown)
+        return 0
 
-    except Exception as e:
-        print(json.dumps({"error": str(e)}, ensure_ascii=False), file=sys.stderr)
+    elif args.command == "check-review":
+        from .review_tool import run_algorithmic_review
+
+        if args.draft == "-":
+            draft_text = sys.stdin.read()
+        else:
+            with open(args.draft, encoding="utf-8") as f:
+                draft_text = f.read()
+        keywords = [k.strip() for k in args.keywords.split(",") if k.strip()]
+        review_result = run_algorithmic_review(draft_text, keywords)
+        print(review_result.model_dump_json(indent=2))
+        return 0
+
+    elif args.command == "analyze-style":
+        from .style_tool import run_analyze_style
+
+        vault_root = Path(args.vault)
+        episode_ids = None
+        if args.episodes:
+            episode_ids = [int(e.strip()) for e in args.episodes.split(",") if e.strip()]
+        prompt = run_analyze_style(vault_root, args.work, episode_ids)
+        print(prompt)
+        return 0
+
+    elif args.command == "save-style":
+        from .style_tool import run_save_style
+
+        vault_root = Path(args.vault)
+        input_path = Path(args.input)
+        run_save_style(vault_root, args.work, args.type, input_path)
+        print(f"Saved {args.type} to {vault_root / args.work}")
+        return 0
+
+    else:
+        parser.print_help()
         return 1
 
 
@@ -2,17 +2,24 @@
 
 L3 ContextBuilder を CLI 経由で呼び出すためのツール。
 build-context: コンテキスト構築 → JSON出力
+build-context-batch: 複数シーンのコンテキスト一括構築 → JSON Lines 出力
+audit-foreshadowing: エピソード範囲の伏線監査 → JSON出力
 format-context: JSON → Markdown プロンプトテキスト変換
 """
 
 from __future__ import annotations
 
+import functools
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from src.core.context.context_builder import ContextBuilder, ContextBuildResult
 from src.core.context.scene_identifier import SceneIdentifier
-from src.core.repositories.foreshadowing import ForeshadowingRepository
+
+if TYPE_CHECKING:
+    # L3 ビルダーとリポジトリは構築時にだけ import する
+    # （format-context などの軽いサブコマンドの起動を速くするため）
+    from src.core.context.context_builder import ContextBuilder, ContextBuildResult
+    from src.core.repositories.foreshadowing import ForeshadowingRepository
 
 
 def serialize_context_result(result: ContextBuildResult) -> dict[str, Any]:
@@ -134,6 +141,61 @@ def format_context_as_markdown(context_data: dict[str, Any]) -> str:
     return "\n\n---\n\n".join(sections)
 
 
+def _create_builder(
+    vault_root: str, work: str | None = None, collect_metrics: bool = False
+) -> ContextBuilder:
+    """vault と作品名から ContextBuilder を構築する.
+
+    キャラクター・世界観の検索には Vault 索引（VaultIndex）を使う。
+
+    Args:
+        vault_root: vault ルートパス
+        work: 作品名 (optional, 省略時は vault_root のディレクトリ名)
+        collect_metrics: ステージ別の計測を有効にするか
+
+    Returns:
+        ContextBuilder
+    """
+    from src.core.context.context_builder import ContextBuilder
+    from src.core.vault.index import VaultIndex
+
+    vault_path = Path(vault_root)
+    work_name = work if work is not None else vault_path.name
+    return ContextBuilder(
+        vault_root=vault_path,
+        work_name=work_name,
+        foreshadowing_reader=_create_foreshadowing_repository(vault_root, work),
+        vault_index=VaultIndex(vault_path),
+        collect_metrics=collect_metrics,
+    )
+
+
+def _create_foreshadowing_repository(
+    vault_root: str, work: str | None = None
+) -> ForeshadowingRepository | None:
+    """vault と作品名から ForeshadowingRepository を構築する.
+
+    Args:
+        vault_root: vault ルートパス
+        work: 作品名 (optional, 省略時は vault_root のディレクトリ名)
+
+    Returns:
+        ForeshadowingRepository（伏線登録簿がない場合は None）
+    """
+    from src.core.repositories.foreshadowing import ForeshadowingRepository
+
+    vault_path = Path(vault_root)
+
+    # ForeshadowingRepository は vault_root.parent / vault_root.name で構成
+    # 例: vault_root="vault/my_novel" → repo(vault_root.parent, vault_root.name)
+    #   → vault/my_novel/_foreshadowing/registry.yaml を読む
+    work_name = work if work is not None else vault_path.name
+    registry_path = vault_path.parent / work_name / "_foreshadowing" / "registry.yaml"
+    if not registry_path.exists():
+        return None
+    return ForeshadowingRepository(vault_path.parent, work_name)
+
+
 def run_build_context(
     vault_root: str,
     episode: str,
@@ -141,6 +203,8 @@ def run_build_context(
     chapter: str | None = None,
     phase: str | None = None,
     work: str | None = None,
+    profile: bool = False,
+    builder: ContextBuilder | None = None,
 ) -> dict[str, Any]:
     """コンテキストを構築し、シリアライズ済み dict を返す.
 
@@ -151,6 +215,9 @@ def run_build_context(
         chapter: チャプター ID (optional)
         phase: フェーズ (optional)
         work: 作品名 (optional, 伏線取得に必要)
+        profile: True の場合、ステージ別の計測結果を "metrics" キーに加える
+        builder: 再利用する ContextBuilder (optional, 省略時は新規構築。
+            profile には collect_metrics=True で構築したものを渡す)
 
     Returns:
         serialize_context_result() の出力
@@ -161,21 +228,130 @@ def run_build_context(
         chapter_id=chapter,
         current_phase=phase,
     )
-    vault_path = Path(vault_root)
+    if builder is None:
+        builder = _create_builder(vault_root, work, collect_metrics=profile)
+    result = builder.build_context(scene)
+    data = serialize_context_result(result)
+    if result.metrics is not None:
+        data["metrics"] = result.metrics.to_dict()
+    return data
 
-    # ForeshadowingRepository は vault_root.parent / vault_root.name で構成
-    # 例: vault_root="vault/my_novel" → repo(vault_root.parent, vault_root.name)
-    #   → vault/my_novel/_foreshadowing/registry.yaml を読む
-    work_name = work if work is not None else vault_path.name
-    foreshadowing_reader: ForeshadowingRepository | None = None
-    registry_path = vault_path.parent / work_name / "_foreshadowing" / "registry.yaml"
-    if registry_path.exists():
-        foreshadowing_reader = ForeshadowingRepository(vault_path.parent, work_name)
 
-    builder = ContextBuilder(
-        vault_root=vault_path,
-        work_name=work_name,
-        foreshadowing_reader=foreshadowing_reader,
+def parse_scene_spec(spec: dict[str, Any]) -> SceneIdentifier:
+    """シーン指定 dict を SceneIdentifier に変換する.
+
+    Args:
+        spec: {"episode": ..., "sequence": ..., "chapter": ..., "phase": ...}
+            （episode 以外は省略可）
+
+    Returns:
+        SceneIdentifier
+
+    Raises:
+        ValueError: episode が指定されていない場合
+    """
+    episode = spec.get("episode")
+    if not episode:
+        raise ValueError(f"episode is required: {spec}")
+
+    def _optional(key: str) -> str | None:
+        value = spec.get(key)
+        return str(value) if value is not None else None
+
+    return SceneIdentifier(
+        episode_id=str(episode),
+        sequence_id=_optional("sequence"),
+        chapter_id=_optional("chapter"),
+        current_phase=_optional("phase"),
     )
-    result = builder.build_context(scene)
-    return serialize_context_result(result)
+
+
+def run_build_context_batch(
+    vault_root: str,
+    scenes: list[SceneIdentifier],
+    work: str | None = None,
+    processes: int | None = None,
+    builder: ContextBuilder | None = None,
+) -> list[dict[str, Any]]:
+    """複数シーンのコンテキストを一括構築し、シリアライズ済み dict のリストを返す.
+
+    共有入力（L1 プロット・サマリ、スタイルガイド、visibility.yaml、伏線登録簿）は
+    バッチ全体で1回だけ読み込む。
+
+    Args:
+        vault_root: vault ルートパス
+        scenes: 構築するシーン（出力はこの順序）
+        work: 作品名 (optional, 伏線取得に必要)
+        processes: ワーカープロセス数 (optional, 2 以上でマルチプロセス構築)
+        builder: 再利用する ContextBuilder (optional, シングルプロセス構築のみ)
+
+    Returns:
+        シーンごとの serialize_context_result() の出力に "scene" キーを加えたリスト
+    """
+    if processes is not None and processes > 1:
+        from src.core.context.process_batch import ProcessPoolContextBuilder
+
+        factory = functools.partial(_create_builder, vault_root, work)
+        with ProcessPoolContextBuilder(factory, max_workers=processes) as pool:
+            results = pool.build_context_batch(scenes)
+    else:
+        if builder is None:
+            builder = _create_builder(vault_root, work)
+        results = builder.build_context_batch(scenes)
+
+    outputs: list[dict[str, Any]] = []
+    for scene, result in zip(scenes, results, strict=True):
+        data = serialize_context_result(result)
+        data["scene"] = {
+            "episode": scene.episode_id,
+            "sequence": scene.sequence_id,
+            "chapter": scene.chapter_id,
+            "phase": scene.current_phase,
+        }
+        outputs.append(data)
+    return outputs
+
+
+def run_foreshadowing_audit(
+    vault_root: str,
+    start: str,
+    end: str,
+    work: str | None = None,
+    appearing_characters: dict[str, list[str]] | None = None,
+    silence_threshold: int = 5,
+    payoff_threshold: int = 3,
+) -> dict[str, Any]:
+    """エピソード範囲の伏線を監査し、JSON シリアライズ可能な dict を返す.
+
+    伏線登録簿は1回だけ読み込み、範囲全体を1回の走査で処理する
+    （SceneForeshadowingChecker.audit_range()）。
+
+    Args:
+        vault_root: vault ルートパス
+        start: 開始エピソード ID（範囲に含む）
+        end: 終了エピソード ID（範囲に含む）
+        work: 作品名 (optional, 省略時は vault_root のディレクトリ名)
+        appearing_characters: エピソード ID → 登場キャラクター (optional, HINT 判定用)
+        silence_threshold: 長期未言及アラートのエピソード数
+        payoff_threshold: 回収接近とみなすエピソード数
+
+    Returns:
+        ForeshadowingAudit.to_dict() の出力
+
+    Raises:
+        FileNotFoundError: 伏線登録簿がない場合
+    """
+    from src.core.context.foreshadowing_checker import SceneForeshadowingChecker
+
+    repository = _create_foreshadowing_repository(vault_root, work)
+    if repository is None:
+        raise FileNotFoundError(f"Foreshadowing registry not found: {vault_root}")
+    checker = SceneForeshadowingChecker.from_reader(repository)
+    audit = checker.audit_range(
+        start,
+        end,
+        appearing_characters=appearing_characters,
+        silence_threshold=silence_threshold,
+        payoff_threshold=payoff_threshold,
+    )
+    return audit.to_dict()
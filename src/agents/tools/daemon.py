@@ -0,0 +1,398 @@
+"""Context daemon for L4 agent pipeline.
+
+ウォームな ContextBuilder を vault/作品ごとに保持し、Unix ドメインソケット上の
+JSON-RPC 2.0 で build-context / build-context-batch を提供する常駐プロセス。
+CLI は起動中のデーモンを検出すると、これらのサブコマンドを自動的に転送する。
+
+プロトコル: 1 行 1 メッセージの JSON（改行区切り）。1 接続で複数リクエスト可。
+    → {"jsonrpc": "2.0", "id": 1, "method": "build-context", "params": {...}}
+    ← {"jsonrpc": "2.0", "id": 1, "result": {...}}
+
+メソッド:
+    ping: 稼働確認（pid と保持中のビルダー数を返す）
+    build-context: run_build_context() と同じ引数
+    build-context-batch: vault_root, scenes（シーン指定 dict のリスト）, work
+    shutdown: デーモンを停止する
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import socket
+import socketserver
+import stat
+import tempfile
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from .context_tool import (
+    _create_builder,
+    parse_scene_spec,
+    run_build_context,
+    run_build_context_batch,
+)
+
+if TYPE_CHECKING:
+    from src.core.context.context_builder import ContextBuilder
+
+logger = logging.getLogger(__name__)
+
+# ソケットパスを指定する環境変数
+SOCKET_ENV = "NOVEL_AGENT_SOCKET"
+
+# JSON-RPC 2.0 エラーコード
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+SERVER_ERROR = -32000
+
+
+# 転送前の稼働確認のタイムアウト（秒）
+PING_TIMEOUT = 1.0
+
+# 転送したリクエストのタイムアウト（秒）。超えた場合はローカルで実行する
+FORWARD_TIMEOUT = 120.0
+
+
+def default_socket_path() -> Path:
+    """デーモンのソケットパスを返す.
+
+    環境変数 NOVEL_AGENT_SOCKET があればそのパス、なければ
+    $XDG_RUNTIME_DIR 下、それもなければ一時ディレクトリ下の
+    ユーザー専用ディレクトリ（0700、serve 時に作成）内のパス。
+
+    Returns:
+        ソケットパス
+    """
+    configured = os.environ.get(SOCKET_ENV)
+    if configured:
+        return Path(configured)
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir and Path(runtime_dir).is_dir():
+        return Path(runtime_dir) / "novel-agent-tools.sock"
+    return (
+        Path(tempfile.gettempdir())
+        / f"novel-agent-tools-{os.getuid()}"
+        / "daemon.sock"
+    )
+
+
+def is_trusted_socket(socket_path: Path) -> bool:
+    """ソケットが現在のユーザーのデーモンのものか確認する.
+
+    ソケット自体が現在のユーザー所有であること、置かれたディレクトリが
+    現在のユーザー所有か sticky bit 付き（/tmp など、他人が差し替えられない）
+    であることを確認する。
+
+    Args:
+        socket_path: ソケットパス
+
+    Returns:
+        転送してよいソケットなら True
+    """
+    try:
+        socket_stat = socket_path.lstat()
+        parent_stat = socket_path.parent.stat()
+    except OSError:
+        return False
+    uid = os.getuid()
+    if not stat.S_ISSOCK(socket_stat.st_mode) or socket_stat.st_uid != uid:
+        return False
+    return parent_stat.st_uid == uid or bool(parent_stat.st_mode & stat.S_ISVTX)
+
+
+def _prepare_socket_dir(directory: Path) -> None:
+    """ソケットを置くディレクトリを用意する（なければ 0700 で作成）.
+
+    Raises:
+        RuntimeError: ディレクトリが他のユーザーの所有の場合
+    """
+    if not directory.exists():
+        directory.mkdir(mode=0o700, parents=True)
+    directory_stat = directory.stat()
+    if directory_stat.st_uid != os.getuid() and not (
+        directory_stat.st_mode & stat.S_ISVTX
+    ):
+        raise RuntimeError(f"socket directory is owned by another user: {directory}")
+
+
+def is_supported() -> bool:
+    """この環境で Unix ドメインソケットが使えるか."""
+    return hasattr(socket, "AF_UNIX")
+
+
+class DaemonError(Exception):
+    """デーモンがエラー応答を返した場合の例外.
+
+    Attributes:
+        code: JSON-RPC エラーコード
+    """
+
+    def __init__(self, code: int, message: str) -> None:
+        super().__init__(message)
+        self.code = code
+
+
+class ContextDaemon:
+    """ウォームな ContextBuilder を保持する JSON-RPC デーモン.
+
+    ビルダーは (vault_root, work, profile) ごとに 1 つ生成して使い回す。
+    ファイル内容のキャッシュ（stat 検証付き）はリクエストをまたいで保持し、
+    シーン単位の伏線指示・禁止キーワードのキャッシュはリクエストごとに破棄する
+    （伏線登録簿の編集を次のリクエストに反映するため）。
+
+    リクエストはスレッドごとに処理されるが、ビルダーのファイルスナップショット・
+    伏線登録簿のスコープはビルダー単位の状態なので、同じビルダーを使う
+    リクエストはビルダーごとのロックで直列化する（別の vault/作品は並行に処理する）。
+
+    Attributes:
+        socket_path: 待ち受けるソケットパス
+    """
+
+    def __init__(self, socket_path: Path) -> None:
+        """Initialize ContextDaemon.
+
+        Args:
+            socket_path: 待ち受けるソケットパス
+        """
+        self.socket_path = socket_path
+        self._builders: dict[tuple[str, str | None, bool], ContextBuilder] = {}
+        self._builder_locks: dict[tuple[str, str | None, bool], threading.Lock] = {}
+        self._lock = threading.Lock()
+        self._server: socketserver.ThreadingUnixStreamServer | None = None
+
+    def builder_for(
+        self, vault_root: str, work: str | None, profile: bool = False
+    ) -> ContextBuilder:
+        """vault/作品に対応するウォームなビルダーを返す（なければ生成）.
+
+        Args:
+            vault_root: vault ルートパス（絶対パス）
+            work: 作品名
+            profile: ステージ別計測を有効にしたビルダーか
+
+        Returns:
+            ContextBuilder
+        """
+        key = (vault_root, work, profile)
+        with self._lock:
+            builder = self._builders.get(key)
+            if builder is None:
+                builder = _create_builder(vault_root, work, collect_metrics=profile)
+                self._builders[key] = builder
+            return builder
+
+    @contextmanager
+    def using_builder(
+        self, vault_root: str, work: str | None, profile: bool = False
+    ) -> Iterator[ContextBuilder]:
+        """ビルダーを排他的に使う（同じビルダーを使う他のリクエストを待たせる）.
+
+        Args:
+            vault_root: vault ルートパス（絶対パス）
+            work: 作品名
+            profile: ステージ別計測を有効にしたビルダーか
+
+        Yields:
+            ContextBuilder
+        """
+        key = (vault_root, work, profile)
+        with self._lock:
+            builder_lock = self._builder_locks.setdefault(key, threading.Lock())
+        with builder_lock:
+            yield self.builder_for(vault_root, work, profile)
+
+    def dispatch(self, method: str, params: dict[str, Any]) -> Any:
+        """メソッドを実行する.
+
+        Args:
+            method: メソッド名
+            params: パラメータ
+
+        Returns:
+            メソッドの結果
+
+        Raises:
+            DaemonError: 不明なメソッド・不正なパラメータの場合
+        """
+        if method == "ping":
+            with self._lock:
+                return {"pid": os.getpid(), "builders": len(self._builders)}
+
+        if method == "shutdown":
+            threading.Thread(target=self.shutdown, daemon=True).start()
+            return {"stopping": True}
+
+        if method == "build-context":
+            try:
+                vault_root = str(params["vault_root"])
+                episode = str(params["episode"])
+            except KeyError as e:
+                raise DaemonError(INVALID_PARAMS, f"missing param: {e}") from e
+            work = params.get("work")
+            profile = bool(params.get("profile", False))
+            with self.using_builder(vault_root, work, profile) as builder:
+                builder.clear_all_caches()
+                return run_build_context(
+                    vault_root=vault_root,
+                    episode=episode,
+                    sequence=params.get("sequence"),
+                    chapter=params.get("chapter"),
+                    phase=params.get("phase"),
+                    work=work,
+                    profile=profile,
+                    builder=builder,
+                )
+
+        if method == "build-context-batch":
+            try:
+                vault_root = str(params["vault_root"])
+                scenes = [parse_scene_spec(spec) for spec in params["scenes"]]
+            except (KeyError, TypeError, ValueError) as e:
+                raise DaemonError(INVALID_PARAMS, f"invalid params: {e}") from e
+            work = params.get("work")
+            with self.using_builder(vault_root, work) as builder:
+                builder.clear_all_caches()
+                return run_build_context_batch(
+                    vault_root, scenes, work=work, builder=builder
+                )
+
+        raise DaemonError(METHOD_NOT_FOUND, f"unknown method: {method}")
+
+    def handle_message(self, line: bytes) -> dict[str, Any]:
+        """1 行の JSON-RPC リクエストを処理し、応答を返す.
+
+        Args:
+            line: リクエスト行
+
+        Returns:
+            JSON-RPC 応答
+        """
+        request_id: Any = None
+        try:
+            try:
+                request = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise DaemonError(PARSE_ERROR, f"parse error: {e}") from e
+            if not isinstance(request, dict) or not isinstance(
+                request.get("method"), str
+            ):
+                raise DaemonError(INVALID_REQUEST, "invalid request")
+            request_id = request.get("id")
+            params = request.get("params") or {}
+            if not isinstance(params, dict):
+                raise DaemonError(INVALID_PARAMS, "params must be an object")
+            result = self.dispatch(request["method"], params)
+            return {"jsonrpc": "2.0", "id": request_id, "result": result}
+        except DaemonError as e:
+            error = {"code": e.code, "message": str(e)}
+        except Exception as e:
+            logger.exception("Daemon request failed")
+            error = {"code": SERVER_ERROR, "message": str(e)}
+        return {"jsonrpc": "2.0", "id": request_id, "error": error}
+
+    def serve_forever(self) -> None:
+        """ソケットで待ち受け、shutdown() まで処理を続ける.
+
+        Raises:
+            RuntimeError: 同じソケットで別のデーモンが稼働中の場合
+        """
+        _prepare_socket_dir(self.socket_path.parent)
+        if self.socket_path.exists():
+            if ping_daemon(self.socket_path) is not None:
+                raise RuntimeError(f"daemon already running: {self.socket_path}")
+            # 前回の異常終了で残ったソケット
+            self.socket_path.unlink()
+
+        daemon = self
+
+        class _Handler(socketserver.StreamRequestHandler):
+            def handle(self) -> None:
+                for line in self.rfile:
+                    if not line.strip():
+                        continue
+                    response = daemon.handle_message(line)
+                    payload = json.dumps(response, ensure_ascii=False) + "\n"
+                    self.wfile.write(payload.encode("utf-8"))
+                    self.wfile.flush()
+
+        server = socketserver.ThreadingUnixStreamServer(
+            str(self.socket_path), _Handler
+        )
+        server.daemon_threads = True
+        self.socket_path.chmod(0o600)
+        self._server = server
+        try:
+            server.serve_forever(poll_interval=0.1)
+        finally:
+            server.server_close()
+            self._server = None
+            self.socket_path.unlink(missing_ok=True)
+
+    def shutdown(self) -> None:
+        """serve_forever() を停止する（別スレッドから呼ぶ）."""
+        server = self._server
+        if server is not None:
+            server.shutdown()
+
+
+def call_daemon(
+    socket_path: Path,
+    method: str,
+    params: dict[str, Any] | None = None,
+    timeout: float | None = None,
+) -> Any:
+    """デーモンのメソッドを呼び出す.
+
+    Args:
+        socket_path: デーモンのソケットパス
+        method: メソッド名
+        params: パラメータ
+        timeout: タイムアウト秒数（None で無制限）
+
+    Returns:
+        メソッドの結果
+
+    Raises:
+        OSError: デーモンに接続できない場合
+        DaemonError: デーモンがエラー応答を返した場合
+    """
+    request = {"jsonrpc": "2.0", "id": 1, "method": method, "params": params or {}}
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(str(socket_path))
+        sock.sendall(json.dumps(request, ensure_ascii=False).encode("utf-8") + b"\n")
+        with sock.makefile("rb") as reader:
+            line = reader.readline()
+    if not line:
+        raise DaemonError(SERVER_ERROR, "daemon closed the connection")
+    response = json.loads(line)
+    if "error" in response:
+        error = response["error"]
+        raise DaemonError(error.get("code", SERVER_ERROR), error.get("message", ""))
+    return response.get("result")
+
+
+def ping_daemon(
+    socket_path: Path, timeout: float = PING_TIMEOUT
+) -> dict[str, Any] | None:
+    """デーモンの稼働を確認する.
+
+    Args:
+        socket_path: デーモンのソケットパス
+        timeout: タイムアウト秒数
+
+    Returns:
+        ping の結果、デーモンが応答しない場合は None
+    """
+    try:
+        result: dict[str, Any] = call_daemon(socket_path, "ping", timeout=timeout)
+    except (OSError, DaemonError, ValueError):
+        return None
+    return result
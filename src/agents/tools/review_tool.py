@@ -2,7 +2,9 @@
 
 This module provides:
 1. Algorithmic review: forbidden keyword detection using L2 expression_filter.
-2. Human Fallback: retry count management and fallback report generation.
+2. Streaming review: forbidden keyword detection while a draft is generated.
+3. Review session: incremental re-review of revised drafts in the retry loop.
+4. Human Fallback: retry count management and fallback report generation.
 
 Used by the Reviewer agent as a pre-check before LLM-based review.
 """
@@ -19,7 +21,15 @@ from src.agents.models.review_result import (
     ReviewResult,
     ReviewStatus,
 )
-from src.core.services.expression_filter import check_forbidden_keywords
+from src.core.services.expression_filter import (
+    KeywordViolation,
+    check_forbidden_keywords,
+    violations_from_hits,
+)
+from src.core.services.keyword_matcher import compile_keywords
+
+# Characters of preceding text shown in streaming review issue locations
+STREAM_CONTEXT_CHARS = 20
 
 
 def run_algorithmic_review(
@@ -29,6 +39,8 @@ def run_algorithmic_review(
     """Run algorithmic review on draft text.
 
     Checks for forbidden keyword violations using L2 expression_filter.
+    The keyword list is compiled once per distinct keyword set and the
+    draft is scanned in a single pass.
 
     Args:
         draft_text: The draft text to review.
@@ -38,24 +50,306 @@ def run_algorithmic_review(
         ReviewResult with status and issues.
     """
     violations = check_forbidden_keywords(draft_text, forbidden_keywords)
+    return _result_from_violations(violations)
+
+
+def _result_from_violations(violations: list[KeywordViolation]) -> ReviewResult:
+    """Convert forbidden keyword violations into a ReviewResult.
 
+    Args:
+        violations: Violations from the L2 expression_filter.
+
+    Returns:
+        APPROVED if there are no violations, otherwise REJECTED with
+        one critical issue per violated keyword.
+    """
     if not violations:
         return ReviewResult(status=ReviewStatus.APPROVED)
 
     issues = [
-        ReviewIssue(
-            type=ReviewIssueType.FORBIDDEN_KEYWORD,
-            severity=IssueSeverity.CRITICAL,
-            location=v.context,
-            detail=f"禁止キーワード '{v.keyword}' が検出されました（{len(v.positions)}箇所）",
-            suggestion=f"'{v.keyword}' を使わない表現に変更してください",
-        )
+        _forbidden_keyword_issue(v.keyword, len(v.positions), v.context)
         for v in violations
     ]
 
     return ReviewResult(status=ReviewStatus.REJECTED, issues=issues)
 
 
+def _forbidden_keyword_issue(keyword: str, count: int, location: str) -> ReviewIssue:
+    """Create the issue reported for a forbidden keyword.
+
+    Args:
+        keyword: The detected forbidden keyword.
+        count: Number of occurrences.
+        location: Text surrounding an occurrence.
+
+    Returns:
+        Critical FORBIDDEN_KEYWORD issue.
+    """
+    return ReviewIssue(
+        type=ReviewIssueType.FORBIDDEN_KEYWORD,
+        severity=IssueSeverity.CRITICAL,
+        location=location,
+        detail=f"禁止キーワード '{keyword}' が検出されました（{count}箇所）",
+        suggestion=f"'{keyword}' を使わない表現に変更してください",
+    )
+
+
+class StreamingReview:
+    """Forbidden keyword review of a draft while it is being generated.
+
+    Chunks are fed as the model streams them. Matching state is kept across
+    chunks, so a keyword split between two chunks is still detected, and
+    feed() reports it as soon as its last character arrives. The caller can
+    then abort generation instead of reviewing the finished draft.
+
+    Only the text needed for issue locations is retained, not the draft.
+
+    Example:
+        >>> review = StreamingReview(["王族"])
+        >>> review.feed("彼は王")
+        []
+        >>> [issue.detail for issue in review.feed("族の")]
+        ["禁止キーワード '王族' が検出されました（1箇所）"]
+        >>> review.should_abort
+        True
+    """
+
+    def __init__(
+        self,
+        forbidden_keywords: list[str],
+        context_chars: int = STREAM_CONTEXT_CHARS,
+    ) -> None:
+        """Initialize StreamingReview.
+
+        Args:
+            forbidden_keywords: List of forbidden keywords.
+            context_chars: Characters of preceding text in issue locations.
+        """
+        matcher = compile_keywords(forbidden_keywords)
+        self._stream = matcher.stream()
+        self._keep = context_chars + max((len(k) for k in matcher.keywords), default=0)
+        self._context_chars = context_chars
+        self._tail = ""
+        self._tail_start = 0
+        self._counts: dict[str, int] = {}
+        self._locations: dict[str, str] = {}
+
+    def feed(self, chunk: str) -> list[ReviewIssue]:
+        """Scan the next chunk of generated text.
+
+        Args:
+            chunk: Newly generated text.
+
+        Returns:
+            Issues for forbidden keywords detected for the first time
+            in this chunk (empty if none).
+        """
+        matches = self._stream.feed(chunk)
+        self._tail += chunk
+
+        issues: list[ReviewIssue] = []
+        for match in matches:
+            self._counts[match.keyword] = self._counts.get(match.keyword, 0) + 1
+            if match.keyword in self._locations:
+                continue
+            location = self._location(match.start, match.end)
+            self._locations[match.keyword] = location
+            issues.append(_forbidden_keyword_issue(match.keyword, 1, location))
+
+        if len(self._tail) > self._keep:
+            trimmed = len(self._tail) - self._keep
+            self._tail = self._tail[trimmed:]
+            self._tail_start += trimmed
+        return issues
+
+    def _location(self, start: int, end: int) -> str:
+        """Text preceding and including a match (prefixed with ... if cut)."""
+        begin = max(0, start - self._context_chars)
+        text = self._tail[begin - self._tail_start : end - self._tail_start]
+        return "..." + text if begin > 0 else text
+
+    @property
+    def should_abort(self) -> bool:
+        """True once any forbidden keyword has been detected."""
+        return bool(self._counts)
+
+    @property
+    def position(self) -> int:
+        """Number of characters reviewed so far."""
+        return self._stream.position
+
+    def result(self) -> ReviewResult:
+        """Summarize the text reviewed so far.
+
+        Returns:
+            ReviewResult in the same form as run_algorithmic_review().
+        """
+        if not self._counts:
+            return ReviewResult(status=ReviewStatus.APPROVED)
+        issues = [
+            _forbidden_keyword_issue(keyword, count, self._locations[keyword])
+            for keyword, count in self._counts.items()
+        ]
+        return ReviewResult(status=ReviewStatus.REJECTED, issues=issues)
+
+
+class ReviewSession:
+    """Algorithmic review across the retry loop of one scene.
+
+    Revised drafts usually change only a few paragraphs, so the session
+    remembers the matches of each paragraph of the previous draft (keyed by
+    paragraph content) and rescans only new or edited paragraphs. Keywords
+    spanning a paragraph boundary are found by scanning a window of
+    (longest keyword - 1) characters on each side of the boundary. The
+    result is identical to run_algorithmic_review() on the full draft.
+
+    The session also counts rejected reviews for the Human Fallback check.
+
+    Attributes:
+        forbidden_keywords: List of forbidden keywords.
+        max_retries: Maximum retries before fallback.
+        retry_count: Number of rejected reviews so far.
+        last_draft: The most recently reviewed draft (None before the first).
+        last_result: The result for last_draft.
+        rescanned_paragraphs: Paragraphs scanned by the latest review().
+
+    Example:
+        >>> session = ReviewSession(["王族"])
+        >>> session.review("一段落目。\\n王族の末裔。\\n").status
+        <ReviewStatus.REJECTED: 'rejected'>
+        >>> session.review("一段落目。\\n貴族の末裔。\\n").status
+        <ReviewStatus.APPROVED: 'approved'>
+        >>> session.rescanned_paragraphs
+        1
+    """
+
+    def __init__(
+        self,
+        forbidden_keywords: list[str],
+        max_retries: int = MAX_REVIEW_RETRIES,
+    ) -> None:
+        """Initialize ReviewSession.
+
+        Args:
+            forbidden_keywords: List of forbidden keywords.
+            max_retries: Maximum retries before fallback.
+        """
+        self.forbidden_keywords = list(forbidden_keywords)
+        self.max_retries = max_retries
+        self.retry_count = 0
+        self.last_draft: str | None = None
+        self.last_result: ReviewResult | None = None
+        self.rescanned_paragraphs = 0
+        self._matcher = compile_keywords(self.forbidden_keywords)
+        self._reach = max((len(k) for k in self._matcher.keywords), default=1) - 1
+        # paragraph text -> matches relative to the paragraph start
+        self._paragraph_hits: dict[str, dict[str, list[int]]] = {}
+        # (window text, boundary offset in window) -> matches crossing it
+        self._boundary_hits: dict[tuple[str, int], list[tuple[str, int]]] = {}
+
+    def review(self, draft_text: str) -> ReviewResult:
+        """Review a (revised) draft.
+
+        Args:
+            draft_text: The draft text to review.
+
+        Returns:
+            ReviewResult identical to run_algorithmic_review(draft_text, ...).
+        """
+        if draft_text == self.last_draft and self.last_result is not None:
+            self.rescanned_paragraphs = 0
+            result = self.last_result
+        else:
+            hits = self._find_all(draft_text)
+            violations = violations_from_hits(
+                draft_text, hits, self.forbidden_keywords
+            )
+            result = _result_from_violations(violations)
+
+        self.last_draft = draft_text
+        self.last_result = result
+        if result.status == ReviewStatus.REJECTED:
+            self.retry_count += 1
+        return result
+
+    def _find_all(self, text: str) -> dict[str, list[int]]:
+        """Find all keyword positions, reusing unchanged paragraphs."""
+        paragraph_hits: dict[str, dict[str, list[int]]] = {}
+        boundary_hits: dict[tuple[str, int], list[tuple[str, int]]] = {}
+        found: dict[str, list[int]] = {}
+        rescanned = 0
+
+        offset = 0
+        for paragraph in text.splitlines(keepends=True):
+            if offset and self._reach:
+                for keyword, start in self._boundary_matches(
+                    text, offset, boundary_hits
+                ):
+                    found.setdefault(keyword, []).append(start)
+
+            hits = paragraph_hits.get(paragraph)
+            if hits is None:
+                hits = self._paragraph_hits.get(paragraph)
+                if hits is None:
+                    hits = self._matcher.find_all(paragraph)
+                    rescanned += 1
+                paragraph_hits[paragraph] = hits
+            for keyword, positions in hits.items():
+                found.setdefault(keyword, []).extend(offset + p for p in positions)
+            offset += len(paragraph)
+
+        self._paragraph_hits = paragraph_hits
+        self._boundary_hits = boundary_hits
+        self.rescanned_paragraphs = rescanned
+
+        # A keyword can span several short paragraphs (found at each boundary)
+        return {keyword: sorted(set(starts)) for keyword, starts in found.items()}
+
+    def _boundary_matches(
+        self,
+        text: str,
+        boundary: int,
+        boundary_hits: dict[tuple[str, int], list[tuple[str, int]]],
+    ) -> list[tuple[str, int]]:
+        """Find matches crossing a paragraph boundary (absolute positions)."""
+        window_start = max(0, boundary - self._reach)
+        key = (text[window_start : boundary + self._reach], boundary - window_start)
+        crossing = boundary_hits.get(key)
+        if crossing is None:
+            crossing = self._boundary_hits.get(key)
+            if crossing is None:
+                window, split = key
+                crossing = [
+                    (keyword, start)
+                    for keyword, starts in self._matcher.find_all(window).items()
+                    for start in starts
+                    if start < split < start + len(keyword)
+                ]
+            boundary_hits[key] = crossing
+        return [(keyword, window_start + start) for keyword, start in crossing]
+
+    def should_fallback(self) -> bool:
+        """Determine if review should fallback to human.
+
+        Returns:
+            True if the rejected reviews reached max_retries.
+        """
+        return should_fallback(self.retry_count, self.max_retries)
+
+    def fallback_report(self) -> dict[str, Any]:
+        """Format the Human Fallback report for the latest review.
+
+        Returns:
+            Report dictionary (see format_fallback_report()).
+
+        Raises:
+            ValueError: If no draft has been reviewed yet.
+        """
+        if self.last_result is None:
+            raise ValueError("No draft has been reviewed")
+        return format_fallback_report(self.retry_count, self.last_result)
+
+
 def should_fallback(
     retry_count: int,
     max_retries: int = MAX_REVIEW_RETRIES,
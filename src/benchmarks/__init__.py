@@ -0,0 +1,13 @@
+"""Performance benchmarks on a synthetic vault."""
+
+from .runner import BenchmarkResult, compare_reports, measure, run_benchmarks
+from .synthetic_vault import SyntheticVaultSpec, generate_synthetic_vault
+
+__all__ = [
+    "BenchmarkResult",
+    "SyntheticVaultSpec",
+    "compare_reports",
+    "generate_synthetic_vault",
+    "measure",
+    "run_benchmarks",
+]
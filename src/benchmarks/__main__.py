@@ -0,0 +1,7 @@
+"""Allow running as python -m src.benchmarks."""
+
+import sys
+
+from src.benchmarks.runner import main
+
+sys.exit(main())
@@ -0,0 +1,168 @@
+"""CLI startup import-time profile.
+
+エージェント CLI を `python -X importtime` 付きのサブプロセスで実行し、
+モジュールごとの import 時間と、起動予算（IMPORT_BUDGET_MS）・
+軽量サブコマンドで読み込んではならないモジュールの検査結果を JSON で出力する。
+import 時間は環境に左右されるため予算は報告のみとし、
+終了コードは重いモジュールの import の有無だけで決める。
+
+使用例: python -m src.benchmarks.import_time check-review --draft - --keywords 秘密
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+# src.agents.tools.cli の import（累積）に許す時間（ミリ秒）
+IMPORT_BUDGET_MS = 150.0
+
+# 軽量サブコマンドで import してはならないモジュール（前方一致）
+HEAVY_MODULES = (
+    "src.core.context.context_builder",
+    "src.core.repositories",
+)
+
+# 軽量サブコマンド（L3 ビルダー・リポジトリを使わない）
+LIGHT_COMMANDS = ("check-review", "format-context")
+
+_CLI_MODULE = "src.agents.tools.cli"
+_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)$")
+_RUN_CLI = "import sys; from src.agents.tools.cli import main; sys.exit(main(sys.argv[1:]))"
+
+
+@dataclass
+class ImportProfile:
+    """CLI 1 回分の import 時間.
+
+    Attributes:
+        argv: CLI 引数
+        self_us: モジュール名 → 自身の import 時間（マイクロ秒）
+        cumulative_us: モジュール名 → 依存を含む import 時間（マイクロ秒）
+        exit_code: CLI の終了コード
+    """
+
+    argv: list[str]
+    self_us: dict[str, int] = field(default_factory=dict)
+    cumulative_us: dict[str, int] = field(default_factory=dict)
+    exit_code: int = 0
+
+    @property
+    def cli_import_ms(self) -> float:
+        """CLI モジュールの import 時間（累積、ミリ秒）."""
+        return self.cumulative_us.get(_CLI_MODULE, 0) / 1000
+
+    def imported(self, prefix: str) -> list[str]:
+        """名前が prefix で始まる import 済みモジュールを返す."""
+        return sorted(
+            name
+            for name in self.cumulative_us
+            if name == prefix or name.startswith(prefix + ".")
+        )
+
+    def heavy_imports(self) -> list[str]:
+        """HEAVY_MODULES に該当する import 済みモジュールを返す."""
+        return sorted({m for prefix in HEAVY_MODULES for m in self.imported(prefix)})
+
+    def to_dict(self, top: int = 15) -> dict[str, Any]:
+        """JSON 出力用の dict を返す.
+
+        Args:
+            top: 出力する自身の import 時間上位モジュール数
+        """
+        slowest = sorted(self.self_us.items(), key=lambda kv: kv[1], reverse=True)
+        return {
+            "argv": self.argv,
+            "exit_code": self.exit_code,
+            "cli_import_ms": round(self.cli_import_ms, 3),
+            "budget_ms": IMPORT_BUDGET_MS,
+            "within_budget": self.cli_import_ms <= IMPORT_BUDGET_MS,
+            "heavy_imports": self.heavy_imports(),
+            "slowest_self_us": dict(slowest[:top]),
+        }
+
+
+def parse_importtime(stderr: str) -> tuple[dict[str, int], dict[str, int]]:
+    """`-X importtime` の出力をパースする.
+
+    Args:
+        stderr: サブプロセスの標準エラー出力
+
+    Returns:
+        (モジュール → 自身の時間, モジュール → 累積時間)（マイクロ秒）
+    """
+    self_us: dict[str, int] = {}
+    cumulative_us: dict[str, int] = {}
+    for line in stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            name = match.group(4)
+            self_us[name] = int(match.group(1))
+            cumulative_us[name] = int(match.group(2))
+    return self_us, cumulative_us
+
+
+def profile_cli(
+    argv: list[str], cwd: Path | None = None, stdin: str = ""
+) -> ImportProfile:
+    """CLI を `-X importtime` 付きで実行し、import 時間を計測する.
+
+    Args:
+        argv: CLI 引数（例: ["format-context", "--input", "ctx.json"]）
+        cwd: 実行ディレクトリ（省略時はリポジトリルート）
+        stdin: 標準入力に渡すテキスト
+
+    Returns:
+        import 時間のプロファイル
+    """
+    root = cwd if cwd is not None else Path(__file__).resolve().parents[2]
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _RUN_CLI, *argv],
+        cwd=root,
+        input=stdin,
+        capture_output=True,
+        text=True,
+        encoding="utf-8",
+        check=False,
+    )
+    self_us, cumulative_us = parse_importtime(completed.stderr)
+    return ImportProfile(
+        argv=list(argv),
+        self_us=self_us,
+        cumulative_us=cumulative_us,
+        exit_code=completed.returncode,
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    """import 時間計測のエントリポイント.
+
+    Args:
+        argv: 計測する CLI 引数（None の場合は sys.argv[1:]）
+
+    Returns:
+        終了コード（軽量サブコマンドで重いモジュールを import していれば 1。
+        予算超過は within_budget で報告するのみ）
+    """
+    cli_argv = list(sys.argv[1:] if argv is None else argv)
+    if not cli_argv:
+        print(json.dumps({"error": "CLI arguments are required"}), file=sys.stderr)
+        return 1
+
+    stdin = "" if sys.stdin is None or sys.stdin.isatty() else sys.stdin.read()
+    profile = profile_cli(cli_argv, stdin=stdin)
+    report = profile.to_dict()
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+
+    if cli_argv[0] in LIGHT_COMMANDS and report["heavy_imports"]:
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
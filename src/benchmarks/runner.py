@@ -0,0 +1,315 @@
+"""Benchmark runner.
+
+合成 Vault 上で主要な処理の所要時間を計測し、p50/p95 レイテンシ・
+スループット・ピークメモリを JSON で出力する。
+
+使用例: python -m src.benchmarks --episodes 200 --iterations 50 --output after.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable, Sequence
+from dataclasses import asdict, dataclass
+from itertools import count
+from pathlib import Path
+from typing import Any
+
+from src.agents.tools.text_stats import compute_text_stats
+from src.core.context.context_builder import ContextBuilder
+from src.core.context.scene_identifier import SceneIdentifier
+from src.core.repositories.character import CharacterRepository
+from src.core.repositories.foreshadowing import ForeshadowingRepository
+from src.core.services.expression_filter import check_forbidden_keywords
+from src.core.services.timeline_index import TimelineIndex
+
+from .synthetic_vault import (
+    SyntheticVaultSpec,
+    episode_id,
+    generate_synthetic_vault,
+    phase_for_episode,
+)
+
+# 合成 Vault の作品名
+WORK_NAME = "benchmark"
+
+# JSON 出力フォーマットのバージョン
+REPORT_VERSION = 1
+
+
+@dataclass
+class BenchmarkResult:
+    """1つのベンチマークの計測結果.
+
+    Attributes:
+        name: ベンチマーク名
+        iterations: 計測回数
+        p50_ms: レイテンシ中央値（ミリ秒）
+        p95_ms: レイテンシ 95 パーセンタイル（ミリ秒）
+        mean_ms: レイテンシ平均（ミリ秒）
+        throughput_per_sec: 1秒あたりの実行回数
+        peak_memory_kib: 1回の実行で確保されたメモリのピーク（KiB）
+    """
+
+    name: str
+    iterations: int
+    p50_ms: float
+    p95_ms: float
+    mean_ms: float
+    throughput_per_sec: float
+    peak_memory_kib: float
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON 出力用の dict を返す."""
+        return asdict(self)
+
+
+def _percentile(sorted_values: Sequence[float], fraction: float) -> float:
+    """ソート済みの値から最近傍法でパーセンタイルを求める."""
+    index = max(0, min(len(sorted_values) - 1, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def measure(
+    name: str,
+    func: Callable[[], object],
+    iterations: int,
+    warmup: int = 1,
+) -> BenchmarkResult:
+    """関数の所要時間とピークメモリを計測する.
+
+    タイミング計測は tracemalloc を無効にした状態で行い、
+    ピークメモリはその後の1回の実行で別途計測する。
+
+    Args:
+        name: ベンチマーク名
+        func: 計測する関数（引数なし）
+        iterations: 計測回数
+        warmup: 計測前のウォームアップ回数
+
+    Returns:
+        計測結果
+
+    Raises:
+        ValueError: iterations が 1 未満の場合
+    """
+    if iterations < 1:
+        raise ValueError(f"iterations must be >= 1, got {iterations}")
+
+    for _ in range(warmup):
+        func()
+
+    gc.collect()
+    timings: list[float] = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    timings.sort()
+    total = sum(timings)
+    return BenchmarkResult(
+        name=name,
+        iterations=iterations,
+        p50_ms=_percentile(timings, 0.50) * 1000,
+        p95_ms=_percentile(timings, 0.95) * 1000,
+        mean_ms=statistics.fmean(timings) * 1000,
+        throughput_per_sec=iterations / total if total > 0 else float("inf"),
+        peak_memory_kib=peak / 1024,
+    )
+
+
+def _cycle(values: Sequence[Any]) -> Callable[[], Any]:
+    """呼び出すたびに次の値を返す関数を作る（末尾の次は先頭）."""
+    counter = count()
+    return lambda: values[next(counter) % len(values)]
+
+
+def run_benchmarks(
+    vault_path: Path,
+    spec: SyntheticVaultSpec,
+    iterations: int,
+    warmup: int = 1,
+) -> list[BenchmarkResult]:
+    """合成 Vault を生成して全ベンチマークを実行する.
+
+    Args:
+        vault_path: 合成 Vault を生成するディレクトリ
+        spec: 合成 Vault の規模
+        iterations: 各ベンチマークの計測回数
+        warmup: 各ベンチマークのウォームアップ回数
+
+    Returns:
+        計測結果のリスト
+    """
+    work_path = generate_synthetic_vault(vault_path, WORK_NAME, spec)
+    episodes = [episode_id(n) for n in range(1, spec.episodes + 1)]
+    texts = [
+        (work_path / "episodes" / f"{ep}.md").read_text(encoding="utf-8")
+        for ep in episodes
+    ]
+
+    builder = ContextBuilder(
+        vault_root=work_path,
+        work_name=WORK_NAME,
+        foreshadowing_reader=ForeshadowingRepository(vault_path, WORK_NAME),
+    )
+    foreshadowing_repo = ForeshadowingRepository(vault_path, WORK_NAME)
+    character_repo = CharacterRepository(work_path)
+    foreshadowings = foreshadowing_repo.list_all()
+    keywords = sorted(
+        {kw for fs in foreshadowings for kw in fs.ai_visibility.forbidden_keywords}
+    )
+
+    scenes = [
+        SceneIdentifier(
+            episode_id=episode_id(n), current_phase=phase_for_episode(n, spec.episodes)
+        )
+        for n in range(1, spec.episodes + 1)
+    ]
+    next_scene = _cycle(scenes)
+    next_text = _cycle(texts)
+
+    benchmarks: list[tuple[str, Callable[[], object]]] = [
+        ("context_builder.build_context", lambda: builder.build_context(next_scene())),
+        (
+            "expression_filter.check_forbidden_keywords",
+            lambda: check_forbidden_keywords(next_text(), keywords),
+        ),
+        ("foreshadowing_repository.list_all", foreshadowing_repo.list_all),
+        ("character_repository.list_all", character_repo.list_all),
+        ("timeline_index.build", lambda: TimelineIndex.build(foreshadowings)),
+        ("text_stats.compute_text_stats", lambda: compute_text_stats(next_text())),
+    ]
+    return [measure(name, func, iterations, warmup) for name, func in benchmarks]
+
+
+def compare_reports(
+    baseline: dict[str, Any], current: dict[str, Any]
+) -> dict[str, dict[str, float]]:
+    """2つのレポートの p50/p95 を比較する.
+
+    Args:
+        baseline: 比較元のレポート
+        current: 比較先のレポート
+
+    Returns:
+        ベンチマーク名 → {"p50_ratio", "p95_ratio"}（current / baseline、
+        1.0 未満なら高速化）。両方に存在するベンチマークのみ。
+    """
+    comparison: dict[str, dict[str, float]] = {}
+    for name, result in current.get("results", {}).items():
+        base = baseline.get("results", {}).get(name)
+        if not base or not base.get("p50_ms") or not base.get("p95_ms"):
+            continue
+        comparison[name] = {
+            "p50_ratio": result["p50_ms"] / base["p50_ms"],
+            "p95_ratio": result["p95_ms"] / base["p95_ms"],
+        }
+    return comparison
+
+
+def build_report(
+    spec: SyntheticVaultSpec, results: list[BenchmarkResult]
+) -> dict[str, Any]:
+    """計測結果を JSON レポートにまとめる.
+
+    Args:
+        spec: 合成 Vault の規模
+        results: 計測結果
+
+    Returns:
+        レポート dict
+    """
+    return {
+        "version": REPORT_VERSION,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "spec": spec.to_dict(),
+        "results": {r.name: r.to_dict() for r in results},
+    }
+
+
+def create_parser() -> argparse.ArgumentParser:
+    """ベンチマーク CLI のパーサーを構築する."""
+    defaults = SyntheticVaultSpec()
+    parser = argparse.ArgumentParser(
+        prog="novel-benchmarks",
+        description="合成 Vault によるパフォーマンス計測",
+    )
+    parser.add_argument("--episodes", type=int, default=defaults.episodes, help="エピソード数")
+    parser.add_argument("--characters", type=int, default=defaults.characters, help="キャラクター数")
+    parser.add_argument(
+        "--world-settings", type=int, default=defaults.world_settings, help="世界観設定数"
+    )
+    parser.add_argument(
+        "--foreshadowings", type=int, default=defaults.foreshadowings, help="伏線数"
+    )
+    parser.add_argument("--seed", type=int, default=defaults.seed, help="乱数シード")
+    parser.add_argument("--iterations", type=int, default=30, help="計測回数")
+    parser.add_argument("--warmup", type=int, default=1, help="ウォームアップ回数")
+    parser.add_argument(
+        "--vault-dir",
+        default=None,
+        help="合成 Vault の生成先（省略時は一時ディレクトリ、終了時に削除）",
+    )
+    parser.add_argument("--baseline", default=None, help="比較元の JSON レポート")
+    parser.add_argument("--output", default=None, help="出力先（省略時は標準出力）")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    """ベンチマーク CLI のエントリポイント.
+
+    Args:
+        argv: コマンドライン引数（None の場合は sys.argv）
+
+    Returns:
+        終了コード
+    """
+    parser = create_parser()
+    args = parser.parse_args(argv)
+
+    try:
+        spec = SyntheticVaultSpec(
+            episodes=args.episodes,
+            characters=args.characters,
+            world_settings=args.world_settings,
+            foreshadowings=args.foreshadowings,
+            seed=args.seed,
+        )
+        if args.vault_dir is not None:
+            results = run_benchmarks(Path(args.vault_dir), spec, args.iterations, args.warmup)
+        else:
+            with tempfile.TemporaryDirectory(prefix="novel-bench-") as tmp:
+                results = run_benchmarks(Path(tmp), spec, args.iterations, args.warmup)
+
+        report = build_report(spec, results)
+        if args.baseline is not None:
+            baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+            report["comparison"] = compare_reports(baseline, report)
+    except (OSError, ValueError) as e:
+        print(json.dumps({"error": str(e)}, ensure_ascii=False), file=sys.stderr)
+        return 1
+
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output is not None:
+        Path(args.output).write_text(output + "\n", encoding="utf-8")
+    else:
+        print(output)
+    return 0
@@ -0,0 +1,277 @@
+"""Synthetic vault generator.
+
+ベンチマーク用に、VaultInitializer のレイアウトに従った大規模な合成 Vault を
+生成する。乱数シードを固定するため、同じ仕様からは常に同じ Vault が得られる。
+"""
+
+import random
+from dataclasses import asdict, dataclass
+from datetime import date
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+from src.core.models.character import AIVisibilitySettings, Character, Phase
+from src.core.models.foreshadowing import (
+    Foreshadowing,
+    ForeshadowingAIVisibility,
+    ForeshadowingPayoff,
+    ForeshadowingSeed,
+    ForeshadowingStatus,
+    ForeshadowingType,
+    RelatedElements,
+    TimelineEntry,
+    TimelineInfo,
+)
+from src.core.models.world_setting import WorldSetting
+from src.core.repositories.character import CharacterRepository
+from src.core.repositories.foreshadowing import ForeshadowingRepository
+from src.core.repositories.world_setting import WorldSettingRepository
+from src.core.vault.init import VaultInitializer
+
+# 本文生成に使う語彙（文長・台詞率・語彙の多様性を持たせる）
+_NARRATION = [
+    "夜明け前の街は静まり返っていた",
+    "{name}は窓の外をじっと見つめた",
+    "遠くで鐘の音が三度響いた",
+    "石畳に残る足跡は東へ続いている",
+    "{name}は古い地図を広げ、指で道をなぞった",
+    "風が止み、港の灯りがひとつずつ消えていく",
+    "{place}の噂は旅人たちの間で囁かれていた",
+]
+_DIALOGUE = [
+    "「まだ間に合うはずだ」",
+    "「{name}、あの約束を覚えている？」",
+    "「{place}へ行くなら、夜を待ったほうがいい」",
+    "「答えはいつも足元にある」",
+]
+# ContextBuilder の既定フェーズ順に合わせる
+_PHASES = ["initial", "development", "climax"]
+
+
+@dataclass(frozen=True)
+class SyntheticVaultSpec:
+    """合成 Vault の規模.
+
+    Attributes:
+        episodes: エピソード数
+        characters: キャラクター数（フェーズと秘匿セクションを持つ）
+        world_settings: 世界観設定数
+        foreshadowings: 伏線数（タイムライン付き）
+        paragraphs: 1エピソードあたりの段落数
+        seed: 乱数シード
+    """
+
+    episodes: int = 100
+    characters: int = 50
+    world_settings: int = 30
+    foreshadowings: int = 200
+    paragraphs: int = 20
+    seed: int = 42
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON 出力用の dict を返す."""
+        return asdict(self)
+
+
+def episode_id(number: int) -> str:
+    """エピソード番号からエピソード ID を返す（例: 7 → "ep007"）."""
+    return f"ep{number:03d}"
+
+
+def character_name(number: int) -> str:
+    """キャラクター番号からキャラクター名を返す."""
+    return f"人物{number:03d}"
+
+
+def world_setting_name(number: int) -> str:
+    """世界観設定番号から設定名を返す."""
+    return f"設定{number:03d}"
+
+
+def phase_for_episode(number: int, episodes: int) -> str:
+    """エピソードが属するフェーズ名を返す（エピソード数を3等分）."""
+    third = max(1, episodes // 3)
+    return _PHASES[min(2, (number - 1) // third)]
+
+
+def _phase_ranges(episodes: int) -> list[Phase]:
+    """エピソード数を3等分したフェーズを返す."""
+    third = max(1, episodes // 3)
+    return [
+        Phase(name=_PHASES[0], episodes=f"1-{third}"),
+        Phase(name=_PHASES[1], episodes=f"{third + 1}-{third * 2}"),
+        Phase(name=_PHASES[2], episodes=f"{third * 2 + 1}-"),
+    ]
+
+
+def _episode_text(rng: random.Random, spec: SyntheticVaultSpec, number: int) -> str:
+    """エピソード本文を生成する（登場人物・設定へのリンクを含む）."""
+    cast = rng.sample(range(1, spec.characters + 1), k=min(4, spec.characters))
+    places = rng.sample(range(1, spec.world_settings + 1), k=min(2, spec.world_settings))
+    names = [character_name(n) for n in cast]
+    place_names = [world_setting_name(n) for n in places]
+
+    lines = [f"# 第{number}話", ""]
+    lines.extend(f"[[{name}]]" for name in names)
+    lines.extend(f"[[world/{place}]]" for place in place_names)
+    lines.append("")
+    for _ in range(spec.paragraphs):
+        template = rng.choice(_DIALOGUE if rng.random() < 0.3 else _NARRATION)
+        sentence = template.format(
+            name=rng.choice(names) if names else "誰か",
+            place=rng.choice(place_names) if place_names else "彼方",
+        )
+        lines.append(sentence + ("" if sentence.endswith("」") else "。"))
+    return "\n".join(lines) + "\n"
+
+
+def _make_character(rng: random.Random, spec: SyntheticVaultSpec, number: int) -> Character:
+    """フェーズと秘匿セクションを持つキャラクターを生成する."""
+    name = character_name(number)
+    sections = {
+        "基本情報": f"{name}は王都で育った{rng.randint(15, 60)}歳の旅人。",
+        "性格": "慎重だが、仲間のためなら危険を顧みない。",
+        **{
+            f"{phase}の動向": f"{name}は{phase}期に{rng.choice(['港', '森', '塔'])}を目指す。"
+            for phase in _PHASES
+        },
+        "秘密": f"<!-- ai_visibility: 0 -->\n{name}の出生には王家の秘密が関わっている。",
+    }
+    return Character(
+        name=name,
+        phases=_phase_ranges(spec.episodes),
+        current_phase=_PHASES[0],
+        ai_visibility=AIVisibilitySettings(default=3, hidden_section=0),
+        created=date(2024, 1, 1),
+        updated=date(2024, 1, 1),
+        tags=[rng.choice(["主要", "脇役", "敵対"])],
+        sections=sections,
+    )
+
+
+def _make_world_setting(
+    rng: random.Random, spec: SyntheticVaultSpec, number: int
+) -> WorldSetting:
+    """世界観設定を生成する."""
+    name = world_setting_name(number)
+    return WorldSetting(
+        name=name,
+        category=rng.choice(["Geography", "Magic System", "Organizations"]),
+        phases=_phase_ranges(spec.episodes),
+        current_phase=_PHASES[0],
+        ai_visibility=AIVisibilitySettings(default=3, hidden_section=0),
+        created=date(2024, 1, 1),
+        updated=date(2024, 1, 1),
+        sections={
+            "概要": f"{name}は大陸の{rng.choice(['北', '南', '東', '西'])}に位置する。",
+            "真相": f"<!-- ai_visibility: 0 -->\n{name}には封印された遺跡が眠っている。",
+        },
+    )
+
+
+def _make_foreshadowing(
+    rng: random.Random, spec: SyntheticVaultSpec, number: int
+) -> Foreshadowing:
+    """タイムライン付きの伏線を生成する."""
+    plant = rng.randint(1, spec.episodes)
+    payoff = min(spec.episodes, plant + rng.randint(5, 40))
+    status = rng.choice(list(ForeshadowingStatus))
+    reinforce = rng.sample(range(plant + 1, payoff + 1), k=min(3, payoff - plant))
+    events = [
+        TimelineEntry(
+            episode=episode_id(episode),
+            type=ForeshadowingStatus.PLANTED if i == 0 else ForeshadowingStatus.REINFORCED,
+            date=date(2024, 1, 1),
+            expression=f"伏線{number}の描写{i}",
+            subtlety=rng.randint(1, 10),
+        )
+        for i, episode in enumerate([plant, *sorted(reinforce)])
+    ]
+    return Foreshadowing(
+        id=f"FS-{plant:03d}-secret{number}",
+        title=f"伏線{number}",
+        fs_type=rng.choice(list(ForeshadowingType)),
+        status=status,
+        subtlety_level=rng.randint(1, 10),
+        ai_visibility=ForeshadowingAIVisibility(
+            level=rng.randint(0, 3),
+            forbidden_keywords=[f"禁句{number}"],
+        ),
+        seed=ForeshadowingSeed(content=f"伏線{number}の種"),
+        payoff=ForeshadowingPayoff(
+            content=f"伏線{number}の回収", planned_episode=episode_id(payoff)
+        ),
+        timeline=TimelineInfo(registered_at=date(2024, 1, 1), events=events),
+        related=RelatedElements(
+            characters=[character_name(rng.randint(1, max(1, spec.characters)))]
+        ),
+    )
+
+
+def generate_synthetic_vault(
+    vault_path: Path, work_name: str, spec: SyntheticVaultSpec
+) -> Path:
+    """合成 Vault を生成する.
+
+    VaultInitializer でディレクトリ構造を作成した上で、プロット・サマリー・
+    スタイルガイド・エピソード・キャラクター・世界観設定・伏線を書き込む。
+
+    Args:
+        vault_path: Vault のルートパス
+        work_name: 作品名
+        spec: 生成する Vault の規模
+
+    Returns:
+        作品ディレクトリのパス
+    """
+    initializer = VaultInitializer(vault_path, work_name)
+    initializer.initialize()
+    work_path = initializer.get_work_path()
+    rng = random.Random(spec.seed)
+
+    (work_path / "_plot" / "l1_theme.md").write_text(
+        "# テーマ\n\n失われた王家の記憶を巡る旅。\n", encoding="utf-8"
+    )
+    (work_path / "_summary" / "l1_overall.md").write_text(
+        "# 全体サマリー\n\n旅人たちが王都の秘密に迫る。\n", encoding="utf-8"
+    )
+    (work_path / "_style_guides" / "default.md").write_text(
+        "# 文体\n\n三人称・過去形。短い文を基本とする。\n", encoding="utf-8"
+    )
+
+    for number in range(1, spec.episodes + 1):
+        ep = episode_id(number)
+        text = _episode_text(rng, spec, number)
+        (work_path / "episodes" / f"{ep}.md").write_text(text, encoding="utf-8")
+        (work_path / "_plot" / f"l3_{ep}.md").write_text(
+            f"# {ep} の構成\n\n" + text.split("\n\n", 1)[0] + "\n", encoding="utf-8"
+        )
+        (work_path / "_summary" / f"l3_{ep}.md").write_text(
+            f"# {ep} のサマリー\n\n第{number}話の出来事。\n", encoding="utf-8"
+        )
+
+    character_repo = CharacterRepository(work_path)
+    for number in range(1, spec.characters + 1):
+        character_repo.create(_make_character(rng, spec, number))
+
+    world_repo = WorldSettingRepository(work_path)
+    for number in range(1, spec.world_settings + 1):
+        world_repo.create(_make_world_setting(rng, spec, number))
+
+    foreshadowing_repo = ForeshadowingRepository(vault_path, work_name)
+    with foreshadowing_repo.batch():
+        for number in range(1, spec.foreshadowings + 1):
+            foreshadowing_repo.create(_make_foreshadowing(rng, spec, number))
+
+    visibility = {
+        "version": "1.0",
+        "default_visibility": 3,
+        "global_forbidden_keywords": [f"禁句{n}" for n in range(1, 21)],
+    }
+    (work_path / "_ai_control" / "visibility.yaml").write_text(
+        yaml.dump(visibility, allow_unicode=True, sort_keys=False), encoding="utf-8"
+    )
+
+    return work_path
@@ -3,59 +3,129 @@
 This layer is responsible for building filtered context for AI agents.
 It integrates L2 services (visibility control, expression filter, foreshadowing manager)
 to construct the appropriate context for each scene.
+
+Public names are imported from their submodules on first access, so
+importing one light class does not load the whole layer.
 """
 
-# Phase F: Context Builder Facade
-from .context_builder import ContextBuilder, ContextBuildResult
+from typing import TYPE_CHECKING, Any
+
+from src.core.lazy_exports import load_export
+
+if TYPE_CHECKING:
+    # Phase F: Context Builder Facade
+    from .async_builder import AsyncContextBuilder
+    from .build_metrics import BuildHook, BuildMetrics
+    from .context_builder import ContextBuilder, ContextBuildResult
+
+    # Phase A: Data classes and protocols
+    from .context_integrator import ContextCollector, ContextIntegrator
+    from .filtered_context import FilteredContext
+    from .foreshadow_instruction import (
+        ForeshadowInstruction,
+        ForeshadowInstructions,
+        InstructionAction,
+    )
+    from .foreshadowing_checker import (
+        AlertSeverity,
+        AlertType,
+        EpisodeAudit,
+        ForeshadowingAlert,
+        ForeshadowingAudit,
+        PayoffApproaching,
+        PlantSuggestion,
+        ReinforceSuggestion,
+        SceneForeshadowingCheck,
+        SceneForeshadowingChecker,
+    )
+    from .instruction_generator import InstructionGenerator
+    from .lazy_loader import (
+        CacheEntry,
+        CacheValidation,
+        ContentType,
+        FileLazyLoader,
+        GracefulLoader,
+        GracefulLoadResult,
+        LazyLoadedContent,
+        LazyLoader,
+        LazyLoadResult,
+        LoadPriority,
+    )
+    from .phase_filter import (
+        CharacterPhaseFilter,
+        InvalidPhaseError,
+        PhaseFilter,
+        PhaseFilterError,
+        WorldSettingPhaseFilter,
+    )
+    from .process_batch import ProcessPoolContextBuilder
+    from .reference_scanner import Reference, ReferenceScanner
+    from .scene_identifier import SceneIdentifier
+    from .scene_resolver import ResolvedPaths, SceneResolver
+    from .scene_sources import SceneSources
+    from .visibility_context import VisibilityAwareContext, VisibilityHint
 
-# Phase A: Data classes and protocols
-from .context_integrator import ContextCollector, ContextIntegrator
-from .filtered_context import FilteredContext
-from .foreshadow_instruction import (
-    ForeshadowInstruction,
-    ForeshadowInstructions,
-    InstructionAction,
-)
-from .foreshadowing_checker import (
-    AlertSeverity,
-    AlertType,
-    ForeshadowingAlert,
-    PayoffApproaching,
-    PlantSuggestion,
-    ReinforceSuggestion,
-    SceneForeshadowingCheck,
-    SceneForeshadowingChecker,
-)
-from .instruction_generator import InstructionGenerator
-from .lazy_loader import (
-    CacheEntry,
-    ContentType,
-    FileLazyLoader,
-    GracefulLoader,
-    GracefulLoadResult,
-    LazyLoadedContent,
-    LazyLoader,
-    LazyLoadResult,
-    LoadPriority,
-)
-from .phase_filter import (
-    CharacterPhaseFilter,
-    InvalidPhaseError,
-    PhaseFilter,
-    PhaseFilterError,
-    WorldSettingPhaseFilter,
-)
-from .scene_identifier import SceneIdentifier
-from .scene_resolver import ResolvedPaths, SceneResolver
-from .visibility_context import VisibilityAwareContext, VisibilityHint
+    # Phase F: Write Facade
+    from .write_facade import (
+        DependencyNotConfiguredError,
+        WriteFacade,
+        WriteFacadeError,
+        WriteOperationError,
+    )
 
-# Phase F: Write Facade
-from .write_facade import (
-    DependencyNotConfiguredError,
-    WriteFacade,
-    WriteFacadeError,
-    WriteOperationError,
-)
+# Public name -> defining submodule (imported on first access)
+_EXPORTS: dict[str, str] = {
+    "AsyncContextBuilder": ".async_builder",
+    "BuildHook": ".build_metrics",
+    "BuildMetrics": ".build_metrics",
+    "ContextBuilder": ".context_builder",
+    "ContextBuildResult": ".context_builder",
+    "ContextCollector": ".context_integrator",
+    "ContextIntegrator": ".context_integrator",
+    "FilteredContext": ".filtered_context",
+    "ForeshadowInstruction": ".foreshadow_instruction",
+    "ForeshadowInstructions": ".foreshadow_instruction",
+    "InstructionAction": ".foreshadow_instruction",
+    "AlertSeverity": ".foreshadowing_checker",
+    "AlertType": ".foreshadowing_checker",
+    "EpisodeAudit": ".foreshadowing_checker",
+    "ForeshadowingAlert": ".foreshadowing_checker",
+    "ForeshadowingAudit": ".foreshadowing_checker",
+    "PayoffApproaching": ".foreshadowing_checker",
+    "PlantSuggestion": ".foreshadowing_checker",
+    "ReinforceSuggestion": ".foreshadowing_checker",
+    "SceneForeshadowingCheck": ".foreshadowing_checker",
+    "SceneForeshadowingChecker": ".foreshadowing_checker",
+    "InstructionGenerator": ".instruction_generator",
+    "CacheEntry": ".lazy_loader",
+    "CacheValidation": ".lazy_loader",
+    "ContentType": ".lazy_loader",
+    "FileLazyLoader": ".lazy_loader",
+    "GracefulLoader": ".lazy_loader",
+    "GracefulLoadResult": ".lazy_loader",
+    "LazyLoadedContent": ".lazy_loader",
+    "LazyLoader": ".lazy_loader",
+    "LazyLoadResult": ".lazy_loader",
+    "LoadPriority": ".lazy_loader",
+    "CharacterPhaseFilter": ".phase_filter",
+    "InvalidPhaseError": ".phase_filter",
+    "PhaseFilter": ".phase_filter",
+    "PhaseFilterError": ".phase_filter",
+    "WorldSettingPhaseFilter": ".phase_filter",
+    "ProcessPoolContextBuilder": ".process_batch",
+    "Reference": ".reference_scanner",
+    "ReferenceScanner": ".reference_scanner",
+    "SceneIdentifier": ".scene_identifier",
+    "ResolvedPaths": ".scene_resolver",
+    "SceneResolver": ".scene_resolver",
+    "SceneSources": ".scene_sources",
+    "VisibilityAwareContext": ".visibility_context",
+    "VisibilityHint": ".visibility_context",
+    "DependencyNotConfiguredError": ".write_facade",
+    "WriteFacade": ".write_facade",
+    "WriteFacadeError": ".write_facade",
+    "WriteOperationError": ".write_facade",
+}
 
 __all__ = [
     # Scene identification
@@ -63,8 +133,12 @@ __all__ = [
     # Scene resolution
     "ResolvedPaths",
     "SceneResolver",
+    "SceneSources",
+    "Reference",
+    "ReferenceScanner",
     # Lazy loading
     "CacheEntry",
+    "CacheValidation",
     "ContentType",
     "FileLazyLoader",
     "GracefulLoader",
@@ -89,7 +163,9 @@ __all__ = [
     # Foreshadowing checker (integrated check output)
     "AlertSeverity",
     "AlertType",
+    "EpisodeAudit",
     "ForeshadowingAlert",
+    "ForeshadowingAudit",
     "PayoffApproaching",
     "PlantSuggestion",
     "ReinforceSuggestion",
@@ -104,9 +180,24 @@ __all__ = [
     # Context Builder (L3-7 Facade)
     "ContextBuilder",
     "ContextBuildResult",
+    "ProcessPoolContextBuilder",
+    "AsyncContextBuilder",
+    # Build metrics
+    "BuildHook",
+    "BuildMetrics",
     # Write Facade (L3 Write Operations)
     "DependencyNotConfiguredError",
     "WriteFacade",
     "WriteFacadeError",
     "WriteOperationError",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public name from its submodule on first access."""
+    return load_export(__name__, _EXPORTS, name, globals())
+
+
+def __dir__() -> list[str]:
+    """List public names, including those not imported yet."""
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,199 @@
+"""Asynchronous facade for L3 context building.
+
+This module provides AsyncContextBuilder, which exposes ContextBuilder to
+async L4 orchestration. All blocking work (file reads, YAML parsing,
+collectors) runs on one bounded thread pool shared by every in-flight
+build, and the number of concurrent builds is limited by a semaphore, so
+awaiting many scenes does not cost one OS thread per build.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import contextvars
+import functools
+from collections.abc import Callable, Sequence
+from types import TracebackType
+from typing import TypeVar
+
+from .context_builder import ContextBuilder, ContextBuildResult
+from .foreshadow_instruction import ForeshadowInstructions
+from .scene_identifier import SceneIdentifier
+
+R = TypeVar("R")
+
+
+class AsyncContextBuilder:
+    """Async wrapper around ContextBuilder.
+
+    abuild_context() first prefetches the scene's files concurrently through
+    the I/O pool, then runs context integration and the foreshadowing
+    instruction / forbidden keyword chain concurrently, and finally applies
+    visibility filtering and hint collection. The result is identical to
+    ContextBuilder.build_context() for the same scene.
+
+    Attributes:
+        builder: The wrapped ContextBuilder (shared by all builds).
+        max_concurrency: Maximum number of builds in flight.
+        io_workers: Number of threads in the blocking I/O pool.
+
+    Examples:
+        >>> async with AsyncContextBuilder(ContextBuilder(Path("vault"))) as ab:
+        ...     results = await ab.abuild_context_batch(scenes)
+    """
+
+    DEFAULT_MAX_CONCURRENCY: int = 16
+    DEFAULT_IO_WORKERS: int = 8
+
+    def __init__(
+        self,
+        builder: ContextBuilder,
+        *,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        io_workers: int = DEFAULT_IO_WORKERS,
+    ) -> None:
+        """Initialize AsyncContextBuilder.
+
+        Args:
+            builder: ContextBuilder to run.
+            max_concurrency: Maximum number of builds in flight.
+            io_workers: Threads in the blocking I/O pool.
+
+        Raises:
+            ValueError: If max_concurrency or io_workers is less than 1.
+        """
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be >= 1, got {max_concurrency}")
+        if io_workers < 1:
+            raise ValueError(f"io_workers must be >= 1, got {io_workers}")
+        self.builder = builder
+        self.max_concurrency = max_concurrency
+        self.io_workers = io_workers
+        self._executor: concurrent.futures.ThreadPoolExecutor | None = None
+        self._semaphore: asyncio.Semaphore | None = None
+        self._semaphore_loop: asyncio.AbstractEventLoop | None = None
+
+    async def __aenter__(self) -> AsyncContextBuilder:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def _get_executor(self) -> concurrent.futures.ThreadPoolExecutor:
+        """Return the I/O pool, starting it on first use."""
+        if self._executor is None:
+            self._executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.io_workers, thread_name_prefix="context-io"
+            )
+        return self._executor
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Return the concurrency semaphore for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphore_loop = loop
+        return self._semaphore
+
+    async def _run(self, func: Callable[..., R], *args: object) -> R:
+        """Run a blocking call on the I/O pool.
+
+        The call runs in a copy of the current context, so build metrics
+        recorded on the pool thread reach the build that awaits it.
+
+        Args:
+            func: Blocking callable.
+            *args: Positional arguments.
+
+        Returns:
+            The callable's return value.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._get_executor(),
+            functools.partial(contextvars.copy_context().run, func, *args),
+        )
+
+    async def prefetch(self, scene: SceneIdentifier) -> None:
+        """Load the scene's files into the loader cache concurrently.
+
+        Args:
+            scene: The scene identifier.
+        """
+        identifiers = await self._run(self.builder.scene_files, scene)
+        await asyncio.gather(*(self._run(self.builder.preload, i) for i in identifiers))
+
+    async def _instructions_and_forbidden(
+        self, scene: SceneIdentifier
+    ) -> tuple[ForeshadowInstructions, list[str], list[str]]:
+        """Generate foreshadowing instructions, then forbidden keywords.
+
+        Forbidden keyword collection depends on the instructions, so the two
+        run in sequence, concurrently with context integration.
+
+        Returns:
+            Tuple of (instructions, forbidden keywords, warnings).
+        """
+        instructions = await self._run(self.builder.instructions_stage, scene)
+        keywords, warnings = await self._run(self.builder.forbidden_stage, scene)
+        return instructions, keywords, warnings
+
+    async def abuild_context(self, scene: SceneIdentifier) -> ContextBuildResult:
+        """Build complete context for a scene asynchronously.
+
+        Args:
+            scene: The scene identifier.
+
+        Returns:
+            Complete build result (same as ContextBuilder.build_context()).
+        """
+        async with self._get_semaphore():
+            with self.builder.metrics_scope(scene) as metrics:
+                await self.prefetch(scene)
+                (context, warnings, errors), (
+                    instructions,
+                    forbidden_keywords,
+                    forbidden_warnings,
+                ) = await asyncio.gather(
+                    self._run(self.builder.integrate_stage, scene),
+                    self._instructions_and_forbidden(scene),
+                )
+                warnings.extend(forbidden_warnings)
+                result = await self._run(
+                    self.builder.finish_build,
+                    scene,
+                    context,
+                    instructions,
+                    forbidden_keywords,
+                    warnings,
+                    errors,
+                )
+            result.metrics = metrics
+            return result
+
+    async def abuild_context_batch(
+        self, scenes: Sequence[SceneIdentifier]
+    ) -> list[ContextBuildResult]:
+        """Build many scenes concurrently (bounded by max_concurrency).
+
+        Args:
+            scenes: Scene identifiers to build.
+
+        Returns:
+            Build results in the same order as scenes.
+        """
+        return list(await asyncio.gather(*(self.abuild_context(s) for s in scenes)))
+
+    def close(self) -> None:
+        """Shut down the I/O pool (a later build starts a new one)."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        self._semaphore = None
+        self._semaphore_loop = None
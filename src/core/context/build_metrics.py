@@ -0,0 +1,262 @@
+"""Opt-in build metrics for L3 context building.
+
+This module records where the time of a context build goes: wall time per
+build stage and per context collector, files read, bytes read and loader
+cache hits/misses. Recording is scoped to one build with a ContextVar, so
+concurrent builds (threads or asyncio tasks) never mix their numbers, and
+instrumented code costs a single ContextVar lookup when no build is being
+recorded.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+from .scene_identifier import SceneIdentifier
+
+logger = logging.getLogger(__name__)
+
+# Build stages, in execution order
+STAGE_INTEGRATION = "integration"
+STAGE_FORESHADOW_INSTRUCTIONS = "foreshadow_instructions"
+STAGE_FORBIDDEN_KEYWORDS = "forbidden_keywords"
+STAGE_VISIBILITY_FILTERING = "visibility_filtering"
+STAGE_HINTS = "hints"
+
+BUILD_STAGES: tuple[str, ...] = (
+    STAGE_INTEGRATION,
+    STAGE_FORESHADOW_INSTRUCTIONS,
+    STAGE_FORBIDDEN_KEYWORDS,
+    STAGE_VISIBILITY_FILTERING,
+    STAGE_HINTS,
+)
+
+
+@dataclass
+class BuildMetrics:
+    """Metrics of a single context build.
+
+    Attributes:
+        total_ms: Wall time of the whole build in milliseconds.
+        stages_ms: Wall time per build stage in milliseconds.
+        collectors_ms: Wall time per context collector in milliseconds
+            (part of the integration stage).
+        files_read: Number of files read from disk.
+        bytes_read: Total size of the files read, in bytes.
+        cache_hits: Loader cache hits.
+        cache_misses: Loader cache misses.
+    """
+
+    total_ms: float = 0.0
+    stages_ms: dict[str, float] = field(default_factory=dict)
+    collectors_ms: dict[str, float] = field(default_factory=dict)
+    files_read: int = 0
+    bytes_read: int = 0
+    cache_hits: int = 0
+    cache_misses: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-serializable dict.
+
+        Returns:
+            Dictionary with the same keys as the attributes.
+        """
+        return asdict(self)
+
+    def format_breakdown(self) -> str:
+        """Format a human-readable timing breakdown.
+
+        Returns:
+            Multi-line text with one line per stage and collector.
+        """
+        lines = [f"total: {self.total_ms:.2f} ms"]
+        for stage, elapsed in self.stages_ms.items():
+            lines.append(f"  {stage}: {elapsed:.2f} ms")
+            if stage == STAGE_INTEGRATION:
+                for collector, collector_elapsed in self.collectors_ms.items():
+                    lines.append(f"    {collector}: {collector_elapsed:.2f} ms")
+        lines.append(
+            f"files read: {self.files_read} ({self.bytes_read} bytes), "
+            f"cache hits: {self.cache_hits}, misses: {self.cache_misses}"
+        )
+        return "\n".join(lines)
+
+
+class BuildHook:
+    """Receives build events as they happen.
+
+    Subclass and override the events of interest; every method is a no-op
+    by default. Exceptions raised by a hook are logged and ignored, so a
+    faulty hook never fails a build.
+    """
+
+    def on_stage(self, scene: SceneIdentifier, stage: str, elapsed_ms: float) -> None:
+        """Called when a build stage finishes.
+
+        Args:
+            scene: The scene being built.
+            stage: Stage name (one of BUILD_STAGES).
+            elapsed_ms: Wall time of the stage in milliseconds.
+        """
+
+    def on_collector(
+        self, scene: SceneIdentifier, collector: str, elapsed_ms: float
+    ) -> None:
+        """Called when a context collector finishes.
+
+        Args:
+            scene: The scene being built.
+            collector: Collector name (e.g. "plot", "character").
+            elapsed_ms: Wall time of the collector in milliseconds.
+        """
+
+    def on_file_read(self, scene: SceneIdentifier, identifier: str, size: int) -> None:
+        """Called when a file is read from disk (cache miss).
+
+        Args:
+            scene: The scene being built.
+            identifier: File path relative to the vault root.
+            size: File size in bytes.
+        """
+
+    def on_build_complete(self, scene: SceneIdentifier, metrics: BuildMetrics) -> None:
+        """Called when the build finishes.
+
+        Args:
+            scene: The scene that was built.
+            metrics: Complete metrics of the build.
+        """
+
+
+class _Recorder:
+    """Collects metrics for one build and forwards events to hooks."""
+
+    # Serializes updates from parallel collector threads
+    _lock = threading.Lock()
+
+    def __init__(self, scene: SceneIdentifier, hooks: Sequence[BuildHook]) -> None:
+        self.scene = scene
+        self.hooks = hooks
+        self.metrics = BuildMetrics()
+
+    def emit(self, event: str, *args: Any) -> None:
+        """Call an event method on every hook, logging hook failures."""
+        for hook in self.hooks:
+            try:
+                getattr(hook, event)(self.scene, *args)
+            except Exception:
+                logger.exception("Build hook %r failed on %s", hook, event)
+
+    def add_time(self, kind: str, name: str, elapsed_ms: float) -> None:
+        """Accumulate stage or collector wall time."""
+        target = (
+            self.metrics.stages_ms if kind == "stage" else self.metrics.collectors_ms
+        )
+        with self._lock:
+            target[name] = target.get(name, 0.0) + elapsed_ms
+        self.emit("on_stage" if kind == "stage" else "on_collector", name, elapsed_ms)
+
+
+_current_recorder: ContextVar[_Recorder | None] = ContextVar(
+    "context_build_recorder", default=None
+)
+
+
+@contextmanager
+def record_build(
+    scene: SceneIdentifier, hooks: Sequence[BuildHook] = ()
+) -> Iterator[BuildMetrics]:
+    """Record metrics for the build running inside the block.
+
+    Args:
+        scene: The scene being built.
+        hooks: Hooks that receive the build events.
+
+    Yields:
+        The metrics being recorded (total_ms is set when the block exits).
+    """
+    recorder = _Recorder(scene, hooks)
+    token = _current_recorder.set(recorder)
+    start = time.perf_counter()
+    try:
+        yield recorder.metrics
+    finally:
+        recorder.metrics.total_ms = (time.perf_counter() - start) * 1000
+        _current_recorder.reset(token)
+        recorder.emit("on_build_complete", recorder.metrics)
+
+
+@contextmanager
+def _measure(kind: str, name: str) -> Iterator[None]:
+    """Time the block as a stage or collector of the current build."""
+    recorder = _current_recorder.get()
+    if recorder is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        recorder.add_time(kind, name, (time.perf_counter() - start) * 1000)
+
+
+def measure_stage(name: str) -> Any:
+    """Time the block as a build stage (no-op outside record_build).
+
+    Args:
+        name: Stage name.
+
+    Returns:
+        Context manager.
+    """
+    return _measure("stage", name)
+
+
+def measure_collector(name: str) -> Any:
+    """Time the block as a context collector (no-op outside record_build).
+
+    Args:
+        name: Collector name.
+
+    Returns:
+        Context manager.
+    """
+    return _measure("collector", name)
+
+
+def record_cache_hit() -> None:
+    """Count a loader cache hit for the current build."""
+    recorder = _current_recorder.get()
+    if recorder is not None:
+        with recorder._lock:
+            recorder.metrics.cache_hits += 1
+
+
+def record_cache_miss() -> None:
+    """Count a loader cache miss for the current build."""
+    recorder = _current_recorder.get()
+    if recorder is not None:
+        with recorder._lock:
+            recorder.metrics.cache_misses += 1
+
+
+def record_file_read(identifier: str, size: int) -> None:
+    """Count a file read from disk for the current build.
+
+    Args:
+        identifier: File path relative to the vault root.
+        size: File size in bytes.
+    """
+    recorder = _current_recorder.get()
+    if recorder is not None:
+        with recorder._lock:
+            recorder.metrics.files_read += 1
+            recorder.metrics.bytes_read += size
+        recorder.emit("on_file_read", identifier, size)
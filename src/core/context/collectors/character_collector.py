@@ -9,10 +9,13 @@ from pathlib import Path
 
 from ...models.character import Character
 from ...parsers.frontmatter import ParseError, parse_frontmatter
+from ...repositories.entity_cache import CHARACTER_NAMESPACE, get_entity_cache
+from ...tracing import traced
 from ..lazy_loader import FileLazyLoader, LoadPriority
 from ..phase_filter import CharacterPhaseFilter
 from ..scene_identifier import SceneIdentifier
 from ..scene_resolver import SceneResolver
+from ..scene_sources import SceneSources
 
 
 @dataclass
@@ -80,33 +83,40 @@ class CharacterCollector:
         self.resolver = resolver
         self.phase_filter = phase_filter
 
-    def collect(self, scene: SceneIdentifier) -> CharacterContext:
+    @traced("collector")
+    def collect(
+        self, scene: SceneIdentifier, sources: SceneSources | None = None
+    ) -> CharacterContext:
         """Collect character context for a scene.
 
-        1. Load episode and plot_l3 files to get content.
-        2. Identify character files using resolver.
-        3. Load and parse each character file.
-        4. Apply phase filter to character data.
-        5. Convert to context string.
+        1. Identify character files (from sources, or by loading the
+           episode and plot_l3 files and scanning them).
+        2. Load and parse each character file.
+        3. Apply phase filter to character data.
+        4. Convert to context string.
 
         Args:
             scene: Scene identifier.
+            sources: Scene source bundle of the current build (optional).
 
         Returns:
             CharacterContext with collected characters and warnings.
         """
         context = CharacterContext()
 
-        # Load source files and identify characters
-        episode_content = self._load_file_content(
-            self.resolver.resolve_episode_path(scene)
-        )
-        _, _, plot_l3_path = self.resolver.resolve_plot_paths(scene)
-        plot_l3_content = self._load_file_content(plot_l3_path)
+        if sources is not None:
+            character_paths = sources.character_paths
+        else:
+            # Load source files and identify characters
+            episode_content = self._load_file_content(
+                self.resolver.resolve_episode_path(scene)
+            )
+            _, _, plot_l3_path = self.resolver.resolve_plot_paths(scene)
+            plot_l3_content = self._load_file_content(plot_l3_path)
 
-        character_paths = self.resolver.identify_characters(
-            scene, episode_content, plot_l3_content
-        )
+            character_paths = self.resolver.identify_characters(
+                scene, episode_content, plot_l3_content
+            )
 
         # Collect each character
         for path in character_paths:
@@ -150,8 +160,16 @@ class CharacterCollector:
                 context.warnings.append(f"キャラクター読み込み失敗: {path}")
                 return
 
-            # Parse character
-            character, parse_error = self._parse_character(path, result.data)
+            # Parse character (reuses the process-wide parsed-entity cache)
+            cache = get_entity_cache()
+            # Fingerprint of the content just loaded (not re-read from the loader)
+            fingerprint = result.fingerprint
+            character = cache.get(CHARACTER_NAMESPACE, path, fingerprint)
+            parse_error = None
+            if character is None:
+                character, parse_error = self._parse_character(path, result.data)
+                if character:
+                    cache.put(CHARACTER_NAMESPACE, path, fingerprint, character)
             if not character:
                 msg = f"キャラクターパース失敗: {path}"
                 if parse_error:
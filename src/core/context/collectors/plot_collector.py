@@ -8,8 +8,10 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from ...tracing import traced
 from ..lazy_loader import FileLazyLoader, LoadPriority
 from ..scene_identifier import SceneIdentifier
+from ..scene_sources import SceneSources
 
 if TYPE_CHECKING:
     from src.core.repositories.plot import PlotRepository
@@ -89,11 +91,16 @@ class PlotCollector:
         result = self.loader.load(path, priority)
         return result.data if result.success else None
 
-    def collect(self, scene: SceneIdentifier) -> PlotContext:
+    @traced("collector")
+    def collect(
+        self, scene: SceneIdentifier, sources: SceneSources | None = None
+    ) -> PlotContext:
         """Collect plot context.
 
         Args:
             scene: Scene identifier
+            sources: Scene source bundle of the current build (optional).
+                When given, L3 plot is taken from it instead of re-reading.
 
         Returns:
             Collected plot context
@@ -101,7 +108,9 @@ class PlotCollector:
         return PlotContext(
             l1_theme=self._collect_l1(),
             l2_chapter=self._collect_l2(scene),
-            l3_scene=self._collect_l3(scene),
+            l3_scene=(
+                sources.plot_l3_text if sources is not None else self._collect_l3(scene)
+            ),
         )
 
     def _collect_l1(self) -> str | None:
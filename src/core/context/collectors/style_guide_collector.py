@@ -7,6 +7,7 @@ style guide context from the vault.
 from dataclasses import dataclass
 from pathlib import Path
 
+from ...tracing import traced
 from ..lazy_loader import FileLazyLoader, LoadPriority
 from ..scene_identifier import SceneIdentifier
 
@@ -82,6 +83,7 @@ class StyleGuideCollector:
         result = self.loader.load(path, priority)
         return result.data if result.success else None
 
+    @traced("collector")
     def collect(self, scene: SceneIdentifier) -> StyleGuideContext:
         """Collect style guide.
 
@@ -8,6 +8,7 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from ...tracing import traced
 from ..lazy_loader import FileLazyLoader, LoadPriority
 from ..scene_identifier import SceneIdentifier
 
@@ -90,6 +91,7 @@ class SummaryCollector:
         result = self.loader.load(path, priority)
         return result.data if result.success else None
 
+    @traced("collector")
     def collect(self, scene: SceneIdentifier) -> SummaryContext:
         """Collect summary context.
 
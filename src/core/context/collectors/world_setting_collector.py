@@ -13,11 +13,14 @@ from src.core.models.character import AIVisibilitySettings, Phase
 from src.core.models.world_setting import WorldSetting
 from src.core.parsers.frontmatter import parse_frontmatter_with_fallback
 from src.core.parsers.markdown import extract_sections
+from src.core.repositories.entity_cache import get_entity_cache
+from src.core.tracing import traced
 
 from ..lazy_loader import FileLazyLoader, LoadPriority
 from ..phase_filter import WorldSettingPhaseFilter
 from ..scene_identifier import SceneIdentifier
 from ..scene_resolver import SceneResolver
+from ..scene_sources import SceneSources
 
 
 @dataclass
@@ -45,7 +48,8 @@ class WorldSettingCollector:
     """WorldSetting context collector.
 
     Collects WorldSetting contexts related to a scene,
-    applying Phase filtering.
+    applying Phase filtering. Parsed settings are kept in the process-wide
+    EntityCache until the source file changes.
 
     Attributes:
         vault_root: Vault root path.
@@ -54,6 +58,10 @@ class WorldSettingCollector:
         phase_filter: Phase filter for WorldSetting.
     """
 
+    # EntityCache namespace (sections are parsed from the body, unlike
+    # WorldSettingRepository, so parse results are not shared with it)
+    _CACHE_NAMESPACE = "WorldSetting:body_sections"
+
     def __init__(
         self,
         vault_root: Path,
@@ -74,16 +82,21 @@ class WorldSettingCollector:
         self.resolver = resolver
         self.phase_filter = phase_filter
 
-    def collect(self, scene: SceneIdentifier) -> WorldSettingContext:
+    @traced("collector")
+    def collect(
+        self, scene: SceneIdentifier, sources: SceneSources | None = None
+    ) -> WorldSettingContext:
         """Collect WorldSetting context.
 
-        1. Identify setting files related to the scene.
+        1. Identify setting files related to the scene (from sources, or by
+           loading the episode and plot_l3 files and scanning them).
         2. Load each setting file.
         3. Parse WorldSetting.
         4. Apply Phase filter.
 
         Args:
             scene: Scene identifier.
+            sources: Scene source bundle of the current build (optional).
 
         Returns:
             Collected WorldSetting context.
@@ -91,21 +104,37 @@ class WorldSettingCollector:
         context = WorldSettingContext()
 
         # Identify setting files
-        setting_paths = self.resolver.identify_world_settings(scene)
+        if sources is not None:
+            setting_paths = sources.world_setting_paths
+        else:
+            _, _, plot_l3_path = self.resolver.resolve_plot_paths(scene)
+            setting_paths = self.resolver.identify_world_settings(
+                scene,
+                self._load_file_content(self.resolver.resolve_episode_path(scene)),
+                self._load_file_content(plot_l3_path),
+            )
 
         for path in setting_paths:
             try:
                 # Load file
-                result = self.loader.load(
-                    str(path.relative_to(self.vault_root)),
-                    LoadPriority.REQUIRED,
-                )
+                rel_path = str(path.relative_to(self.vault_root))
+                result = self.loader.load(rel_path, LoadPriority.REQUIRED)
                 if not result.success or not result.data:
                     context.warnings.append(f"世界観設定読み込み失敗: {path}")
                     continue
 
-                # Parse
-                setting, parse_error = self._parse_world_setting(path, result.data)
+                # Parse (reuses the process-wide parsed-entity cache)
+                cache = get_entity_cache()
+                # Fingerprint of the content just loaded (not re-read from the loader)
+                fingerprint = result.fingerprint
+                setting = cache.get(self._CACHE_NAMESPACE, path, fingerprint)
+                parse_error = None
+                if setting is None:
+                    setting, parse_error = self._parse_world_setting(
+                        path, result.data
+                    )
+                    if setting:
+                        cache.put(self._CACHE_NAMESPACE, path, fingerprint, setting)
                 if not setting:
                     msg = f"世界観設定パース失敗: {path}"
                     if parse_error:
@@ -130,6 +159,24 @@ class WorldSettingCollector:
 
         return context
 
+    def _load_file_content(self, path: Path | None) -> str | None:
+        """Load a scene source file (episode or plot_l3).
+
+        Args:
+            path: File path, or None if file doesn't exist.
+
+        Returns:
+            File content, or None if loading failed or path is None.
+        """
+        if not path:
+            return None
+
+        rel_path = str(path.relative_to(self.vault_root))
+        result = self.loader.load(rel_path, LoadPriority.OPTIONAL)
+        if result.success and result.data:
+            return result.data
+        return None
+
     def _parse_world_setting(
         self, path: Path, content: str
     ) -> tuple[WorldSetting | None, str | None]:
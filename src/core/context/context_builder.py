@@ -11,13 +11,31 @@ Usage:
 
 from __future__ import annotations
 
+import copy
 import logging
+import threading
 from collections import OrderedDict
-from dataclasses import dataclass, field
+from collections.abc import Iterator, Sequence
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass, field, fields
 from pathlib import Path
 
+from src.core.services.keyword_matcher import KeywordStream, compile_keywords
 from src.core.services.visibility_controller import VisibilityController
-
+from src.core.tracing import traced
+from src.core.vault.index import VaultIndex
+
+from .build_metrics import (
+    STAGE_FORBIDDEN_KEYWORDS,
+    STAGE_FORESHADOW_INSTRUCTIONS,
+    STAGE_HINTS,
+    STAGE_INTEGRATION,
+    STAGE_VISIBILITY_FILTERING,
+    BuildHook,
+    BuildMetrics,
+    measure_stage,
+    record_build,
+)
 from .collectors.character_collector import CharacterCollector
 from .collectors.plot_collector import PlotCollector
 from .collectors.style_guide_collector import StyleGuideCollector
@@ -30,13 +48,19 @@ from .forbidden_keyword_collector import (
     ForbiddenKeywordResult,
 )
 from .foreshadow_instruction import ForeshadowInstructions, InstructionAction
-from .foreshadowing_identifier import ForeshadowingIdentifier, ForeshadowingReader
+from .foreshadowing_identifier import (
+    ForeshadowingIdentifier,
+    ForeshadowingReader,
+    ScopedForeshadowingReader,
+)
 from .hint_collector import HintCollection, HintCollector
 from .instruction_generator import InstructionGeneratorImpl
-from .lazy_loader import FileLazyLoader
+from .lazy_loader import FileLazyLoader, LoadPriority
 from .phase_filter import CharacterPhaseFilter, WorldSettingPhaseFilter
 from .scene_identifier import SceneIdentifier
 from .scene_resolver import SceneResolver
+from .scene_sources import SceneSources
+from .striped_locks import StripedLocks
 from .visibility_context import VisibilityAwareContext
 from .visibility_filtering import VisibilityFilteringService
 
@@ -58,6 +82,7 @@ class ContextBuildResult:
         success: Whether the build completed successfully.
         errors: List of error messages.
         warnings: List of warning messages.
+        metrics: Build metrics (None unless the builder collects metrics).
     """
 
     context: FilteredContext
@@ -68,6 +93,7 @@ class ContextBuildResult:
     success: bool = True
     errors: list[str] = field(default_factory=list)
     warnings: list[str] = field(default_factory=list)
+    metrics: BuildMetrics | None = field(default=None, compare=False)
 
     def has_errors(self) -> bool:
         """Check if any errors occurred during build.
@@ -102,6 +128,8 @@ class ContextBuilder:
         work_name: Name of the work (for foreshadowing).
         visibility_controller: Optional L2 visibility controller.
         foreshadowing_reader: Optional foreshadowing reader (Protocol).
+        collect_metrics: Attach per-stage BuildMetrics to every result.
+        hooks: Build hooks notified of stage timings and file reads.
 
     Examples:
         >>> builder = ContextBuilder(vault_root=Path("vault"))
@@ -128,6 +156,9 @@ class ContextBuilder:
         visibility_controller: VisibilityController | None = None,
         foreshadowing_reader: ForeshadowingReader | None = None,
         phase_order: list[str] | None = None,
+        vault_index: VaultIndex | None = None,
+        collect_metrics: bool = False,
+        hooks: Sequence[BuildHook] | None = None,
     ) -> None:
         """Initialize ContextBuilder with all components.
 
@@ -137,14 +168,22 @@ class ContextBuilder:
             visibility_controller: Optional L2 visibility controller.
             foreshadowing_reader: Optional foreshadowing reader (Protocol).
             phase_order: Ordered list of narrative phases. Uses defaults if None.
+            vault_index: Optional vault index used for entity lookups.
+            collect_metrics: Attach per-stage BuildMetrics to every result
+                (default: False; instrumentation is skipped when disabled
+                and no hooks are registered).
+            hooks: Build hooks notified of stage timings and file reads.
         """
         self._vault_root = vault_root
         self._work_name = work_name
         self._phase_order = phase_order or self._DEFAULT_PHASE_ORDER
+        self._collect_metrics = collect_metrics
+        self._hooks: list[BuildHook] = list(hooks or [])
 
         # Core infrastructure
         self._loader = FileLazyLoader(vault_root)
-        self._resolver = SceneResolver(vault_root)
+        self._vault_index = vault_index
+        self._resolver = SceneResolver(vault_root, vault_index)
 
         # Phase filters
         character_phase_filter = CharacterPhaseFilter(self._phase_order)
@@ -182,14 +221,16 @@ class ContextBuilder:
 
         # Foreshadowing (optional L2 dependency)
         self._foreshadowing_reader = foreshadowing_reader
+        self._scoped_reader: ScopedForeshadowingReader | None = None
         self._foreshadowing_identifier: ForeshadowingIdentifier | None = None
         self._instruction_generator: InstructionGeneratorImpl | None = None
         if foreshadowing_reader is not None:
+            self._scoped_reader = ScopedForeshadowingReader(foreshadowing_reader)
             self._foreshadowing_identifier = ForeshadowingIdentifier(
-                foreshadowing_reader
+                self._scoped_reader
             )
             self._instruction_generator = InstructionGeneratorImpl(
-                foreshadowing_reader, self._foreshadowing_identifier
+                self._scoped_reader, self._foreshadowing_identifier
             )
 
         # Caches (OrderedDict for LRU eviction with size limit)
@@ -198,6 +239,11 @@ class ContextBuilder:
         self._forbidden_result_cache: OrderedDict[str, ForbiddenKeywordResult] = (
             OrderedDict()
         )
+        # Guards cache updates when builds run concurrently (AsyncContextBuilder)
+        self._cache_lock = threading.Lock()
+        # Per-scene single-flight locks for cache misses
+        self._instruction_locks = StripedLocks()
+        self._forbidden_locks = StripedLocks()
 
     def _cache_put(self, cache: OrderedDict, key: str, value: object) -> None:  # type: ignore[type-arg]
         """Insert into a bounded cache, evicting oldest entry if full.
@@ -207,12 +253,73 @@ class ContextBuilder:
             key: Cache key.
             value: Value to cache.
         """
-        if key in cache:
-            cache.move_to_end(key)
-        cache[key] = value
-        while len(cache) > self._MAX_CACHE_SIZE:
-            cache.popitem(last=False)
+        with self._cache_lock:
+            if key in cache:
+                cache.move_to_end(key)
+            cache[key] = value
+            while len(cache) > self._MAX_CACHE_SIZE:
+                cache.popitem(last=False)
+
+    def add_hook(self, hook: BuildHook) -> None:
+        """Register a build hook.
+
+        Args:
+            hook: Hook notified of stage timings, file reads and build completion.
+        """
+        self._hooks.append(hook)
+
+    # --- Build stages ---
+    # build_context() runs these in order. They are public so that other
+    # drivers (AsyncContextBuilder) can schedule the same stages without
+    # depending on the builder's internals.
+
+    def scene_files(self, scene: SceneIdentifier) -> list[str]:
+        """List the vault files a build of this scene is going to read.
+
+        Args:
+            scene: The scene identifier.
+
+        Returns:
+            File paths relative to the vault root (existing scene files,
+            plus the optional AI control files).
+        """
+        paths = self._resolver.resolve_all(scene)
+        identifiers = [
+            Path(path).relative_to(self._vault_root).as_posix()
+            for path in (getattr(paths, f.name) for f in fields(paths))
+            if path is not None
+        ]
+        identifiers.extend(ForbiddenKeywordCollector.CONTROL_FILES)
+        return identifiers
+
+    def preload(self, identifier: str) -> None:
+        """Load a vault file into the loader cache ahead of a build.
+
+        Missing files are ignored.
+
+        Args:
+            identifier: File path relative to the vault root.
+        """
+        self._loader.load(identifier, LoadPriority.OPTIONAL)
 
+    @contextmanager
+    def metrics_scope(self, scene: SceneIdentifier) -> Iterator[BuildMetrics | None]:
+        """Record build metrics for the block when metrics or hooks are enabled.
+
+        Args:
+            scene: The scene being built.
+
+        Yields:
+            The metrics being recorded, or None when recording is disabled.
+            total_ms is only final once the block exits.
+        """
+        if not self._collect_metrics and not self._hooks:
+            yield None
+            return
+        with record_build(scene, tuple(self._hooks)) as metrics:
+            yield metrics if self._collect_metrics else None
+
+    @traced("build")
     def build_context(self, scene: SceneIdentifier) -> ContextBuildResult:
         """Build complete context for a scene.
 
@@ -225,53 +332,132 @@ class ContextBuilder:
         Returns:
             Complete build result with context, instructions, and metadata.
         """
-        warnings: list[str] = []
-        errors: list[str] = []
         logger.debug("Building context for scene %s:%s", scene.episode_id, scene.sequence_id)
 
-        # 1. Context integration (collect all context data)
-        try:
-            context, integration_warnings = self._integrator.integrate_with_warnings(
-                scene,
-                plot_collector=self._plot_collector,
-                summary_collector=self._summary_collector,
-                character_collector=self._character_collector,
-                world_collector=self._world_collector,
-                style_collector=self._style_collector,
+        with self.metrics_scope(scene) as metrics:
+            # 1. Context integration (collect all context data)
+            context, warnings, errors = self.integrate_stage(scene)
+
+            # 2. Foreshadowing instructions (optional)
+            foreshadow_instructions = self.instructions_stage(scene)
+
+            # 3. Forbidden keywords (uses cache via get_forbidden_keywords)
+            forbidden_keywords, forbidden_warnings = self.forbidden_stage(scene)
+            warnings.extend(forbidden_warnings)
+
+            # 4-5. Visibility filtering and hint collection
+            result = self.finish_build(
+                scene, context, foreshadow_instructions, forbidden_keywords, warnings, errors
             )
-            warnings.extend(integration_warnings)
-        except (OSError, ValueError, KeyError, TypeError) as e:
-            logger.error("Context integration failed: %s", e)
-            errors.append(f"Context integration failed: {e}")
-            context = FilteredContext()
+        result.metrics = metrics
+        return result
 
-        # 2. Foreshadowing instructions (optional)
-        foreshadow_instructions = self.get_foreshadow_instructions(scene)
+    def integrate_stage(
+        self, scene: SceneIdentifier
+    ) -> tuple[FilteredContext, list[str], list[str]]:
+        """Run context integration (build step 1).
 
-        # 3. Forbidden keywords (uses cache via get_forbidden_keywords)
-        try:
-            forbidden_keywords = self.get_forbidden_keywords(scene)
-        except (OSError, ValueError, KeyError, TypeError) as e:
-            logger.warning("Forbidden keyword collection failed: %s", e)
-            warnings.append(f"Forbidden keyword collection failed: {e}")
-            forbidden_keywords = []
+        Args:
+            scene: The scene identifier.
 
-        # 4. Visibility filtering (optional)
-        visibility_context: VisibilityAwareContext | None = None
-        if self._visibility_filtering_service is not None:
+        Returns:
+            Tuple of (context, warnings, errors).
+        """
+        warnings: list[str] = []
+        errors: list[str] = []
+        with ExitStack() as stack, measure_stage(STAGE_INTEGRATION):
+            if self._vault_index is not None:
+                # Check the index for added/deleted files once per scene
+                stack.enter_context(self._vault_index.batch())
             try:
-                visibility_context = (
-                    self._visibility_filtering_service.filter_context(context)
+                # Episode and L3 plot are read and scanned once for all collectors
+                sources = SceneSources.load(scene, self._resolver, self._loader)
+                context, integration_warnings = self._integrator.integrate_with_warnings(
+                    scene,
+                    sources=sources,
+                    plot_collector=self._plot_collector,
+                    summary_collector=self._summary_collector,
+                    character_collector=self._character_collector,
+                    world_collector=self._world_collector,
+                    style_collector=self._style_collector,
                 )
+                warnings.extend(integration_warnings)
             except (OSError, ValueError, KeyError, TypeError) as e:
-                logger.warning("Visibility filtering failed: %s", e)
-                warnings.append(f"Visibility filtering failed: {e}")
+                logger.error("Context integration failed: %s", e)
+                errors.append(f"Context integration failed: {e}")
+                context = FilteredContext()
+        return context, warnings, errors
+
+    def instructions_stage(self, scene: SceneIdentifier) -> ForeshadowInstructions:
+        """Generate foreshadowing instructions (build step 2).
+
+        Args:
+            scene: The scene identifier.
+
+        Returns:
+            Foreshadowing instructions for the scene.
+        """
+        with measure_stage(STAGE_FORESHADOW_INSTRUCTIONS):
+            return self.get_foreshadow_instructions(scene)
+
+    def forbidden_stage(self, scene: SceneIdentifier) -> tuple[list[str], list[str]]:
+        """Collect forbidden keywords (build step 3).
+
+        Args:
+            scene: The scene identifier.
+
+        Returns:
+            Tuple of (forbidden keywords, warnings).
+        """
+        with measure_stage(STAGE_FORBIDDEN_KEYWORDS):
+            try:
+                return self.get_forbidden_keywords(scene), []
+            except (OSError, ValueError, KeyError, TypeError) as e:
+                logger.warning("Forbidden keyword collection failed: %s", e)
+                return [], [f"Forbidden keyword collection failed: {e}"]
+
+    def finish_build(
+        self,
+        scene: SceneIdentifier,
+        context: FilteredContext,
+        foreshadow_instructions: ForeshadowInstructions,
+        forbidden_keywords: list[str],
+        warnings: list[str],
+        errors: list[str],
+    ) -> ContextBuildResult:
+        """Apply visibility filtering, collect hints and assemble the result.
+
+        Build steps 4-5, shared by the synchronous and asynchronous builders.
+
+        Args:
+            scene: The scene identifier.
+            context: Integrated context.
+            foreshadow_instructions: Foreshadowing instructions.
+            forbidden_keywords: Forbidden keywords.
+            warnings: Warnings collected so far (extended in place).
+            errors: Errors collected so far.
+
+        Returns:
+            Complete build result.
+        """
+        # 4. Visibility filtering (optional)
+        visibility_context: VisibilityAwareContext | None = None
+        if self._visibility_filtering_service is not None:
+            with measure_stage(STAGE_VISIBILITY_FILTERING):
+                try:
+                    visibility_context = (
+                        self._visibility_filtering_service.filter_context(context)
+                    )
+                except (OSError, ValueError, KeyError, TypeError) as e:
+                    logger.warning("Visibility filtering failed: %s", e)
+                    warnings.append(f"Visibility filtering failed: {e}")
 
         # 5. Hint collection
-        hints = self._hint_collector.collect_all(
-            visibility_context=visibility_context,
-            foreshadow_instructions=foreshadow_instructions,
-        )
+        with measure_stage(STAGE_HINTS):
+            hints = self._hint_collector.collect_all(
+                visibility_context=visibility_context,
+                foreshadow_instructions=foreshadow_instructions,
+            )
 
         success = len(errors) == 0
         if success:
@@ -290,6 +476,48 @@ class ContextBuilder:
             warnings=warnings,
         )
 
+    @traced("build")
+    def build_context_batch(
+        self, scenes: Sequence[SceneIdentifier]
+    ) -> list[ContextBuildResult]:
+        """Build complete context for many scenes at once.
+
+        Inputs shared across scenes are loaded once for the whole batch:
+        every vault file (L1 plot/summary, style guide, visibility.yaml, ...)
+        is read at most once and the foreshadowing registry is read once.
+        Duplicate scenes are built once. Each result is identical to what
+        build_context() returns for the same scene.
+
+        Args:
+            scenes: Scene identifiers to build.
+
+        Returns:
+            Build results in the same order as scenes. Each result is an
+            independent object, even for duplicate scenes.
+        """
+        built: dict[SceneIdentifier, ContextBuildResult] = {}
+        results: list[ContextBuildResult] = []
+
+        with ExitStack() as stack:
+            stack.enter_context(self._loader.snapshot())
+            if self._vault_index is not None:
+                stack.enter_context(self._vault_index.batch())
+            if self._scoped_reader is not None:
+                stack.enter_context(self._scoped_reader.scope())
+
+            for scene in scenes:
+                if scene in built:
+                    results.append(copy.deepcopy(built[scene]))
+                    continue
+                result = self.build_context(scene)
+                built[scene] = result
+                results.append(result)
+
+        logger.debug(
+            "Built context batch: %d scene(s), %d unique", len(results), len(built)
+        )
+        return results
+
     def build_context_simple(self, scene: SceneIdentifier) -> FilteredContext:
         """Build context and return only the FilteredContext.
 
@@ -319,10 +547,33 @@ class ContextBuilder:
         """
         cache_key = f"{scene.episode_id}:{scene.sequence_id}"
 
-        if use_cache and cache_key in self._instruction_cache:
+        if not use_cache:
+            return self._generate_instructions(scene, cache_key)
+
+        cached = self._instruction_cache.get(cache_key)
+        if cached is not None:
             logger.debug("Instruction cache hit for %s", cache_key)
-            return self._instruction_cache[cache_key]
+            return cached
+
+        # Single-flight: concurrent builds of the same scene generate once
+        with self._instruction_locks.lock_for(cache_key):
+            cached = self._instruction_cache.get(cache_key)
+            if cached is not None:
+                return cached
+            return self._generate_instructions(scene, cache_key)
 
+    def _generate_instructions(
+        self, scene: SceneIdentifier, cache_key: str
+    ) -> ForeshadowInstructions:
+        """Generate foreshadowing instructions and cache them.
+
+        Args:
+            scene: The scene identifier.
+            cache_key: Instruction cache key of the scene.
+
+        Returns:
+            Foreshadowing instructions.
+        """
         if self._instruction_generator is None:
             instructions = ForeshadowInstructions()
         else:
@@ -354,10 +605,33 @@ class ContextBuilder:
         """
         cache_key = f"{scene.episode_id}:{scene.sequence_id}"
 
-        if use_cache and cache_key in self._forbidden_cache:
+        if not use_cache:
+            return self._collect_forbidden_keywords(scene, cache_key)
+
+        cached_keywords = self._forbidden_cache.get(cache_key)
+        if cached_keywords is not None:
             logger.debug("Forbidden keyword cache hit for %s", cache_key)
-            return self._forbidden_cache[cache_key]
+            return cached_keywords
 
+        # Single-flight: concurrent builds of the same scene collect once
+        with self._forbidden_locks.lock_for(cache_key):
+            cached_keywords = self._forbidden_cache.get(cache_key)
+            if cached_keywords is not None:
+                return cached_keywords
+            return self._collect_forbidden_keywords(scene, cache_key)
+
+    def _collect_forbidden_keywords(
+        self, scene: SceneIdentifier, cache_key: str
+    ) -> list[str]:
+        """Collect forbidden keywords and cache them with their sources.
+
+        Args:
+            scene: The scene identifier.
+            cache_key: Forbidden keyword cache key of the scene.
+
+        Returns:
+            List of forbidden keywords (sorted, deduplicated).
+        """
         # Stage 1: ForbiddenKeywordCollector (4 sources)
         foreshadow_instructions = self.get_foreshadow_instructions(scene)
         result = self._forbidden_keyword_collector.collect(scene, foreshadow_instructions)
@@ -510,6 +784,9 @@ class ContextBuilder:
     ) -> list[str]:
         """Check text for forbidden keywords.
 
+        The keyword set is compiled into a multi-pattern matcher (cached by
+        content hash), so the text is scanned once regardless of keyword count.
+
         Args:
             scene: The scene identifier.
             text: The text to check.
@@ -518,7 +795,23 @@ class ContextBuilder:
             List of forbidden keywords found in the text.
         """
         keywords = self.get_forbidden_keywords(scene)
-        return [kw for kw in keywords if kw in text]
+        found = compile_keywords(keywords).find_keywords(text)
+        return [kw for kw in keywords if kw in found]
+
+    def create_forbidden_keyword_stream(self, scene: SceneIdentifier) -> KeywordStream:
+        """Create an incremental forbidden keyword detector for a scene.
+
+        Feed the generated text chunk by chunk; each feed() returns the
+        keywords completed by that chunk, so generation can be aborted on
+        the first violation instead of after the whole draft is written.
+
+        Args:
+            scene: The scene identifier.
+
+        Returns:
+            A fresh KeywordStream over get_forbidden_keywords(scene).
+        """
+        return compile_keywords(self.get_forbidden_keywords(scene)).stream()
 
     def is_text_clean(self, scene: SceneIdentifier, text: str) -> bool:
         """Check if text contains no forbidden keywords.
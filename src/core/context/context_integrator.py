@@ -4,15 +4,18 @@ This module defines protocols for collecting and integrating
 various context elements (plot, summary, characters, etc.).
 """
 
+import contextvars
 from pathlib import Path
 from typing import Any, Protocol
 
+from .build_metrics import measure_collector
 from .collectors.character_collector import CharacterContext
 from .collectors.plot_collector import PlotContext
 from .collectors.summary_collector import SummaryContext
 from .collectors.world_setting_collector import WorldSettingContext
 from .filtered_context import FilteredContext
 from .scene_identifier import SceneIdentifier
+from .scene_sources import SceneSources
 
 
 class ContextCollector(Protocol):
@@ -56,6 +59,7 @@ class ContextIntegrator(Protocol):
         character_collector: ContextCollector | None = None,
         world_collector: ContextCollector | None = None,
         style_collector: ContextCollector | None = None,
+        sources: SceneSources | None = None,
     ) -> FilteredContext:
         """Integrate context from multiple collectors.
 
@@ -66,6 +70,7 @@ class ContextIntegrator(Protocol):
             character_collector: Collector for character context.
             world_collector: Collector for world setting context.
             style_collector: Collector for style guide context.
+            sources: Scene source bundle shared by collectors (optional).
 
         Returns:
             Integrated FilteredContext.
@@ -81,7 +86,8 @@ class ContextIntegrator(Protocol):
 
         Args:
             scene: The scene identifier.
-            **collectors: Named collectors.
+            **collectors: Named collectors, plus an optional "sources"
+                scene source bundle.
 
         Returns:
             Tuple of (FilteredContext, list of warning messages).
@@ -126,6 +132,7 @@ class ContextIntegratorImpl:
         character_collector: ContextCollector | None = None,
         world_collector: ContextCollector | None = None,
         style_collector: ContextCollector | None = None,
+        sources: SceneSources | None = None,
     ) -> FilteredContext:
         """Integrate context from multiple collectors.
 
@@ -136,6 +143,8 @@ class ContextIntegratorImpl:
             character_collector: Collector for character context.
             world_collector: Collector for world setting context.
             style_collector: Collector for style guide context.
+            sources: Scene source bundle shared by the plot, character and
+                world setting collectors (optional).
 
         Returns:
             Integrated FilteredContext.
@@ -154,6 +163,7 @@ class ContextIntegratorImpl:
                 character_collector=character_collector,
                 world_collector=world_collector,
                 style_collector=style_collector,
+                sources=sources,
             )
         else:
             self._integrate_sequential(
@@ -164,6 +174,7 @@ class ContextIntegratorImpl:
                 character_collector=character_collector,
                 world_collector=world_collector,
                 style_collector=style_collector,
+                sources=sources,
             )
 
         return ctx
@@ -178,18 +189,24 @@ class ContextIntegratorImpl:
         character_collector: ContextCollector | None = None,
         world_collector: ContextCollector | None = None,
         style_collector: ContextCollector | None = None,
+        sources: SceneSources | None = None,
     ) -> None:
         """Integrate collectors sequentially (original behavior)."""
         if plot_collector is not None:
-            self._integrate_plot(ctx, plot_collector, scene)
+            with measure_collector("plot"):
+                self._integrate_plot(ctx, plot_collector, scene, sources)
         if summary_collector is not None:
-            self._integrate_summary(ctx, summary_collector, scene)
+            with measure_collector("summary"):
+                self._integrate_summary(ctx, summary_collector, scene)
         if character_collector is not None:
-            self._integrate_character(ctx, character_collector, scene)
+            with measure_collector("character"):
+                self._integrate_character(ctx, character_collector, scene, sources)
         if world_collector is not None:
-            self._integrate_world_setting(ctx, world_collector, scene)
+            with measure_collector("world"):
+                self._integrate_world_setting(ctx, world_collector, scene, sources)
         if style_collector is not None:
-            ctx.style_guide = style_collector.collect_as_string(scene)
+            with measure_collector("style"):
+                ctx.style_guide = style_collector.collect_as_string(scene)
 
     def _integrate_parallel(
         self,
@@ -201,6 +218,7 @@ class ContextIntegratorImpl:
         character_collector: ContextCollector | None = None,
         world_collector: ContextCollector | None = None,
         style_collector: ContextCollector | None = None,
+        sources: SceneSources | None = None,
     ) -> None:
         """Integrate collectors in parallel using ThreadPoolExecutor.
 
@@ -230,8 +248,15 @@ class ContextIntegratorImpl:
         ) as executor:
             futures: dict[str, concurrent.futures.Future[FilteredContext]] = {}
             for name, collector in collectors.items():
+                # Run in a copy of the caller's context so build metrics
+                # recorded by the collector reach the current build
                 futures[name] = executor.submit(
-                    self._run_collector_isolated, name, collector, scene
+                    contextvars.copy_context().run,
+                    self._run_collector_isolated,
+                    name,
+                    collector,
+                    scene,
+                    sources,
                 )
 
             for name, future in futures.items():
@@ -264,6 +289,7 @@ class ContextIntegratorImpl:
         name: str,
         collector: ContextCollector,
         scene: SceneIdentifier,
+        sources: SceneSources | None = None,
     ) -> FilteredContext:
         """Run a single collector and return an isolated FilteredContext.
 
@@ -274,23 +300,43 @@ class ContextIntegratorImpl:
             scene_id=scene.episode_id,
             current_phase=scene.current_phase,
         )
-        if name == "plot":
-            self._integrate_plot(local_ctx, collector, scene)
-        elif name == "summary":
-            self._integrate_summary(local_ctx, collector, scene)
-        elif name == "character":
-            self._integrate_character(local_ctx, collector, scene)
-        elif name == "world":
-            self._integrate_world_setting(local_ctx, collector, scene)
-        elif name == "style":
-            local_ctx.style_guide = collector.collect_as_string(scene)
+        with measure_collector(name):
+            if name == "plot":
+                self._integrate_plot(local_ctx, collector, scene, sources)
+            elif name == "summary":
+                self._integrate_summary(local_ctx, collector, scene)
+            elif name == "character":
+                self._integrate_character(local_ctx, collector, scene, sources)
+            elif name == "world":
+                self._integrate_world_setting(local_ctx, collector, scene, sources)
+            elif name == "style":
+                local_ctx.style_guide = collector.collect_as_string(scene)
         return local_ctx
 
+    @staticmethod
+    def _collect(
+        collector: Any, scene: SceneIdentifier, sources: SceneSources | None
+    ) -> Any:
+        """Call collector.collect(), passing the scene source bundle if given.
+
+        Args:
+            collector: Collector with a collect() method.
+            scene: The scene identifier.
+            sources: Scene source bundle, or None.
+
+        Returns:
+            The collector's result.
+        """
+        if sources is None:
+            return collector.collect(scene)
+        return collector.collect(scene, sources=sources)
+
     def _integrate_plot(
         self,
         ctx: FilteredContext,
         collector: ContextCollector,
         scene: SceneIdentifier,
+        sources: SceneSources | None = None,
     ) -> None:
         """Integrate plot context into FilteredContext.
 
@@ -298,10 +344,11 @@ class ContextIntegratorImpl:
             ctx: The FilteredContext to update.
             collector: The plot collector.
             scene: The scene identifier.
+            sources: Scene source bundle (optional).
         """
         # Check if collector has collect method returning PlotContext
         if hasattr(collector, "collect") and callable(collector.collect):
-            result = collector.collect(scene)
+            result = self._collect(collector, scene, sources)
             if isinstance(result, PlotContext):
                 ctx.plot_l1 = result.l1_theme
                 ctx.plot_l2 = result.l2_chapter
@@ -345,6 +392,7 @@ class ContextIntegratorImpl:
         ctx: FilteredContext,
         collector: ContextCollector,
         scene: SceneIdentifier,
+        sources: SceneSources | None = None,
     ) -> None:
         """Integrate character context into FilteredContext.
 
@@ -352,10 +400,11 @@ class ContextIntegratorImpl:
             ctx: The FilteredContext to update.
             collector: The character collector.
             scene: The scene identifier.
+            sources: Scene source bundle (optional).
         """
         # Check if collector has collect method returning CharacterContext
         if hasattr(collector, "collect") and callable(collector.collect):
-            result = collector.collect(scene)
+            result = self._collect(collector, scene, sources)
             if isinstance(result, CharacterContext):
                 # Store each character with its own key
                 for char_name, char_content in result.characters.items():
@@ -374,6 +423,7 @@ class ContextIntegratorImpl:
         ctx: FilteredContext,
         collector: ContextCollector,
         scene: SceneIdentifier,
+        sources: SceneSources | None = None,
     ) -> None:
         """Integrate world setting context into FilteredContext.
 
@@ -381,10 +431,11 @@ class ContextIntegratorImpl:
             ctx: The FilteredContext to update.
             collector: The world setting collector.
             scene: The scene identifier.
+            sources: Scene source bundle (optional).
         """
         # Check if collector has collect method returning WorldSettingContext
         if hasattr(collector, "collect") and callable(collector.collect):
-            result = collector.collect(scene)
+            result = self._collect(collector, scene, sources)
             if isinstance(result, WorldSettingContext):
                 # Store each setting with its own key
                 for setting_name, setting_content in result.settings.items():
@@ -407,7 +458,8 @@ class ContextIntegratorImpl:
 
         Args:
             scene: The scene identifier.
-            **collectors: Named collectors.
+            **collectors: Named collectors, plus an optional "sources"
+                scene source bundle.
 
         Returns:
             Tuple of (FilteredContext, list of warning messages).
@@ -421,6 +473,7 @@ class ContextIntegratorImpl:
             character_collector=collectors.get("character_collector"),
             world_collector=collectors.get("world_collector"),
             style_collector=collectors.get("style_collector"),
+            sources=collectors.get("sources"),
         )
 
         # Collect warnings from context
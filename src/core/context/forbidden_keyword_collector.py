@@ -10,7 +10,10 @@ This module collects forbidden keywords from multiple sources:
 from dataclasses import dataclass, field
 from pathlib import Path
 
-import yaml
+from src.core.services.visibility_policy import (
+    VisibilityPolicy,
+    compile_visibility_policy,
+)
 
 from .foreshadow_instruction import ForeshadowInstructions
 from .lazy_loader import FileLazyLoader, LoadPriority
@@ -63,6 +66,8 @@ class ForbiddenKeywordCollector:
     # File paths relative to vault root
     _VISIBILITY_FILE = "_ai_control/visibility.yaml"
     _FORBIDDEN_FILE = "_ai_control/forbidden_keywords.txt"
+    # AI control files read by collect() (for prefetching)
+    CONTROL_FILES: tuple[str, ...] = (_VISIBILITY_FILE, _FORBIDDEN_FILE)
 
     def __init__(
         self,
@@ -77,6 +82,30 @@ class ForbiddenKeywordCollector:
         """
         self.vault_root = vault_root
         self.loader = loader
+        # Last loaded visibility.yaml (raw content, compiled policy)
+        self._visibility_policy: tuple[str, VisibilityPolicy] | None = None
+
+    def _load_policy(self) -> VisibilityPolicy | None:
+        """Load visibility.yaml as a compiled policy.
+
+        The policy is compiled once per file content (see
+        compile_visibility_policy), so both visibility sources are plain
+        attribute lookups on the shared policy.
+
+        Returns:
+            Compiled policy, or None if the file is missing or empty.
+        """
+        load_result = self.loader.load(self._VISIBILITY_FILE, LoadPriority.OPTIONAL)
+        if not load_result.success or not load_result.data:
+            return None
+
+        raw = load_result.data
+        if self._visibility_policy is not None and self._visibility_policy[0] == raw:
+            return self._visibility_policy[1]
+
+        policy = compile_visibility_policy(raw)
+        self._visibility_policy = (raw, policy)
+        return policy
 
     def collect(
         self,
@@ -141,20 +170,8 @@ class ForbiddenKeywordCollector:
         Returns:
             List of forbidden keywords from visibility settings.
         """
-        load_result = self.loader.load(self._VISIBILITY_FILE, LoadPriority.OPTIONAL)
-        if not load_result.success or not load_result.data:
-            return []
-
-        try:
-            data = yaml.safe_load(load_result.data)
-            if data and isinstance(data, dict):
-                keywords = data.get("global_forbidden_keywords", [])
-                if isinstance(keywords, list):
-                    return [str(k) for k in keywords if k]
-        except yaml.YAMLError:
-            pass
-
-        return []
+        policy = self._load_policy()
+        return list(policy.global_keywords) if policy else []
 
     def _collect_from_global(self) -> list[str]:
         """Collect from forbidden_keywords.txt.
@@ -178,32 +195,10 @@ class ForbiddenKeywordCollector:
     def _collect_from_entity_visibility(self) -> list[str]:
         """Collect from visibility.yaml entity-specific forbidden keywords.
 
-        Parses entities[*].sections[*].forbidden_keywords from visibility.yaml.
+        Uses entities[*].sections[*].forbidden_keywords from visibility.yaml.
 
         Returns:
             List of entity-specific forbidden keywords.
         """
-        load_result = self.loader.load(self._VISIBILITY_FILE, LoadPriority.OPTIONAL)
-        if not load_result.success or not load_result.data:
-            return []
-
-        try:
-            data = yaml.safe_load(load_result.data)
-            if not data or not isinstance(data, dict):
-                return []
-
-            keywords: list[str] = []
-            entities = data.get("entities", [])
-            if isinstance(entities, list):
-                for entity in entities:
-                    if isinstance(entity, dict):
-                        sections = entity.get("sections", [])
-                        if isinstance(sections, list):
-                            for section in sections:
-                                if isinstance(section, dict):
-                                    fk = section.get("forbidden_keywords", [])
-                                    if isinstance(fk, list):
-                                        keywords.extend(str(k) for k in fk if k)
-            return keywords
-        except yaml.YAMLError:
-            return []
+        policy = self._load_policy()
+        return list(policy.entity_keywords) if policy else []
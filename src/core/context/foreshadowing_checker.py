@@ -3,18 +3,22 @@
 仕様 Section 4.5 check_foreshadowing_for_scene の統合出力実装。
 """
 
+import bisect
 import re
-from dataclasses import dataclass, field
+from collections.abc import Mapping
+from contextlib import AbstractContextManager, nullcontext
+from dataclasses import asdict, dataclass, field
 from enum import Enum
 from typing import Any
 
-from src.core.models.foreshadowing import ForeshadowingStatus
+from src.core.models.foreshadowing import Foreshadowing, ForeshadowingStatus
 
 from .foreshadow_instruction import ForeshadowInstruction, InstructionAction
 from .foreshadowing_identifier import (
     ForeshadowingIdentifier,
     ForeshadowingReader,
     IdentifiedForeshadowing,
+    ScopedForeshadowingReader,
 )
 from .instruction_generator import InstructionGeneratorImpl
 from .scene_identifier import SceneIdentifier
@@ -142,10 +146,71 @@ class SceneForeshadowingCheck:
         return [a for a in self.alerts if a.severity == AlertSeverity.CRITICAL]
 
 
+def _to_json_value(items: list[tuple[str, Any]]) -> dict[str, Any]:
+    """dict_factory for asdict() that serializes enums by value."""
+    return {
+        key: value.value if isinstance(value, Enum) else value for key, value in items
+    }
+
+
+@dataclass
+class EpisodeAudit:
+    """Foreshadowing report of one episode in a series-wide audit.
+
+    Same contents as SceneForeshadowingCheck (without active instructions),
+    with REINFORCE and HINT suggestions reported separately.
+    """
+
+    episode_id: str
+    plant: list[PlantSuggestion] = field(default_factory=list)
+    reinforce: list[ReinforceSuggestion] = field(default_factory=list)
+    hint: list[ReinforceSuggestion] = field(default_factory=list)
+    payoff: list[PayoffApproaching] = field(default_factory=list)
+    silence: list[ForeshadowingAlert] = field(default_factory=list)
+
+    @property
+    def has_reports(self) -> bool:
+        """Check if the episode has any suggestion or alert."""
+        return bool(
+            self.plant or self.reinforce or self.hint or self.payoff or self.silence
+        )
+
+
+@dataclass
+class ForeshadowingAudit:
+    """Series-wide foreshadowing audit over an episode range.
+
+    Result of SceneForeshadowingChecker.audit_range().
+    """
+
+    start_episode: str
+    end_episode: str
+    episodes: list[EpisodeAudit] = field(default_factory=list)
+
+    def get(self, episode_id: str) -> EpisodeAudit | None:
+        """Get the report of an episode (by its zero-padded ID)."""
+        for episode in self.episodes:
+            if episode.episode_id == episode_id:
+                return episode
+        return None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-serializable dict (enums as values)."""
+        return asdict(self, dict_factory=_to_json_value)
+
+
 class SceneForeshadowingChecker:
     """Scene foreshadowing checker for integrated check output.
 
     仕様 Section 4.5 check_foreshadowing_for_scene の統合チェッカー。
+
+    reader が ScopedForeshadowingReader の場合、check() 1 回の間は
+    レジストリのスナップショットを固定する。from_reader() で生成すると
+    identifier・generator・checker が同じスナップショットを共有し、
+    1 シーンのチェックでレジストリの読み込みは 1 回になる。
+
+    巻単位の計画には audit_range() を使う。タイムラインと回収予定を
+    1 回だけソートし、エピソード範囲を 1 回の走査で処理する。
     """
 
     # Pattern to extract episode number from episode ID
@@ -168,6 +233,29 @@ class SceneForeshadowingChecker:
         self.generator = instruction_generator
         self.reader = foreshadowing_reader
 
+    @classmethod
+    def from_reader(
+        cls, foreshadowing_reader: ForeshadowingReader
+    ) -> "SceneForeshadowingChecker":
+        """Create a checker whose components share one scoped reader.
+
+        Args:
+            foreshadowing_reader: Foreshadowing reader instance.
+
+        Returns:
+            SceneForeshadowingChecker using a per-check registry snapshot.
+        """
+        scoped = ScopedForeshadowingReader(foreshadowing_reader)
+        identifier = ForeshadowingIdentifier(scoped)
+        generator = InstructionGeneratorImpl(scoped, identifier)
+        return cls(identifier, generator, scoped)
+
+    def _snapshot_scope(self) -> AbstractContextManager[None]:
+        """Pin the registry snapshot for one check (if the reader supports it)."""
+        if isinstance(self.reader, ScopedForeshadowingReader):
+            return self.reader.scope()
+        return nullcontext()
+
     def check(
         self,
         scene: SceneIdentifier,
@@ -189,21 +277,42 @@ class SceneForeshadowingChecker:
         Returns:
             Integrated foreshadowing check result.
         """
+        with self._snapshot_scope():
+            return self._check(
+                scene, appearing_characters, silence_threshold, payoff_threshold
+            )
+
+    def _check(
+        self,
+        scene: SceneIdentifier,
+        appearing_characters: list[str] | None,
+        silence_threshold: int,
+        payoff_threshold: int,
+    ) -> SceneForeshadowingCheck:
+        """Execute the check (see check())."""
         result = SceneForeshadowingCheck(episode_id=scene.episode_id)
 
         # 1. ForeshadowingIdentifier.identify() で関連伏線を特定
         identified = self.identifier.identify(scene, appearing_characters)
 
         # 2. IdentifiedForeshadowing を PlantSuggestion / ReinforceSuggestion に変換
+        #    （詳細情報は ForeshadowingReader.read_many() でまとめて取得）
+        details = self.reader.read_many(
+            [item.foreshadowing_id for item in identified]
+        )
         for item in identified:
             if item.suggested_action == InstructionAction.PLANT:
-                result.should_plant.append(self._to_plant_suggestion(item))
+                result.should_plant.append(
+                    self._to_plant_suggestion(item, self._detail(details, item))
+                )
             elif item.suggested_action in (
                 InstructionAction.REINFORCE,
                 InstructionAction.HINT,
             ):
                 result.should_reinforce.append(
-                    self._to_reinforce_suggestion(item, scene)
+                    self._to_reinforce_suggestion(
+                        item, self._detail(details, item), scene
+                    )
                 )
 
         # 3. payoff が近い伏線を PayoffApproaching に変換
@@ -220,18 +329,169 @@ class SceneForeshadowingChecker:
 
         return result
 
-    def _to_plant_suggestion(self, identified: IdentifiedForeshadowing) -> PlantSuggestion:
+    def audit_range(
+        self,
+        start_episode: str,
+        end_episode: str,
+        *,
+        appearing_characters: Mapping[str, list[str]] | None = None,
+        silence_threshold: int = 5,
+        payoff_threshold: int = 3,
+    ) -> ForeshadowingAudit:
+        """Audit foreshadowing for every episode in a range.
+
+        Produces the same plant/reinforce/payoff/long-silence results as
+        calling check() for each episode, but reads the registry once and
+        sorts planned payoffs and last timeline events once. A single sweep
+        over the range then advances the payoff window and activates silent
+        foreshadowing as the episode number grows.
+
+        Args:
+            start_episode: First episode ID of the range (inclusive).
+            end_episode: Last episode ID of the range (inclusive).
+            appearing_characters: Characters appearing in each episode,
+                keyed by episode ID (used for HINT suggestions).
+            silence_threshold: Episode threshold for long silence alert.
+            payoff_threshold: Episode threshold for approaching payoff detection.
+
+        Returns:
+            ForeshadowingAudit with one EpisodeAudit per episode.
+
+        Raises:
+            ValueError: If an episode ID cannot be normalized or the range
+                is empty.
+        """
+        start = self._normalize_episode(start_episode)
+        end = self._normalize_episode(end_episode)
+        if start > end:
+            raise ValueError(f"Invalid episode range: {start_episode}..{end_episode}")
+        characters = {
+            self._normalize_episode(episode_id): names
+            for episode_id, names in (appearing_characters or {}).items()
+        }
+        with self._snapshot_scope():
+            return self._audit_range(
+                start, end, characters, silence_threshold, payoff_threshold
+            )
+
+    def _audit_range(
+        self,
+        start: int,
+        end: int,
+        characters: dict[int, list[str]],
+        silence_threshold: int,
+        payoff_threshold: int,
+    ) -> ForeshadowingAudit:
+        """Execute the audit sweep (see audit_range())."""
+        all_foreshadowing = self.reader.list_all()
+        by_id = {fs.id: fs for fs in all_foreshadowing}
+
+        # 回収予定: (予定エピソード番号, レジストリ順, planned_episode)
+        payoffs: list[tuple[int, int, str]] = []
+        # 長期未言及: (アラート開始エピソード番号, レジストリ順, 最終イベント番号)
+        silences: list[tuple[int, int, int]] = []
+        for position, fs in enumerate(all_foreshadowing):
+            if fs.payoff and fs.payoff.planned_episode:
+                planned = self._normalize_episode(fs.payoff.planned_episode)
+                payoffs.append((planned, position, fs.payoff.planned_episode))
+            if (
+                fs.status
+                in (ForeshadowingStatus.PLANTED, ForeshadowingStatus.REINFORCED)
+                and fs.timeline
+                and fs.timeline.events
+            ):
+                last = self._normalize_episode(fs.timeline.events[-1].episode)
+                silences.append((last + silence_threshold, position, last))
+        payoffs.sort()
+        silences.sort()
+
+        audit = ForeshadowingAudit(
+            start_episode=f"{start:03d}", end_episode=f"{end:03d}"
+        )
+        low = high = next_silence = 0
+        # アラート対象になった伏線: (レジストリ順, 最終イベント番号)
+        silent: list[tuple[int, int]] = []
+        for number in range(start, end + 1):
+            episode = EpisodeAudit(episode_id=f"{number:03d}")
+            scene = SceneIdentifier(episode_id=episode.episode_id)
+
+            for item in self.identifier.identify(scene, characters.get(number)):
+                if item.suggested_action == InstructionAction.PLANT:
+                    episode.plant.append(
+                        self._to_plant_suggestion(item, self._detail(by_id, item))
+                    )
+                elif item.suggested_action in (
+                    InstructionAction.REINFORCE,
+                    InstructionAction.HINT,
+                ):
+                    suggestions = (
+                        episode.reinforce
+                        if item.suggested_action == InstructionAction.REINFORCE
+                        else episode.hint
+                    )
+                    suggestions.append(
+                        self._to_reinforce_suggestion(
+                            item, self._detail(by_id, item), scene
+                        )
+                    )
+
+            # 回収予定が (number, number + payoff_threshold] の範囲にある伏線
+            while low < len(payoffs) and payoffs[low][0] <= number:
+                low += 1
+            while (
+                high < len(payoffs) and payoffs[high][0] <= number + payoff_threshold
+            ):
+                high += 1
+            for planned, position, planned_reveal in sorted(
+                payoffs[low:high], key=lambda payoff: payoff[1]
+            ):
+                episode.payoff.append(
+                    self._to_payoff_approaching(
+                        all_foreshadowing[position], planned_reveal, planned - number
+                    )
+                )
+
+            # 最終イベントから silence_threshold 以上経過した伏線を追加
+            while (
+                next_silence < len(silences) and silences[next_silence][0] <= number
+            ):
+                _, position, last = silences[next_silence]
+                bisect.insort(silent, (position, last))
+                next_silence += 1
+            for position, last in silent:
+                episode.silence.append(
+                    self._to_silence_alert(all_foreshadowing[position], number - last)
+                )
+
+            audit.episodes.append(episode)
+
+        return audit
+
+    def _detail(
+        self, details: dict[str, Foreshadowing], identified: IdentifiedForeshadowing
+    ) -> Foreshadowing:
+        """Get the foreshadowing data of an identified element.
+
+        Elements missing from the batch read are read individually, so a
+        foreshadowing that no longer exists raises the reader's error.
+        """
+        foreshadowing = details.get(identified.foreshadowing_id)
+        if foreshadowing is None:
+            foreshadowing = self.reader.read(identified.foreshadowing_id)
+        return foreshadowing
+
+    def _to_plant_suggestion(
+        self, identified: IdentifiedForeshadowing, foreshadowing: Foreshadowing
+    ) -> PlantSuggestion:
         """Convert IdentifiedForeshadowing to PlantSuggestion.
 
         Args:
             identified: Identified foreshadowing.
+            foreshadowing: Foreshadowing data of the element.
 
         Returns:
             PlantSuggestion instance.
         """
-        # ForeshadowingReader で詳細情報を取得
-        foreshadowing = self.reader.read(identified.foreshadowing_id)
-
         return PlantSuggestion(
             foreshadowing_id=identified.foreshadowing_id,
             title=foreshadowing.title,
@@ -244,20 +504,21 @@ class SceneForeshadowingChecker:
         )
 
     def _to_reinforce_suggestion(
-        self, identified: IdentifiedForeshadowing, scene: SceneIdentifier
+        self,
+        identified: IdentifiedForeshadowing,
+        foreshadowing: Foreshadowing,
+        scene: SceneIdentifier,
     ) -> ReinforceSuggestion:
         """Convert IdentifiedForeshadowing to ReinforceSuggestion.
 
         Args:
             identified: Identified foreshadowing.
+            foreshadowing: Foreshadowing data of the element.
             scene: Current scene identifier.
 
         Returns:
             ReinforceSuggestion instance.
         """
-        # ForeshadowingReader で詳細情報を取得
-        foreshadowing = self.reader.read(identified.foreshadowing_id)
-
         # timeline から last_mentioned を算出
         last_mentioned = "unknown"
         episodes_since = 0
@@ -305,28 +566,45 @@ class SceneForeshadowingChecker:
 
             # threshold 以内の場合のみ検出
             if 0 < remaining <= threshold:
-                # reinforcement_count を計算
-                reinforcement_count = 0
-                if fs.timeline and fs.timeline.events:
-                    reinforcement_count = sum(
-                        1
-                        for event in fs.timeline.events
-                        if event.type == ForeshadowingStatus.REINFORCED
-                    )
-
                 result.append(
-                    PayoffApproaching(
-                        foreshadowing_id=fs.id,
-                        title=fs.title,
-                        planned_reveal=fs.payoff.planned_episode,
-                        remaining_episodes=remaining,
-                        suggestion="回収が近いです。最終的な強化を検討",
-                        reinforcement_count=reinforcement_count,
+                    self._to_payoff_approaching(
+                        fs, fs.payoff.planned_episode, remaining
                     )
                 )
 
         return result
 
+    def _to_payoff_approaching(
+        self, fs: Foreshadowing, planned_reveal: str, remaining: int
+    ) -> PayoffApproaching:
+        """Create PayoffApproaching for a foreshadowing with a planned payoff.
+
+        Args:
+            fs: Foreshadowing data.
+            planned_reveal: Planned payoff episode (payoff.planned_episode).
+            remaining: Episodes remaining until the planned payoff.
+
+        Returns:
+            PayoffApproaching instance.
+        """
+        # reinforcement_count を計算
+        reinforcement_count = 0
+        if fs.timeline and fs.timeline.events:
+            reinforcement_count = sum(
+                1
+                for event in fs.timeline.events
+                if event.type == ForeshadowingStatus.REINFORCED
+            )
+
+        return PayoffApproaching(
+            foreshadowing_id=fs.id,
+            title=fs.title,
+            planned_reveal=planned_reveal,
+            remaining_episodes=remaining,
+            suggestion="回収が近いです。最終的な強化を検討",
+            reinforcement_count=reinforcement_count,
+        )
+
     def _detect_long_silence(
         self, scene: SceneIdentifier, threshold: int
     ) -> list[ForeshadowingAlert]:
@@ -361,19 +639,29 @@ class SceneForeshadowingChecker:
 
             # threshold 以上経過していればアラート生成
             if gap >= threshold:
-                result.append(
-                    ForeshadowingAlert(
-                        alert_type=AlertType.LONG_SILENCE,
-                        severity=AlertSeverity.WARNING,
-                        foreshadowing_id=fs.id,
-                        title="長期未言及",
-                        message=f"伏線「{fs.title}」が{gap}エピソード未言及です",
-                        data={"episodes_since": gap},
-                    )
-                )
+                result.append(self._to_silence_alert(fs, gap))
 
         return result
 
+    def _to_silence_alert(self, fs: Foreshadowing, gap: int) -> ForeshadowingAlert:
+        """Create a long silence alert.
+
+        Args:
+            fs: Silent foreshadowing.
+            gap: Episodes since the last timeline event.
+
+        Returns:
+            ForeshadowingAlert instance.
+        """
+        return ForeshadowingAlert(
+            alert_type=AlertType.LONG_SILENCE,
+            severity=AlertSeverity.WARNING,
+            foreshadowing_id=fs.id,
+            title="長期未言及",
+            message=f"伏線「{fs.title}」が{gap}エピソード未言及です",
+            data={"episodes_since": gap},
+        )
+
     def _normalize_episode(self, episode_id: str) -> int:
         """Normalize episode ID to integer.
 
@@ -5,10 +5,13 @@ relevant to a given scene, determining appropriate actions (PLANT/REINFORCE/HINT
 """
 
 import re
-from dataclasses import dataclass
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from typing import Protocol
 
 from src.core.models.foreshadowing import Foreshadowing, ForeshadowingStatus
+from src.core.repositories.foreshadowing import normalize_episode
 
 from .foreshadow_instruction import InstructionAction
 from .scene_identifier import SceneIdentifier
@@ -23,6 +26,10 @@ class ForeshadowingReader(Protocol):
 
     Implementations:
         - ForeshadowingRepository (L1): The concrete implementation.
+
+    Readers may also provide ``registry_version() -> int``, a value that
+    changes whenever the registry changes. ForeshadowingIdentifier then
+    reuses its lookup index until the version changes.
     """
 
     def list_all(self) -> list[Foreshadowing]:
@@ -49,6 +56,212 @@ class ForeshadowingReader(Protocol):
         """
         ...
 
+    def read_many(self, identifiers: list[str]) -> dict[str, Foreshadowing]:
+        """Read several foreshadowing elements at once.
+
+        Args:
+            identifiers: Foreshadowing IDs.
+
+        Returns:
+            Mapping of ID to element, in request order. IDs that are not
+            found are omitted.
+        """
+        ...
+
+
+class ScopedForeshadowingReader:
+    """ForeshadowingReader wrapper that can pin a registry snapshot for a scope.
+
+    Outside a scope every call is delegated unchanged. Inside ``scope()``,
+    list_all() is called once and read() is served from that snapshot, so
+    work spanning many scenes (e.g. batch context builds) reads the registry
+    once. IDs missing from the snapshot are still delegated to the reader.
+
+    Attributes:
+        reader: The wrapped foreshadowing reader.
+    """
+
+    def __init__(self, reader: ForeshadowingReader) -> None:
+        """Initialize ScopedForeshadowingReader.
+
+        Args:
+            reader: Foreshadowing reader to delegate to.
+        """
+        self.reader = reader
+        self._depth = 0
+        self._all: list[Foreshadowing] | None = None
+        self._by_id: dict[str, Foreshadowing] = {}
+        self._version: int | None = None
+
+    @contextmanager
+    def scope(self) -> Iterator[None]:
+        """Pin a registry snapshot for the duration of the block (reentrant).
+
+        Yields:
+            None
+        """
+        self._depth += 1
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            if self._depth == 0:
+                self._all = None
+                self._by_id = {}
+                self._version = None
+
+    def _snapshot(self) -> list[Foreshadowing]:
+        """Return the pinned registry snapshot, loading it on first use."""
+        if self._all is None:
+            # Taken before listing: a concurrent change yields a newer version
+            self._version = _registry_version(self.reader)
+            self._all = self.reader.list_all()
+            self._by_id = {fs.id: fs for fs in self._all}
+        return self._all
+
+    def registry_version(self) -> int | None:
+        """Return the registry version (of the pinned snapshot in a scope).
+
+        Returns:
+            The reader's registry version, or None if it has none.
+        """
+        if self._depth == 0:
+            return _registry_version(self.reader)
+        self._snapshot()
+        return self._version
+
+    def list_all(self) -> list[Foreshadowing]:
+        """List all foreshadowing elements (pinned inside a scope).
+
+        Returns:
+            List of all foreshadowing elements.
+        """
+        if self._depth == 0:
+            return self.reader.list_all()
+        return list(self._snapshot())
+
+    def read(self, identifier: str) -> Foreshadowing:
+        """Read a foreshadowing element (served from the snapshot in a scope).
+
+        Args:
+            identifier: Foreshadowing ID.
+
+        Returns:
+            The foreshadowing element.
+        """
+        if self._depth == 0:
+            return self.reader.read(identifier)
+        self._snapshot()
+        cached = self._by_id.get(identifier)
+        return cached if cached is not None else self.reader.read(identifier)
+
+    def read_many(self, identifiers: list[str]) -> dict[str, Foreshadowing]:
+        """Read several elements (served from the snapshot in a scope).
+
+        Args:
+            identifiers: Foreshadowing IDs.
+
+        Returns:
+            Mapping of ID to element, in request order (missing IDs omitted).
+        """
+        if self._depth == 0:
+            return self.reader.read_many(identifiers)
+        self._snapshot()
+        found = {i: self._by_id[i] for i in identifiers if i in self._by_id}
+        missing = [i for i in identifiers if i not in found]
+        if missing:
+            found.update(self.reader.read_many(missing))
+            found = {i: found[i] for i in identifiers if i in found}
+        return found
+
+
+def _registry_version(reader: ForeshadowingReader) -> int | None:
+    """Return reader.registry_version(), or None if the reader has none."""
+    version_of = getattr(reader, "registry_version", None)
+    if not callable(version_of):
+        return None
+    version = version_of()
+    return version if isinstance(version, int) else None
+
+
+@dataclass
+class _ForeshadowingIndex:
+    """Lookup tables for ForeshadowingIdentifier, built from one registry listing.
+
+    Each table maps a key to positions in ``foreshadowings`` in registry
+    order, so identification visits candidates in the same order as a full
+    scan. Episode keys are normalized with normalize_episode().
+
+    Attributes:
+        foreshadowings: All foreshadowing elements in registry order.
+        plant: Plant episode (from the ID) -> REGISTERED elements.
+        reinforce: Reinforce event episode -> PLANTED/REINFORCED elements.
+        hint: Related character -> PLANTED elements.
+        reveal: Planned payoff episode -> elements.
+    """
+
+    foreshadowings: list[Foreshadowing]
+    plant: dict[str, list[int]] = field(default_factory=dict)
+    reinforce: dict[str, list[int]] = field(default_factory=dict)
+    hint: dict[str, list[int]] = field(default_factory=dict)
+    reveal: dict[str, list[int]] = field(default_factory=dict)
+
+    @classmethod
+    def build(
+        cls, foreshadowings: list[Foreshadowing], id_pattern: re.Pattern[str]
+    ) -> "_ForeshadowingIndex":
+        """Build the lookup tables.
+
+        Args:
+            foreshadowings: All foreshadowing elements in registry order.
+            id_pattern: Pattern extracting the plant episode from an ID.
+
+        Returns:
+            The index.
+        """
+        index = cls(foreshadowings)
+        reinforceable = (ForeshadowingStatus.PLANTED, ForeshadowingStatus.REINFORCED)
+        for position, fs in enumerate(foreshadowings):
+            if fs.status == ForeshadowingStatus.REGISTERED:
+                match = id_pattern.match(fs.id)
+                if match:
+                    index._add(index.plant, normalize_episode(match.group(1)), position)
+
+            if fs.status in reinforceable and fs.timeline and fs.timeline.events:
+                for event in fs.timeline.events:
+                    if event.type == ForeshadowingStatus.REINFORCED:
+                        index._add(
+                            index.reinforce, normalize_episode(event.episode), position
+                        )
+
+            if fs.status == ForeshadowingStatus.PLANTED and fs.related:
+                for character in fs.related.characters:
+                    index._add(index.hint, character, position)
+
+            if fs.payoff and fs.payoff.planned_episode:
+                index._add(
+                    index.reveal, normalize_episode(fs.payoff.planned_episode), position
+                )
+        return index
+
+    @staticmethod
+    def _add(table: dict[str, list[int]], key: str, position: int) -> None:
+        """Append a position unless it was just added for the same key."""
+        positions = table.setdefault(key, [])
+        if not positions or positions[-1] != position:
+            positions.append(position)
+
+    def lookup(self, table: dict[str, list[int]], key: str) -> list[Foreshadowing]:
+        """Return the elements stored under a key, in registry order."""
+        return [self.foreshadowings[p] for p in table.get(key, ())]
+
+    def lookup_hint(self, characters: list[str]) -> list[Foreshadowing]:
+        """Return elements related to any of the characters, in registry order."""
+        positions: set[int] = set()
+        for character in set(characters):
+            positions.update(self.hint.get(character, ()))
+        return [self.foreshadowings[p] for p in sorted(positions)]
+
 
 @dataclass
 class IdentifiedForeshadowing:
@@ -77,6 +290,11 @@ class ForeshadowingIdentifier:
     which elements are relevant to the current scene, along with
     suggested actions (PLANT/REINFORCE/HINT/NONE).
 
+    The registry is indexed by plant, reinforce and reveal episode and by
+    related character, so a scene is identified with a few dictionary
+    lookups. If the reader provides registry_version(), the index is built
+    once per version; otherwise it is rebuilt from list_all() on each call.
+
     Attributes:
         reader: Foreshadowing reader for data access.
     """
@@ -91,6 +309,18 @@ class ForeshadowingIdentifier:
             reader: Foreshadowing reader instance (Protocol).
         """
         self.reader = reader
+        self._index: tuple[int, _ForeshadowingIndex] | None = None
+
+    def _current_index(self) -> _ForeshadowingIndex:
+        """Return the lookup index for the current registry version."""
+        version = _registry_version(self.reader)
+        cached = self._index
+        if version is not None and cached is not None and cached[0] == version:
+            return cached[1]
+        index = _ForeshadowingIndex.build(self.reader.list_all(), self._ID_PATTERN)
+        if version is not None:
+            self._index = (version, index)
+        return index
 
     def identify(
         self,
@@ -113,25 +343,24 @@ class ForeshadowingIdentifier:
         results: list[IdentifiedForeshadowing] = []
         already_identified_ids: set[str] = set()
 
-        # Get all foreshadowing elements
-        all_foreshadowings = self.reader.list_all()
+        index = self._current_index()
+        episode = normalize_episode(scene.episode_id)
 
         # 1. Find PLANT targets (registered + episode matches)
-        for fs in all_foreshadowings:
-            if self._should_plant(fs, scene):
-                results.append(
-                    IdentifiedForeshadowing(
-                        foreshadowing_id=fs.id,
-                        suggested_action=InstructionAction.PLANT,
-                        status=fs.status.value,
-                        relevance_reason=f"Episode {scene.episode_id} matches plant episode in ID",
-                    )
+        for fs in index.lookup(index.plant, episode):
+            results.append(
+                IdentifiedForeshadowing(
+                    foreshadowing_id=fs.id,
+                    suggested_action=InstructionAction.PLANT,
+                    status=fs.status.value,
+                    relevance_reason=f"Episode {scene.episode_id} matches plant episode in ID",
                 )
-                already_identified_ids.add(fs.id)
+            )
+            already_identified_ids.add(fs.id)
 
         # 2. Find REINFORCE targets (planted + in reinforce timeline)
-        for fs in all_foreshadowings:
-            if fs.id not in already_identified_ids and self._should_reinforce(fs, scene):
+        for fs in index.lookup(index.reinforce, episode):
+            if fs.id not in already_identified_ids:
                 results.append(
                     IdentifiedForeshadowing(
                         foreshadowing_id=fs.id,
@@ -144,10 +373,8 @@ class ForeshadowingIdentifier:
 
         # 3. Find HINT candidates (planted + related character appears)
         if appearing_characters:
-            for fs in all_foreshadowings:
-                if fs.id not in already_identified_ids and self._should_hint(
-                    fs, appearing_characters
-                ):
+            for fs in index.lookup_hint(appearing_characters):
+                if fs.id not in already_identified_ids:
                     results.append(
                         IdentifiedForeshadowing(
                             foreshadowing_id=fs.id,
@@ -159,8 +386,8 @@ class ForeshadowingIdentifier:
                     already_identified_ids.add(fs.id)
 
         # 4. Check for reveal consideration
-        for fs in all_foreshadowings:
-            if fs.id not in already_identified_ids and self._is_reveal_episode(fs, scene):
+        for fs in index.lookup(index.reveal, episode):
+            if fs.id not in already_identified_ids:
                 results.append(
                     IdentifiedForeshadowing(
                         foreshadowing_id=fs.id,
@@ -288,8 +515,4 @@ class ForeshadowingIdentifier:
             True if episodes match.
         """
         # Normalize: remove 'ep' prefix and leading zeros for comparison
-        def normalize(ep: str) -> str:
-            ep = ep.lower().replace("ep", "").lstrip("0")
-            return ep if ep else "0"
-
-        return normalize(ep1) == normalize(ep2)
+        return normalize_episode(ep1) == normalize_episode(ep2)
@@ -9,6 +9,7 @@ from typing import Any, Protocol
 
 from src.core.models.foreshadowing import Foreshadowing, ForeshadowingStatus
 from src.core.repositories.base import EntityNotFoundError
+from src.core.tracing import traced
 
 from .foreshadow_instruction import (
     ForeshadowInstruction,
@@ -128,6 +129,7 @@ class InstructionGeneratorImpl:
         self._reader = reader
         self._identifier = identifier
 
+    @traced("foreshadowing")
     def generate(
         self,
         scene: SceneIdentifier,
@@ -147,31 +149,33 @@ class InstructionGeneratorImpl:
         # Identify relevant foreshadowing elements
         identified = self._identifier.identify(scene, appearing_characters)
 
-        # Generate instruction for each identified element
+        # Read all identified elements at once, then generate instructions
+        details = self._reader.read_many(
+            [item.foreshadowing_id for item in identified]
+        )
         for item in identified:
-            instruction = self._generate_instruction(item)
-            if instruction is not None:
-                instructions.add_instruction(instruction)
+            fs = details.get(item.foreshadowing_id)
+            if fs is None:
+                # Foreshadowing was identified but no longer exists in repository
+                continue
+            instructions.add_instruction(self._generate_instruction(item, fs))
 
         return instructions
 
     def _generate_instruction(
         self,
         identified: IdentifiedForeshadowing,
-    ) -> ForeshadowInstruction | None:
+        fs: Foreshadowing,
+    ) -> ForeshadowInstruction:
         """Generate a single instruction from identified foreshadowing.
 
         Args:
             identified: Identified foreshadowing element.
+            fs: The foreshadowing data of the element.
 
         Returns:
-            Generated instruction, or None if foreshadowing not found.
+            Generated instruction.
         """
-        try:
-            fs = self._reader.read(identified.foreshadowing_id)
-        except (KeyError, FileNotFoundError, EntityNotFoundError):
-            # Foreshadowing was identified but no longer exists in repository
-            return None
         action = identified.suggested_action
 
         # Build note (PLANT may include seed description)
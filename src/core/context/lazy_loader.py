@@ -4,12 +4,22 @@ This module defines the LazyLoader protocol and related classes for
 implementing lazy loading with caching and graceful degradation.
 """
 
+import threading
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
 from typing import Generic, Protocol, TypeVar
 
+from src.core.tracing import span
+from src.core.vault.fingerprint import FileFingerprint
+
+from .build_metrics import record_cache_hit, record_cache_miss, record_file_read
+from .striped_locks import StripedLocks
+
 T = TypeVar("T")
 
 
@@ -28,6 +38,20 @@ class LoadPriority(Enum):
     OPTIONAL = "optional"
 
 
+class CacheValidation(Enum):
+    """Cache validation strategy for FileLazyLoader.
+
+    Attributes:
+        STAT: Validate each hit against the file's (mtime_ns, size, inode).
+            A hit costs one stat call and edits are picked up immediately.
+        TTL: Serve cached content until it is older than the TTL, without
+            touching the file system.
+    """
+
+    STAT = "stat"
+    TTL = "ttl"
+
+
 class ContentType(Enum):
     """Content type classification for lazy loading.
 
@@ -62,6 +86,9 @@ class LazyLoadResult(Generic[T]):
         data: The loaded data (None if failed).
         error: Error message if the load failed.
         warnings: List of warning messages.
+        fingerprint: Fingerprint of the file the data was read from, taken
+            together with the data (None if not tracked). Use it to key
+            caches of data derived from this result.
 
     Examples:
         >>> result = LazyLoadResult.ok("loaded data")
@@ -73,19 +100,28 @@ class LazyLoadResult(Generic[T]):
     data: T | None
     error: str | None = None
     warnings: list[str] = field(default_factory=list)
+    fingerprint: FileFingerprint | None = None
 
     @classmethod
-    def ok(cls, data: T, warnings: list[str] | None = None) -> "LazyLoadResult[T]":
+    def ok(
+        cls,
+        data: T,
+        warnings: list[str] | None = None,
+        fingerprint: FileFingerprint | None = None,
+    ) -> "LazyLoadResult[T]":
         """Create a successful result.
 
         Args:
             data: The successfully loaded data.
             warnings: Optional list of warning messages.
+            fingerprint: Optional fingerprint of the source file.
 
         Returns:
             A LazyLoadResult indicating success.
         """
-        return cls(success=True, data=data, warnings=warnings or [])
+        return cls(
+            success=True, data=data, warnings=warnings or [], fingerprint=fingerprint
+        )
 
     @classmethod
     def fail(cls, error: str) -> "LazyLoadResult[T]":
@@ -230,6 +266,8 @@ class CacheEntry(Generic[T]):
         data: The cached data.
         loaded_at: Timestamp when the data was loaded.
         source: Path to the source file.
+        fingerprint: File fingerprint at load time (None if not tracked).
+        size: Size of the cached content in bytes (used for the LRU bound).
 
     Example:
         >>> entry = CacheEntry(
@@ -244,6 +282,8 @@ class CacheEntry(Generic[T]):
     data: T
     loaded_at: datetime
     source: Path
+    fingerprint: FileFingerprint | None = None
+    size: int = 0
 
     def is_expired(self, ttl_seconds: float) -> bool:
         """Check if cache entry has expired.
@@ -262,11 +302,21 @@ class FileLazyLoader:
     """File-based lazy loader with caching.
 
     Implements the LazyLoader protocol for file system access with
-    built-in caching and TTL support.
+    built-in caching. By default each cache hit is validated with a single
+    stat call (see CacheValidation), so edits made in the vault while agents
+    run are picked up immediately and unchanged files are never re-read.
+    The cache is an LRU bounded by the total size of cached content.
+    Cache bookkeeping is guarded by a lock, so one loader can be shared by
+    concurrent builds. File reads happen outside that lock under a striped
+    per-file lock: concurrent misses on the same file read it once, while
+    reads of unrelated files proceed in parallel.
 
     Attributes:
         vault_root: Root directory for vault data.
-        cache_ttl_seconds: Cache time-to-live in seconds.
+        cache_ttl_seconds: Cache time-to-live in seconds (TTL validation and
+            evict_expired()).
+        validation: Cache validation strategy.
+        max_cache_bytes: Upper bound on total cached bytes (None = unbounded).
 
     Example:
         >>> loader = FileLazyLoader(Path("/vault"), cache_ttl_seconds=300.0)
@@ -275,16 +325,64 @@ class FileLazyLoader:
         ...     print(result.data)
     """
 
-    def __init__(self, vault_root: Path, cache_ttl_seconds: float = 300.0):
+    # Default upper bound on total cached bytes (64 MiB)
+    DEFAULT_MAX_CACHE_BYTES: int = 64 * 1024 * 1024
+
+    def __init__(
+        self,
+        vault_root: Path,
+        cache_ttl_seconds: float = 300.0,
+        *,
+        validation: CacheValidation = CacheValidation.STAT,
+        max_cache_bytes: int | None = DEFAULT_MAX_CACHE_BYTES,
+    ):
         """Initialize FileLazyLoader.
 
         Args:
             vault_root: Root directory for vault data.
             cache_ttl_seconds: Cache TTL in seconds (default: 300).
+            validation: Cache validation strategy (default: STAT).
+            max_cache_bytes: Upper bound on total cached bytes. The least
+                recently used entries are evicted when exceeded.
+                None disables the bound.
         """
         self.vault_root = vault_root
         self.cache_ttl_seconds = cache_ttl_seconds
-        self._cache: dict[str, CacheEntry[str]] = {}
+        self.validation = validation
+        self.max_cache_bytes = max_cache_bytes
+        self._cache: OrderedDict[str, CacheEntry[str]] = OrderedDict()
+        self._cache_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+        self._lock = threading.RLock()
+        self._key_locks = StripedLocks()
+        self._snapshot: dict[tuple[str, LoadPriority], LazyLoadResult[str]] | None = (
+            None
+        )
+
+    @contextmanager
+    def snapshot(self) -> Iterator[None]:
+        """Pin a point-in-time view of the vault for the duration of the block.
+
+        Inside the block each identifier is validated and read at most once;
+        repeated loads return the first result without touching the
+        filesystem. Used by batch builds so that inputs shared by many scenes
+        (L1 plot, style guide, visibility.yaml, ...) are loaded once.
+        Nested blocks share the outermost snapshot.
+
+        Yields:
+            None
+        """
+        outermost = self._snapshot is None
+        if outermost:
+            self._snapshot = {}
+        try:
+            yield
+        finally:
+            if outermost:
+                self._snapshot = None
 
     def load(self, identifier: str, priority: LoadPriority) -> LazyLoadResult[str]:
         """Load file content.
@@ -296,23 +394,79 @@ class FileLazyLoader:
         Returns:
             LazyLoadResult containing the loaded data or error information.
         """
-        # Check cache
-        if self.is_cached(identifier):
-            entry = self._cache[identifier]
-            if not entry.is_expired(self.cache_ttl_seconds):
-                return LazyLoadResult.ok(entry.data)
+        with span("FileLazyLoader.load", "io", identifier=identifier):
+            snapshot = self._snapshot
+            if snapshot is None:
+                return self._load(identifier, priority)
+
+            key = (identifier, priority)
+            pinned = snapshot.get(key)
+            if pinned is not None:
+                with self._lock:
+                    self._hits += 1
+                record_cache_hit()
+                return pinned
+            result = self._load(identifier, priority)
+            snapshot.setdefault(key, result)
+            return result
+
+    def _load(self, identifier: str, priority: LoadPriority) -> LazyLoadResult[str]:
+        """Load file content through the validated cache.
+
+        Args:
+            identifier: File path relative to vault_root.
+            priority: Load priority (REQUIRED or OPTIONAL).
 
-        # Load from file
+        Returns:
+            LazyLoadResult containing the loaded data or error information.
+        """
         file_path = self.vault_root / identifier
         try:
-            content = file_path.read_text(encoding="utf-8")
-            self._cache[identifier] = CacheEntry(
-                data=content,
-                loaded_at=datetime.now(),
-                source=file_path,
+            fingerprint = (
+                FileFingerprint.of(file_path)
+                if self.validation == CacheValidation.STAT
+                else None
             )
-            return LazyLoadResult.ok(content)
+
+            # Check cache
+            cached = self._lookup(identifier, fingerprint)
+            if cached is not None:
+                return LazyLoadResult.ok(cached.data, fingerprint=cached.fingerprint)
+
+            # Single-flight: concurrent misses on the same file wait for one read
+            with self._key_locks.lock_for(identifier):
+                cached = self._lookup(identifier, fingerprint)
+                if cached is not None:
+                    return LazyLoadResult.ok(
+                        cached.data, fingerprint=cached.fingerprint
+                    )
+                with self._lock:
+                    self._misses += 1
+                record_cache_miss()
+
+                # Load from file
+                content = file_path.read_text(encoding="utf-8")
+                size = (
+                    fingerprint.size if fingerprint else len(content.encode("utf-8"))
+                )
+                record_file_read(identifier, size)
+                with self._lock:
+                    self._store(
+                        identifier,
+                        CacheEntry(
+                            data=content,
+                            loaded_at=datetime.now(),
+                            source=file_path,
+                            fingerprint=fingerprint,
+                            size=size,
+                        ),
+                    )
+            return LazyLoadResult.ok(content, fingerprint=fingerprint)
         except FileNotFoundError:
+            with self._lock:
+                if identifier in self._cache:
+                    self._remove(identifier)
+                    self._invalidations += 1
             error_msg = f"File not found: {file_path}"
             if priority == LoadPriority.REQUIRED:
                 return LazyLoadResult.fail(error_msg)
@@ -320,6 +474,77 @@ class FileLazyLoader:
         except Exception as e:
             return LazyLoadResult.fail(str(e))
 
+    def _lookup(
+        self, identifier: str, fingerprint: FileFingerprint | None
+    ) -> CacheEntry[str] | None:
+        """Serve a valid cache entry, dropping it if it is stale.
+
+        Args:
+            identifier: Cache key.
+            fingerprint: Current file fingerprint (STAT validation only).
+
+        Returns:
+            The cache entry (content and its fingerprint), or None on a miss.
+        """
+        with self._lock:
+            entry = self._cache.get(identifier)
+            if entry is None:
+                return None
+            if self._is_valid(entry, fingerprint):
+                self._cache.move_to_end(identifier)
+                self._hits += 1
+                record_cache_hit()
+                return entry
+            self._remove(identifier)
+            self._invalidations += 1
+            return None
+
+    def _is_valid(
+        self, entry: CacheEntry[str], fingerprint: FileFingerprint | None
+    ) -> bool:
+        """Check whether a cache entry can be served.
+
+        Args:
+            entry: Cached entry.
+            fingerprint: Current file fingerprint (STAT validation only).
+
+        Returns:
+            True if the entry is still valid.
+        """
+        if self.validation == CacheValidation.STAT:
+            return entry.fingerprint is not None and entry.fingerprint == fingerprint
+        return not entry.is_expired(self.cache_ttl_seconds)
+
+    def _store(self, identifier: str, entry: CacheEntry[str]) -> None:
+        """Insert an entry and evict least recently used entries if over budget.
+
+        Args:
+            identifier: Cache key.
+            entry: Entry to insert.
+        """
+        if identifier in self._cache:
+            self._remove(identifier)
+        if self.max_cache_bytes is not None and entry.size > self.max_cache_bytes:
+            # Larger than the whole budget: serve without caching
+            return
+        self._cache[identifier] = entry
+        self._cache_bytes += entry.size
+        if self.max_cache_bytes is None:
+            return
+        while self._cache_bytes > self.max_cache_bytes:
+            oldest = next(iter(self._cache))
+            self._remove(oldest)
+            self._evictions += 1
+
+    def _remove(self, identifier: str) -> None:
+        """Remove an entry and update the byte accounting.
+
+        Args:
+            identifier: Cache key.
+        """
+        entry = self._cache.pop(identifier)
+        self._cache_bytes -= entry.size
+
     def is_cached(self, identifier: str) -> bool:
         """Check if data is already cached.
 
@@ -333,19 +558,38 @@ class FileLazyLoader:
 
     def clear_cache(self) -> None:
         """Clear all cached data."""
-        self._cache.clear()
+        with self._lock:
+            self._cache.clear()
+            self._cache_bytes = 0
 
     def get_cache_stats(self) -> dict[str, int]:
         """Get cache statistics.
 
         Returns:
-            Dictionary with 'total' and 'expired' counts.
+            Dictionary with the following counts:
+            - total: Number of cached entries.
+            - expired: Entries older than the TTL.
+            - bytes: Total size of cached content in bytes.
+            - hits: Loads served from the cache.
+            - misses: Loads that read the file.
+            - evictions: Entries evicted by the LRU byte bound.
+            - invalidations: Entries dropped because the file changed
+              (or expired, in TTL mode).
         """
-        total = len(self._cache)
-        expired = sum(
-            1 for e in self._cache.values() if e.is_expired(self.cache_ttl_seconds)
-        )
-        return {"total": total, "expired": expired}
+        with self._lock:
+            total = len(self._cache)
+            expired = sum(
+                1 for e in self._cache.values() if e.is_expired(self.cache_ttl_seconds)
+            )
+            return {
+                "total": total,
+                "expired": expired,
+                "bytes": self._cache_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "invalidations": self._invalidations,
+            }
 
     def evict_expired(self) -> int:
         """Evict expired cache entries.
@@ -353,11 +597,14 @@ class FileLazyLoader:
         Returns:
             Number of entries evicted.
         """
-        expired_keys = [
-            k for k, v in self._cache.items() if v.is_expired(self.cache_ttl_seconds)
-        ]
-        for k in expired_keys:
-            del self._cache[k]
+        with self._lock:
+            expired_keys = [
+                k
+                for k, v in self._cache.items()
+                if v.is_expired(self.cache_ttl_seconds)
+            ]
+            for k in expired_keys:
+                self._remove(k)
         return len(expired_keys)
 
 
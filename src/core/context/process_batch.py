@@ -0,0 +1,195 @@
+"""Multi-process batch context building.
+
+This module spreads batch context builds over a ProcessPoolExecutor so that
+YAML parsing and regex work is not limited by the GIL. Each worker process
+keeps one warm ContextBuilder (created once by a picklable factory) whose
+loader, entity and instruction caches persist across chunks and batches.
+"""
+
+from __future__ import annotations
+
+import concurrent.futures
+import copy
+import logging
+import math
+import os
+import pickle
+from collections.abc import Callable, Sequence
+from types import TracebackType
+
+from .context_builder import ContextBuilder, ContextBuildResult
+from .scene_identifier import SceneIdentifier
+
+logger = logging.getLogger(__name__)
+
+# Per-process builder (set by _init_worker in each worker)
+_worker_builder: ContextBuilder | None = None
+
+
+def _init_worker(builder_factory: Callable[[], ContextBuilder]) -> None:
+    """Create the warm ContextBuilder for this worker process.
+
+    Args:
+        builder_factory: Picklable factory returning a ContextBuilder.
+    """
+    global _worker_builder
+    _worker_builder = builder_factory()
+
+
+def _build_chunk(scenes: list[SceneIdentifier]) -> bytes:
+    """Build a chunk of scenes in a worker and serialize the results.
+
+    The results are pickled together, so values shared between scenes in
+    the chunk (L1 plot, style guide, ...) are serialized once.
+
+    Args:
+        scenes: Scenes to build (no duplicates).
+
+    Returns:
+        Pickled list of ContextBuildResult in scene order.
+    """
+    if _worker_builder is None:
+        raise RuntimeError("Worker process was not initialized")
+    results = _worker_builder.build_context_batch(scenes)
+    return pickle.dumps(results, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+class ProcessPoolContextBuilder:
+    """Builds batches of scene contexts on a pool of worker processes.
+
+    Scenes are deduplicated, split into contiguous chunks and built with
+    ContextBuilder.build_context_batch() inside the workers. Results are
+    returned in input order and are equal to the results of the sequential
+    ContextBuilder.build_context_batch().
+
+    The pool (and the warm builder in each worker) is created on first use
+    and kept until close(), so repeated batches reuse the worker caches.
+    Use as a context manager to shut the pool down reliably.
+
+    Attributes:
+        max_workers: Number of worker processes.
+        chunk_size: Scenes per task (None = chosen from batch size).
+
+    Examples:
+        >>> factory = functools.partial(ContextBuilder, vault_root=Path("vault"))
+        >>> with ProcessPoolContextBuilder(factory, max_workers=4) as pool:
+        ...     results = pool.build_context_batch(scenes)
+    """
+
+    # Tasks per worker when chunk_size is not given (balances load vs overhead)
+    _TASKS_PER_WORKER: int = 4
+
+    def __init__(
+        self,
+        builder_factory: Callable[[], ContextBuilder],
+        *,
+        max_workers: int | None = None,
+        chunk_size: int | None = None,
+    ) -> None:
+        """Initialize ProcessPoolContextBuilder.
+
+        Args:
+            builder_factory: Picklable zero-argument callable that returns a
+                ContextBuilder (e.g. a module-level function or
+                functools.partial(ContextBuilder, ...)). Called once per worker.
+            max_workers: Number of worker processes (default: CPU count).
+            chunk_size: Scenes per task. Defaults to an even split into
+                about four tasks per worker.
+
+        Raises:
+            ValueError: If max_workers or chunk_size is less than 1.
+        """
+        if max_workers is not None and max_workers < 1:
+            raise ValueError(f"max_workers must be >= 1, got {max_workers}")
+        if chunk_size is not None and chunk_size < 1:
+            raise ValueError(f"chunk_size must be >= 1, got {chunk_size}")
+        self._builder_factory = builder_factory
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self._executor: concurrent.futures.ProcessPoolExecutor | None = None
+
+    def __enter__(self) -> ProcessPoolContextBuilder:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def _get_executor(self) -> concurrent.futures.ProcessPoolExecutor:
+        """Return the worker pool, starting it on first use."""
+        if self._executor is None:
+            self._executor = concurrent.futures.ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=_init_worker,
+                initargs=(self._builder_factory,),
+            )
+        return self._executor
+
+    def _chunk(self, scenes: list[SceneIdentifier]) -> list[list[SceneIdentifier]]:
+        """Split scenes into contiguous chunks.
+
+        Args:
+            scenes: Unique scenes in build order.
+
+        Returns:
+            List of chunks.
+        """
+        size = self.chunk_size or max(
+            1, math.ceil(len(scenes) / (self.max_workers * self._TASKS_PER_WORKER))
+        )
+        return [scenes[i : i + size] for i in range(0, len(scenes), size)]
+
+    def build_context_batch(
+        self, scenes: Sequence[SceneIdentifier]
+    ) -> list[ContextBuildResult]:
+        """Build complete context for many scenes on the worker pool.
+
+        Args:
+            scenes: Scene identifiers to build.
+
+        Returns:
+            Build results in the same order as scenes. Each result is an
+            independent object, even for duplicate scenes.
+
+        Raises:
+            concurrent.futures.process.BrokenProcessPool: If a worker dies
+                (e.g. builder_factory fails).
+        """
+        unique = list(dict.fromkeys(scenes))
+        if not unique:
+            return []
+
+        chunks = self._chunk(unique)
+        executor = self._get_executor()
+        built: dict[SceneIdentifier, ContextBuildResult] = {}
+        for chunk, payload in zip(
+            chunks, executor.map(_build_chunk, chunks), strict=True
+        ):
+            built.update(zip(chunk, pickle.loads(payload), strict=True))
+
+        logger.debug(
+            "Built context batch on %d worker(s): %d scene(s) in %d chunk(s)",
+            self.max_workers,
+            len(unique),
+            len(chunks),
+        )
+
+        results: list[ContextBuildResult] = []
+        returned: set[SceneIdentifier] = set()
+        for scene in scenes:
+            if scene in returned:
+                results.append(copy.deepcopy(built[scene]))
+            else:
+                returned.add(scene)
+                results.append(built[scene])
+        return results
+
+    def close(self) -> None:
+        """Shut down the worker pool (a later batch starts a new one)."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
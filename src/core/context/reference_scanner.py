@@ -0,0 +1,205 @@
+"""Compiled reference scanner for L3 context building.
+
+This module compiles the character and world setting reference patterns
+(wikilinks, YAML lists and list headers, see reference_patterns.yaml) into
+one combined regular expression, so a single pass over a text yields every
+reference together with its kind.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+from dataclasses import dataclass, field
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Reference kinds
+CHARACTER = "character"
+WORLD_SETTING = "world_setting"
+
+# Pattern families keyed by kind, with the list headers and wikilink prefix
+# used when the configuration does not specify them
+_FAMILIES: dict[str, tuple[str, list[str], str]] = {
+    CHARACTER: ("character_patterns", ["登場人物", "登場キャラクター"], "characters"),
+    WORLD_SETTING: ("world_patterns", ["関連設定", "世界観設定"], "world"),
+}
+
+# Items of a YAML list block / of a list-header block
+_YAML_ITEM = re.compile(r"-\s*(.+)")
+_LIST_ITEM = re.compile(r"[-・]\s*(.+)")
+
+
+@dataclass(frozen=True)
+class Reference:
+    """A reference found in a text.
+
+    Attributes:
+        kind: CHARACTER or WORLD_SETTING.
+        name: Referenced name (may include a path like "地理/王都").
+    """
+
+    kind: str
+    name: str
+
+
+@dataclass
+class _Rule:
+    """One alternative of the combined regex."""
+
+    kind: str
+    source: str  # "wikilink", "yaml" or "list"
+    value_group: int  # group holding the value (0 = whole match)
+    exclude_prefixes: tuple[str, ...] = ()
+    strip: re.Pattern[str] | None = None
+
+
+@dataclass(frozen=True)
+class ReferenceScanner:
+    """Finds character and world setting references in one pass.
+
+    Build with from_patterns(); instances are immutable and thread-safe.
+
+    Attributes:
+        pattern: The combined regular expression.
+    """
+
+    pattern: re.Pattern[str]
+    _rules: dict[str, _Rule] = field(repr=False)
+    _inline: re.Pattern[str] | None = field(repr=False)
+
+    @classmethod
+    def from_patterns(cls, patterns: dict[str, Any]) -> ReferenceScanner:
+        """Compile reference patterns into a scanner.
+
+        Invalid patterns are logged and skipped.
+
+        Args:
+            patterns: Reference patterns (SceneResolver.get_reference_patterns()).
+
+        Returns:
+            Compiled scanner.
+        """
+        inline: list[tuple[str, _Rule, str]] = []
+        blocks: list[tuple[str, _Rule, str]] = []
+        for kind, (key, default_headers, prefix) in _FAMILIES.items():
+            family = patterns.get(key, {})
+            strip = re.compile(
+                rf"\[\[(?:{re.escape(prefix)}/)?([^\]|]+)(?:\|[^\]]+)?\]\]"
+            )
+            for entry in family.get("wikilinks", []):
+                rule = _Rule(
+                    kind,
+                    "wikilink",
+                    0,
+                    exclude_prefixes=tuple(entry.get("exclude_prefixes", [])),
+                )
+                inline.append((entry["pattern"], rule, ""))
+            for entry in family.get("yaml", []):
+                blocks.append((entry["pattern"], _Rule(kind, "yaml", 0), "m"))
+            for header in family.get("list_headers", default_headers):
+                list_pattern = (
+                    rf"(?:{re.escape(header)})(?:\s*[:：]\s*|\s*\n)"
+                    r"((?:\s*[-・]\s*.+\n?)+)"
+                )
+                rule = _Rule(kind, "list", 0, strip=strip)
+                blocks.append((list_pattern, rule, ""))
+
+        rules: dict[str, _Rule] = {}
+        inline_parts = cls._assemble(inline, rules, 0)
+        block_parts = cls._assemble(blocks, rules, len(rules))
+        cls._number_groups(inline_parts + block_parts, rules)
+        combined = re.compile("|".join(p for p, _ in inline_parts + block_parts))
+
+        inline_only = None
+        if inline_parts:
+            inline_only = re.compile("|".join(p for p, _ in inline_parts))
+        return cls(pattern=combined, _rules=rules, _inline=inline_only)
+
+    @staticmethod
+    def _assemble(
+        entries: list[tuple[str, _Rule, str]], rules: dict[str, _Rule], start: int
+    ) -> list[tuple[str, int]]:
+        """Wrap valid patterns in named groups (r0, r1, ...).
+
+        Returns:
+            List of (wrapped pattern, number of inner groups).
+        """
+        parts: list[tuple[str, int]] = []
+        for pattern, rule, flags in entries:
+            name = f"r{start + len(parts)}"
+            body = f"(?{flags}:{pattern})" if flags else pattern
+            wrapped = f"(?P<{name}>{body})"
+            try:
+                inner_groups = re.compile(pattern).groups
+                re.compile(wrapped)
+            except re.error as e:
+                logger.warning("Invalid reference pattern %r skipped: %s", pattern, e)
+                continue
+            rules[name] = rule
+            parts.append((wrapped, inner_groups))
+        return parts
+
+    @staticmethod
+    def _number_groups(parts: list[tuple[str, int]], rules: dict[str, _Rule]) -> None:
+        """Record the group holding each rule's value (first inner group)."""
+        group = 0
+        for (_, inner_groups), rule in zip(parts, rules.values(), strict=True):
+            outer = group + 1
+            rule.value_group = outer + 1 if inner_groups else outer
+            group = outer + inner_groups
+
+    def scan(self, content: str) -> list[Reference]:
+        """Find all references in a text.
+
+        Wikilinks are collected wherever they occur; for YAML lists and
+        list headers only the first block of each pattern is used.
+
+        Args:
+            content: Text to scan.
+
+        Returns:
+            References in order of appearance, without duplicates.
+        """
+        found: dict[Reference, None] = {}
+        seen_blocks: set[str] = set()
+        for match in self.pattern.finditer(content):
+            name = match.lastgroup
+            if name is None:
+                continue
+            rule = self._rules[name]
+            if rule.source == "wikilink":
+                self._add_wikilink(found, rule, match.group(rule.value_group))
+                continue
+
+            if name not in seen_blocks:
+                seen_blocks.add(name)
+                block = match.group(rule.value_group)
+                item_pattern = _YAML_ITEM if rule.source == "yaml" else _LIST_ITEM
+                for item in item_pattern.findall(block):
+                    if rule.strip is not None:
+                        item = rule.strip.sub(r"\1", item)
+                    self._add(found, rule.kind, item.strip())
+            # Wikilinks inside the block were consumed by the block match
+            if self._inline is not None:
+                for inner in self._inline.finditer(content, match.start(), match.end()):
+                    inner_rule = self._rules[inner.lastgroup or ""]
+                    self._add_wikilink(
+                        found, inner_rule, inner.group(inner_rule.value_group)
+                    )
+        return list(found)
+
+    def _add_wikilink(
+        self, found: dict[Reference, None], rule: _Rule, value: str
+    ) -> None:
+        """Add a wikilink reference unless its prefix is excluded."""
+        if rule.exclude_prefixes and value.startswith(rule.exclude_prefixes):
+            return
+        self._add(found, rule.kind, value)
+
+    @staticmethod
+    def _add(found: dict[Reference, None], kind: str, name: str) -> None:
+        """Add a non-empty reference."""
+        if name:
+            found.setdefault(Reference(kind, name), None)
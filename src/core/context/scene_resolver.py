@@ -5,15 +5,22 @@ from SceneIdentifier within the vault structure.
 """
 
 import copy
-import re
+import logging
+from contextlib import AbstractContextManager, nullcontext
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+from src.core.vault.fingerprint import FileFingerprint
+from src.core.vault.index import VaultIndex, VaultIndexError
+
+from .reference_scanner import CHARACTER, WORLD_SETTING, Reference, ReferenceScanner
 from .scene_identifier import SceneIdentifier
 
+logger = logging.getLogger(__name__)
+
 # Default reference patterns (used when no config file exists)
 DEFAULT_REFERENCE_PATTERNS: dict[str, Any] = {
     "character_patterns": {
@@ -95,18 +102,48 @@ class SceneResolver:
     This class handles the logic of finding relevant files for a given scene
     across different directories (_plot, _summary, episodes, etc.).
 
+    When a VaultIndex is given, character and world setting lookups are
+    answered by index queries instead of probing the filesystem. If the
+    index cannot be opened or updated (read-only vault, locked index file),
+    the resolver drops it and falls back to the filesystem lookups.
+
     Attributes:
         vault_root: Root directory of the vault.
+        index: Optional vault index rooted at vault_root.
     """
 
-    def __init__(self, vault_root: Path) -> None:
+    def __init__(self, vault_root: Path, index: VaultIndex | None = None) -> None:
         """Initialize SceneResolver.
 
         Args:
             vault_root: Path to the vault root directory.
+            index: Optional vault index (must share vault_root).
         """
         self.vault_root = vault_root
+        self.index = index
         self._patterns_cache: dict[str, Any] | None = None
+        self._patterns_fingerprint: FileFingerprint | None = None
+        self._scanner_cache: (
+            tuple[FileFingerprint | None, ReferenceScanner] | None
+        ) = None
+
+    @property
+    def _config_path(self) -> Path:
+        """Path of the reference pattern configuration file."""
+        return self.vault_root / "_settings" / "reference_patterns.yaml"
+
+    def _disable_index(self, error: VaultIndexError) -> None:
+        """Stop using an unavailable vault index (filesystem lookups from now on).
+
+        Args:
+            error: The error raised by the index.
+        """
+        logger.warning("Vault index disabled, using filesystem lookups: %s", error)
+        self.index = None
+
+    def _index_batch(self) -> AbstractContextManager[None]:
+        """Check index freshness once for the lookups of one entry point."""
+        return self.index.batch() if self.index is not None else nullcontext()
 
     def get_reference_patterns(
         self, force_reload: bool = False
@@ -125,7 +162,8 @@ class SceneResolver:
         if self._patterns_cache is not None and not force_reload:
             return self._patterns_cache
 
-        config_path = self.vault_root / "_settings" / "reference_patterns.yaml"
+        config_path = self._config_path
+        self._patterns_fingerprint = FileFingerprint.of_or_none(config_path)
 
         if config_path.exists():
             try:
@@ -275,15 +313,39 @@ class SceneResolver:
         path = self.vault_root / "_style_guides" / "default.md"
         return path if path.exists() else None
 
-    # --- Character identification methods (L3-1-1c) ---
+    # --- Reference scanning ---
 
-    def identify_characters(
+    def get_reference_scanner(self) -> ReferenceScanner:
+        """Get the compiled reference scanner.
+
+        The scanner is compiled from get_reference_patterns() and kept until
+        the fingerprint of _settings/reference_patterns.yaml changes, in which
+        case the patterns are reloaded and recompiled.
+
+        Returns:
+            Compiled reference scanner.
+        """
+        fingerprint = FileFingerprint.of_or_none(self._config_path)
+        cached = self._scanner_cache
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+
+        patterns = self.get_reference_patterns(
+            force_reload=fingerprint != self._patterns_fingerprint
+        )
+        scanner = ReferenceScanner.from_patterns(patterns)
+        self._scanner_cache = (fingerprint, scanner)
+        return scanner
+
+    def identify_references(
         self,
         scene: SceneIdentifier,
         episode_content: str | None = None,
         plot_l3_content: str | None = None,
-    ) -> list[Path]:
-        """Identify character files related to a scene.
+    ) -> tuple[list[Path], list[Path]]:
+        """Identify character and world setting files in one pass.
+
+        Each text is scanned once for both kinds of references.
 
         Args:
             scene: Scene identifier.
@@ -291,31 +353,83 @@ class SceneResolver:
             plot_l3_content: L3 plot content (pre-loaded).
 
         Returns:
-            List of paths to character files.
+            Tuple of (character file paths, world setting file paths).
         """
-        references: set[str] = set()
+        references = self._scan_references(episode_content, plot_l3_content)
+        with self._index_batch():
+            return (
+                self._resolve_references(references, CHARACTER),
+                self._resolve_references(references, WORLD_SETTING),
+            )
 
-        if episode_content:
-            refs = self._extract_character_references(episode_content)
-            references.update(refs)
+    def _scan_references(self, *contents: str | None) -> list[Reference]:
+        """Scan texts for references, in order of appearance.
 
-        if plot_l3_content:
-            refs = self._extract_character_references(plot_l3_content)
-            references.update(refs)
+        Args:
+            contents: Texts to scan (None or empty texts are skipped).
 
-        # Resolve to paths
-        paths: list[Path] = []
-        for ref in references:
-            path = self._resolve_character_path(ref)
-            if path and path not in paths:
-                paths.append(path)
+        Returns:
+            Unique references found in all texts.
+        """
+        scanner = self.get_reference_scanner()
+        found: dict[Reference, None] = {}
+        for content in contents:
+            if content:
+                found.update(dict.fromkeys(scanner.scan(content)))
+        return list(found)
+
+    def _resolve_references(
+        self, references: list[Reference], kind: str
+    ) -> list[Path]:
+        """Resolve references of one kind to existing file paths.
+
+        Args:
+            references: Scanned references.
+            kind: CHARACTER or WORLD_SETTING.
 
+        Returns:
+            Unique file paths, in order of first reference.
+        """
+        resolve = (
+            self._resolve_character_path
+            if kind == CHARACTER
+            else self._resolve_world_setting_path
+        )
+        paths: list[Path] = []
+        with self._index_batch():
+            for ref in references:
+                if ref.kind != kind:
+                    continue
+                path = resolve(ref.name)
+                if path and path not in paths:
+                    paths.append(path)
         return paths
 
+    # --- Character identification methods (L3-1-1c) ---
+
+    def identify_characters(
+        self,
+        scene: SceneIdentifier,
+        episode_content: str | None = None,
+        plot_l3_content: str | None = None,
+    ) -> list[Path]:
+        """Identify character files related to a scene.
+
+        Args:
+            scene: Scene identifier.
+            episode_content: Episode content (pre-loaded).
+            plot_l3_content: L3 plot content (pre-loaded).
+
+        Returns:
+            List of paths to character files.
+        """
+        references = self._scan_references(episode_content, plot_l3_content)
+        return self._resolve_references(references, CHARACTER)
+
     def _extract_character_references(self, content: str) -> list[str]:
         """Extract character references from content.
 
-        Recognizes the following formats:
+        Recognizes the following formats (see character_patterns):
         - [[characters/name]] or [[characters/name|alias]]
         - [[name]] (assumes characters/)
         - YAML frontmatter: characters: [name1, name2]
@@ -327,72 +441,11 @@ class SceneResolver:
         Returns:
             List of character names.
         """
-        references: list[str] = []
-        references.extend(self._extract_wikilink_characters(content))
-        references.extend(self._extract_yaml_characters(content))
-        references.extend(self._extract_list_characters(content))
-        return self._deduplicate_references(references)
-
-    def _extract_wikilink_characters(self, content: str) -> list[str]:
-        """Extract character refs from wikilinks [[characters/name]] or [[name]]."""
-        refs: list[str] = []
-        # Pattern: [[characters/name]] or [[characters/name|alias]]
-        # Matches: characters/ followed by name, optional |alias, then ]]
-        pattern_full = r'\[\[characters/([^\]|]+)(?:\|[^\]]+)?\]\]'
-        refs.extend(re.findall(pattern_full, content))
-
-        # Pattern: [[name]] short form (excludes known directory prefixes)
-        # Matches: [[ followed by name without /, optional |alias, then ]]
-        pattern_short = r'\[\[([^\]/|]+)(?:\|[^\]]+)?\]\]'
-        for match in re.findall(pattern_short, content):
-            if not match.startswith(('world', '_', 'episodes')):
-                refs.append(match)
-        return refs
-
-    def _extract_yaml_characters(self, content: str) -> list[str]:
-        """Extract character refs from YAML frontmatter characters list."""
-        # Pattern: characters: followed by newline and list items (- name)
-        pattern = r'^characters:\s*\n((?:\s+-\s*.+\n?)+)'
-        match = re.search(pattern, content, re.MULTILINE)
-        if match:
-            items = re.findall(r'-\s*(.+)', match.group(1))
-            return [item.strip() for item in items]
-        return []
-
-    def _extract_list_characters(self, content: str) -> list[str]:
-        """Extract character refs from configured list headers.
-
-        Uses list_headers from character_patterns configuration.
-        """
-        patterns = self.get_reference_patterns()
-        list_headers = patterns.get("character_patterns", {}).get(
-            "list_headers", ["登場人物", "登場キャラクター"]
-        )
-
-        refs: list[str] = []
-        for header in list_headers:
-            # Pattern: header, then : or newline, then list items
-            pattern = rf'(?:{re.escape(header)})(?:\s*[:：]\s*|\s*\n)((?:\s*[-・]\s*.+\n?)+)'
-            match = re.search(pattern, content)
-            if match:
-                items = re.findall(r'[-・]\s*(.+)', match.group(1))
-                # Pattern to strip wikilink: [[characters/name|alias]] or [[name]]
-                wikilink_strip = r'\[\[(?:characters/)?([^\]|]+)(?:\|[^\]]+)?\]\]'
-                for item in items:
-                    clean = re.sub(wikilink_strip, r'\1', item)
-                    refs.append(clean.strip())
-
-        return refs
-
-    def _deduplicate_references(self, references: list[str]) -> list[str]:
-        """Deduplicate reference list while preserving order."""
-        seen: set[str] = set()
-        unique: list[str] = []
-        for ref in references:
-            if ref and ref not in seen:
-                seen.add(ref)
-                unique.append(ref)
-        return unique
+        return [
+            ref.name
+            for ref in self.get_reference_scanner().scan(content)
+            if ref.kind == CHARACTER
+        ]
 
     def _resolve_character_path(self, character_name: str) -> Path | None:
         """Resolve character name to file path.
@@ -405,6 +458,12 @@ class SceneResolver:
         Returns:
             File path if exists, None otherwise.
         """
+        if self.index is not None:
+            try:
+                return self.index.find_by_path(f"characters/{character_name}.md")
+            except VaultIndexError as e:
+                self._disable_index(e)
+
         char_dir = self.vault_root / "characters"
         if not char_dir.exists():
             return None
@@ -418,6 +477,12 @@ class SceneResolver:
         Returns:
             All .md files under characters/.
         """
+        if self.index is not None:
+            try:
+                return self.index.list_directory("characters")
+            except VaultIndexError as e:
+                self._disable_index(e)
+
         char_dir = self.vault_root / "characters"
         if not char_dir.exists():
             return []
@@ -442,24 +507,8 @@ class SceneResolver:
         Returns:
             List of paths to world setting files.
         """
-        references: set[str] = set()
-
-        if episode_content:
-            refs = self._extract_world_references(episode_content)
-            references.update(refs)
-
-        if plot_l3_content:
-            refs = self._extract_world_references(plot_l3_content)
-            references.update(refs)
-
-        # Resolve to paths
-        paths: list[Path] = []
-        for ref in references:
-            path = self._resolve_world_setting_path(ref)
-            if path and path not in paths:
-                paths.append(path)
-
-        return paths
+        references = self._scan_references(episode_content, plot_l3_content)
+        return self._resolve_references(references, WORLD_SETTING)
 
     def _extract_world_references(self, content: str) -> list[str]:
         """Extract world setting references from content.
@@ -472,47 +521,11 @@ class SceneResolver:
         Returns:
             List of setting names (may include path like "地理/王都").
         """
-        references: list[str] = []
-
-        # Pattern 1: [[world/path]] or [[world/path|alias]]
-        pattern1 = r'\[\[world/([^\]|]+)(?:\|[^\]]+)?\]\]'
-        matches = re.findall(pattern1, content)
-        references.extend(matches)
-
-        # Pattern 2: YAML frontmatter world_settings list
-        yaml_pattern = r'^world_settings:\s*\n((?:\s+-\s*.+\n?)+)'
-        yaml_match = re.search(yaml_pattern, content, re.MULTILINE)
-        if yaml_match:
-            items = re.findall(r'-\s*(.+)', yaml_match.group(1))
-            references.extend([item.strip() for item in items])
-
-        # Pattern 3: List format from config
-        patterns = self.get_reference_patterns()
-        list_headers = patterns.get("world_patterns", {}).get(
-            "list_headers", ["関連設定", "世界観設定"]
-        )
-
-        for header in list_headers:
-            list_pattern = rf'(?:{re.escape(header)})(?:\s*[:：]\s*|\s*\n)((?:\s*[-・]\s*.+\n?)+)'
-            list_match = re.search(list_pattern, content)
-            if list_match:
-                items = re.findall(r'[-・]\s*(.+)', list_match.group(1))
-                for item in items:
-                    # Remove wikilink formatting if present
-                    clean = re.sub(
-                        r'\[\[(?:world/)?([^\]|]+)(?:\|[^\]]+)?\]\]', r'\1', item
-                    )
-                    references.append(clean.strip())
-
-        # Deduplicate while preserving order
-        seen: set[str] = set()
-        unique: list[str] = []
-        for ref in references:
-            if ref and ref not in seen:
-                seen.add(ref)
-                unique.append(ref)
-
-        return unique
+        return [
+            ref.name
+            for ref in self.get_reference_scanner().scan(content)
+            if ref.kind == WORLD_SETTING
+        ]
 
     def _resolve_world_setting_path(self, setting_name: str) -> Path | None:
         """Resolve setting name to file path.
@@ -527,6 +540,12 @@ class SceneResolver:
         Returns:
             File path if exists, None otherwise.
         """
+        if self.index is not None:
+            try:
+                return self._resolve_world_setting_path_indexed(self.index, setting_name)
+            except VaultIndexError as e:
+                self._disable_index(e)
+
         world_dir = self.vault_root / "world"
         if not world_dir.exists():
             return None
@@ -551,12 +570,47 @@ class SceneResolver:
 
         return None
 
+    def _resolve_world_setting_path_indexed(
+        self, index: VaultIndex, setting_name: str
+    ) -> Path | None:
+        """Resolve setting name to file path using the vault index.
+
+        Same lookup order as the filesystem variant; among category
+        subdirectories the first match in path order wins.
+
+        Args:
+            index: Vault index to query.
+            setting_name: Setting name (may include path like "地理/王都").
+
+        Returns:
+            File path if indexed, None otherwise.
+        """
+        path = index.find_by_path(f"world/{setting_name}.md")
+        if path is not None:
+            return path
+
+        suffix = f"/{setting_name}.md"
+        for candidate in index.find_by_stem("world_setting", Path(setting_name).name):
+            rel = candidate.relative_to(self.vault_root).as_posix()
+            if not (rel.startswith("world/") and rel.endswith(suffix)):
+                continue
+            category = rel[len("world/") : -len(suffix)]
+            if category and "/" not in category:
+                return candidate
+        return None
+
     def list_all_world_settings(self) -> list[Path]:
         """List all world setting files recursively.
 
         Returns:
             All .md files under world/ (recursive).
         """
+        if self.index is not None:
+            try:
+                return self.index.list_directory("world", depth=None)
+            except VaultIndexError as e:
+                self._disable_index(e)
+
         world_dir = self.vault_root / "world"
         if not world_dir.exists():
             return []
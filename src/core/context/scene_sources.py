@@ -0,0 +1,99 @@
+"""Per-build scene source bundle for L3 context building.
+
+The episode text and the L3 plot are the reference sources of a scene:
+the plot collector returns the L3 plot, and the character and world setting
+collectors scan both texts for references. SceneSources reads, decodes and
+scans them once per build and is handed to every collector that needs them.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .lazy_loader import FileLazyLoader, LoadPriority
+from .scene_identifier import SceneIdentifier
+from .scene_resolver import ResolvedPaths, SceneResolver
+
+
+@dataclass
+class SceneSources:
+    """Source files of one scene, read and scanned once per build.
+
+    Attributes:
+        scene: The scene the bundle was built for.
+        paths: Resolved file paths of the scene.
+        episode_text: Episode text (None if missing or unreadable).
+        plot_l3_text: L3 plot text (None if missing or unreadable).
+        character_paths: Character files referenced by the scene.
+        world_setting_paths: World setting files referenced by the scene.
+    """
+
+    scene: SceneIdentifier
+    paths: ResolvedPaths
+    episode_text: str | None = None
+    plot_l3_text: str | None = None
+    character_paths: list[Path] = field(default_factory=list)
+    world_setting_paths: list[Path] = field(default_factory=list)
+
+    @classmethod
+    def load(
+        cls,
+        scene: SceneIdentifier,
+        resolver: SceneResolver,
+        loader: FileLazyLoader,
+    ) -> SceneSources:
+        """Resolve, read and scan the reference sources of a scene.
+
+        Args:
+            scene: The scene identifier.
+            resolver: Scene resolver for paths and reference extraction.
+            loader: Loader used to read the source files.
+
+        Returns:
+            The scene source bundle.
+        """
+        paths = resolver.resolve_all(scene)
+        episode_text = _load_text(
+            loader, resolver.vault_root, paths.episode, LoadPriority.OPTIONAL
+        )
+        # The L3 plot is essential for scene writing (as in PlotCollector)
+        plot_l3_text = _load_text(
+            loader, resolver.vault_root, paths.plot_l3, LoadPriority.REQUIRED
+        )
+        character_paths, world_setting_paths = resolver.identify_references(
+            scene, episode_text, plot_l3_text
+        )
+        return cls(
+            scene=scene,
+            paths=paths,
+            episode_text=episode_text,
+            plot_l3_text=plot_l3_text,
+            character_paths=character_paths,
+            world_setting_paths=world_setting_paths,
+        )
+
+
+def _load_text(
+    loader: FileLazyLoader,
+    vault_root: Path,
+    path: Path | None,
+    priority: LoadPriority,
+) -> str | None:
+    """Load a source file through the loader.
+
+    Args:
+        loader: Loader used to read the file.
+        vault_root: Vault root the loader is rooted at.
+        path: Absolute file path, or None if the file does not exist.
+        priority: Load priority of the source.
+
+    Returns:
+        File content, or None if missing, empty or unreadable.
+    """
+    if path is None:
+        return None
+    result = loader.load(str(path.relative_to(vault_root)), priority)
+    if result.success and result.data:
+        return result.data
+    return None
@@ -0,0 +1,53 @@
+"""Striped per-key locks for L3 context caches.
+
+Caches shared by concurrent builds (parallel collectors, AsyncContextBuilder)
+use these locks for single-flight loading: a miss is re-checked and filled
+while holding the key's lock, so concurrent requests for the same key wait
+for one load instead of repeating it. Keys are hashed onto a fixed set of
+locks, so unrelated keys rarely contend and memory does not grow with the
+number of keys.
+"""
+
+import threading
+from collections.abc import Hashable
+
+
+class StripedLocks:
+    """Fixed pool of reentrant locks selected by key hash.
+
+    Example:
+        >>> locks = StripedLocks()
+        >>> with locks.lock_for("episodes/ep010.md"):
+        ...     pass  # re-check the cache, then load
+    """
+
+    # Default number of stripes
+    DEFAULT_STRIPES: int = 16
+
+    def __init__(self, stripes: int = DEFAULT_STRIPES) -> None:
+        """Initialize StripedLocks.
+
+        Args:
+            stripes: Number of locks (must be positive).
+
+        Raises:
+            ValueError: If stripes is not positive.
+        """
+        if stripes <= 0:
+            raise ValueError(f"stripes must be positive: {stripes}")
+        self._locks = [threading.RLock() for _ in range(stripes)]
+
+    def __len__(self) -> int:
+        """Return the number of stripes."""
+        return len(self._locks)
+
+    def lock_for(self, key: Hashable) -> threading.RLock:
+        """Get the lock guarding a key.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            The lock of the key's stripe (the same lock for equal keys).
+        """
+        return self._locks[hash(key) % len(self._locks)]
@@ -8,6 +8,7 @@ from dataclasses import dataclass, field
 
 from src.core.models.ai_visibility import AIVisibilityLevel
 from src.core.services.visibility_controller import VisibilityController
+from src.core.tracing import traced
 
 from .filtered_context import FilteredContext
 from .visibility_context import VisibilityAwareContext, VisibilityHint
@@ -50,6 +51,7 @@ class VisibilityFilteringService:
         """
         self.visibility_controller = visibility_controller
 
+    @traced("visibility")
     def filter_context(
         self,
         context: FilteredContext,
@@ -108,7 +110,9 @@ class VisibilityFilteringService:
 
         for name, content in characters.items():
             # Use VisibilityController to filter content
-            filter_result = self.visibility_controller.filter(content)
+            filter_result = self.visibility_controller.filter(
+                content, entity_type="character", entity_name=name
+            )
 
             # Store filtered content
             filtered[name] = filter_result.content
@@ -151,7 +155,9 @@ class VisibilityFilteringService:
 
         for name, content in world_settings.items():
             # Use VisibilityController to filter content
-            filter_result = self.visibility_controller.filter(content)
+            filter_result = self.visibility_controller.filter(
+                content, entity_type="world_setting", entity_name=name
+            )
 
             # Store filtered content
             filtered[name] = filter_result.content
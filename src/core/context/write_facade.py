@@ -15,9 +15,11 @@ from src.core.models.foreshadowing import (
 )
 from src.core.models.world_setting import WorldSetting
 from src.core.repositories.character import CharacterRepository
+from src.core.repositories.entity_cache import get_entity_cache
 from src.core.repositories.foreshadowing import ForeshadowingRepository
 from src.core.repositories.world_setting import WorldSettingRepository
 from src.core.services.foreshadowing_manager import ForeshadowingManager
+from src.core.services.timeline_index import TimelineIndex
 
 if TYPE_CHECKING:
     from src.core.models.style import StyleProfile
@@ -64,6 +66,7 @@ class WriteFacade:
         foreshadowing_manager: ForeshadowingManager | None = None,
         character_repository: CharacterRepository | None = None,
         world_setting_repository: WorldSettingRepository | None = None,
+        timeline_index: TimelineIndex | None = None,
     ) -> None:
         """Initialize WriteFacade.
 
@@ -74,6 +77,8 @@ class WriteFacade:
             foreshadowing_manager: Foreshadowing manager service (optional)
             character_repository: Character repository (optional)
             world_setting_repository: World setting repository (optional)
+            timeline_index: Timeline index kept in sync with appended
+                timeline events (optional)
         """
         self._vault_root = vault_root
         self._work_name = work_name
@@ -81,6 +86,7 @@ class WriteFacade:
         self._foreshadowing_manager = foreshadowing_manager
         self._character_repository = character_repository
         self._world_setting_repository = world_setting_repository
+        self._timeline_index = timeline_index
 
     def update_foreshadowing_status(
         self,
@@ -154,32 +160,11 @@ class WriteFacade:
                 "foreshadowing_repository", "add_foreshadowing_event"
             )
 
-        # Read current entity
-        current = self._foreshadowing_repository.read(foreshadowing_id)
-
-        # Add event to timeline
-        from datetime import date
-
-        from src.core.models.foreshadowing import TimelineInfo
-
-        if current.timeline is None:
-            # Create new timeline if it doesn't exist
-            new_timeline = TimelineInfo(
-                registered_at=date.today(),
-                events=[event],
-            )
-        else:
-            # Add to existing timeline
-            new_timeline = TimelineInfo(
-                registered_at=current.timeline.registered_at,
-                events=current.timeline.events + [event],
-            )
+        # Appended to the registry journal (no full registry rewrite)
+        updated = self._foreshadowing_repository.append_event(foreshadowing_id, event)
 
-        # Update entity with new timeline
-        updated = current.model_copy(update={"timeline": new_timeline})
-
-        # Persist
-        self._foreshadowing_repository.update(updated)
+        if self._timeline_index is not None:
+            self._timeline_index.add_event(updated, event)
 
         return updated
 
@@ -432,6 +417,7 @@ class WriteFacade:
             path.parent.mkdir(parents=True, exist_ok=True)
             tmp_path.write_text(content, encoding="utf-8")
             tmp_path.replace(path)
+            get_entity_cache().invalidate(path)
         except OSError:
             if tmp_path.exists():
                 tmp_path.unlink()
@@ -0,0 +1,43 @@
+"""パッケージの遅延エクスポート.
+
+パッケージの __init__ で全サブモジュールを import すると、1 つの軽いクラス
+（例: SceneIdentifier）を使うだけでもパッケージ全体の import コストがかかる。
+公開名 → 定義モジュールの対応表を持たせ、モジュールの __getattr__（PEP 562）
+から load_export() を呼ぶことで、初回アクセス時にだけ import する。
+"""
+
+from __future__ import annotations
+
+import importlib
+from collections.abc import Mapping
+from typing import Any
+
+
+def load_export(
+    package: str,
+    exports: Mapping[str, str],
+    name: str,
+    namespace: dict[str, Any],
+) -> Any:
+    """遅延エクスポートされた名前を解決する.
+
+    解決した値はパッケージの名前空間に保存し、2 回目以降は通常の属性参照になる。
+
+    Args:
+        package: パッケージ名（__name__）
+        exports: 公開名 → 定義モジュール（相対名）の対応表
+        name: 参照された名前
+        namespace: パッケージの名前空間（globals()）
+
+    Returns:
+        解決した値
+
+    Raises:
+        AttributeError: 公開名でない場合
+    """
+    module_name = exports.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {package!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, package), name)
+    namespace[name] = value
+    return value
@@ -9,6 +9,8 @@ from typing import Any, Literal
 import frontmatter
 import yaml
 
+from src.core.tracing import traced
+
 
 class ParseError(Exception):
     """frontmatter の解析に失敗した場合の例外."""
@@ -41,6 +43,7 @@ class ParseResult:
     error: str | None = None
 
 
+@traced("parse")
 def parse_frontmatter(content: str) -> tuple[dict[str, Any], str]:
     """Markdown コンテンツから frontmatter と本文を抽出する.
 
@@ -5,12 +5,16 @@ Markdown + YAML frontmatter 形式のエンティティに対する CRUD 操作
 
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Generic, TypeVar
+from typing import TYPE_CHECKING, Generic, TypeVar
 
 import yaml
 from pydantic import BaseModel
 
 from src.core.parsers.frontmatter import parse_frontmatter
+from src.core.repositories.entity_cache import get_entity_cache
+
+if TYPE_CHECKING:
+    from src.core.vault.index import VaultIndex
 
 T = TypeVar("T", bound=BaseModel)
 
@@ -34,7 +38,14 @@ class EntityExistsError(RepositoryError):
 
 
 class BaseRepository(ABC, Generic[T]):
-    """エンティティ CRUD 操作の基底クラス."""
+    """エンティティ CRUD 操作の基底クラス.
+
+    読み込んだエンティティはプロセス共通の EntityCache にキャッシュされ、
+    ファイルが変更されるまで再パースしない。
+    """
+
+    # EntityCache の名前空間（None の場合はリポジトリクラス名）
+    _CACHE_NAMESPACE: str | None = None
 
     def __init__(self, vault_root: Path) -> None:
         """初期化.
@@ -43,6 +54,8 @@ class BaseRepository(ABC, Generic[T]):
             vault_root: Vault のルートディレクトリ
         """
         self.vault_root = vault_root
+        # Vault 索引（設定されている場合は書き込み時に索引へ反映する）
+        self._index: VaultIndex | None = None
 
     @abstractmethod
     def _get_path(self, identifier: str) -> Path:
@@ -93,6 +106,7 @@ class BaseRepository(ABC, Generic[T]):
         if path.exists():
             raise EntityExistsError(f"Already exists: {path}")
         self._write(path, entity)
+        self._invalidate(path)
         return path
 
     def read(self, identifier: str) -> T:
@@ -110,7 +124,7 @@ class BaseRepository(ABC, Generic[T]):
         path = self._get_path(identifier)
         if not path.exists():
             raise EntityNotFoundError(f"Not found: {path}")
-        return self._read(path)
+        return self._read_cached(path)
 
     def update(self, entity: T) -> None:
         """エンティティを更新.
@@ -125,6 +139,7 @@ class BaseRepository(ABC, Generic[T]):
         if not path.exists():
             raise EntityNotFoundError(f"Not found: {path}")
         self._write(path, entity)
+        self._invalidate(path)
 
     def delete(self, identifier: str) -> None:
         """エンティティを削除.
@@ -139,6 +154,7 @@ class BaseRepository(ABC, Generic[T]):
         if not path.exists():
             raise EntityNotFoundError(f"Not found: {path}")
         path.unlink()
+        self._invalidate(path)
 
     def exists(self, identifier: str) -> bool:
         """エンティティが存在するか確認.
@@ -151,6 +167,37 @@ class BaseRepository(ABC, Generic[T]):
         """
         return self._get_path(identifier).exists()
 
+    def _invalidate(self, path: Path) -> None:
+        """書き込み・削除したファイルのキャッシュと索引を更新.
+
+        Args:
+            path: ファイルパス
+        """
+        get_entity_cache().invalidate(path)
+        if self._index is not None:
+            from src.core.vault.index import VaultIndexError
+
+            try:
+                self._index.update_path(path)
+            except VaultIndexError:
+                # 索引を更新できない場合は以降ファイルシステムを直接使う
+                self._index = None
+
+    def _read_cached(self, path: Path) -> T:
+        """キャッシュ経由でファイルからモデルを読み込み.
+
+        ファイルのフィンガープリントが前回パース時と同じ場合、
+        _read() を呼ばずにキャッシュ済みモデルのコピーを返す。
+
+        Args:
+            path: ファイルパス
+
+        Returns:
+            読み込んだモデル（呼び出し側で変更してよいコピー）
+        """
+        namespace = self._CACHE_NAMESPACE or type(self).__qualname__
+        return get_entity_cache().get_or_load(namespace, path, self._read, copy=True)
+
     def _read(self, path: Path) -> T:
         """ファイルからモデルを読み込み.
 
@@ -7,12 +7,16 @@ from pathlib import Path
 
 from src.core.models.character import Character
 from src.core.repositories.base import BaseRepository
+from src.core.repositories.entity_cache import CHARACTER_NAMESPACE
 from src.core.vault.path_resolver import VaultPathResolver
 
 
 class CharacterRepository(BaseRepository[Character]):
     """Character リポジトリ."""
 
+    # CharacterCollector とパース結果を共有する
+    _CACHE_NAMESPACE = CHARACTER_NAMESPACE
+
     def __init__(self, vault_root: Path) -> None:
         """初期化."""
         super().__init__(vault_root)
@@ -39,7 +43,7 @@ class CharacterRepository(BaseRepository[Character]):
         chars_dir = self.vault_root / "characters"
         if not chars_dir.exists():
             return []
-        return [self._read(path) for path in chars_dir.glob("*.md")]
+        return [self._read_cached(path) for path in chars_dir.glob("*.md")]
 
     def get_by_tag(self, tag: str) -> list[Character]:
         """タグでフィルタリング.
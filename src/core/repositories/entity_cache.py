@@ -0,0 +1,180 @@
+"""EntityCache.
+
+パース・検証済みエンティティ（Pydantic モデル）のプロセス共通キャッシュ。
+(名前空間, パス) をキーとし、ファイルのフィンガープリントが一致する間は
+YAML パースとモデル構築を再実行しない。
+
+リポジトリとコレクターで同じパース方法を使うものは同じ名前空間を共有する。
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, TypeVar
+
+from pydantic import BaseModel
+
+from src.core.vault.fingerprint import FileFingerprint
+
+M = TypeVar("M", bound=BaseModel)
+
+# 名前空間: Character（CharacterRepository と CharacterCollector で共有）
+CHARACTER_NAMESPACE = "Character"
+
+
+class EntityCache:
+    """パース済みエンティティのキャッシュ.
+
+    キャッシュしたモデルは呼び出し側で共有されるため、変更してはならない。
+    変更する可能性がある呼び出し側は get_or_load(copy=True) を使うこと。
+
+    Attributes:
+        max_entries: 最大エントリ数（超過時は LRU で追い出す）
+    """
+
+    DEFAULT_MAX_ENTRIES: int = 4096
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        """初期化.
+
+        Args:
+            max_entries: 最大エントリ数
+        """
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, str], tuple[FileFingerprint, Any]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @staticmethod
+    def _key(namespace: str, path: Path) -> tuple[str, str]:
+        """キャッシュキーを作成（パスは絶対パスに正規化）."""
+        return namespace, os.path.abspath(path)
+
+    def get(
+        self, namespace: str, path: Path, fingerprint: FileFingerprint | None
+    ) -> Any | None:
+        """フィンガープリントが一致するキャッシュ済みモデルを取得.
+
+        Args:
+            namespace: 名前空間（パース方法の識別子）
+            path: ファイルパス
+            fingerprint: 現在のファイルのフィンガープリント
+
+        Returns:
+            キャッシュ済みモデル、無効または未登録の場合は None
+        """
+        if fingerprint is None:
+            return None
+        key = self._key(namespace, path)
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None and cached[0] == fingerprint:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return cached[1]
+            self._misses += 1
+            return None
+
+    def put(
+        self,
+        namespace: str,
+        path: Path,
+        fingerprint: FileFingerprint | None,
+        entity: Any,
+    ) -> None:
+        """モデルをキャッシュに登録.
+
+        Args:
+            namespace: 名前空間
+            path: ファイルパス
+            fingerprint: パースしたファイル内容のフィンガープリント
+            entity: パース済みモデル
+        """
+        if fingerprint is None:
+            return
+        key = self._key(namespace, path)
+        with self._lock:
+            self._entries[key] = (fingerprint, entity)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get_or_load(
+        self,
+        namespace: str,
+        path: Path,
+        load: Callable[[Path], M],
+        *,
+        copy: bool = False,
+    ) -> M:
+        """キャッシュから取得し、なければ load でパースして登録する.
+
+        フィンガープリントは読み込み前に取得するため、読み込み中にファイルが
+        更新された場合でも次回アクセス時に再読み込みされる。
+
+        Args:
+            namespace: 名前空間
+            path: ファイルパス
+            load: ファイルを読み込んでモデルを返す関数
+            copy: True の場合ディープコピーを返す（呼び出し側が変更する場合）
+
+        Returns:
+            パース済みモデル
+
+        Raises:
+            FileNotFoundError: ファイルが存在しない場合
+        """
+        fingerprint = FileFingerprint.of(path)
+        entity = self.get(namespace, path, fingerprint)
+        if entity is None:
+            entity = load(path)
+            self.put(namespace, path, fingerprint, entity)
+        return entity.model_copy(deep=True) if copy else entity
+
+    def invalidate(self, path: Path) -> None:
+        """パスに対応するエントリを全名前空間から削除.
+
+        Args:
+            path: ファイルパス
+        """
+        abs_path = os.path.abspath(path)
+        with self._lock:
+            for key in [k for k in self._entries if k[1] == abs_path]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """全エントリを削除."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def get_stats(self) -> dict[str, int]:
+        """キャッシュ統計を取得.
+
+        Returns:
+            total（エントリ数）, hits, misses の辞書
+        """
+        with self._lock:
+            return {
+                "total": len(self._entries),
+                "hits": self._hits,
+                "misses": self._misses,
+            }
+
+
+_entity_cache = EntityCache()
+
+
+def get_entity_cache() -> EntityCache:
+    """プロセス共通の EntityCache を取得.
+
+    Returns:
+        EntityCache インスタンス
+    """
+    return _entity_cache
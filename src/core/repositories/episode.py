@@ -42,7 +42,7 @@ class EpisodeRepository(BaseRepository[Episode]):
             return []
         episodes = []
         for path in sorted(episodes_dir.glob("ep_*.md")):
-            episodes.append(self._read(path))
+            episodes.append(self._read_cached(path))
         return episodes
 
     def get_range(self, start: int, end: int) -> list[Episode]:
@@ -1,24 +1,90 @@
 """Foreshadowing repository.
 
 伏線データを YAML レジストリ形式で管理するリポジトリ。
+
+レジストリはメモリ上の索引（ID → エントリ、ステータス別、エピソード別）として
+保持し、ファイルのフィンガープリントが変わった場合のみ再パースする。
+書き込みは一時ファイル + rename によるアトミック書き込みで行い、
+タイムラインイベントの追加は追記専用のジャーナルに記録する。
 """
 
+import json
+import re
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import date
 from pathlib import Path
 from typing import Any
 
 import yaml
 
-from src.core.models.foreshadowing import Foreshadowing, ForeshadowingStatus
+from src.core.models.foreshadowing import (
+    Foreshadowing,
+    ForeshadowingStatus,
+    TimelineEntry,
+)
 from src.core.repositories.base import EntityExistsError, EntityNotFoundError
+from src.core.vault.fingerprint import FileFingerprint
+
+# 伏線 ID から設置エピソードを抽出するパターン（FS-{episode}-{slug}）
+_ID_EPISODE_PATTERN = re.compile(r"^FS-(\d+)-")
+
+
+def normalize_episode(episode: str) -> str:
+    """エピソード識別子を正規化する.
+
+    "ep010" / "010" / "10" はいずれも "10" になる。
+
+    Args:
+        episode: エピソード識別子
+
+    Returns:
+        正規化されたエピソード識別子
+    """
+    ep = episode.lower().replace("ep", "").lstrip("0")
+    return ep if ep else "0"
+
+
+def _referenced_episodes(raw: dict[str, Any]) -> set[str]:
+    """エントリが参照するエピソード（正規化済み）を返す.
+
+    ID の設置エピソード、タイムラインイベント、回収予定エピソードを対象とする。
+    """
+    episodes: set[str] = set()
+    match = _ID_EPISODE_PATTERN.match(str(raw.get("id", "")))
+    if match:
+        episodes.add(normalize_episode(match.group(1)))
+    timeline = raw.get("timeline") or {}
+    for event in timeline.get("events") or []:
+        if event.get("episode"):
+            episodes.add(normalize_episode(str(event["episode"])))
+    payoff = raw.get("payoff") or {}
+    if payoff.get("planned_episode"):
+        episodes.add(normalize_episode(str(payoff["planned_episode"])))
+    return episodes
 
 
 class ForeshadowingRepository:
     """伏線リポジトリ.
 
     vault/{作品名}/_foreshadowing/registry.yaml を管理する。
+
+    読み込んだレジストリはインスタンス内に索引として保持し、
+    registry.yaml とジャーナルのフィンガープリントが変わるまで再パースしない
+    （他プロセス・他インスタンスによる変更は stat で検出する）。
+
+    - 書き込みはアトミック（一時ファイル + rename）。batch() 内の書き込みは
+      ブロック終了時に1回だけ保存する。
+    - append_event() はレジストリ全体を書き直さず、
+      registry.journal.jsonl に1行追記する。ジャーナルは読み込み時に再生され、
+      JOURNAL_COMPACT_THRESHOLD 件に達するか他の書き込みが行われた時点で
+      レジストリへ統合（コンパクション）される。
     """
 
+    # ジャーナルをレジストリへ統合するイベント件数
+    JOURNAL_COMPACT_THRESHOLD: int = 64
+
     def __init__(self, vault_root: Path, work_name: str) -> None:
         """初期化.
 
@@ -28,11 +94,45 @@ class ForeshadowingRepository:
         """
         self.vault_root = vault_root
         self.work_name = work_name
+        self._lock = threading.RLock()
+        # 読み込み時点の (registry, journal) フィンガープリント
+        self._fingerprint: tuple[FileFingerprint | None, FileFingerprint | None] | None = None
+        self._loaded = False
+        # レジストリのヘッダ（foreshadowing 以外のキー）
+        self._header: dict[str, Any] = {}
+        # ID → エントリ（レジストリの順序を保持）
+        self._entries: dict[str, dict[str, Any]] = {}
+        # ID → 並び順（セカンダリ索引の結果をレジストリ順に並べるため）
+        self._order: dict[str, int] = {}
+        self._next_order = 0
+        # ステータス値 → ID 集合、正規化エピソード → ID 集合
+        self._by_status: dict[str, set[str]] = {}
+        self._by_episode: dict[str, set[str]] = {}
+        # 最後に適用したジャーナル番号と、未統合のジャーナル件数
+        self._journal_seq = 0
+        self._journal_count = 0
+        self._batch_depth = 0
+        self._dirty = False
+        # 索引の内容が変わるたびに増える世代番号（registry_version() 用）
+        self._generation = 0
 
     def _get_registry_path(self) -> Path:
         """レジストリファイルのパスを返す."""
         return self.vault_root / self.work_name / "_foreshadowing" / "registry.yaml"
 
+    def _get_journal_path(self) -> Path:
+        """ジャーナルファイルのパスを返す."""
+        return self._get_registry_path().with_name("registry.journal.jsonl")
+
+    def _current_fingerprint(
+        self,
+    ) -> tuple[FileFingerprint | None, FileFingerprint | None]:
+        """レジストリとジャーナルの現在のフィンガープリントを返す."""
+        return (
+            FileFingerprint.of_or_none(self._get_registry_path()),
+            FileFingerprint.of_or_none(self._get_journal_path()),
+        )
+
     def _load_registry(self) -> dict[str, Any]:
         """レジストリを読み込む."""
         path = self._get_registry_path()
@@ -43,21 +143,172 @@ class ForeshadowingRepository:
         data = yaml.safe_load(content)
         return data if data else {"version": "1.0", "last_updated": None, "foreshadowing": []}
 
-    def _save_registry(self, data: dict[str, Any]) -> None:
-        """レジストリを保存する."""
+    def _load_journal(self, after_seq: int) -> list[dict[str, Any]]:
+        """ジャーナルを読み込む.
+
+        Args:
+            after_seq: この番号以下のレコード（統合済み）は読み飛ばす
+
+        Returns:
+            未統合のジャーナルレコード（書き込み途中の行は無視する）
+        """
+        path = self._get_journal_path()
+        if not path.exists():
+            return []
+
+        records: list[dict[str, Any]] = []
+        for line in path.read_text(encoding="utf-8").splitlines():
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if (
+                isinstance(record, dict)
+                and "event" in record
+                and record.get("seq", 0) > after_seq
+            ):
+                records.append(record)
+        return records
+
+    def _ensure_loaded(self) -> None:
+        """ファイルが変更されていれば索引を再構築する.
+
+        batch() 内ではメモリ上の状態が正とし、再読み込みしない。
+        """
+        if self._batch_depth:
+            return
+        fingerprint = self._current_fingerprint()
+        if self._loaded and fingerprint == self._fingerprint:
+            return
+
+        data = self._load_registry()
+        self._generation += 1
+        self._header = {k: v for k, v in data.items() if k != "foreshadowing"}
+        self._entries = {}
+        self._order = {}
+        self._next_order = 0
+        self._by_status = {}
+        self._by_episode = {}
+        for raw in data.get("foreshadowing") or []:
+            fs_id = raw.get("id")
+            if fs_id is not None and fs_id not in self._entries:
+                self._add_entry(fs_id, raw)
+
+        self._journal_seq = int(self._header.get("journal_seq") or 0)
+        records = self._load_journal(self._journal_seq)
+        for record in records:
+            if record.get("id") in self._entries:
+                self._apply_event(record["id"], record["event"], record.get("registered_at"))
+            self._journal_seq = max(self._journal_seq, int(record["seq"]))
+        self._journal_count = len(records)
+
+        self._fingerprint = fingerprint
+        self._loaded = True
+
+    def _index(self, fs_id: str, raw: dict[str, Any]) -> None:
+        """エントリをセカンダリ索引に登録する."""
+        self._generation += 1
+        self._by_status.setdefault(str(raw.get("status")), set()).add(fs_id)
+        for episode in _referenced_episodes(raw):
+            self._by_episode.setdefault(episode, set()).add(fs_id)
+
+    def _unindex(self, fs_id: str, raw: dict[str, Any]) -> None:
+        """エントリをセカンダリ索引から削除する."""
+        self._generation += 1
+        self._by_status.get(str(raw.get("status")), set()).discard(fs_id)
+        for episode in _referenced_episodes(raw):
+            self._by_episode.get(episode, set()).discard(fs_id)
+
+    def _add_entry(self, fs_id: str, raw: dict[str, Any]) -> None:
+        """エントリを末尾に追加して索引に登録する."""
+        self._entries[fs_id] = raw
+        self._order[fs_id] = self._next_order
+        self._next_order += 1
+        self._index(fs_id, raw)
+
+    def _apply_event(
+        self, fs_id: str, event: dict[str, Any], registered_at: str | None
+    ) -> None:
+        """タイムラインイベントをエントリに適用する."""
+        raw = self._entries[fs_id]
+        self._unindex(fs_id, raw)
+        if raw.get("timeline") is None:
+            raw["timeline"] = {
+                "registered_at": registered_at or date.today().isoformat(),
+                "events": [],
+            }
+        raw["timeline"].setdefault("events", []).append(event)
+        self._index(fs_id, raw)
+
+    def _write_registry(self) -> None:
+        """メモリ上のレジストリをアトミックに保存し、ジャーナルを統合する.
+
+        一時ファイルに書き込んでから rename する。レジストリには統合済みの
+        ジャーナル番号を記録するため、rename 後にジャーナルの削除前に
+        中断してもイベントが二重に適用されることはない。
+        """
         path = self._get_registry_path()
         path.parent.mkdir(parents=True, exist_ok=True)
 
+        data = dict(self._header)
         data["last_updated"] = date.today().isoformat()
-        content = yaml.dump(data, allow_unicode=True, default_flow_style=False, sort_keys=False)
-        path.write_text(content, encoding="utf-8")
+        if self._journal_seq:
+            data["journal_seq"] = self._journal_seq
+        data["foreshadowing"] = list(self._entries.values())
+        self._header = {k: v for k, v in data.items() if k != "foreshadowing"}
 
-    def _find_index(self, registry: dict[str, Any], fs_id: str) -> int | None:
-        """ID から伏線のインデックスを検索."""
-        for i, fs in enumerate(registry.get("foreshadowing", [])):
-            if fs.get("id") == fs_id:
-                return i
-        return None
+        content = yaml.dump(data, allow_unicode=True, default_flow_style=False, sort_keys=False)
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        try:
+            tmp_path.write_text(content, encoding="utf-8")
+            tmp_path.replace(path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+            self._loaded = False
+            raise
+        self._get_journal_path().unlink(missing_ok=True)
+        self._journal_count = 0
+        self._fingerprint = self._current_fingerprint()
+
+    def _commit(self) -> None:
+        """変更を保存する（batch() 内ではブロック終了まで遅延する）."""
+        if self._batch_depth:
+            self._dirty = True
+        else:
+            self._write_registry()
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """ブロック内の書き込みをまとめて1回で保存する.
+
+        ブロックが例外で終了した場合、変更は保存されず破棄される。
+        入れ子にした場合は最も外側のブロック終了時に保存する。
+
+        Yields:
+            None
+        """
+        with self._lock:
+            self._ensure_loaded()
+            self._batch_depth += 1
+            completed = False
+            try:
+                yield
+                completed = True
+            finally:
+                self._batch_depth -= 1
+                if self._batch_depth == 0:
+                    if not completed:
+                        self._loaded = False
+                    elif self._dirty:
+                        self._write_registry()
+                    self._dirty = False
+
+    def compact(self) -> None:
+        """ジャーナルをレジストリへ統合する."""
+        with self._lock:
+            self._ensure_loaded()
+            if self._journal_count:
+                self._commit()
 
     def create(self, entity: Foreshadowing) -> None:
         """伏線を作成する.
@@ -68,15 +319,14 @@ class ForeshadowingRepository:
         Raises:
             EntityExistsError: 同じ ID の伏線が既に存在する場合
         """
-        registry = self._load_registry()
+        with self._lock:
+            self._ensure_loaded()
 
-        if self._find_index(registry, entity.id) is not None:
-            raise EntityExistsError(f"Foreshadowing already exists: {entity.id}")
+            if entity.id in self._entries:
+                raise EntityExistsError(f"Foreshadowing already exists: {entity.id}")
 
-        registry["foreshadowing"].append(
-            entity.model_dump(mode="json", exclude_none=True)
-        )
-        self._save_registry(registry)
+            self._add_entry(entity.id, entity.model_dump(mode="json", exclude_none=True))
+            self._commit()
 
     def read(self, fs_id: str) -> Foreshadowing:
         """伏線を読み込む.
@@ -90,13 +340,33 @@ class ForeshadowingRepository:
         Raises:
             EntityNotFoundError: 伏線が見つからない場合
         """
-        registry = self._load_registry()
-        idx = self._find_index(registry, fs_id)
+        with self._lock:
+            self._ensure_loaded()
+            raw = self._entries.get(fs_id)
+
+            if raw is None:
+                raise EntityNotFoundError(f"Foreshadowing not found: {fs_id}")
+
+            return Foreshadowing(**raw)
 
-        if idx is None:
-            raise EntityNotFoundError(f"Foreshadowing not found: {fs_id}")
+    def read_many(self, fs_ids: list[str]) -> dict[str, Foreshadowing]:
+        """複数の伏線をまとめて読み込む.
 
-        return Foreshadowing(**registry["foreshadowing"][idx])
+        レジストリの変更確認は1回だけ行う。
+
+        Args:
+            fs_ids: 伏線 ID のリスト
+
+        Returns:
+            ID → 伏線モデルの辞書（指定順）。存在しない ID は含まない。
+        """
+        with self._lock:
+            self._ensure_loaded()
+            return {
+                fs_id: Foreshadowing(**self._entries[fs_id])
+                for fs_id in dict.fromkeys(fs_ids)
+                if fs_id in self._entries
+            }
 
     def update(self, entity: Foreshadowing) -> None:
         """伏線を更新する.
@@ -107,16 +377,72 @@ class ForeshadowingRepository:
         Raises:
             EntityNotFoundError: 伏線が見つからない場合
         """
-        registry = self._load_registry()
-        idx = self._find_index(registry, entity.id)
+        with self._lock:
+            self._ensure_loaded()
+            raw = self._entries.get(entity.id)
 
-        if idx is None:
-            raise EntityNotFoundError(f"Foreshadowing not found: {entity.id}")
+            if raw is None:
+                raise EntityNotFoundError(f"Foreshadowing not found: {entity.id}")
 
-        registry["foreshadowing"][idx] = entity.model_dump(
-            mode="json", exclude_none=True
-        )
-        self._save_registry(registry)
+            self._unindex(entity.id, raw)
+            new_raw = entity.model_dump(mode="json", exclude_none=True)
+            self._entries[entity.id] = new_raw
+            self._index(entity.id, new_raw)
+            self._commit()
+
+    def append_event(self, fs_id: str, event: TimelineEntry) -> Foreshadowing:
+        """伏線のタイムラインにイベントを追加する.
+
+        レジストリ全体は書き直さず、ジャーナルに1行追記する
+        （batch() 内ではブロック終了時にレジストリへ保存する）。
+        タイムラインが無い場合は本日付で作成する。
+
+        Args:
+            fs_id: 伏線 ID
+            event: 追加するイベント
+
+        Returns:
+            更新後の伏線モデル
+
+        Raises:
+            EntityNotFoundError: 伏線が見つからない場合
+        """
+        with self._lock:
+            self._ensure_loaded()
+
+            if fs_id not in self._entries:
+                raise EntityNotFoundError(f"Foreshadowing not found: {fs_id}")
+
+            event_data = event.model_dump(mode="json", exclude_none=True)
+            registered_at = date.today().isoformat()
+            self._apply_event(fs_id, event_data, registered_at)
+            self._journal_seq += 1
+
+            if self._batch_depth or self._journal_count + 1 >= self.JOURNAL_COMPACT_THRESHOLD:
+                self._commit()
+            else:
+                self._append_journal(
+                    {
+                        "seq": self._journal_seq,
+                        "id": fs_id,
+                        "registered_at": registered_at,
+                        "event": event_data,
+                    }
+                )
+            return Foreshadowing(**self._entries[fs_id])
+
+    def _append_journal(self, record: dict[str, Any]) -> None:
+        """ジャーナルにレコードを1行追記する."""
+        path = self._get_journal_path()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            with path.open("a", encoding="utf-8") as f:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        except OSError:
+            self._loaded = False
+            raise
+        self._journal_count += 1
+        self._fingerprint = self._current_fingerprint()
 
     def delete(self, fs_id: str) -> None:
         """伏線を削除する.
@@ -127,14 +453,16 @@ class ForeshadowingRepository:
         Raises:
             EntityNotFoundError: 伏線が見つからない場合
         """
-        registry = self._load_registry()
-        idx = self._find_index(registry, fs_id)
+        with self._lock:
+            self._ensure_loaded()
+            raw = self._entries.pop(fs_id, None)
 
-        if idx is None:
-            raise EntityNotFoundError(f"Foreshadowing not found: {fs_id}")
+            if raw is None:
+                raise EntityNotFoundError(f"Foreshadowing not found: {fs_id}")
 
-        del registry["foreshadowing"][idx]
-        self._save_registry(registry)
+            self._unindex(fs_id, raw)
+            del self._order[fs_id]
+            self._commit()
 
     def exists(self, fs_id: str) -> bool:
         """伏線が存在するか確認する.
@@ -145,8 +473,22 @@ class ForeshadowingRepository:
         Returns:
             存在する場合 True
         """
-        registry = self._load_registry()
-        return self._find_index(registry, fs_id) is not None
+        with self._lock:
+            self._ensure_loaded()
+            return fs_id in self._entries
+
+    def registry_version(self) -> int:
+        """レジストリの版を返す.
+
+        内容が変わるたびに（他プロセスによる変更の検出を含む）異なる値になる。
+        伏線の一覧から作った索引を、版が変わるまで再利用するために使う。
+
+        Returns:
+            このインスタンス内で単調増加する版番号
+        """
+        with self._lock:
+            self._ensure_loaded()
+            return self._generation
 
     def list_all(self) -> list[Foreshadowing]:
         """すべての伏線をリストする.
@@ -154,9 +496,15 @@ class ForeshadowingRepository:
         Returns:
             伏線のリスト
         """
-        registry = self._load_registry()
+        with self._lock:
+            self._ensure_loaded()
+            return [Foreshadowing(**fs_data) for fs_data in self._entries.values()]
+
+    def _list_ids(self, ids: set[str]) -> list[Foreshadowing]:
+        """ID 集合の伏線をレジストリ順で返す."""
         return [
-            Foreshadowing(**fs_data) for fs_data in registry.get("foreshadowing", [])
+            Foreshadowing(**self._entries[fs_id])
+            for fs_id in sorted(ids, key=self._order.__getitem__)
         ]
 
     def list_by_status(self, status: ForeshadowingStatus) -> list[Foreshadowing]:
@@ -168,5 +516,23 @@ class ForeshadowingRepository:
         Returns:
             フィルタされた伏線のリスト
         """
-        all_fs = self.list_all()
-        return [fs for fs in all_fs if fs.status == status]
+        with self._lock:
+            self._ensure_loaded()
+            return self._list_ids(self._by_status.get(status.value, set()))
+
+    def list_by_episode(self, episode: str) -> list[Foreshadowing]:
+        """エピソードを参照する伏線をリストする.
+
+        ID の設置エピソード、タイムラインイベントのエピソード、
+        回収予定エピソードのいずれかが一致する伏線を返す
+        （"ep010" / "010" / "10" は同一とみなす）。
+
+        Args:
+            episode: エピソード識別子
+
+        Returns:
+            該当する伏線のリスト
+        """
+        with self._lock:
+            self._ensure_loaded()
+            return self._list_ids(self._by_episode.get(normalize_episode(episode), set()))
@@ -5,7 +5,7 @@ Summary エンティティの CRUD 操作を行うリポジトリ。
 """
 
 from pathlib import Path
-from typing import Literal
+from typing import TYPE_CHECKING, Literal
 
 import yaml
 
@@ -14,6 +14,9 @@ from src.core.parsers.frontmatter import parse_frontmatter
 from src.core.repositories.base import BaseRepository
 from src.core.vault.path_resolver import VaultPathResolver
 
+if TYPE_CHECKING:
+    from src.core.vault.index import VaultIndex
+
 Summary = SummaryL1 | SummaryL2 | SummaryL3
 
 
@@ -26,9 +29,16 @@ class SummaryRepository(BaseRepository[Summary]):
         現在の実装では、L3 ディレクトリ名から chapter_name を抽出している。
     """
 
-    def __init__(self, vault_root: Path) -> None:
-        """初期化."""
+    def __init__(self, vault_root: Path, index: "VaultIndex | None" = None) -> None:
+        """初期化.
+
+        Args:
+            vault_root: Vault のルートディレクトリ
+            index: Vault 索引（指定時は list_all を索引クエリで行う。
+                index.vault_root は vault_root と同じであること）
+        """
         super().__init__(vault_root)
+        self._index = index
         self._path_resolver = VaultPathResolver(vault_root)
 
     def _get_path(self, identifier: str) -> Path:
@@ -179,6 +189,18 @@ class SummaryRepository(BaseRepository[Summary]):
         Returns:
             サマリのリスト（L1, L2, L3 すべて）
         """
+        if self._index is not None:
+            from src.core.vault.index import VaultIndexError
+
+            try:
+                with self._index.batch():
+                    paths = self._indexed_paths(self._index)
+            except VaultIndexError:
+                # 索引を開けない場合はファイルシステムの走査にフォールバック
+                self._index = None
+            else:
+                return [self._read_cached(path) for path in paths]
+
         summaries: list[Summary] = []
 
         summary_dir = self.vault_root / "_summary"
@@ -188,13 +210,13 @@ class SummaryRepository(BaseRepository[Summary]):
         # L1: _summary/L1_overall.md
         l1_path = summary_dir / "L1_overall.md"
         if l1_path.exists():
-            summaries.append(self._read(l1_path))
+            summaries.append(self._read_cached(l1_path))
 
         # L2: _summary/L2_chapters/*.md
         l2_dir = summary_dir / "L2_chapters"
         if l2_dir.exists():
             for path in l2_dir.glob("*.md"):
-                summaries.append(self._read(path))
+                summaries.append(self._read_cached(path))
 
         # L3: _summary/L3_sequences/*/*.md
         l3_dir = summary_dir / "L3_sequences"
@@ -202,6 +224,16 @@ class SummaryRepository(BaseRepository[Summary]):
             for chapter_dir in l3_dir.iterdir():
                 if chapter_dir.is_dir():
                     for path in chapter_dir.glob("*.md"):
-                        summaries.append(self._read(path))
+                        summaries.append(self._read_cached(path))
 
         return summaries
+
+    def _indexed_paths(self, index: "VaultIndex") -> list[Path]:
+        """索引から全サマリファイルのパスを取得（L1, L2, L3 の順）."""
+        paths: list[Path] = []
+        l1_path = index.find_by_path("_summary/L1_overall.md")
+        if l1_path is not None:
+            paths.append(l1_path)
+        paths.extend(index.list_directory("_summary/L2_chapters"))
+        paths.extend(index.list_directory("_summary/L3_sequences", depth=1))
+        return paths
@@ -39,7 +39,7 @@ class WorldSettingRepository(BaseRepository[WorldSetting]):
         world_dir = self.vault_root / "world"
         if not world_dir.exists():
             return []
-        return [self._read(path) for path in world_dir.glob("*.md")]
+        return [self._read_cached(path) for path in world_dir.glob("*.md")]
 
     def get_by_category(self, category: str) -> list[WorldSetting]:
         """カテゴリでフィルタリング.
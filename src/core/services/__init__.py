@@ -2,40 +2,98 @@
 
 This layer provides core services for AI information control:
 - Expression filtering and forbidden keyword detection
-- Visibility-based content filtering
+- Approximate secret leak detection (MinHash/LSH)
+- Visibility-based content filtering and compiled visibility policies
 - Foreshadowing state management and visibility mapping
 - Timeline indexing for cross-episode queries
+- Columnar timeline analytics for pacing dashboards
+
+Public names are imported from their submodules on first access, so
+importing one light class does not load the whole layer.
 """
 
-# Expression filter
-from .expression_filter import (
-    KeywordViolation,
-    SafetyCheckResult,
-    check_forbidden_keywords,
-    check_text_safety,
-)
-
-# Foreshadowing manager
-from .foreshadowing_manager import (
-    STATUS_VISIBILITY_MAP,
-    VALID_TRANSITIONS,
-    ForeshadowingManager,
-    get_recommended_visibility,
-    get_visibility_from_subtlety,
-    validate_status_transition,
-)
-
-# Timeline index
-from .timeline_index import TimelineEvent, TimelineIndex
-
-# Visibility controller
-from .visibility_controller import (
-    VisibilityController,
-    VisibilityFilteredContent,
-    filter_content_by_visibility,
-    generate_level1_template,
-    generate_level2_template,
-)
+from typing import TYPE_CHECKING, Any
+
+from src.core.lazy_exports import load_export
+
+if TYPE_CHECKING:
+    # Expression filter
+    from .expression_filter import (
+        KeywordViolation,
+        SafetyCheckResult,
+        check_forbidden_keywords,
+        check_text_safety,
+    )
+
+    # Foreshadowing manager
+    from .foreshadowing_manager import (
+        STATUS_VISIBILITY_MAP,
+        VALID_TRANSITIONS,
+        ForeshadowingManager,
+        get_recommended_visibility,
+        get_visibility_from_subtlety,
+        validate_status_transition,
+    )
+
+    # Keyword matcher
+    from .keyword_matcher import (
+        KeywordMatch,
+        KeywordMatcher,
+        KeywordStream,
+        compile_keywords,
+    )
+
+    # Secret leak detector
+    from .secret_leak_detector import SecretLeak, SecretLeakDetector
+
+    # Timeline analytics
+    from .timeline_columns import GapStats, TimelineColumns
+
+    # Timeline index
+    from .timeline_index import TimelineEvent, TimelineIndex
+
+    # Visibility controller
+    from .visibility_controller import (
+        VisibilityController,
+        VisibilityFilteredContent,
+        filter_content_by_visibility,
+        generate_level1_template,
+        generate_level2_template,
+    )
+
+    # Visibility policy
+    from .visibility_policy import VisibilityPolicy, compile_visibility_policy
+
+# Public name -> defining submodule (imported on first access)
+_EXPORTS: dict[str, str] = {
+    "KeywordViolation": ".expression_filter",
+    "SafetyCheckResult": ".expression_filter",
+    "check_forbidden_keywords": ".expression_filter",
+    "check_text_safety": ".expression_filter",
+    "STATUS_VISIBILITY_MAP": ".foreshadowing_manager",
+    "VALID_TRANSITIONS": ".foreshadowing_manager",
+    "ForeshadowingManager": ".foreshadowing_manager",
+    "get_recommended_visibility": ".foreshadowing_manager",
+    "get_visibility_from_subtlety": ".foreshadowing_manager",
+    "validate_status_transition": ".foreshadowing_manager",
+    "KeywordMatch": ".keyword_matcher",
+    "KeywordMatcher": ".keyword_matcher",
+    "KeywordStream": ".keyword_matcher",
+    "compile_keywords": ".keyword_matcher",
+    "SecretLeak": ".secret_leak_detector",
+    "SecretLeakDetector": ".secret_leak_detector",
+    "GapStats": ".timeline_columns",
+    "TimelineColumns": ".timeline_columns",
+    "TimelineEvent": ".timeline_index",
+    "TimelineIndex": ".timeline_index",
+    "VisibilityController": ".visibility_controller",
+    "VisibilityFilteredContent": ".visibility_controller",
+    "filter_content_by_visibility": ".visibility_controller",
+    "generate_level1_template": ".visibility_controller",
+    "generate_level2_template": ".visibility_controller",
+    "VisibilityPolicy": ".visibility_policy",
+    "compile_visibility_policy": ".visibility_policy",
+}
 
 __all__ = [
     # Expression filter
@@ -43,12 +101,23 @@ __all__ = [
     "SafetyCheckResult",
     "check_forbidden_keywords",
     "check_text_safety",
+    # Keyword matcher
+    "KeywordMatch",
+    "KeywordMatcher",
+    "KeywordStream",
+    "compile_keywords",
+    # Secret leak detector
+    "SecretLeak",
+    "SecretLeakDetector",
     # Visibility controller
     "VisibilityFilteredContent",
     "VisibilityController",
     "filter_content_by_visibility",
     "generate_level1_template",
     "generate_level2_template",
+    # Visibility policy
+    "VisibilityPolicy",
+    "compile_visibility_policy",
     # Foreshadowing manager
     "ForeshadowingManager",
     "VALID_TRANSITIONS",
@@ -59,4 +128,17 @@ __all__ = [
     # Timeline index
     "TimelineEvent",
     "TimelineIndex",
+    # Timeline analytics
+    "GapStats",
+    "TimelineColumns",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public name from its submodule on first access."""
+    return load_export(__name__, _EXPORTS, name, globals())
+
+
+def __dir__() -> list[str]:
+    """List public names, including those not imported yet."""
+    return sorted(set(globals()) | set(__all__))
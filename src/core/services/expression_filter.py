@@ -6,6 +6,8 @@
 
 from dataclasses import dataclass, field
 
+from .keyword_matcher import compile_keywords
+
 
 @dataclass
 class KeywordViolation:
@@ -49,6 +51,9 @@ def check_forbidden_keywords(
 ) -> list[KeywordViolation]:
     """テキスト内の禁止キーワードをチェックする.
 
+    キーワード群はコンパイル済みオートマトン（内容ハッシュでキャッシュ）により
+    テキストを1回走査するだけで検出する。違反はキーワードリストの順に返す。
+
     Args:
         text: チェック対象のテキスト
         forbidden_keywords: 禁止キーワードのリスト
@@ -60,19 +65,45 @@ def check_forbidden_keywords(
     if text is None:
         return []
 
+    hits = compile_keywords(forbidden_keywords).find_all(text)
+    return violations_from_hits(text, hits, forbidden_keywords, context_chars)
+
+
+def violations_from_hits(
+    text: str,
+    hits: dict[str, list[int]],
+    forbidden_keywords: list[str],
+    context_chars: int = 20,
+) -> list[KeywordViolation]:
+    """検出済みの出現位置から違反リストを組み立てる.
+
+    出現位置を別の方法（差分走査など）で求めた場合も、
+    check_forbidden_keywords() と同じ形式・順序の結果を返す。
+
+    Args:
+        text: チェック対象のテキスト
+        hits: キーワード → 出現位置（0-indexed, 昇順）の辞書
+        forbidden_keywords: 禁止キーワードのリスト
+        context_chars: コンテキストとして抽出する前後の文字数
+
+    Returns:
+        検出された違反のリスト（キーワードリストの順）
+    """
     violations: list[KeywordViolation] = []
+    if not hits:
+        return violations
 
     for keyword in forbidden_keywords:
         if not keyword:
             continue
 
-        positions = _find_all_positions(text, keyword)
+        positions = hits.get(keyword)
         if positions:
             context = _extract_context(text, positions[0], keyword, context_chars)
             violations.append(
                 KeywordViolation(
                     keyword=keyword,
-                    positions=positions,
+                    positions=list(positions),
                     context=context,
                 )
             )
@@ -80,29 +111,6 @@ def check_forbidden_keywords(
     return violations
 
 
-def _find_all_positions(text: str, keyword: str) -> list[int]:
-    """テキスト内のキーワード出現位置を全て検索する.
-
-    Args:
-        text: 検索対象テキスト
-        keyword: 検索キーワード
-
-    Returns:
-        出現位置（0-indexed）のリスト
-    """
-    positions: list[int] = []
-    start = 0
-
-    while True:
-        pos = text.find(keyword, start)
-        if pos == -1:
-            break
-        positions.append(pos)
-        start = pos + 1
-
-    return positions
-
-
 def _extract_context(
     text: str,
     position: int,
@@ -0,0 +1,287 @@
+"""Multi-pattern keyword matcher.
+
+禁止キーワード群を Aho-Corasick オートマトンにコンパイルし、
+テキストを1回走査するだけで全キーワードの出現位置を検出する。
+仕様: docs/specs/novel-generator-v2/04_ai-information-control.md Section 5
+"""
+
+import hashlib
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+# コンパイル済みマッチャーのキャッシュ上限
+_MAX_CACHE_SIZE = 64
+
+_matcher_cache: OrderedDict[str, "KeywordMatcher"] = OrderedDict()
+
+
+class KeywordMatcher:
+    """Aho-Corasick オートマトンによる複数キーワードマッチャー.
+
+    キーワード数に依存せず、テキスト長に比例する時間で
+    全キーワードの全出現位置（重なりを含む）を検出する。
+
+    Attributes:
+        keywords: コンパイル対象のキーワード（空文字・重複を除いた登録順）
+
+    Examples:
+        >>> matcher = KeywordMatcher(["王族", "血筋"])
+        >>> matcher.find_all("王族の血筋")
+        {'王族': [0], '血筋': [3]}
+    """
+
+    def __init__(self, keywords: Iterable[str]) -> None:
+        """オートマトンを構築する.
+
+        Args:
+            keywords: 検出対象のキーワード
+        """
+        self.keywords: list[str] = list(dict.fromkeys(k for k in keywords if k))
+
+        # 状態 0 がルート。goto[state][char] -> 次状態
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        # 状態で終端するキーワードの番号
+        self._output: list[list[int]] = [[]]
+
+        for index, keyword in enumerate(self.keywords):
+            self._insert(keyword, index)
+        self._build_failure_links()
+
+    def _insert(self, keyword: str, index: int) -> None:
+        """トライにキーワードを追加する."""
+        state = 0
+        for char in keyword:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = next_state
+        self._output[state].append(index)
+
+    def _build_failure_links(self) -> None:
+        """幅優先探索で失敗遷移を構築し、出力を失敗先から継承する."""
+        queue: list[int] = list(self._goto[0].values())
+        head = 0
+        while head < len(queue):
+            state = queue[head]
+            head += 1
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                self._output[next_state] = (
+                    self._output[next_state] + self._output[self._fail[next_state]]
+                )
+
+    def find_all(self, text: str) -> dict[str, list[int]]:
+        """テキスト内の全キーワード出現位置を検出する.
+
+        Args:
+            text: 検索対象テキスト
+
+        Returns:
+            キーワード → 出現位置（0-indexed, 昇順）の辞書。
+            出現しなかったキーワードは含まれない。
+        """
+        hits: dict[str, list[int]] = {}
+        if not text or not self.keywords:
+            return hits
+
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        keywords = self.keywords
+        state = 0
+
+        for pos, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                for index in output[state]:
+                    keyword = keywords[index]
+                    start = pos - len(keyword) + 1
+                    if keyword in hits:
+                        hits[keyword].append(start)
+                    else:
+                        hits[keyword] = [start]
+
+        # 同一キーワードは長さが一定のため、終端順 = 開始位置の昇順
+        return hits
+
+    def find_keywords(self, text: str) -> set[str]:
+        """テキストに出現するキーワードの集合を返す.
+
+        Args:
+            text: 検索対象テキスト
+
+        Returns:
+            出現したキーワードの集合
+        """
+        return set(self.find_all(text))
+
+    def stream(self) -> "KeywordStream":
+        """逐次入力用の検出器を生成する.
+
+        Returns:
+            このマッチャーを共有する新しい KeywordStream
+        """
+        return KeywordStream(self)
+
+    def __len__(self) -> int:
+        """コンパイル済みキーワード数."""
+        return len(self.keywords)
+
+
+@dataclass(frozen=True)
+class KeywordMatch:
+    """ストリーム中で検出されたキーワード.
+
+    Attributes:
+        keyword: 検出されたキーワード
+        start: ストリーム先頭からの開始位置（0-indexed）
+    """
+
+    keyword: str
+    start: int
+
+    @property
+    def end(self) -> int:
+        """終了位置（排他的）."""
+        return self.start + len(self.keyword)
+
+
+class KeywordStream:
+    """チャンク単位で届くテキストの逐次キーワード検出器.
+
+    オートマトンの状態と通算位置をチャンク間で保持するため、
+    チャンク境界をまたぐキーワードも検出できる。キーワードは
+    最後の1文字が届いた feed() の呼び出しで報告される。
+    全チャンクを連結したテキストに対する find_all() と同じ結果になる。
+
+    Attributes:
+        matcher: 共有するコンパイル済みマッチャー
+        position: これまでに入力された文字数
+
+    Examples:
+        >>> stream = KeywordMatcher(["王族"]).stream()
+        >>> stream.feed("彼は王")
+        []
+        >>> stream.feed("族だ")
+        [KeywordMatch(keyword='王族', start=2)]
+    """
+
+    def __init__(self, matcher: KeywordMatcher) -> None:
+        """検出器を初期化する.
+
+        Args:
+            matcher: コンパイル済みマッチャー
+        """
+        self.matcher = matcher
+        self.position = 0
+        self._state = 0
+        self._matches: list[KeywordMatch] = []
+
+    def feed(self, chunk: str) -> list[KeywordMatch]:
+        """チャンクを入力し、このチャンクで完成したキーワードを返す.
+
+        Args:
+            chunk: 追加入力されたテキスト
+
+        Returns:
+            新たに検出されたキーワード（終端位置順）
+        """
+        found: list[KeywordMatch] = []
+        if not chunk:
+            return found
+
+        matcher = self.matcher
+        goto = matcher._goto
+        fail = matcher._fail
+        output = matcher._output
+        keywords = matcher.keywords
+        state = self._state
+
+        for offset, char in enumerate(chunk, self.position):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                for index in output[state]:
+                    keyword = keywords[index]
+                    found.append(KeywordMatch(keyword, offset - len(keyword) + 1))
+
+        self._state = state
+        self.position += len(chunk)
+        self._matches.extend(found)
+        return found
+
+    @property
+    def matches(self) -> list[KeywordMatch]:
+        """これまでに検出された全キーワード（検出順）."""
+        return list(self._matches)
+
+    @property
+    def has_match(self) -> bool:
+        """キーワードを1つ以上検出したか."""
+        return bool(self._matches)
+
+    def reset(self) -> None:
+        """状態を初期化する（再生成の開始時などに使う）."""
+        self.position = 0
+        self._state = 0
+        self._matches.clear()
+
+
+def keyword_set_digest(keywords: Iterable[str]) -> str:
+    """キーワード集合の内容ハッシュを計算する.
+
+    並び順・重複に依存しない値を返す。
+
+    Args:
+        keywords: キーワード
+
+    Returns:
+        SHA-256 の16進文字列
+    """
+    unique = sorted({k for k in keywords if k})
+    return hashlib.sha256("\0".join(unique).encode("utf-8")).hexdigest()
+
+
+def compile_keywords(keywords: Iterable[str]) -> KeywordMatcher:
+    """キーワード集合をコンパイルする（内容ハッシュでキャッシュ）.
+
+    同じ内容のキーワード集合に対してはオートマトンを再構築しない。
+
+    Args:
+        keywords: キーワード
+
+    Returns:
+        コンパイル済みの KeywordMatcher
+    """
+    keyword_list = list(keywords)
+    digest = keyword_set_digest(keyword_list)
+
+    cached = _matcher_cache.get(digest)
+    if cached is not None:
+        _matcher_cache.move_to_end(digest)
+        return cached
+
+    matcher = KeywordMatcher(sorted({k for k in keyword_list if k}))
+    _matcher_cache[digest] = matcher
+    while len(_matcher_cache) > _MAX_CACHE_SIZE:
+        _matcher_cache.popitem(last=False)
+    return matcher
+
+
+def clear_matcher_cache() -> None:
+    """コンパイル済みマッチャーのキャッシュをクリアする."""
+    _matcher_cache.clear()
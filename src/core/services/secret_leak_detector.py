@@ -0,0 +1,274 @@
+"""Secret leak detector.
+
+原稿の文（パッセージ）と秘密情報（Secret.content）の類似度を計算し、
+言い換えによる秘密の漏洩を検出する。禁止キーワードの完全一致では
+捕捉できない表現を、文字 n-gram の Jaccard 類似度で判定する。
+
+秘密ごとに MinHash シグネチャを計算して LSH（バンド分割）の索引に登録し、
+パッセージごとにバンドのバケットを引いて候補の秘密だけを精査する。
+このため 1 パッセージの検査時間は秘密の数にほぼ依存しない。
+候補の判定は n-gram 集合の厳密な Jaccard 類似度で行い、
+Secret.get_similarity_threshold() の閾値以上を漏洩とする。
+
+仕様: docs/specs/novel-generator-v2/04_ai-information-control.md
+"""
+
+import random
+import re
+import zlib
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from src.core.models.ai_visibility import AIVisibilityLevel
+from src.core.models.secret import Secret
+
+# 類似度判定で無視する文字（空白・句読点・括弧）
+_IGNORED_CHARS = re.compile(r"[\s、。，．,.!?！？「」『』（）()【】…―]")
+
+# パッセージ（文）の区切り: 文末記号または改行
+_PASSAGE = re.compile(r"[^。！？!?\n]+[。！？!?]*")
+
+# MinHash のハッシュ関数族 (a * x + b) mod _PRIME
+_PRIME = (1 << 61) - 1
+
+
+def shingles(text: str, ngram: int = 3) -> frozenset[str]:
+    """テキストを文字 n-gram の集合に変換する.
+
+    空白・句読点・括弧は除去してから分割する。
+    n 文字に満たないテキストはテキスト全体を 1 要素とする。
+
+    Args:
+        text: 対象テキスト
+        ngram: n-gram の文字数
+
+    Returns:
+        n-gram の集合（空テキストなら空集合）
+    """
+    normalized = _IGNORED_CHARS.sub("", text)
+    if len(normalized) <= ngram:
+        return frozenset([normalized]) if normalized else frozenset()
+    return frozenset(
+        normalized[i : i + ngram] for i in range(len(normalized) - ngram + 1)
+    )
+
+
+def jaccard(left: frozenset[str], right: frozenset[str]) -> float:
+    """2つの集合の Jaccard 類似度を計算する.
+
+    Args:
+        left: 集合
+        right: 集合
+
+    Returns:
+        |left ∩ right| / |left ∪ right|（両方空なら 0.0）
+    """
+    if not left or not right:
+        return 0.0
+    intersection = len(left & right)
+    return intersection / (len(left) + len(right) - intersection)
+
+
+def split_passages(text: str) -> list[tuple[int, str]]:
+    """テキストを文単位のパッセージに分割する.
+
+    Args:
+        text: 原稿テキスト
+
+    Returns:
+        (開始位置, パッセージ) のリスト。空白のみのパッセージは含まない。
+    """
+    return [
+        (match.start(), match.group())
+        for match in _PASSAGE.finditer(text)
+        if match.group().strip()
+    ]
+
+
+@dataclass(frozen=True)
+class SecretLeak:
+    """秘密の漏洩候補.
+
+    Attributes:
+        secret_id: 類似した秘密の ID
+        passage: 類似したパッセージ
+        start: パッセージの開始位置（0-indexed）
+        similarity: Jaccard 類似度
+        threshold: 秘密の重要度に応じた閾値
+    """
+
+    secret_id: str
+    passage: str
+    start: int
+    similarity: float
+    threshold: float
+
+
+class SecretLeakDetector:
+    """MinHash/LSH による秘密漏洩検出器.
+
+    秘密の n-gram 集合・MinHash シグネチャ・LSH 索引は構築時に1回だけ計算する。
+    可視性が USE（文章で使ってよい）の秘密は検査対象外。
+
+    LSH は類似度が最小閾値付近のペアを高い確率で候補に挙げるよう
+    バンド数・行数を設定する（既定の 40 バンド × 3 行では類似度 0.55 の
+    ペアが候補から漏れる確率は 0.1% 未満）。候補は厳密な類似度で判定するため
+    誤検出はない。
+
+    Attributes:
+        secrets: 検査対象の秘密（USE を除いた登録順）
+        ngram: n-gram の文字数
+
+    Examples:
+        >>> secret = Secret(id="s1", content="アイリスは王家の血を引いている")
+        >>> detector = SecretLeakDetector([secret])
+        >>> [leak.secret_id for leak in detector.detect("実はアイリスは王家の血を引いている。")]
+        ['s1']
+    """
+
+    # 既定の LSH パラメータ（シグネチャ長 = バンド数 × 行数）
+    DEFAULT_BANDS: int = 40
+    DEFAULT_ROWS: int = 3
+
+    def __init__(
+        self,
+        secrets: Iterable[Secret],
+        ngram: int = 3,
+        bands: int = DEFAULT_BANDS,
+        rows: int = DEFAULT_ROWS,
+        base_threshold: float | None = None,
+        seed: int = 0,
+    ) -> None:
+        """秘密の索引を構築する.
+
+        Args:
+            secrets: 検査対象の秘密
+            ngram: n-gram の文字数
+            bands: LSH のバンド数
+            rows: 1バンドあたりの MinHash 数
+            base_threshold: 類似度の基準閾値（None の場合は Secret の既定値）
+            seed: ハッシュ関数族の乱数シード
+
+        Raises:
+            ValueError: ngram・bands・rows が正でない場合
+        """
+        if ngram <= 0 or bands <= 0 or rows <= 0:
+            raise ValueError(
+                f"ngram, bands and rows must be positive: {ngram}, {bands}, {rows}"
+            )
+        self.ngram = ngram
+        self._bands = bands
+        self._rows = rows
+        rng = random.Random(seed)
+        self._hash_params = [
+            (rng.randrange(1, _PRIME), rng.randrange(0, _PRIME))
+            for _ in range(bands * rows)
+        ]
+
+        self.secrets: list[Secret] = []
+        self._shingles: list[frozenset[str]] = []
+        self._thresholds: list[float] = []
+        # バンド番号 → バンドの MinHash 値 → 秘密の番号
+        self._buckets: list[dict[tuple[int, ...], list[int]]] = [
+            {} for _ in range(bands)
+        ]
+
+        for secret in secrets:
+            if secret.visibility == AIVisibilityLevel.USE:
+                continue
+            secret_shingles = shingles(secret.content, ngram)
+            if not secret_shingles:
+                continue
+            index = len(self.secrets)
+            self.secrets.append(secret)
+            self._shingles.append(secret_shingles)
+            self._thresholds.append(
+                secret.get_similarity_threshold()
+                if base_threshold is None
+                else secret.get_similarity_threshold(base_threshold)
+            )
+            for band, key in enumerate(self._band_keys(secret_shingles)):
+                self._buckets[band].setdefault(key, []).append(index)
+
+    def _signature(self, items: frozenset[str]) -> list[int]:
+        """n-gram 集合の MinHash シグネチャを計算する."""
+        hashes = [zlib.crc32(item.encode("utf-8")) for item in items]
+        return [
+            min((a * h + b) % _PRIME for h in hashes) for a, b in self._hash_params
+        ]
+
+    def _band_keys(self, items: frozenset[str]) -> list[tuple[int, ...]]:
+        """シグネチャをバンドごとのバケットキーに分割する."""
+        signature = self._signature(items)
+        rows = self._rows
+        return [
+            tuple(signature[band * rows : (band + 1) * rows])
+            for band in range(self._bands)
+        ]
+
+    def candidates(self, passage: str) -> set[int]:
+        """パッセージと同じバケットに入る秘密の番号を返す.
+
+        Args:
+            passage: 検査対象のパッセージ
+
+        Returns:
+            候補の秘密の番号（self.secrets のインデックス）
+        """
+        return self._candidates(shingles(passage, self.ngram))
+
+    def _candidates(self, items: frozenset[str]) -> set[int]:
+        """n-gram 集合と同じバケットに入る秘密の番号を返す."""
+        if not items or not self.secrets:
+            return set()
+        found: set[int] = set()
+        for band, key in enumerate(self._band_keys(items)):
+            found.update(self._buckets[band].get(key, ()))
+        return found
+
+    def check_passage(self, passage: str, start: int = 0) -> list[SecretLeak]:
+        """1つのパッセージを検査する.
+
+        Args:
+            passage: 検査対象のパッセージ
+            start: パッセージの開始位置（結果にそのまま記録する）
+
+        Returns:
+            閾値以上に類似した秘密（秘密の登録順）
+        """
+        items = shingles(passage, self.ngram)
+        leaks: list[SecretLeak] = []
+        for index in sorted(self._candidates(items)):
+            similarity = jaccard(items, self._shingles[index])
+            threshold = self._thresholds[index]
+            if similarity >= threshold:
+                leaks.append(
+                    SecretLeak(
+                        secret_id=self.secrets[index].id,
+                        passage=passage,
+                        start=start,
+                        similarity=similarity,
+                        threshold=threshold,
+                    )
+                )
+        return leaks
+
+    def detect(self, text: str) -> list[SecretLeak]:
+        """原稿全体を文単位で検査する.
+
+        Args:
+            text: 原稿テキスト
+
+        Returns:
+            漏洩候補（出現順）
+        """
+        leaks: list[SecretLeak] = []
+        if not text or not self.secrets:
+            return leaks
+        for start, passage in split_passages(text):
+            leaks.extend(self.check_passage(passage, start))
+        return leaks
+
+    def __len__(self) -> int:
+        """検査対象の秘密の数."""
+        return len(self.secrets)
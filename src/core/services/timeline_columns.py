@@ -0,0 +1,428 @@
+"""Columnar timeline analytics.
+
+伏線タイムラインの列指向ビュー。TimelineIndex の全イベントを
+エピソード番号・イベント種別コード・微細度・伏線番号の数値配列
+（array.array）に変換し、ペーシング分析用の集計クエリを提供する。
+
+- episode_histogram(): エピソードごとのイベント数（伏線の密度）
+- rolling_counts(): 直近 window エピソードのイベント数
+- subtlety_trend(): 微細度の平均の推移（移動平均）
+- gap_stats(): 伏線ごとのイベント間隔（強化の間隔）の統計
+
+NumPy がインストールされている場合は配列をコピーせずに ndarray として扱い、
+ベクトル演算で集計する。ない場合は純 Python で同じ結果を計算する。
+NumPy はオプション依存（pip install .[analytics]）。
+"""
+
+import array
+import bisect
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any
+
+from src.core.models.foreshadowing import ForeshadowingStatus
+
+from .timeline_index import TimelineEvent, TimelineIndex, _episode_number
+
+# イベント種別コード（type_codes 列の値）→ ForeshadowingStatus
+EVENT_TYPES: tuple[ForeshadowingStatus, ...] = tuple(ForeshadowingStatus)
+_TYPE_CODES = {status: code for code, status in enumerate(EVENT_TYPES)}
+
+# 間隔統計の既定の対象（設置と強化の間隔）
+_MENTION_TYPES = (ForeshadowingStatus.PLANTED, ForeshadowingStatus.REINFORCED)
+
+
+def _load_numpy() -> Any:
+    """NumPy を import する（インストールされていなければ None）."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+@dataclass(frozen=True)
+class GapStats:
+    """伏線1件のイベント間隔の統計.
+
+    Attributes:
+        count: 間隔の数（イベント数 - 1）
+        mean: 平均間隔（エピソード数）
+        minimum: 最小間隔
+        maximum: 最大間隔
+    """
+
+    count: int
+    mean: float
+    minimum: int
+    maximum: int
+
+
+class TimelineColumns:
+    """伏線タイムラインの列指向ビュー.
+
+    行はエピソード番号順（同じエピソード内は TimelineIndex の登録順）。
+    構築時のスナップショットであり、TimelineIndex の差分更新は反映しない
+    （必要時に from_index() で再構築する）。
+
+    Attributes:
+        episodes: エピソード番号
+        type_codes: イベント種別コード（EVENT_TYPES のインデックス）
+        subtleties: 微細度 (1-10)
+        foreshadowing_indices: 伏線番号（foreshadowing_ids のインデックス）
+        foreshadowing_ids: 伏線ID（初出順）
+
+    Examples:
+        >>> columns = TimelineColumns.from_index(TimelineIndex())
+        >>> len(columns)
+        0
+    """
+
+    def __init__(
+        self, events: Iterable[TimelineEvent], use_numpy: bool | None = None
+    ) -> None:
+        """イベントから列を構築する.
+
+        Args:
+            events: タイムラインイベント
+            use_numpy: NumPy を使うか（None の場合はインストールされていれば使う）
+
+        Raises:
+            ImportError: use_numpy=True で NumPy がインストールされていない場合
+        """
+        self._np = _load_numpy() if use_numpy is not False else None
+        if use_numpy and self._np is None:
+            raise ImportError("NumPy is required for use_numpy=True")
+
+        self.foreshadowing_ids: list[str] = []
+        fs_numbers: dict[str, int] = {}
+        rows: list[tuple[int, int, int, int]] = []
+        for event in events:
+            fs_number = fs_numbers.get(event.foreshadowing_id)
+            if fs_number is None:
+                fs_number = fs_numbers[event.foreshadowing_id] = len(
+                    self.foreshadowing_ids
+                )
+                self.foreshadowing_ids.append(event.foreshadowing_id)
+            rows.append(
+                (
+                    _episode_number(event.episode),
+                    _TYPE_CODES[event.event_type],
+                    event.subtlety,
+                    fs_number,
+                )
+            )
+        rows.sort(key=lambda row: row[0])
+
+        self.episodes = array.array("q", [row[0] for row in rows])
+        self.type_codes = array.array("b", [row[1] for row in rows])
+        self.subtleties = array.array("b", [row[2] for row in rows])
+        self.foreshadowing_indices = array.array("q", [row[3] for row in rows])
+
+    @classmethod
+    def from_index(
+        cls, index: TimelineIndex, use_numpy: bool | None = None
+    ) -> "TimelineColumns":
+        """TimelineIndex の全イベントから列を構築する.
+
+        Args:
+            index: タイムラインインデックス
+            use_numpy: NumPy を使うか（None の場合はインストールされていれば使う）
+
+        Returns:
+            構築された TimelineColumns
+        """
+        return cls(index.iter_events(), use_numpy=use_numpy)
+
+    @property
+    def uses_numpy(self) -> bool:
+        """集計に NumPy を使うか."""
+        return self._np is not None
+
+    def __len__(self) -> int:
+        """行（イベント）数."""
+        return len(self.episodes)
+
+    def _bounds(
+        self, start: int | str | None, end: int | str | None
+    ) -> tuple[int, int]:
+        """エピソード範囲を番号に正規化する（省略時はイベントの最小・最大）."""
+        first = self.episodes[0] if self.episodes else 0
+        last = self.episodes[-1] if self.episodes else -1
+        start_num = first if start is None else _as_episode_number(start)
+        end_num = last if end is None else _as_episode_number(end)
+        return start_num, end_num
+
+    def _codes(
+        self, event_types: Iterable[ForeshadowingStatus] | None
+    ) -> set[int] | None:
+        """イベント種別をコードの集合に変換する（None は全種別）."""
+        if event_types is None:
+            return None
+        return {_TYPE_CODES[status] for status in event_types}
+
+    def _episode_sums(
+        self,
+        start: int,
+        end: int,
+        codes: set[int] | None,
+        column: "array.array[int] | None",
+    ) -> list[int]:
+        """エピソードごとに column の合計（None の場合は行数）を求める.
+
+        Args:
+            start: 開始エピソード番号
+            end: 終了エピソード番号（両端を含む）
+            codes: 対象のイベント種別コード（None は全種別）
+            column: 合計する列
+
+        Returns:
+            start..end の各エピソードの合計
+        """
+        size = end - start + 1
+        if size <= 0:
+            return []
+        lo = bisect.bisect_left(self.episodes, start)
+        hi = bisect.bisect_right(self.episodes, end)
+
+        np = self._np
+        if np is not None:
+            episodes = np.frombuffer(self.episodes, dtype=np.int64)[lo:hi]
+            weights = (
+                None
+                if column is None
+                else np.frombuffer(column, dtype=np.int8)[lo:hi].astype(np.int64)
+            )
+            if codes is not None:
+                types = np.frombuffer(self.type_codes, dtype=np.int8)[lo:hi]
+                selected = np.isin(types, list(codes))
+                episodes = episodes[selected]
+                weights = None if weights is None else weights[selected]
+            sums = np.bincount(episodes - start, weights=weights, minlength=size)
+            return [int(value) for value in sums.tolist()]
+
+        result = [0] * size
+        for row in range(lo, hi):
+            if codes is None or self.type_codes[row] in codes:
+                result[self.episodes[row] - start] += (
+                    1 if column is None else column[row]
+                )
+        return result
+
+    def _rolling_sums(self, values: list[int], window: int) -> list[int]:
+        """values の先頭 window-1 個を助走区間として、移動合計を求める."""
+        np = self._np
+        if np is not None:
+            cumulative = np.concatenate(([0], np.cumsum(values, dtype=np.int64)))
+            return [
+                int(value)
+                for value in (cumulative[window:] - cumulative[:-window]).tolist()
+            ]
+
+        result: list[int] = []
+        total = sum(values[: window - 1])
+        for i in range(window - 1, len(values)):
+            total += values[i]
+            result.append(total)
+            total -= values[i - window + 1]
+        return result
+
+    def episode_histogram(
+        self,
+        start: int | str | None = None,
+        end: int | str | None = None,
+        event_types: Iterable[ForeshadowingStatus] | None = None,
+    ) -> list[int]:
+        """エピソードごとのイベント数（伏線の密度）を返す.
+
+        Args:
+            start: 開始エピソード（番号または ID、省略時は最初のイベント）
+            end: 終了エピソード（両端を含む、省略時は最後のイベント）
+            event_types: 対象のイベント種別（省略時は全種別）
+
+        Returns:
+            start..end の各エピソードのイベント数
+        """
+        start_num, end_num = self._bounds(start, end)
+        return self._episode_sums(start_num, end_num, self._codes(event_types), None)
+
+    def rolling_counts(
+        self,
+        window: int,
+        start: int | str | None = None,
+        end: int | str | None = None,
+        event_types: Iterable[ForeshadowingStatus] | None = None,
+    ) -> list[int]:
+        """直近 window エピソード（当該エピソードを含む）のイベント数を返す.
+
+        Args:
+            window: 窓の幅（エピソード数）
+            start: 開始エピソード（番号または ID、省略時は最初のイベント）
+            end: 終了エピソード（両端を含む、省略時は最後のイベント）
+            event_types: 対象のイベント種別（省略時は全種別）
+
+        Returns:
+            start..end の各エピソードの移動合計
+
+        Raises:
+            ValueError: window が正でない場合
+        """
+        if window <= 0:
+            raise ValueError(f"window must be positive: {window}")
+        start_num, end_num = self._bounds(start, end)
+        if end_num < start_num:
+            return []
+        counts = self._episode_sums(
+            start_num - window + 1, end_num, self._codes(event_types), None
+        )
+        return self._rolling_sums(counts, window)
+
+    def subtlety_trend(
+        self,
+        start: int | str | None = None,
+        end: int | str | None = None,
+        window: int = 1,
+        event_types: Iterable[ForeshadowingStatus] | None = None,
+    ) -> list[float | None]:
+        """微細度の平均の推移を返す.
+
+        Args:
+            start: 開始エピソード（番号または ID、省略時は最初のイベント）
+            end: 終了エピソード（両端を含む、省略時は最後のイベント）
+            window: 移動平均の窓の幅（エピソード数、1 でエピソードごとの平均）
+            event_types: 対象のイベント種別（省略時は全種別）
+
+        Returns:
+            start..end の各エピソードの平均微細度（窓内にイベントがなければ None）
+
+        Raises:
+            ValueError: window が正でない場合
+        """
+        if window <= 0:
+            raise ValueError(f"window must be positive: {window}")
+        start_num, end_num = self._bounds(start, end)
+        if end_num < start_num:
+            return []
+        codes = self._codes(event_types)
+        first = start_num - window + 1
+        counts = self._rolling_sums(
+            self._episode_sums(first, end_num, codes, None), window
+        )
+        sums = self._rolling_sums(
+            self._episode_sums(first, end_num, codes, self.subtleties), window
+        )
+        return [
+            total / count if count else None
+            for total, count in zip(sums, counts, strict=True)
+        ]
+
+    def type_counts(
+        self, start: int | str | None = None, end: int | str | None = None
+    ) -> dict[ForeshadowingStatus, int]:
+        """イベント種別ごとのイベント数を返す.
+
+        Args:
+            start: 開始エピソード（番号または ID、省略時は最初のイベント）
+            end: 終了エピソード（両端を含む、省略時は最後のイベント）
+
+        Returns:
+            イベント種別 → イベント数（EVENT_TYPES の順、0 件の種別を含む）
+        """
+        start_num, end_num = self._bounds(start, end)
+        lo = bisect.bisect_left(self.episodes, start_num)
+        hi = bisect.bisect_right(self.episodes, end_num)
+
+        np = self._np
+        if np is not None:
+            types = np.frombuffer(self.type_codes, dtype=np.int8)[lo:hi]
+            counts = [
+                int(value)
+                for value in np.bincount(types, minlength=len(EVENT_TYPES)).tolist()
+            ]
+        else:
+            counts = [0] * len(EVENT_TYPES)
+            for row in range(lo, hi):
+                counts[self.type_codes[row]] += 1
+        return dict(zip(EVENT_TYPES, counts, strict=True))
+
+    def gap_stats(
+        self,
+        event_types: Iterable[ForeshadowingStatus] | None = _MENTION_TYPES,
+    ) -> dict[str, GapStats]:
+        """伏線ごとの連続するイベントの間隔の統計を返す.
+
+        既定では設置（PLANTED）と強化（REINFORCED）のイベントを対象とし、
+        設置 → 強化 → 強化 ... の間隔を集計する。
+
+        Args:
+            event_types: 対象のイベント種別（None は全種別）
+
+        Returns:
+            伏線ID → 間隔の統計（対象イベントが2件以上ある伏線のみ、初出順）
+        """
+        codes = self._codes(event_types)
+        fs_count = len(self.foreshadowing_ids)
+
+        np = self._np
+        if np is not None:
+            episodes = np.frombuffer(self.episodes, dtype=np.int64)
+            owners = np.frombuffer(self.foreshadowing_indices, dtype=np.int64)
+            if codes is not None:
+                types = np.frombuffer(self.type_codes, dtype=np.int8)
+                selected = np.isin(types, list(codes))
+                episodes = episodes[selected]
+                owners = owners[selected]
+            order = np.lexsort((episodes, owners))
+            episodes = episodes[order]
+            owners = owners[order]
+            same = owners[1:] == owners[:-1]
+            gaps = (episodes[1:] - episodes[:-1])[same]
+            gap_owners = owners[1:][same]
+            counts = np.bincount(gap_owners, minlength=fs_count).tolist()
+            totals = np.bincount(
+                gap_owners, weights=gaps, minlength=fs_count
+            ).tolist()
+            minimums = np.zeros(fs_count, dtype=np.int64)
+            maximums = np.zeros(fs_count, dtype=np.int64)
+            if len(gaps):
+                minimums[:] = np.iinfo(np.int64).max
+                np.minimum.at(minimums, gap_owners, gaps)
+                np.maximum.at(maximums, gap_owners, gaps)
+            minimums = minimums.tolist()
+            maximums = maximums.tolist()
+            return {
+                self.foreshadowing_ids[fs]: GapStats(
+                    count=int(counts[fs]),
+                    mean=int(totals[fs]) / int(counts[fs]),
+                    minimum=int(minimums[fs]),
+                    maximum=int(maximums[fs]),
+                )
+                for fs in range(fs_count)
+                if counts[fs]
+            }
+
+        # 行はエピソード番号順なので、伏線ごとに直前のイベントとの差を取る
+        last: dict[int, int] = {}
+        gap_lists: dict[int, list[int]] = {}
+        for row in range(len(self.episodes)):
+            if codes is not None and self.type_codes[row] not in codes:
+                continue
+            fs = self.foreshadowing_indices[row]
+            episode = self.episodes[row]
+            if fs in last:
+                gap_lists.setdefault(fs, []).append(episode - last[fs])
+            last[fs] = episode
+        return {
+            self.foreshadowing_ids[fs]: GapStats(
+                count=len(gap_lists[fs]),
+                mean=sum(gap_lists[fs]) / len(gap_lists[fs]),
+                minimum=min(gap_lists[fs]),
+                maximum=max(gap_lists[fs]),
+            )
+            for fs in sorted(gap_lists)
+        }
+
+
+def _as_episode_number(episode: int | str) -> int:
+    """エピソード番号または ID を番号に変換する."""
+    return episode if isinstance(episode, int) else _episode_number(episode)
@@ -2,18 +2,26 @@
 
 横断参照インデックス: 各 Foreshadowing モデル内の timeline フィールドから
 エピソード横断のクエリ機能を提供する導出ビュー。
+
+エピソード ID は build 時に整数のエピソード番号へ正規化し、
+番号 → イベントの辞書（完全一致）とソート済み番号配列（範囲検索）で引く。
 """
 
+import bisect
+import functools
 import re
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from datetime import date
 
 from src.core.models.foreshadowing import (
     Foreshadowing,
     ForeshadowingStatus,
+    TimelineEntry,
 )
 
 
+@functools.lru_cache(maxsize=4096)
 def _episode_number(episode_id: str) -> int:
     """エピソードIDからエピソード番号を抽出.
 
@@ -37,25 +45,6 @@ def _episode_number(episode_id: str) -> int:
     return int(cleaned) if cleaned else 0
 
 
-def _episodes_match(ep1: str, ep2: str) -> bool:
-    """2つのエピソードIDが同じかどうか.
-
-    Args:
-        ep1: エピソードID1
-        ep2: エピソードID2
-
-    Returns:
-        同じエピソード番号を指している場合 True
-
-    Examples:
-        >>> _episodes_match("ep010", "010")
-        True
-        >>> _episodes_match("ep010", "ep011")
-        False
-    """
-    return _episode_number(ep1) == _episode_number(ep2)
-
-
 @dataclass
 class TimelineEvent:
     """タイムラインイベント（横断参照用）.
@@ -92,6 +81,9 @@ class TimelineIndex:
     マスターデータは各 Foreshadowing 内の timeline フィールド。
     本インデックスは導出ビューであり、必要時に build() で再構築する。
 
+    イベントの追加・伏線の削除は add_event() / remove_foreshadowing() で
+    差分更新でき、全体を再構築する必要はない。
+
     Attributes:
         events_by_episode: エピソードごとのイベントリスト
         last_mention: 各伏線の最終言及エピソード
@@ -101,6 +93,18 @@ class TimelineIndex:
     events_by_episode: dict[str, list[TimelineEvent]] = field(default_factory=dict)
     last_mention: dict[str, str] = field(default_factory=dict)
     _all_events: list[TimelineEvent] = field(default_factory=list)
+    # エピソード番号 → イベントリスト（"ep010" と "010" は同じキー）
+    _events_by_number: dict[int, list[TimelineEvent]] = field(
+        default_factory=dict, repr=False
+    )
+    # イベントが存在するエピソード番号（昇順、範囲検索用）
+    _episode_numbers: list[int] = field(default_factory=list, repr=False)
+    # 伏線ID → 最終言及エピソード番号
+    _last_mention_number: dict[str, int] = field(default_factory=dict, repr=False)
+    # 伏線ID → その伏線のイベントリスト
+    _events_by_foreshadowing: dict[str, list[TimelineEvent]] = field(
+        default_factory=dict, repr=False
+    )
 
     @classmethod
     def build(cls, foreshadowings: list[Foreshadowing]) -> "TimelineIndex":
@@ -116,47 +120,133 @@ class TimelineIndex:
         for fs in foreshadowings:
             if fs.timeline and fs.timeline.events:
                 for entry in fs.timeline.events:
-                    event = TimelineEvent(
-                        foreshadowing_id=fs.id,
-                        foreshadowing_title=fs.title,
-                        episode=entry.episode,
-                        event_type=entry.type,
-                        expression=entry.expression,
-                        subtlety=entry.subtlety,
-                        event_date=entry.date,
-                    )
-                    index._all_events.append(event)
-
-                    # events_by_episode
-                    ep = entry.episode
-                    if ep not in index.events_by_episode:
-                        index.events_by_episode[ep] = []
-                    index.events_by_episode[ep].append(event)
-
-                    # last_mention (最新のイベントで更新)
-                    # エピソード番号で比較して最大のものを保持
-                    current_last = index.last_mention.get(fs.id)
-                    if current_last is None or _episode_number(ep) > _episode_number(
-                        current_last
-                    ):
-                        index.last_mention[fs.id] = ep
+                    index._insert(fs.id, fs.title, entry)
 
+        index._episode_numbers = sorted(index._events_by_number)
         return index
 
+    def _insert(self, fs_id: str, fs_title: str, entry: TimelineEntry) -> TimelineEvent:
+        """イベントを各索引に登録する（_episode_numbers は呼び出し側で更新）.
+
+        Args:
+            fs_id: 伏線ID
+            fs_title: 伏線タイトル
+            entry: タイムラインエントリ
+
+        Returns:
+            登録したイベント
+        """
+        event = TimelineEvent(
+            foreshadowing_id=fs_id,
+            foreshadowing_title=fs_title,
+            episode=entry.episode,
+            event_type=entry.type,
+            expression=entry.expression,
+            subtlety=entry.subtlety,
+            event_date=entry.date,
+        )
+        self._all_events.append(event)
+        self._events_by_foreshadowing.setdefault(fs_id, []).append(event)
+
+        ep = entry.episode
+        number = _episode_number(ep)
+        self.events_by_episode.setdefault(ep, []).append(event)
+        self._events_by_number.setdefault(number, []).append(event)
+
+        # last_mention (最新のイベントで更新)
+        # エピソード番号で比較して最大のものを保持
+        current_last = self._last_mention_number.get(fs_id)
+        if current_last is None or number > current_last:
+            self.last_mention[fs_id] = ep
+            self._last_mention_number[fs_id] = number
+
+        return event
+
+    def add_event(self, foreshadowing: Foreshadowing, entry: TimelineEntry) -> TimelineEvent:
+        """伏線のタイムラインに追加されたイベントをインデックスに反映する.
+
+        Args:
+            foreshadowing: イベントが追加された伏線
+            entry: 追加されたタイムラインエントリ
+
+        Returns:
+            登録したイベント
+        """
+        number = _episode_number(entry.episode)
+        if number not in self._events_by_number:
+            bisect.insort(self._episode_numbers, number)
+        return self._insert(foreshadowing.id, foreshadowing.title, entry)
+
+    def remove_foreshadowing(self, foreshadowing_id: str) -> int:
+        """伏線のイベントをインデックスから削除する.
+
+        Args:
+            foreshadowing_id: 伏線ID
+
+        Returns:
+            削除したイベント数
+        """
+        self.last_mention.pop(foreshadowing_id, None)
+        self._last_mention_number.pop(foreshadowing_id, None)
+        events = self._events_by_foreshadowing.pop(foreshadowing_id, [])
+        if not events:
+            return 0
+
+        removed = {id(event) for event in events}
+        for ep in {event.episode for event in events}:
+            remaining = [e for e in self.events_by_episode[ep] if id(e) not in removed]
+            if remaining:
+                self.events_by_episode[ep] = remaining
+            else:
+                del self.events_by_episode[ep]
+        for number in {_episode_number(event.episode) for event in events}:
+            remaining = [e for e in self._events_by_number[number] if id(e) not in removed]
+            if remaining:
+                self._events_by_number[number] = remaining
+            else:
+                del self._events_by_number[number]
+                del self._episode_numbers[bisect.bisect_left(self._episode_numbers, number)]
+        self._all_events = [e for e in self._all_events if id(e) not in removed]
+        return len(events)
+
+    def iter_events(self) -> Iterator[TimelineEvent]:
+        """全イベントを登録順に返す.
+
+        Returns:
+            イベントのイテレータ（コピーしない）
+        """
+        return iter(self._all_events)
+
     def get_events_for_episode(self, episode_id: str) -> list[TimelineEvent]:
         """指定エピソードの全イベントを取得.
 
         Args:
-            episode_id: エピソードID
+            episode_id: エピソードID（"ep010" / "010" / "10" は同一とみなす）
 
         Returns:
             そのエピソードのイベントリスト
         """
-        # 正規化して検索
-        for ep_key, events in self.events_by_episode.items():
-            if _episodes_match(ep_key, episode_id):
-                return events
-        return []
+        return list(self._events_by_number.get(_episode_number(episode_id), []))
+
+    def get_events_in_range(self, start_episode: str, end_episode: str) -> list[TimelineEvent]:
+        """指定範囲（両端を含む）のエピソードのイベントを取得.
+
+        Args:
+            start_episode: 開始エピソードID
+            end_episode: 終了エピソードID
+
+        Returns:
+            エピソード番号順のイベントリスト
+        """
+        start = _episode_number(start_episode)
+        end = _episode_number(end_episode)
+        lo = bisect.bisect_left(self._episode_numbers, start)
+        hi = bisect.bisect_right(self._episode_numbers, end)
+        return [
+            event
+            for number in self._episode_numbers[lo:hi]
+            for event in self._events_by_number[number]
+        ]
 
     def get_silent_foreshadowings(
         self,
@@ -185,8 +275,7 @@ class TimelineIndex:
         results = []
 
         # last_mention から silence を計算
-        for fs_id, last_ep in self.last_mention.items():
-            last_num = _episode_number(last_ep)
+        for fs_id, last_num in self._last_mention_number.items():
             silence = current_num - last_num
             if silence >= threshold:
                 results.append((fs_id, silence))
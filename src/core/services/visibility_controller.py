@@ -18,6 +18,7 @@ from src.core.parsers.visibility_comment import (
     VISIBILITY_COMMENT_PATTERN,
     extract_section_visibility,
 )
+from src.core.services.visibility_policy import VisibilityPolicy
 
 
 def generate_level1_template(
@@ -140,20 +141,26 @@ class VisibilityController:
         default_level: AIVisibilityLevel = AIVisibilityLevel.HIDDEN,
         forbidden_keywords: list[str] | None = None,
         config: VisibilityConfig | None = None,
+        policy: VisibilityPolicy | None = None,
     ) -> None:
         """初期化.
 
         Args:
             default_level: デフォルトの可視性レベル
             forbidden_keywords: グローバル禁止キーワードリスト
-            config: 可視性設定（指定時は設定から禁止キーワードを収集）
+            config: 可視性設定（指定時は設定からポリシーを構築する）
+            policy: コンパイル済みポリシー（指定時は config より優先）
         """
         self.default_level = default_level
         self.config = config
-        # Collect forbidden keywords from config if provided
-        if config:
-            config_keywords = config.collect_forbidden_keywords()
-            self.forbidden_keywords = list(set((forbidden_keywords or []) + config_keywords))
+        if policy is None and config:
+            policy = VisibilityPolicy.from_config(config)
+        self.policy = policy
+        # Merge forbidden keywords from the policy if provided
+        if policy:
+            self.forbidden_keywords = list(
+                set(forbidden_keywords or []) | policy.forbidden_keywords
+            )
         else:
             self.forbidden_keywords = forbidden_keywords or []
         self._global_hints: list[str] = []
@@ -166,20 +173,31 @@ class VisibilityController:
         """
         self._global_hints.append(hint)
 
-    def filter(self, content: str) -> VisibilityFilteredContent:
+    def filter(
+        self,
+        content: str,
+        entity_type: str | None = None,
+        entity_name: str | None = None,
+    ) -> VisibilityFilteredContent:
         """コンテンツをフィルタリングする.
 
         Args:
             content: フィルタ対象のMarkdownコンテンツ
+            entity_type: エンティティタイプ（指定時はポリシーのセクション設定を使う）
+            entity_name: エンティティ名
 
         Returns:
             フィルタ済みコンテンツ
         """
+        section_configs = None
+        if self.policy and entity_type is not None and entity_name is not None:
+            section_configs = dict(self.policy.section_configs(entity_type, entity_name))
         return filter_content_by_visibility(
             content,
             default_level=self.default_level,
             forbidden_keywords=self.forbidden_keywords,
             global_hints=self._global_hints,
+            section_configs=section_configs,
         )
 
 
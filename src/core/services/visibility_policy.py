@@ -0,0 +1,259 @@
+"""Compiled visibility policy.
+
+visibility.yaml を1回だけ走査し、禁止キーワード・エンティティ別の
+セクション → レベル対応・許可表現を定数時間で引ける形にまとめる。
+visibility.yaml の内容ハッシュ（フィンガープリント）ごとにキャッシュし、
+同じ内容に対してはポリシーを再構築しない。
+
+利用者:
+- ForbiddenKeywordCollector（L3）: global / エンティティ別の禁止キーワード
+- VisibilityController: 禁止キーワードとエンティティ別のセクション設定
+- VisibilityFilteringService（L3）: VisibilityController 経由のセクション設定
+
+仕様: docs/specs/novel-generator-v2/04_ai-information-control.md
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections import OrderedDict
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+import yaml
+from pydantic import ValidationError
+
+from src.core.models.ai_visibility import (
+    AIVisibilityLevel,
+    SectionVisibility,
+    VisibilityConfig,
+)
+
+# エンティティのキー: (entity_type, entity_name)
+EntityKey = tuple[str, str]
+
+# コンパイル済みポリシーのキャッシュ上限
+_MAX_CACHE_SIZE = 16
+
+_policy_cache: OrderedDict[str, VisibilityPolicy] = OrderedDict()
+
+
+@dataclass(frozen=True)
+class VisibilityPolicy:
+    """コンパイル済みの可視性ポリシー.
+
+    構築後は変更しない。問い合わせはすべて辞書引き（定数時間）。
+
+    Attributes:
+        default_level: 設定にないエンティティの可視性レベル
+        global_keywords: global_forbidden_keywords（記載順）
+        entity_keywords: 全エンティティ・全セクションの禁止キーワード（記載順）
+        forbidden_keywords: global_keywords と entity_keywords の和集合
+
+    Examples:
+        >>> policy = compile_visibility_policy("global_forbidden_keywords: [王族]")
+        >>> sorted(policy.forbidden_keywords)
+        ['王族']
+    """
+
+    default_level: AIVisibilityLevel = AIVisibilityLevel.HIDDEN
+    global_keywords: tuple[str, ...] = ()
+    entity_keywords: tuple[str, ...] = ()
+    forbidden_keywords: frozenset[str] = frozenset()
+    # エンティティ → 既定レベル / セクション名 → 設定 / セクション名 → レベル / 禁止キーワード
+    _entity_levels: Mapping[EntityKey, AIVisibilityLevel] = field(
+        default_factory=dict, repr=False
+    )
+    _sections: Mapping[EntityKey, Mapping[str, SectionVisibility]] = field(
+        default_factory=dict, repr=False
+    )
+    _section_levels: Mapping[EntityKey, Mapping[str, AIVisibilityLevel]] = field(
+        default_factory=dict, repr=False
+    )
+    _keywords_by_entity: Mapping[EntityKey, frozenset[str]] = field(
+        default_factory=dict, repr=False
+    )
+
+    @classmethod
+    def from_config(
+        cls,
+        config: VisibilityConfig,
+        global_keywords: Iterable[str] = (),
+        entity_keywords: Iterable[str] | None = None,
+    ) -> VisibilityPolicy:
+        """VisibilityConfig からポリシーを構築する.
+
+        Args:
+            config: 可視性設定
+            global_keywords: global_forbidden_keywords
+            entity_keywords: エンティティの禁止キーワード
+                （None の場合は config のセクションから収集する）
+
+        Returns:
+            構築されたポリシー
+        """
+        entity_levels: dict[EntityKey, AIVisibilityLevel] = {}
+        sections: dict[EntityKey, dict[str, SectionVisibility]] = {}
+        keywords_by_entity: dict[EntityKey, frozenset[str]] = {}
+        collected: list[str] = []
+        for entity in config.entities:
+            key = (entity.entity_type, entity.entity_name)
+            entity_levels.setdefault(key, entity.default_level)
+            entity_sections = sections.setdefault(key, {})
+            keywords: list[str] = []
+            for section in entity.sections:
+                entity_sections.setdefault(section.section_name, section)
+                keywords.extend(k for k in section.forbidden_keywords if k)
+            keywords_by_entity[key] = keywords_by_entity.get(key, frozenset()) | set(
+                keywords
+            )
+            collected.extend(keywords)
+
+        global_tuple = tuple(k for k in global_keywords if k)
+        entity_tuple = (
+            tuple(collected)
+            if entity_keywords is None
+            else tuple(k for k in entity_keywords if k)
+        )
+        return cls(
+            default_level=config.default_visibility,
+            global_keywords=global_tuple,
+            entity_keywords=entity_tuple,
+            forbidden_keywords=frozenset(global_tuple) | frozenset(entity_tuple),
+            _entity_levels=entity_levels,
+            _sections=sections,
+            _section_levels={
+                key: {name: s.level for name, s in entity_sections.items()}
+                for key, entity_sections in sections.items()
+            },
+            _keywords_by_entity=keywords_by_entity,
+        )
+
+    def entity_level(self, entity_type: str, entity_name: str) -> AIVisibilityLevel:
+        """エンティティの既定レベルを返す（設定がなければ default_level）."""
+        return self._entity_levels.get((entity_type, entity_name), self.default_level)
+
+    def section_levels(
+        self, entity_type: str, entity_name: str
+    ) -> Mapping[str, AIVisibilityLevel]:
+        """エンティティのセクション名 → レベルの対応を返す."""
+        return self._section_levels.get((entity_type, entity_name), {})
+
+    def section_level(
+        self, entity_type: str, entity_name: str, section_name: str
+    ) -> AIVisibilityLevel:
+        """セクションのレベルを返す（設定がなければエンティティの既定レベル）."""
+        level = self.section_levels(entity_type, entity_name).get(section_name)
+        if level is None:
+            return self.entity_level(entity_type, entity_name)
+        return level
+
+    def section_configs(
+        self, entity_type: str, entity_name: str
+    ) -> Mapping[str, SectionVisibility]:
+        """エンティティのセクション名 → セクション設定を返す."""
+        return self._sections.get((entity_type, entity_name), {})
+
+    def allowed_expressions(
+        self, entity_type: str, entity_name: str, section_name: str
+    ) -> list[str]:
+        """セクションの許可表現を返す（設定がなければ空リスト）."""
+        section = self.section_configs(entity_type, entity_name).get(section_name)
+        return list(section.allowed_expressions) if section else []
+
+    def entity_forbidden_keywords(
+        self, entity_type: str, entity_name: str
+    ) -> frozenset[str]:
+        """エンティティの全セクションの禁止キーワードを返す."""
+        return self._keywords_by_entity.get((entity_type, entity_name), frozenset())
+
+
+def _keyword_list(value: Any) -> list[str]:
+    """YAML のキーワードリストを文字列リストに変換する（リスト以外は空）."""
+    if isinstance(value, list):
+        return [str(k) for k in value if k]
+    return []
+
+
+def _raw_entity_keywords(data: Mapping[str, Any]) -> list[str]:
+    """entities[*].sections[*].forbidden_keywords を記載順に集める.
+
+    VisibilityConfig として検証できない設定でも、形が合う部分は収集する。
+    """
+    keywords: list[str] = []
+    entities = data.get("entities", [])
+    if not isinstance(entities, list):
+        return keywords
+    for entity in entities:
+        if not isinstance(entity, dict):
+            continue
+        sections = entity.get("sections", [])
+        if not isinstance(sections, list):
+            continue
+        for section in sections:
+            if isinstance(section, dict):
+                keywords.extend(_keyword_list(section.get("forbidden_keywords", [])))
+    return keywords
+
+
+def _compile(raw: str) -> VisibilityPolicy:
+    """visibility.yaml の内容からポリシーを構築する."""
+    try:
+        data = yaml.safe_load(raw)
+    except yaml.YAMLError:
+        data = None
+    if not isinstance(data, dict) or not data:
+        return VisibilityPolicy()
+
+    try:
+        config = VisibilityConfig.model_validate(data)
+    except ValidationError:
+        # エンティティ別の対応は作れないが、禁止キーワードは収集する
+        config = VisibilityConfig()
+    return VisibilityPolicy.from_config(
+        config,
+        global_keywords=_keyword_list(data.get("global_forbidden_keywords", [])),
+        entity_keywords=_raw_entity_keywords(data),
+    )
+
+
+def visibility_fingerprint(raw: str) -> str:
+    """visibility.yaml の内容ハッシュを計算する.
+
+    Args:
+        raw: visibility.yaml の内容
+
+    Returns:
+        SHA-256 の16進文字列
+    """
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def compile_visibility_policy(raw: str) -> VisibilityPolicy:
+    """visibility.yaml の内容をポリシーにコンパイルする（内容ハッシュでキャッシュ）.
+
+    空・不正な YAML は制限のない空のポリシーになる。
+
+    Args:
+        raw: visibility.yaml の内容
+
+    Returns:
+        コンパイル済みの VisibilityPolicy
+    """
+    fingerprint = visibility_fingerprint(raw)
+    cached = _policy_cache.get(fingerprint)
+    if cached is not None:
+        _policy_cache.move_to_end(fingerprint)
+        return cached
+
+    policy = _compile(raw)
+    _policy_cache[fingerprint] = policy
+    while len(_policy_cache) > _MAX_CACHE_SIZE:
+        _policy_cache.popitem(last=False)
+    return policy
+
+
+def clear_policy_cache() -> None:
+    """コンパイル済みポリシーのキャッシュをクリアする."""
+    _policy_cache.clear()
@@ -1,6 +1,17 @@
 """Vault utilities."""
 
+from .fingerprint import FileFingerprint
+from .index import IndexEntry, IndexRefreshStats, VaultIndex, VaultIndexError
 from .init import VaultInitializer, VaultStructure
 from .path_resolver import VaultPathResolver
 
-__all__ = ["VaultInitializer", "VaultPathResolver", "VaultStructure"]
+__all__ = [
+    "FileFingerprint",
+    "IndexEntry",
+    "IndexRefreshStats",
+    "VaultIndex",
+    "VaultIndexError",
+    "VaultInitializer",
+    "VaultPathResolver",
+    "VaultStructure",
+]
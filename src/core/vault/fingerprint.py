@@ -0,0 +1,69 @@
+"""FileFingerprint.
+
+ファイルの同一性を stat 情報で判定するためのフィンガープリント。
+キャッシュの有効性検証に使用する（1回の stat で変更を検出できる）。
+"""
+
+import os
+from dataclasses import dataclass
+from pathlib import Path
+
+
+@dataclass(frozen=True)
+class FileFingerprint:
+    """ファイルのフィンガープリント.
+
+    (st_mtime_ns, st_size, st_ino) が一致すれば内容は変わっていないとみなす。
+    rename による置き換え（アトミック書き込み）は inode の変化で検出できる。
+
+    Attributes:
+        mtime_ns: 最終更新時刻（ナノ秒）
+        size: ファイルサイズ（バイト）
+        inode: inode 番号
+    """
+
+    mtime_ns: int
+    size: int
+    inode: int
+
+    @classmethod
+    def from_stat(cls, st: os.stat_result) -> "FileFingerprint":
+        """stat 結果からフィンガープリントを作成.
+
+        Args:
+            st: os.stat の結果
+
+        Returns:
+            フィンガープリント
+        """
+        return cls(mtime_ns=st.st_mtime_ns, size=st.st_size, inode=st.st_ino)
+
+    @classmethod
+    def of(cls, path: Path) -> "FileFingerprint":
+        """ファイルのフィンガープリントを取得.
+
+        Args:
+            path: ファイルパス
+
+        Returns:
+            フィンガープリント
+
+        Raises:
+            FileNotFoundError: ファイルが存在しない場合
+        """
+        return cls.from_stat(path.stat())
+
+    @classmethod
+    def of_or_none(cls, path: Path) -> "FileFingerprint | None":
+        """ファイルのフィンガープリントを取得（存在しない場合は None）.
+
+        Args:
+            path: ファイルパス
+
+        Returns:
+            フィンガープリント、ファイルが存在しない場合は None
+        """
+        try:
+            return cls.of(path)
+        except (FileNotFoundError, NotADirectoryError):
+            return None
@@ -0,0 +1,700 @@
+"""Vault index.
+
+Vault 内の Markdown エンティティを SQLite に索引化する。
+パス・種別・名前・エイリアス・タグ・frontmatter ダイジェスト・
+外向き wikilink を記録し、存在確認や一覧取得をファイルシステム走査ではなく
+索引クエリで行えるようにする。
+
+索引は _settings/.index/vault.sqlite3 に永続化され、refresh() では
+mtime / サイズが変化したファイルのみ再スキャンする。
+クエリ時にはディレクトリの mtime から求めたフィンガープリントを確認し
+（batch() ブロックごと、またはブロック外では FRESHNESS_TTL 秒ごとに1回）、
+ファイルの追加・削除があれば自動的に refresh() する。
+壊れた索引ファイルは作り直し、開けない・更新できない索引
+（読み取り専用・ロック中など）は VaultIndexError を送出する。
+利用側はこの場合ファイルシステムの走査にフォールバックする。
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path, PurePosixPath
+from types import TracebackType
+from typing import Any
+
+from src.core.parsers.frontmatter import parse_frontmatter_with_fallback
+from src.core.parsers.obsidian_link import extract_links
+
+# 索引ファイルの配置（Vault ルートからの相対パス）
+INDEX_DIRECTORY = Path("_settings") / ".index"
+INDEX_FILENAME = "vault.sqlite3"
+
+# スキーマバージョン（変更時は索引を作り直す）
+SCHEMA_VERSION = "1"
+
+# ディレクトリ構成のフィンガープリント: (相対パス, mtime_ns) の組
+DirectoryFingerprint = tuple[tuple[str, int], ...]
+
+# batch() の外で索引の鮮度（ディレクトリ構成）を確認する間隔（秒）
+FRESHNESS_TTL = 1.0
+
+# 索引ファイルとともに削除する SQLite の補助ファイルの接尾辞
+_SQLITE_SIDE_FILES = ("-journal", "-wal", "-shm")
+
+
+class VaultIndexError(Exception):
+    """索引を開けない・更新できない（読み取り専用・ロック中など）."""
+
+# トップレベルディレクトリとエンティティ種別の対応
+ENTITY_TYPE_BY_DIRECTORY: dict[str, str] = {
+    "episodes": "episode",
+    "characters": "character",
+    "world": "world_setting",
+    "_plot": "plot",
+    "_summary": "summary",
+    "_style_guides": "style_guide",
+    "_style_profiles": "style_profile",
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS entities (
+    path TEXT PRIMARY KEY,
+    dir TEXT NOT NULL,
+    stem TEXT NOT NULL,
+    type TEXT NOT NULL,
+    name TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    digest TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_entities_dir ON entities(dir);
+CREATE INDEX IF NOT EXISTS idx_entities_type_stem ON entities(type, stem);
+CREATE TABLE IF NOT EXISTS aliases (
+    path TEXT NOT NULL,
+    alias TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_aliases_alias ON aliases(alias);
+CREATE INDEX IF NOT EXISTS idx_aliases_path ON aliases(path);
+CREATE TABLE IF NOT EXISTS tags (
+    path TEXT NOT NULL,
+    tag TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_tags_tag ON tags(tag);
+CREATE INDEX IF NOT EXISTS idx_tags_path ON tags(path);
+CREATE TABLE IF NOT EXISTS links (
+    path TEXT NOT NULL,
+    target TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_links_target ON links(target);
+CREATE INDEX IF NOT EXISTS idx_links_path ON links(path);
+"""
+
+
+@dataclass
+class IndexEntry:
+    """索引に記録されたエンティティ.
+
+    Attributes:
+        path: Vault ルートからの相対パス（POSIX 形式）
+        entity_type: エンティティ種別（character, world_setting 等）
+        name: エンティティ名（frontmatter の name/title、なければファイル名）
+        digest: frontmatter の SHA-256 ダイジェスト
+        aliases: エイリアス
+        tags: タグ
+        links: 外向き wikilink のターゲット（出現順、重複なし）
+    """
+
+    path: str
+    entity_type: str
+    name: str
+    digest: str
+    aliases: list[str] = field(default_factory=list)
+    tags: list[str] = field(default_factory=list)
+    links: list[str] = field(default_factory=list)
+
+
+@dataclass
+class IndexRefreshStats:
+    """refresh() の結果.
+
+    Attributes:
+        scanned: 再スキャン（追加・更新）したファイル数
+        unchanged: 変更がなくスキップしたファイル数
+        removed: 索引から削除したファイル数
+    """
+
+    scanned: int = 0
+    unchanged: int = 0
+    removed: int = 0
+
+
+def _as_string_list(value: Any) -> list[str]:
+    """frontmatter の値を文字列リストに正規化."""
+    if value is None:
+        return []
+    if isinstance(value, str):
+        return [value] if value else []
+    if isinstance(value, list):
+        return [str(v) for v in value if v is not None and str(v)]
+    return [str(value)]
+
+
+def _dedupe(values: list[str]) -> list[str]:
+    """順序を保ったまま重複を除去."""
+    return list(dict.fromkeys(values))
+
+
+def frontmatter_digest(frontmatter: dict[str, Any]) -> str:
+    """frontmatter のダイジェストを計算.
+
+    キー順に依存しないよう正規化した JSON の SHA-256 を返す。
+
+    Args:
+        frontmatter: frontmatter 辞書
+
+    Returns:
+        16進文字列のダイジェスト
+    """
+    payload = json.dumps(frontmatter, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class VaultIndex:
+    """Vault エンティティの永続索引.
+
+    1つのインスタンスは1つの SQLite 接続を持ち、ロックで直列化するため
+    スレッド間で共有できる。クエリ時にはディレクトリの mtime から求めた
+    フィンガープリントを前回の refresh() 時と比較し、ファイルの追加・削除・
+    リネームがあれば refresh() する（長寿命のプロセスでも索引が古くならない）。
+    この確認は batch() ブロックごとに1回、ブロック外では freshness_ttl 秒に
+    1回だけ行う（確認のたびにディレクトリを走査するため）。
+    既存ファイルの内容変更はディレクトリの mtime を変えないため、
+    索引へ反映するには refresh() か update_path() を呼ぶ。
+    索引を開けない・更新できない場合、クエリは VaultIndexError を送出する。
+
+    Attributes:
+        vault_root: Vault のルートディレクトリ
+        index_path: 索引ファイルのパス
+    """
+
+    def __init__(
+        self,
+        vault_root: Path,
+        index_path: Path | None = None,
+        freshness_ttl: float = FRESHNESS_TTL,
+    ) -> None:
+        """初期化.
+
+        Args:
+            vault_root: Vault のルートディレクトリ
+            index_path: 索引ファイルのパス（省略時は _settings/.index/vault.sqlite3）
+            freshness_ttl: batch() の外で鮮度を確認する間隔（秒）
+        """
+        self.vault_root = vault_root
+        self.index_path = (
+            index_path
+            if index_path is not None
+            else vault_root / INDEX_DIRECTORY / INDEX_FILENAME
+        )
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.RLock()
+        # 前回 refresh() 時のディレクトリ構成（未 refresh なら None）
+        self._fingerprint: DirectoryFingerprint | None = None
+        # 鮮度を最後に確認した時刻（time.monotonic()、未確認なら None）
+        self._freshness_ttl = freshness_ttl
+        self._checked_at: float | None = None
+        # batch() のネスト数と、ブロック内で確認済みかどうか
+        self._batch_depth = 0
+        self._batch_checked = False
+
+    def __enter__(self) -> "VaultIndex":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    # --- 接続管理 ---
+
+    @contextmanager
+    def _guarded(self) -> Iterator[None]:
+        """ロックを取り、SQLite・ファイルシステムのエラーを VaultIndexError に変換する."""
+        with self._lock:
+            try:
+                yield
+            except (sqlite3.Error, OSError) as e:
+                raise VaultIndexError(
+                    f"Vault index unavailable: {self.index_path}: {e}"
+                ) from e
+
+    def _connect(self) -> sqlite3.Connection:
+        """接続を取得（必要ならスキーマを作成、壊れた索引ファイルは作り直す）."""
+        if self._conn is not None:
+            return self._conn
+
+        try:
+            conn = self._open()
+        except sqlite3.OperationalError:
+            # ロック中・読み取り専用など（ファイルは壊れていないので削除しない）
+            raise
+        except sqlite3.DatabaseError:
+            # "file is not a database" など: 索引は Vault から再構築できる
+            self._discard_index_file()
+            conn = self._open()
+        self._conn = conn
+        return conn
+
+    def _open(self) -> sqlite3.Connection:
+        """索引ファイルを開き、スキーマを準備する."""
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.index_path), check_same_thread=False)
+        try:
+            row = None
+            try:
+                row = conn.execute(
+                    "SELECT value FROM meta WHERE key = 'schema_version'"
+                ).fetchone()
+            except sqlite3.OperationalError:
+                pass
+            if row is None or row[0] != SCHEMA_VERSION:
+                for table in ("meta", "entities", "aliases", "tags", "links"):
+                    conn.execute(f"DROP TABLE IF EXISTS {table}")
+            conn.executescript(_SCHEMA)
+            conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('schema_version', ?)",
+                (SCHEMA_VERSION,),
+            )
+            conn.commit()
+        except sqlite3.Error:
+            conn.close()
+            raise
+        return conn
+
+    def _discard_index_file(self) -> None:
+        """索引ファイルと SQLite の補助ファイルを削除する."""
+        for path in [self.index_path] + [
+            self.index_path.with_name(self.index_path.name + suffix)
+            for suffix in _SQLITE_SIDE_FILES
+        ]:
+            path.unlink(missing_ok=True)
+
+    def _ready(self) -> sqlite3.Connection:
+        """クエリ用の接続を取得（ディレクトリ構成が変わっていれば先に refresh する）."""
+        if self._batch_depth > 0:
+            stale_check = not self._batch_checked
+        else:
+            stale_check = (
+                self._checked_at is None
+                or time.monotonic() - self._checked_at >= self._freshness_ttl
+            )
+        if stale_check:
+            if self._directory_fingerprint() != self._fingerprint:
+                self.refresh()
+            self._checked_at = time.monotonic()
+            self._batch_checked = self._batch_depth > 0
+        return self._connect()
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """ブロック内のクエリで索引の鮮度確認を1回にまとめる.
+
+        1回のコンテキスト構築のように短時間に多数のクエリを行う場合に使う。
+        ブロック内の最初のクエリでは freshness_ttl によらず鮮度を確認する。
+        ネストしたブロックは最も外側のブロックを共有する。
+
+        Yields:
+            None
+        """
+        with self._lock:
+            self._batch_depth += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._batch_depth -= 1
+                if self._batch_depth == 0:
+                    self._batch_checked = False
+
+    def close(self) -> None:
+        """接続を閉じる."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+            self._fingerprint = None
+            self._checked_at = None
+
+    # --- 更新 ---
+
+    def _relative(self, path: Path) -> str | None:
+        """Vault ルートからの相対パス（POSIX 形式）を返す."""
+        try:
+            rel = Path(os.path.abspath(path)).relative_to(
+                os.path.abspath(self.vault_root)
+            )
+        except ValueError:
+            return None
+        return rel.as_posix()
+
+    def _directory_fingerprint(self) -> DirectoryFingerprint:
+        """Vault 内のディレクトリ（ドットディレクトリは除外）の mtime を集める.
+
+        ファイルの追加・削除・リネームは親ディレクトリの mtime を変えるため、
+        ファイルを個別に stat せずに索引の鮮度を確認できる。
+        """
+        entries: list[tuple[str, int]] = []
+        root = str(self.vault_root)
+        for dirpath, dirnames, _ in os.walk(root):
+            dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+            try:
+                mtime_ns = os.stat(dirpath).st_mtime_ns
+            except OSError:
+                continue
+            entries.append((os.path.relpath(dirpath, root), mtime_ns))
+        return tuple(entries)
+
+    def _iter_markdown_files(self) -> list[tuple[str, os.stat_result]]:
+        """Vault 内の Markdown ファイルを列挙（ドットディレクトリは除外）."""
+        files: list[tuple[str, os.stat_result]] = []
+        root = str(self.vault_root)
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+            for filename in filenames:
+                if not filename.endswith(".md") or filename.startswith("."):
+                    continue
+                full = os.path.join(dirpath, filename)
+                try:
+                    st = os.stat(full)
+                except OSError:
+                    continue
+                files.append((Path(os.path.relpath(full, root)).as_posix(), st))
+        return files
+
+    def _scan(self, conn: sqlite3.Connection, rel: str, st: os.stat_result) -> bool:
+        """1ファイルを読み込んで索引を更新.
+
+        Returns:
+            索引に登録できた場合 True（読み込みに失敗した場合 False）
+        """
+        try:
+            content = (self.vault_root / rel).read_text(
+                encoding="utf-8", errors="replace"
+            )
+        except OSError:
+            return False
+
+        result = parse_frontmatter_with_fallback(content)
+        fm = result.frontmatter if result.result_type == "structured" else {}
+        fm = fm or {}
+
+        posix = PurePosixPath(rel)
+        top = posix.parts[0] if len(posix.parts) > 1 else ""
+        entity_type = ENTITY_TYPE_BY_DIRECTORY.get(top) or str(fm.get("type") or "other")
+        raw_name = fm.get("name") or fm.get("title")
+        name = raw_name if isinstance(raw_name, str) and raw_name else posix.stem
+
+        aliases = _dedupe(_as_string_list(fm.get("aliases")))
+        tags = _dedupe([t.lstrip("#") for t in _as_string_list(fm.get("tags"))])
+        links = _dedupe([link.target for link in extract_links(content)])
+
+        self._delete(conn, rel)
+        conn.execute(
+            "INSERT INTO entities (path, dir, stem, type, name, mtime_ns, size, digest)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                rel,
+                str(posix.parent) if str(posix.parent) != "." else "",
+                posix.stem,
+                entity_type,
+                name,
+                st.st_mtime_ns,
+                st.st_size,
+                frontmatter_digest(fm),
+            ),
+        )
+        conn.executemany(
+            "INSERT INTO aliases (path, alias) VALUES (?, ?)",
+            [(rel, a) for a in aliases],
+        )
+        conn.executemany(
+            "INSERT INTO tags (path, tag) VALUES (?, ?)", [(rel, t) for t in tags]
+        )
+        conn.executemany(
+            "INSERT INTO links (path, target) VALUES (?, ?)",
+            [(rel, t) for t in links],
+        )
+        return True
+
+    @staticmethod
+    def _delete(conn: sqlite3.Connection, rel: str) -> None:
+        """1ファイル分のレコードを削除."""
+        for table in ("entities", "aliases", "tags", "links"):
+            conn.execute(f"DELETE FROM {table} WHERE path = ?", (rel,))
+
+    def refresh(self) -> IndexRefreshStats:
+        """索引を Vault の現在の状態に同期.
+
+        mtime / サイズが索引と一致するファイルは読み込まない。
+        存在しなくなったファイルは索引から削除する。
+
+        Returns:
+            IndexRefreshStats
+
+        Raises:
+            VaultIndexError: 索引を開けない・更新できない場合
+        """
+        stats = IndexRefreshStats()
+        with self._guarded():
+            conn = self._connect()
+            # 走査中の変更は次回のクエリで検出できるよう、走査前に記録する
+            # （索引ディレクトリの作成による mtime の変化は含めない）
+            fingerprint = self._directory_fingerprint()
+            known = {
+                row[0]: (row[1], row[2])
+                for row in conn.execute("SELECT path, mtime_ns, size FROM entities")
+            }
+            seen: set[str] = set()
+            with conn:
+                for rel, st in self._iter_markdown_files():
+                    if known.get(rel) == (st.st_mtime_ns, st.st_size):
+                        seen.add(rel)
+                        stats.unchanged += 1
+                    elif self._scan(conn, rel, st):
+                        seen.add(rel)
+                        stats.scanned += 1
+                for rel in known.keys() - seen:
+                    self._delete(conn, rel)
+                    stats.removed += 1
+            self._fingerprint = fingerprint
+            self._checked_at = time.monotonic()
+        return stats
+
+    def update_path(self, path: Path) -> None:
+        """1ファイルの変更（作成・更新・削除）を索引に反映.
+
+        Vault 外のパスや Markdown 以外のファイルは無視する。
+
+        Args:
+            path: 変更されたファイルのパス
+
+        Raises:
+            VaultIndexError: 索引を開けない・更新できない場合
+        """
+        rel = self._relative(path)
+        if rel is None or not rel.endswith(".md"):
+            return
+        with self._guarded():
+            conn = self._connect()
+            with conn:
+                try:
+                    st = os.stat(self.vault_root / rel)
+                except OSError:
+                    self._delete(conn, rel)
+                    return
+                if not self._scan(conn, rel, st):
+                    self._delete(conn, rel)
+
+    # --- クエリ ---
+
+    def _paths(self, sql: str, params: tuple[Any, ...] = ()) -> list[Path]:
+        """パスを返すクエリを実行."""
+        with self._guarded():
+            rows = self._ready().execute(sql, params).fetchall()
+        return [self.vault_root / row[0] for row in rows]
+
+    def contains(self, rel_path: str) -> bool:
+        """相対パスのエンティティが索引にあるか確認.
+
+        Args:
+            rel_path: Vault ルートからの相対パス（POSIX 形式）
+
+        Returns:
+            存在する場合 True
+        """
+        with self._guarded():
+            row = self._ready().execute(
+                "SELECT 1 FROM entities WHERE path = ?", (rel_path,)
+            ).fetchone()
+        return row is not None
+
+    def find_by_path(self, rel_path: str) -> Path | None:
+        """相対パスからファイルパスを取得.
+
+        Args:
+            rel_path: Vault ルートからの相対パス（POSIX 形式）
+
+        Returns:
+            索引にあればファイルパス、なければ None
+        """
+        return self.vault_root / rel_path if self.contains(rel_path) else None
+
+    def find_by_stem(self, entity_type: str, stem: str) -> list[Path]:
+        """種別とファイル名（拡張子なし）からファイルパスを取得.
+
+        Args:
+            entity_type: エンティティ種別
+            stem: ファイル名（拡張子なし）
+
+        Returns:
+            パス順のファイルパスのリスト
+        """
+        return self._paths(
+            "SELECT path FROM entities WHERE type = ? AND stem = ? ORDER BY path",
+            (entity_type, stem),
+        )
+
+    def find_by_alias(self, alias: str, entity_type: str | None = None) -> list[Path]:
+        """エイリアスからファイルパスを取得.
+
+        Args:
+            alias: エイリアス
+            entity_type: 種別で絞り込む場合に指定
+
+        Returns:
+            パス順のファイルパスのリスト
+        """
+        if entity_type is None:
+            return self._paths(
+                "SELECT DISTINCT path FROM aliases WHERE alias = ? ORDER BY path",
+                (alias,),
+            )
+        return self._paths(
+            "SELECT DISTINCT a.path FROM aliases a JOIN entities e ON a.path = e.path"
+            " WHERE a.alias = ? AND e.type = ? ORDER BY a.path",
+            (alias, entity_type),
+        )
+
+    def find_by_tag(self, tag: str) -> list[Path]:
+        """タグからファイルパスを取得.
+
+        Args:
+            tag: タグ（先頭の # は不要）
+
+        Returns:
+            パス順のファイルパスのリスト
+        """
+        return self._paths(
+            "SELECT DISTINCT path FROM tags WHERE tag = ? ORDER BY path",
+            (tag.lstrip("#"),),
+        )
+
+    def find_backlinks(self, target: str) -> list[Path]:
+        """指定ターゲットへ wikilink しているファイルを取得.
+
+        Args:
+            target: wikilink のターゲット（例: "characters/アイラ"）
+
+        Returns:
+            パス順のファイルパスのリスト
+        """
+        return self._paths(
+            "SELECT DISTINCT path FROM links WHERE target = ? ORDER BY path",
+            (target,),
+        )
+
+    def list_by_type(self, entity_type: str) -> list[Path]:
+        """種別ごとのファイルパスを取得.
+
+        Args:
+            entity_type: エンティティ種別
+
+        Returns:
+            パス順のファイルパスのリスト
+        """
+        return self._paths(
+            "SELECT path FROM entities WHERE type = ? ORDER BY path", (entity_type,)
+        )
+
+    def list_directory(self, directory: str, *, depth: int | None = 0) -> list[Path]:
+        """ディレクトリ配下のファイルパスを取得.
+
+        Args:
+            directory: Vault ルートからの相対ディレクトリ（POSIX 形式）
+            depth: 0 なら直下のみ、n なら n 階層下のサブディレクトリ内のみ、
+                None なら再帰的にすべて
+
+        Returns:
+            パス順のファイルパスのリスト
+        """
+        directory = directory.strip("/")
+        if depth == 0:
+            return self._paths(
+                "SELECT path FROM entities WHERE dir = ? ORDER BY path", (directory,)
+            )
+
+        prefix = f"{directory}/" if directory else ""
+        with self._guarded():
+            rows = self._ready().execute(
+                "SELECT path, dir FROM entities"
+                " WHERE substr(dir, 1, ?) = ? OR dir = ? ORDER BY path",
+                (len(prefix), prefix, directory),
+            ).fetchall()
+
+        base_depth = len(PurePosixPath(directory).parts) if directory else 0
+        paths: list[Path] = []
+        for rel, rel_dir in rows:
+            level = len(PurePosixPath(rel_dir).parts) - base_depth if rel_dir else 0
+            if depth is None or level == depth:
+                paths.append(self.vault_root / rel)
+        return paths
+
+    def get_entry(self, rel_path: str) -> IndexEntry | None:
+        """索引エントリを取得.
+
+        Args:
+            rel_path: Vault ルートからの相対パス（POSIX 形式）
+
+        Returns:
+            IndexEntry、索引にない場合は None
+        """
+        with self._guarded():
+            conn = self._ready()
+            row = conn.execute(
+                "SELECT path, type, name, digest FROM entities WHERE path = ?",
+                (rel_path,),
+            ).fetchone()
+            if row is None:
+                return None
+            aliases = [
+                r[0]
+                for r in conn.execute(
+                    "SELECT alias FROM aliases WHERE path = ? ORDER BY rowid",
+                    (rel_path,),
+                )
+            ]
+            tags = [
+                r[0]
+                for r in conn.execute(
+                    "SELECT tag FROM tags WHERE path = ? ORDER BY rowid", (rel_path,)
+                )
+            ]
+            links = [
+                r[0]
+                for r in conn.execute(
+                    "SELECT target FROM links WHERE path = ? ORDER BY rowid",
+                    (rel_path,),
+                )
+            ]
+        return IndexEntry(
+            path=row[0],
+            entity_type=row[1],
+            name=row[2],
+            digest=row[3],
+            aliases=aliases,
+            tags=tags,
+            links=links,
+        )
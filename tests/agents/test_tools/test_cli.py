@@ -7,12 +7,14 @@ Tests the CLI parser and main entry point:
 
 from __future__ import annotations
 
+import io
 import json
 from pathlib import Path
 
 import pytest
 
 from src.agents.tools.cli import create_parser, main
+from src.agents.tools.daemon import SOCKET_ENV
 
 # ============================================================================
 # create_parser tests
@@ -107,8 +109,116 @@ def test_main_build_context_outputs_json(tmp_path: Path, capsys: pytest.CaptureF
     assert "prompt_dict" in data
     assert "forbidden_keywords" in data
     assert "foreshadow_instructions" in data
+    assert "metrics" not in data
 
 
+def test_main_build_context_profile(tmp_path: Path, capsys: pytest.CaptureFixture) -> None:  # type: ignore[type-arg]
+    """build-context --profile → metrics キー付き JSON と stderr の内訳."""
+    vault_root = tmp_path / "vault"
+    (vault_root / "_plot").mkdir(parents=True)
+    (vault_root / "_plot" / "l1_theme.md").write_text("テーマ", encoding="utf-8")
+
+    exit_code = main(
+        ["build-context", "--vault-root", str(vault_root), "--episode", "010", "--profile"]
+    )
+
+    assert exit_code == 0
+    captured = capsys.readouterr()
+    data = json.loads(captured.out)
+    assert "integration" in data["metrics"]["stages_ms"]
+    assert data["metrics"]["files_read"] == 1
+    assert "integration:" in captured.err
+
+
+def test_main_trace_writes_chrome_trace(tmp_path: Path, capsys: pytest.CaptureFixture) -> None:  # type: ignore[type-arg]
+    """--trace → Chrome trace-event JSON を書き出す."""
+    vault_root = tmp_path / "vault"
+    vault_root.mkdir()
+    trace_path = tmp_path / "trace.json"
+
+    exit_code = main(
+        ["--trace", str(trace_path), "build-context", "--vault-root", str(vault_root), "--episode", "010"]
+    )
+
+    assert exit_code == 0
+    trace = json.loads(trace_path.read_text(encoding="utf-8"))
+    names = {e["name"] for e in trace["traceEvents"]}
+    assert "ContextBuilder.build_context" in names
+
+
+def test_main_build_context_batch_outputs_json_lines(tmp_path: Path, capsys: pytest.CaptureFixture) -> None:  # type: ignore[type-arg]
+    """build-context-batch → シーンごとに1行の JSON 出力."""
+    vault_root = tmp_path / "vault"
+    (vault_root / "_plot").mkdir(parents=True)
+    (vault_root / "_plot" / "l3_011.md").write_text("シーン11", encoding="utf-8")
+
+    exit_code = main(
+        ["build-context-batch", "--vault-root", str(vault_root), "--episodes", "010,011"]
+    )
+    sequential_out = capsys.readouterr().out
+
+    exit_code_mp = main(
+        [
+            "build-context-batch",
+            "--vault-root",
+            str(vault_root),
+            "--episodes",
+            "010,011",
+            "--processes",
+            "2",
+        ]
+    )
+
+    assert exit_code == 0
+    assert exit_code_mp == 0
+    assert capsys.readouterr().out == sequential_out
+
+    lines = sequential_out.splitlines()
+    assert len(lines) == 2
+    records = [json.loads(line) for line in lines]
+    assert [r["scene"]["episode"] for r in records] == ["010", "011"]
+    assert records[1]["prompt_dict"]["plot_scene"] == "シーン11"
+
+
+def test_main_build_context_batch_from_input(tmp_path: Path, capsys: pytest.CaptureFixture) -> None:  # type: ignore[type-arg]
+    """build-context-batch --input で JSON Lines のシーン指定を読む."""
+    vault_root = tmp_path / "vault"
+    vault_root.mkdir()
+    input_file = tmp_path / "scenes.jsonl"
+    input_file.write_text(
+        '{"episode": "010", "sequence": "seq_01"}\n\n{"episode": "012"}\n',
+        encoding="utf-8",
+    )
+
+    exit_code = main(
+        ["build-context-batch", "--vault-root", str(vault_root), "--input", str(input_file)]
+    )
+
+    assert exit_code == 0
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [(r["scene"]["episode"], r["scene"]["sequence"]) for r in records] == [
+        ("010", "seq_01"),
+        ("012", None),
+    ]
+
+
+def test_main_build_context_batch_from_stdin_without_daemon(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture,  # type: ignore[type-arg]
+) -> None:
+    """デーモンが起動していなくても --input - のシーン指定でローカル実行する."""
+    vault_root = tmp_path / "vault"
+    vault_root.mkdir()
+    monkeypatch.setenv(SOCKET_ENV, str(tmp_path / "missing.sock"))
+    monkeypatch.setattr("sys.stdin", io.StringIO('{"episode": "010"}\n'))
+
+    exit_code = main(["build-context-batch", "--vault-root", str(vault_root), "--input", "-"])
+
+    assert exit_code == 0
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [r["scene"]["episode"] for r in records] == ["010"]
+
 def test_main_format_context_from_file(tmp_path: Path, capsys: pytest.CaptureFixture) -> None:  # type: ignore[type-arg]
     """format-context --input file → Markdown 出力."""
     # tmp_path に JSON ファイルを作成
@@ -188,3 +298,114 @@ def test_main_check_review_violation(
     assert data["status"] == "rejected"
     assert len(data["issues"]) == 1
     assert data["issues"][0]["type"] == "forbidden_keyword"
+
+
+# ============================================================================
+# audit-foreshadowing tests
+# ============================================================================
+
+
+def _write_registry(tmp_path: Path) -> Path:
+    """伏線登録簿つきの vault を作成する."""
+    from datetime import date
+
+    from src.core.models.foreshadowing import (
+        Foreshadowing,
+        ForeshadowingPayoff,
+        ForeshadowingStatus,
+        ForeshadowingType,
+        TimelineEntry,
+        TimelineInfo,
+    )
+    from src.core.repositories.foreshadowing import ForeshadowingRepository
+
+    repository = ForeshadowingRepository(tmp_path, "my_novel")
+    repository.create(
+        Foreshadowing(
+            id="FS-002-ring",
+            title="母の指輪",
+            fs_type=ForeshadowingType.CHARACTER_SECRET,
+            status=ForeshadowingStatus.PLANTED,
+            subtlety_level=5,
+            payoff=ForeshadowingPayoff(content="指輪の正体", planned_episode="009"),
+            timeline=TimelineInfo(
+                registered_at=date(2024, 1, 1),
+                events=[
+                    TimelineEntry(
+                        episode="002",
+                        type=ForeshadowingStatus.PLANTED,
+                        date=date(2024, 1, 1),
+                        expression="指輪が光った",
+                        subtlety=5,
+                    )
+                ],
+            ),
+        )
+    )
+    return tmp_path / "my_novel"
+
+
+def test_parser_audit_foreshadowing_args() -> None:
+    """audit-foreshadowing 引数パース."""
+    parser = create_parser()
+    args = parser.parse_args(
+        ["audit-foreshadowing", "--vault-root", "vault/w", "--start", "1", "--end", "10"]
+    )
+
+    assert args.command == "audit-foreshadowing"
+    assert args.start == "1"
+    assert args.end == "10"
+    assert args.silence_threshold == 5
+    assert args.payoff_threshold == 3
+    assert args.characters is None
+
+
+def test_main_audit_foreshadowing_outputs_json(
+    tmp_path: Path, capsys: pytest.CaptureFixture,  # type: ignore[type-arg]
+) -> None:
+    """audit-foreshadowing → エピソードごとのレポートを JSON 出力."""
+    vault_root = _write_registry(tmp_path)
+
+    exit_code = main(
+        [
+            "audit-foreshadowing",
+            "--vault-root",
+            str(vault_root),
+            "--start",
+            "005",
+            "--end",
+            "008",
+        ]
+    )
+
+    assert exit_code == 0
+    data = json.loads(capsys.readouterr().out)
+    assert data["start_episode"] == "005"
+    assert data["end_episode"] == "008"
+    episodes = {e["episode_id"]: e for e in data["episodes"]}
+    assert sorted(episodes) == ["005", "006", "007", "008"]
+    assert episodes["005"]["payoff"] == []
+    assert episodes["006"]["payoff"][0]["remaining_episodes"] == 3
+    assert episodes["006"]["silence"] == []
+    assert episodes["007"]["silence"][0]["alert_type"] == "long_silence"
+    assert episodes["007"]["silence"][0]["data"] == {"episodes_since": 5}
+
+
+def test_main_audit_foreshadowing_without_registry(
+    tmp_path: Path, capsys: pytest.CaptureFixture,  # type: ignore[type-arg]
+) -> None:
+    """伏線登録簿がない場合はエラー."""
+    exit_code = main(
+        [
+            "audit-foreshadowing",
+            "--vault-root",
+            str(tmp_path / "vault"),
+            "--start",
+            "1",
+            "--end",
+            "3",
+        ]
+    )
+
+    assert exit_code == 1
+    assert "error" in json.loads(capsys.readouterr().err)
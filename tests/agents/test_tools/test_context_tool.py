@@ -8,9 +8,11 @@ Tests the three pure functions:
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 from src.agents.tools.context_tool import (
+    _create_builder,
     format_context_as_markdown,
     run_build_context,
     serialize_context_result,
@@ -23,6 +25,8 @@ from src.core.context.foreshadow_instruction import (
     InstructionAction,
 )
 from src.core.context.hint_collector import HintCollection
+from src.core.context.scene_identifier import SceneIdentifier
+from src.core.vault.index import INDEX_DIRECTORY, INDEX_FILENAME, VaultIndex
 
 
 # Test helper: 最小限の ContextBuildResult を作成
@@ -318,3 +322,44 @@ def test_run_build_context_minimal_vault(tmp_path: Path) -> None:
     assert isinstance(data["prompt_dict"], dict)
     assert isinstance(data["forbidden_keywords"], list)
     assert isinstance(data["foreshadow_instructions"], list)
+
+
+def test_create_builder_uses_fresh_vault_index(tmp_path: Path) -> None:
+    """_create_builder は VaultIndex を使い、構築の間に追加されたファイルも見つける."""
+    vault_root = tmp_path / "vault"
+    (vault_root / "_plot").mkdir(parents=True)
+    (vault_root / "characters").mkdir()
+    (vault_root / "_plot" / "l3_010.md").write_text("[[アイラ]]が登場", encoding="utf-8")
+    builder = _create_builder(str(vault_root))
+    resolver = builder._resolver
+    scene = SceneIdentifier(episode_id="010")
+
+    assert isinstance(resolver.index, VaultIndex)
+    assert run_build_context(str(vault_root), "010", builder=builder)["success"] is True
+    assert resolver.identify_characters(scene, plot_l3_content="[[アイラ]]") == []
+
+    character = vault_root / "characters" / "アイラ.md"
+    character.write_text("---\nname: アイラ\n---\n", encoding="utf-8")
+    st = character.parent.stat()
+    os.utime(character.parent, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    assert resolver.identify_characters(scene, plot_l3_content="[[アイラ]]") == [character]
+
+
+def test_run_build_context_with_corrupt_index(tmp_path: Path) -> None:
+    """壊れた索引ファイルがあっても build_context は成功する（索引を作り直す）."""
+    vault_root = tmp_path / "vault"
+    (vault_root / "_plot").mkdir(parents=True)
+    (vault_root / "characters").mkdir()
+    (vault_root / "_plot" / "l3_010.md").write_text(
+        "[[characters/hero]]が登場", encoding="utf-8"
+    )
+    (vault_root / "characters" / "hero.md").write_text("hero", encoding="utf-8")
+    index_path = vault_root / INDEX_DIRECTORY / INDEX_FILENAME
+    index_path.parent.mkdir(parents=True)
+    index_path.write_bytes(b"garbage" * 100)
+
+    data = run_build_context(vault_root=str(vault_root), episode="010")
+
+    assert data["success"] is True
+    assert data["prompt_dict"]["plot_scene"] == "[[characters/hero]]が登場"
@@ -0,0 +1,373 @@
+"""Tests for the context daemon.
+
+Tests the JSON-RPC daemon and CLI forwarding:
+- ContextDaemon: request handling, warm builder reuse, shutdown
+- main: forwarding to a running daemon and local fallback
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import socket
+import stat
+import tempfile
+import threading
+import time
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from src.agents.tools.cli import main
+from src.agents.tools.context_tool import run_build_context
+from src.agents.tools.daemon import (
+    INVALID_PARAMS,
+    METHOD_NOT_FOUND,
+    PARSE_ERROR,
+    SOCKET_ENV,
+    ContextDaemon,
+    DaemonError,
+    call_daemon,
+    default_socket_path,
+    is_supported,
+    is_trusted_socket,
+    ping_daemon,
+)
+from src.core.context.lazy_loader import LoadPriority
+
+pytestmark = pytest.mark.skipif(
+    not is_supported(), reason="Unix domain sockets are not available"
+)
+
+
+@pytest.fixture
+def vault_root(tmp_path: Path) -> Path:
+    """L3 プロットを1つ持つ最小 vault."""
+    vault = tmp_path / "vault"
+    (vault / "_plot").mkdir(parents=True)
+    (vault / "_plot" / "l3_010.md").write_text("シーン10", encoding="utf-8")
+    return vault
+
+
+@pytest.fixture
+def socket_path() -> Iterator[Path]:
+    """ソケットパス（AF_UNIX のパス長制限のため短い一時ディレクトリに作る）."""
+    directory = Path(tempfile.mkdtemp(prefix="nat-"))
+    yield directory / "d.sock"
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+@pytest.fixture
+def daemon(socket_path: Path) -> Iterator[ContextDaemon]:
+    """バックグラウンドスレッドで稼働するデーモン."""
+    instance = ContextDaemon(socket_path)
+    thread = threading.Thread(target=instance.serve_forever, daemon=True)
+    thread.start()
+    for _ in range(200):
+        if ping_daemon(socket_path) is not None:
+            break
+        threading.Event().wait(0.01)
+    yield instance
+    instance.shutdown()
+    thread.join(timeout=5)
+
+
+class TestContextDaemon:
+    """ContextDaemon のテスト."""
+
+    def test_ping(self, daemon: ContextDaemon, socket_path: Path) -> None:
+        """ping で稼働状況を返す."""
+        result = ping_daemon(socket_path)
+
+        assert result is not None
+        assert result["builders"] == 0
+
+    def test_build_context_matches_local(
+        self, daemon: ContextDaemon, socket_path: Path, vault_root: Path
+    ) -> None:
+        """デーモン経由の build-context はローカル実行と同じ結果を返す."""
+        params = {"vault_root": str(vault_root), "episode": "010"}
+
+        remote = call_daemon(socket_path, "build-context", params)
+
+        assert remote == run_build_context(str(vault_root), "010")
+        assert remote["prompt_dict"]["plot_scene"] == "シーン10"
+
+    def test_builder_reused_across_requests(
+        self, daemon: ContextDaemon, socket_path: Path, vault_root: Path
+    ) -> None:
+        """同じ vault へのリクエストはウォームなビルダーを使い回す."""
+        params = {"vault_root": str(vault_root), "episode": "010"}
+        call_daemon(socket_path, "build-context", params)
+        builder = daemon.builder_for(str(vault_root), None)
+
+        call_daemon(socket_path, "build-context", params)
+
+        assert daemon.builder_for(str(vault_root), None) is builder
+        assert builder._loader.get_cache_stats()["hits"] >= 1
+        assert ping_daemon(socket_path)["builders"] == 1  # type: ignore[index]
+
+    def test_edited_file_is_picked_up(
+        self, daemon: ContextDaemon, socket_path: Path, vault_root: Path
+    ) -> None:
+        """ウォームなキャッシュでも編集後の内容を返す."""
+        params = {"vault_root": str(vault_root), "episode": "010"}
+        call_daemon(socket_path, "build-context", params)
+
+        (vault_root / "_plot" / "l3_010.md").write_text("改稿", encoding="utf-8")
+        result = call_daemon(socket_path, "build-context", params)
+
+        assert result["prompt_dict"]["plot_scene"] == "改稿"
+
+    def test_requests_sharing_a_builder_are_serialized(
+        self, daemon: ContextDaemon, vault_root: Path
+    ) -> None:
+        """同じビルダーを使うリクエストは、使用中のリクエストの完了を待つ."""
+        params = {"vault_root": str(vault_root), "episode": "010"}
+        results: list[dict[str, object]] = []
+        worker = threading.Thread(
+            target=lambda: results.append(daemon.dispatch("build-context", params))
+        )
+
+        with daemon.using_builder(str(vault_root), None) as builder:
+            with builder._loader.snapshot():
+                builder._loader.load("_plot/l3_010.md", LoadPriority.REQUIRED)
+                (vault_root / "_plot" / "l3_010.md").write_text(
+                    "改稿", encoding="utf-8"
+                )
+                worker.start()
+                worker.join(timeout=0.2)
+                assert worker.is_alive()
+                assert results == []
+        worker.join(timeout=5)
+
+        assert results[0]["prompt_dict"]["plot_scene"] == "改稿"  # type: ignore[index]
+
+    def test_errors(self, daemon: ContextDaemon, socket_path: Path) -> None:
+        """不明なメソッド・不正なパラメータはエラー応答になる."""
+        with pytest.raises(DaemonError) as unknown:
+            call_daemon(socket_path, "no-such-method")
+        with pytest.raises(DaemonError) as invalid:
+            call_daemon(socket_path, "build-context", {"episode": "010"})
+
+        assert unknown.value.code == METHOD_NOT_FOUND
+        assert invalid.value.code == INVALID_PARAMS
+
+    def test_parse_error(self, socket_path: Path) -> None:
+        """JSON として不正な行は parse error を返す."""
+        response = ContextDaemon(socket_path).handle_message(b"{not json")
+
+        assert response["error"]["code"] == PARSE_ERROR
+
+    def test_shutdown_removes_socket(self, socket_path: Path) -> None:
+        """shutdown で停止し、ソケットファイルを削除する."""
+        instance = ContextDaemon(socket_path)
+        thread = threading.Thread(target=instance.serve_forever, daemon=True)
+        thread.start()
+        while ping_daemon(socket_path) is None:
+            threading.Event().wait(0.01)
+
+        assert call_daemon(socket_path, "shutdown") == {"stopping": True}
+        thread.join(timeout=5)
+
+        assert not thread.is_alive()
+        assert not socket_path.exists()
+
+
+class TestCliForwarding:
+    """CLI からデーモンへの転送のテスト."""
+
+    def test_build_context_forwarded(
+        self,
+        daemon: ContextDaemon,
+        socket_path: Path,
+        vault_root: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture,  # type: ignore[type-arg]
+    ) -> None:
+        """デーモン稼働中は build-context を転送し、同じ形式で出力する."""
+        monkeypatch.setenv(SOCKET_ENV, str(socket_path))
+
+        exit_code = main(["build-context", "--vault-root", str(vault_root), "--episode", "010"])
+
+        assert exit_code == 0
+        data = json.loads(capsys.readouterr().out)
+        assert data["prompt_dict"]["plot_scene"] == "シーン10"
+        assert ping_daemon(socket_path)["builders"] == 1  # type: ignore[index]
+
+    def test_batch_forwarded(
+        self,
+        daemon: ContextDaemon,
+        socket_path: Path,
+        vault_root: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture,  # type: ignore[type-arg]
+    ) -> None:
+        """build-context-batch も転送され、JSON Lines で出力する."""
+        monkeypatch.setenv(SOCKET_ENV, str(socket_path))
+
+        exit_code = main(
+            ["build-context-batch", "--vault-root", str(vault_root), "--episodes", "010,011"]
+        )
+
+        assert exit_code == 0
+        records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+        assert [r["scene"]["episode"] for r in records] == ["010", "011"]
+        assert ping_daemon(socket_path)["builders"] == 1  # type: ignore[index]
+
+    def test_no_daemon_flag_runs_locally(
+        self,
+        daemon: ContextDaemon,
+        socket_path: Path,
+        vault_root: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture,  # type: ignore[type-arg]
+    ) -> None:
+        """--no-daemon ではデーモンに転送しない."""
+        monkeypatch.setenv(SOCKET_ENV, str(socket_path))
+
+        exit_code = main(
+            ["--no-daemon", "build-context", "--vault-root", str(vault_root), "--episode", "010"]
+        )
+
+        assert exit_code == 0
+        assert ping_daemon(socket_path)["builders"] == 0  # type: ignore[index]
+
+    def test_stale_socket_falls_back_to_local(
+        self,
+        socket_path: Path,
+        vault_root: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture,  # type: ignore[type-arg]
+    ) -> None:
+        """応答しないソケットが残っている場合はローカルで実行する."""
+        socket_path.write_text("", encoding="utf-8")
+        monkeypatch.setenv(SOCKET_ENV, str(socket_path))
+
+        exit_code = main(["build-context", "--vault-root", str(vault_root), "--episode", "010"])
+
+        assert exit_code == 0
+        assert json.loads(capsys.readouterr().out)["success"] is True
+
+
+class TestSocketSafety:
+    """ソケットの配置と所有者確認・タイムアウトのテスト."""
+
+    def test_default_socket_path_prefers_runtime_dir(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """$XDG_RUNTIME_DIR があればその下、なければユーザー専用ディレクトリ."""
+        monkeypatch.delenv(SOCKET_ENV, raising=False)
+        monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+
+        assert default_socket_path() == tmp_path / "novel-agent-tools.sock"
+
+        monkeypatch.delenv("XDG_RUNTIME_DIR")
+        path = default_socket_path()
+
+        assert path.parent.name == f"novel-agent-tools-{os.getuid()}"
+
+    def test_serve_creates_private_directory(self, socket_path: Path) -> None:
+        """serve はソケットのディレクトリを 0700 で作成し、ソケットを 0600 にする."""
+        nested = socket_path.parent / "private" / "d.sock"
+        instance = ContextDaemon(nested)
+        thread = threading.Thread(target=instance.serve_forever, daemon=True)
+        thread.start()
+        try:
+            for _ in range(200):
+                if ping_daemon(nested) is not None:
+                    break
+                time.sleep(0.01)
+
+            assert stat.S_IMODE(nested.parent.stat().st_mode) == 0o700
+            assert stat.S_IMODE(nested.stat().st_mode) == 0o600
+            assert is_trusted_socket(nested)
+        finally:
+            instance.shutdown()
+            thread.join(timeout=5)
+
+    def test_untrusted_sockets(
+        self,
+        daemon: ContextDaemon,
+        socket_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """通常ファイルや他のユーザー所有のソケットは信頼しない."""
+        regular = socket_path.parent / "plain.sock"
+        regular.write_text("", encoding="utf-8")
+        uid = os.getuid()
+
+        assert is_trusted_socket(socket_path)
+        assert not is_trusted_socket(regular)
+        monkeypatch.setattr(os, "getuid", lambda: uid + 1)
+        assert not is_trusted_socket(socket_path)
+
+    def test_foreign_socket_not_forwarded(
+        self,
+        daemon: ContextDaemon,
+        socket_path: Path,
+        vault_root: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture,  # type: ignore[type-arg]
+    ) -> None:
+        """他のユーザー所有のソケットには転送せず、ローカルで実行する."""
+        monkeypatch.setenv(SOCKET_ENV, str(socket_path))
+        uid = os.getuid()
+        monkeypatch.setattr(os, "getuid", lambda: uid + 1)
+
+        exit_code = main(["build-context", "--vault-root", str(vault_root), "--episode", "010"])
+
+        monkeypatch.undo()
+        assert exit_code == 0
+        assert json.loads(capsys.readouterr().out)["success"] is True
+        assert ping_daemon(socket_path)["builders"] == 0  # type: ignore[index]
+
+    def test_unresponsive_socket_falls_back_to_local(
+        self,
+        socket_path: Path,
+        vault_root: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture,  # type: ignore[type-arg]
+    ) -> None:
+        """接続は受け付けるが応答しないソケットではタイムアウトしてローカル実行."""
+        monkeypatch.setenv(SOCKET_ENV, str(socket_path))
+        monkeypatch.setattr("src.agents.tools.daemon.PING_TIMEOUT", 0.1)
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+            server.bind(str(socket_path))
+            server.listen()
+
+            exit_code = main(
+                ["build-context", "--vault-root", str(vault_root), "--episode", "010"]
+            )
+
+        assert exit_code == 0
+        assert json.loads(capsys.readouterr().out)["success"] is True
+
+    def test_forward_timeout_falls_back_to_local(
+        self,
+        daemon: ContextDaemon,
+        socket_path: Path,
+        vault_root: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture,  # type: ignore[type-arg]
+    ) -> None:
+        """転送したリクエストがタイムアウトした場合はローカルで実行する."""
+        monkeypatch.setenv(SOCKET_ENV, str(socket_path))
+        monkeypatch.setattr("src.agents.tools.daemon.FORWARD_TIMEOUT", 0.1)
+        release = threading.Event()
+        dispatch = daemon.dispatch
+
+        def slow_dispatch(method: str, params: dict[str, object]) -> object:
+            if method == "build-context":
+                release.wait(5)
+            return dispatch(method, params)
+
+        monkeypatch.setattr(daemon, "dispatch", slow_dispatch)
+
+        exit_code = main(["build-context", "--vault-root", str(vault_root), "--episode", "010"])
+        release.set()
+
+        assert exit_code == 0
+        assert json.loads(capsys.readouterr().out)["prompt_dict"]["plot_scene"] == "シーン10"
@@ -1,12 +1,20 @@
 """Tests for Algorithmic Review Tool."""
 
+import random
+
+import pytest
+
 from src.agents.models.review_result import (
     IssueSeverity,
     ReviewIssueType,
     ReviewResult,
     ReviewStatus,
 )
-from src.agents.tools.review_tool import run_algorithmic_review
+from src.agents.tools.review_tool import (
+    ReviewSession,
+    StreamingReview,
+    run_algorithmic_review,
+)
 
 
 class TestRunAlgorithmicReview:
@@ -90,3 +98,128 @@ class TestRunAlgorithmicReview:
             forbidden_keywords=["王族", "血筋"],
         )
         assert result.issue_count == 2
+
+
+class TestStreamingReview:
+    """Tests for StreamingReview."""
+
+    def test_reports_violation_when_keyword_completes(self) -> None:
+        """A keyword split across chunks is reported on its last chunk."""
+        review = StreamingReview(forbidden_keywords=["王族", "血筋"])
+
+        assert review.feed("彼女は王") == []
+        assert review.should_abort is False
+
+        issues = review.feed("族の末裔だった。")
+
+        assert len(issues) == 1
+        assert issues[0].type == ReviewIssueType.FORBIDDEN_KEYWORD
+        assert issues[0].severity == IssueSeverity.CRITICAL
+        assert issues[0].location == "彼女は王族"
+        assert "王族" in issues[0].detail
+        assert review.should_abort is True
+
+    def test_each_keyword_reported_once(self) -> None:
+        """Repeated occurrences are counted but not reported again."""
+        review = StreamingReview(forbidden_keywords=["王族"])
+
+        assert len(review.feed("王族と")) == 1
+        assert review.feed("王族") == []
+        assert review.position == 5
+
+        result = review.result()
+        assert result.status == ReviewStatus.REJECTED
+        assert "2箇所" in result.issues[0].detail
+
+    def test_location_is_truncated(self) -> None:
+        """Locations keep only context_chars of preceding text."""
+        review = StreamingReview(forbidden_keywords=["王族"], context_chars=3)
+        for chunk in ["あいうえお", "かきくけこ", "王", "族"]:
+            issues = review.feed(chunk)
+
+        assert issues[0].location == "...くけこ王族"
+
+    def test_clean_stream_approved(self) -> None:
+        """A stream without forbidden keywords matches the batch review."""
+        review = StreamingReview(forbidden_keywords=["王族", "血筋"])
+        for chunk in ["彼女は", "静かに", "微笑んだ。"]:
+            review.feed(chunk)
+
+        assert review.should_abort is False
+        assert review.result() == run_algorithmic_review(
+            "彼女は静かに微笑んだ。", ["王族", "血筋"]
+        )
+
+
+class TestReviewSession:
+    """Tests for ReviewSession."""
+
+    DRAFT = "一段落目は平穏だ。\n王族の末裔が現れた。\n三段落目。\n"
+
+    def test_first_review_matches_full_scan(self) -> None:
+        """The first review scans every paragraph."""
+        session = ReviewSession(["王族", "血筋"])
+
+        result = session.review(self.DRAFT)
+
+        assert result == run_algorithmic_review(self.DRAFT, ["王族", "血筋"])
+        assert session.rescanned_paragraphs == 3
+
+    def test_only_edited_paragraphs_rescanned(self) -> None:
+        """A revision rescans only the paragraphs that changed."""
+        session = ReviewSession(["王族", "血筋"])
+        session.review(self.DRAFT)
+        revised = self.DRAFT.replace("王族", "旅人")
+
+        result = session.review(revised)
+
+        assert result.status == ReviewStatus.APPROVED
+        assert session.rescanned_paragraphs == 1
+        assert session.last_draft == revised
+
+    def test_keyword_spanning_paragraphs(self) -> None:
+        """Keywords across paragraph boundaries are found as in a full scan."""
+        keywords = ["王\n\n族", "末裔"]
+        session = ReviewSession(keywords)
+        session.review("彼は王\n\n族の者。\n")
+        draft = "彼女は王\n\n族の末裔。\n"
+
+        result = session.review(draft)
+
+        assert result == run_algorithmic_review(draft, keywords)
+        assert len(result.issues) == 2
+
+    def test_random_revisions_match_full_scan(self) -> None:
+        """Random edits always give the same result as a full scan."""
+        rng = random.Random(19)
+        alphabet = "あい王族血\n"
+        for _ in range(30):
+            keywords = [
+                "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 4)))
+                for _ in range(rng.randint(1, 8))
+            ]
+            session = ReviewSession(keywords)
+            draft = "".join(rng.choice(alphabet) for _ in range(120))
+            for _ in range(4):
+                start = rng.randrange(len(draft))
+                patch = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 5)))
+                draft = draft[:start] + patch + draft[start + rng.randint(0, 5) :]
+
+                assert session.review(draft) == run_algorithmic_review(draft, keywords)
+
+    def test_fallback_after_max_rejections(self) -> None:
+        """Rejected reviews count toward the Human Fallback limit."""
+        session = ReviewSession(["王族"], max_retries=2)
+
+        session.review(self.DRAFT)
+        assert session.should_fallback() is False
+        session.review(self.DRAFT)
+
+        assert session.retry_count == 2
+        assert session.should_fallback() is True
+        assert session.fallback_report()["retry_count"] == 2
+
+    def test_fallback_report_requires_review(self) -> None:
+        """No report is available before the first review."""
+        with pytest.raises(ValueError):
+            ReviewSession(["王族"]).fallback_report()
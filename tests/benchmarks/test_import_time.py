@@ -0,0 +1,91 @@
+"""Tests for the CLI startup import-time profile."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from src.benchmarks import import_time
+from src.benchmarks.import_time import (
+    ImportProfile,
+    parse_importtime,
+    profile_cli,
+)
+
+SAMPLE = """import time: self [us] | cumulative | imported package
+import time:       120 |        120 |     _io
+import time:       900 |       1500 |   src.core.repositories.base
+import time:       400 |       2300 | src.agents.tools.cli
+"""
+
+
+class TestParseImporttime:
+    """parse_importtime のテスト."""
+
+    def test_parse(self) -> None:
+        """自身の時間と累積時間をモジュールごとに返す."""
+        self_us, cumulative_us = parse_importtime(SAMPLE)
+
+        assert self_us["src.core.repositories.base"] == 900
+        assert cumulative_us["src.agents.tools.cli"] == 2300
+        assert "imported" not in self_us
+
+    def test_heavy_imports(self) -> None:
+        """重いモジュールの import を前方一致で検出する."""
+        self_us, cumulative_us = parse_importtime(SAMPLE)
+        profile = ImportProfile(["x"], self_us, cumulative_us)
+
+        assert profile.heavy_imports() == ["src.core.repositories.base"]
+        assert profile.cli_import_ms == 2.3
+
+
+class TestCliStartup:
+    """軽量サブコマンドの起動時 import のテスト."""
+
+    def test_check_review_skips_l3_and_repositories(self) -> None:
+        """check-review は L3 ビルダーもリポジトリも import しない."""
+        profile = profile_cli(
+            ["check-review", "--draft", "-", "--keywords", "秘密"], stdin="本文"
+        )
+
+        assert profile.exit_code == 0
+        assert profile.heavy_imports() == []
+
+    def test_format_context_skips_l3_and_repositories(self, tmp_path: Path) -> None:
+        """format-context は L3 ビルダーもリポジトリも、pydantic も import しない."""
+        context_file = tmp_path / "ctx.json"
+        context_file.write_text(json.dumps({"prompt_dict": {}}), encoding="utf-8")
+
+        profile = profile_cli(["format-context", "--input", str(context_file)])
+
+        assert profile.exit_code == 0
+        assert profile.heavy_imports() == []
+        assert profile.imported("pydantic") == []
+
+    def test_build_context_still_loads_builder(self, tmp_path: Path) -> None:
+        """build-context は従来どおり L3 ビルダーを使う."""
+        profile = profile_cli(
+            ["--no-daemon", "build-context", "--vault-root", str(tmp_path), "--episode", "010"]
+        )
+
+        assert profile.exit_code == 0
+        assert "src.core.context.context_builder" in profile.heavy_imports()
+
+
+def test_main_reports_budget_without_failing(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture,  # type: ignore[type-arg]
+) -> None:
+    """予算超過は報告のみで、終了コードは重いモジュールの import で決まる."""
+    context_file = tmp_path / "ctx.json"
+    context_file.write_text(json.dumps({"prompt_dict": {}}), encoding="utf-8")
+    monkeypatch.setattr(import_time, "IMPORT_BUDGET_MS", 0.0)
+    monkeypatch.setattr("sys.stdin", None)
+
+    exit_code = import_time.main(["format-context", "--input", str(context_file)])
+
+    report = json.loads(capsys.readouterr().out)
+    assert exit_code == 0
+    assert report["within_budget"] is False
+    assert report["heavy_imports"] == []
@@ -0,0 +1,99 @@
+"""Tests for the benchmark runner."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from src.benchmarks.runner import compare_reports, main, measure
+
+EXPECTED_BENCHMARKS = {
+    "context_builder.build_context",
+    "expression_filter.check_forbidden_keywords",
+    "foreshadowing_repository.list_all",
+    "character_repository.list_all",
+    "timeline_index.build",
+    "text_stats.compute_text_stats",
+}
+
+
+class TestMeasure:
+    """measure のテスト."""
+
+    def test_statistics(self) -> None:
+        """計測回数分実行し、統計値を返す."""
+        calls = []
+
+        result = measure("noop", lambda: calls.append(1), iterations=10, warmup=2)
+
+        # warmup + iterations + メモリ計測の1回
+        assert len(calls) == 13
+        assert result.iterations == 10
+        assert 0 <= result.p50_ms <= result.p95_ms
+        assert result.throughput_per_sec > 0
+        assert result.peak_memory_kib >= 0
+
+    def test_invalid_iterations(self) -> None:
+        """iterations は 1 以上."""
+        with pytest.raises(ValueError):
+            measure("noop", lambda: None, iterations=0)
+
+
+class TestCompareReports:
+    """compare_reports のテスト."""
+
+    def test_ratio(self) -> None:
+        """共通するベンチマークの p50/p95 比を返す."""
+        baseline = {"results": {"a": {"p50_ms": 2.0, "p95_ms": 4.0}}}
+        current = {
+            "results": {
+                "a": {"p50_ms": 1.0, "p95_ms": 4.0},
+                "b": {"p50_ms": 1.0, "p95_ms": 1.0},
+            }
+        }
+
+        assert compare_reports(baseline, current) == {
+            "a": {"p50_ratio": 0.5, "p95_ratio": 1.0}
+        }
+
+
+class TestMain:
+    """ベンチマーク CLI のテスト."""
+
+    def test_json_report(self, tmp_path: Path) -> None:
+        """全ベンチマークの結果を JSON で出力し、比較元と比較できる."""
+        output = tmp_path / "report.json"
+        args = [
+            "--episodes", "6",
+            "--characters", "4",
+            "--world-settings", "2",
+            "--foreshadowings", "8",
+            "--iterations", "2",
+            "--warmup", "0",
+        ]
+
+        assert main([*args, "--output", str(output)]) == 0
+        report = json.loads(output.read_text(encoding="utf-8"))
+        assert set(report["results"]) == EXPECTED_BENCHMARKS
+        assert report["spec"]["episodes"] == 6
+
+        second = tmp_path / "second.json"
+        assert main([*args, "--baseline", str(output), "--output", str(second)]) == 0
+        comparison = json.loads(second.read_text(encoding="utf-8"))["comparison"]
+        assert set(comparison) == EXPECTED_BENCHMARKS
+
+    def test_missing_baseline(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+        """比較元が読めない場合はエラーを出力する."""
+        code = main(
+            [
+                "--episodes", "3",
+                "--characters", "2",
+                "--world-settings", "1",
+                "--foreshadowings", "2",
+                "--iterations", "1",
+                "--baseline", str(tmp_path / "missing.json"),
+            ]
+        )
+
+        assert code == 1
+        assert "error" in json.loads(capsys.readouterr().err)
@@ -0,0 +1,65 @@
+"""Tests for the synthetic vault generator."""
+
+from pathlib import Path
+
+from src.benchmarks.synthetic_vault import (
+    SyntheticVaultSpec,
+    generate_synthetic_vault,
+    phase_for_episode,
+)
+from src.core.context.context_builder import ContextBuilder
+from src.core.context.scene_identifier import SceneIdentifier
+from src.core.repositories.character import CharacterRepository
+from src.core.repositories.foreshadowing import ForeshadowingRepository
+from src.core.vault.init import VaultStructure
+
+SPEC = SyntheticVaultSpec(episodes=9, characters=5, world_settings=3, foreshadowings=12)
+
+
+class TestGenerateSyntheticVault:
+    """generate_synthetic_vault のテスト."""
+
+    def test_layout_and_counts(self, tmp_path: Path) -> None:
+        """VaultInitializer のレイアウトで指定数のエンティティを生成する."""
+        work = generate_synthetic_vault(tmp_path, "bench", SPEC)
+
+        for directory in VaultStructure.DIRECTORIES:
+            assert (work / directory).is_dir()
+        assert len(list((work / "episodes").glob("*.md"))) == 9
+        assert len(list((work / "world").glob("*.md"))) == 3
+        characters = CharacterRepository(work).list_all()
+        assert len(characters) == 5
+        assert all(len(c.phases) == 3 for c in characters)
+        assert all("ai_visibility: 0" in c.sections["秘密"] for c in characters)
+
+        foreshadowings = ForeshadowingRepository(tmp_path, "bench").list_all()
+        assert len(foreshadowings) == 12
+        assert all(fs.timeline and fs.timeline.events for fs in foreshadowings)
+
+    def test_deterministic(self, tmp_path: Path) -> None:
+        """同じ仕様からは同じ Vault が生成される."""
+        first = generate_synthetic_vault(tmp_path / "a", "bench", SPEC)
+        second = generate_synthetic_vault(tmp_path / "b", "bench", SPEC)
+
+        for path in sorted(first.rglob("*.md")):
+            other = second / path.relative_to(first)
+            assert other.read_text(encoding="utf-8") == path.read_text(encoding="utf-8")
+
+    def test_context_builds_cleanly(self, tmp_path: Path) -> None:
+        """生成した Vault でコンテキストを警告なしに構築できる."""
+        work = generate_synthetic_vault(tmp_path, "bench", SPEC)
+        builder = ContextBuilder(
+            vault_root=work,
+            work_name="bench",
+            foreshadowing_reader=ForeshadowingRepository(tmp_path, "bench"),
+        )
+
+        result = builder.build_context(
+            SceneIdentifier(episode_id="ep008", current_phase=phase_for_episode(8, 9))
+        )
+
+        assert result.success
+        assert result.warnings == []
+        assert result.context.characters
+        assert result.context.plot_l3
+        assert result.forbidden_keywords
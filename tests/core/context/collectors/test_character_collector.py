@@ -1,6 +1,8 @@
 """Tests for CharacterCollector."""
 
+import os
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -8,10 +10,12 @@ from src.core.context.collectors.character_collector import (
     CharacterCollector,
     CharacterContext,
 )
-from src.core.context.lazy_loader import FileLazyLoader
+from src.core.context.lazy_loader import FileLazyLoader, LazyLoadResult, LoadPriority
 from src.core.context.phase_filter import CharacterPhaseFilter
 from src.core.context.scene_identifier import SceneIdentifier
 from src.core.context.scene_resolver import SceneResolver
+from src.core.repositories.entity_cache import CHARACTER_NAMESPACE, get_entity_cache
+from src.core.vault.fingerprint import FileFingerprint
 
 
 class TestCharacterContext:
@@ -136,6 +140,58 @@ sections:
         assert "アイラ" in context.characters
         assert len(context.warnings) == 0
 
+    def test_collect_parses_each_file_version_once(
+        self, temp_vault: Path, collector: CharacterCollector
+    ) -> None:
+        """同じキャラクターファイルはシーンをまたいでも1回だけパースする."""
+        char_content = """---
+type: character
+name: アイラ
+created: 2026-01-24
+updated: 2026-01-24
+---
+"""
+        self._create_character_file(temp_vault, "アイラ", char_content)
+        for episode_id in ("001", "002"):
+            self._create_episode_file(temp_vault, episode_id, "[[アイラ]]")
+
+        with patch.object(
+            CharacterCollector, "_parse_character", wraps=collector._parse_character
+        ) as mock_parse:
+            collector.collect(SceneIdentifier(episode_id="001"))
+            context = collector.collect(SceneIdentifier(episode_id="002"))
+
+        assert "アイラ" in context.characters
+        assert mock_parse.call_count == 1
+
+    def test_cache_keyed_by_fingerprint_of_loaded_content(
+        self, temp_vault: Path, loader: FileLazyLoader, collector: CharacterCollector
+    ) -> None:
+        """別スレッドの再読み込みがあっても、読み込んだ内容の版でキャッシュする."""
+        template = "---\ntype: character\nname: アイラ\ncreated: 2026-01-24\nupdated: 2026-01-24\ntags: [{tag}]\n---\n"
+        self._create_character_file(temp_vault, "アイラ", template.format(tag="旧"))
+        self._create_episode_file(temp_vault, "001", "[[アイラ]]")
+        path = temp_vault / "characters" / "アイラ.md"
+        load = loader.load
+
+        def load_then_reload(identifier: str, priority: LoadPriority) -> LazyLoadResult[str]:
+            result = load(identifier, priority)
+            if identifier == "characters/アイラ.md":
+                # 読み込み直後に別の読み手が新しい版を読み込む
+                path.write_text(template.format(tag="新"), encoding="utf-8")
+                st = path.stat()
+                os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+                load(identifier, priority)
+            return result
+
+        with patch.object(loader, "load", side_effect=load_then_reload):
+            collector.collect(SceneIdentifier(episode_id="001"))
+
+        cached = get_entity_cache().get(
+            CHARACTER_NAMESPACE, path, FileFingerprint.of(path)
+        )
+        assert cached is None or cached.tags == ["新"]
+
     def test_collect_multiple_characters(
         self, temp_vault: Path, collector: CharacterCollector
     ) -> None:
@@ -39,8 +39,11 @@ def mock_loader() -> Mock:
 
 @pytest.fixture
 def mock_resolver() -> Mock:
-    """Create mock SceneResolver."""
-    return Mock(spec=SceneResolver)
+    """Create mock SceneResolver (scene without episode and L3 plot files)."""
+    resolver = Mock(spec=SceneResolver)
+    resolver.resolve_episode_path.return_value = None
+    resolver.resolve_plot_paths.return_value = (None, None, None)
+    return resolver
 
 
 @pytest.fixture
@@ -130,7 +133,7 @@ updated: 2026-01-26
         # Assert
         assert "魔法体系" in result.settings
         assert result.warnings == []
-        mock_resolver.identify_world_settings.assert_called_once_with(scene)
+        mock_resolver.identify_world_settings.assert_called_once_with(scene, None, None)
         # Check loader call (path separators may vary by OS)
         actual_path = mock_loader.load.call_args[0][0]
         assert actual_path.replace("\\", "/") == "world/魔法体系.md"
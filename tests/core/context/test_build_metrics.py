@@ -0,0 +1,230 @@
+"""Tests for opt-in build metrics and build hooks."""
+
+import asyncio
+import copy
+import pickle
+from pathlib import Path
+
+import pytest
+
+from src.core.context.async_builder import AsyncContextBuilder
+from src.core.context.build_metrics import (
+    BUILD_STAGES,
+    STAGE_INTEGRATION,
+    BuildHook,
+    BuildMetrics,
+    measure_stage,
+    record_build,
+    record_cache_hit,
+    record_file_read,
+)
+from src.core.context.context_builder import ContextBuilder
+from src.core.context.context_integrator import ContextIntegratorImpl
+from src.core.context.scene_identifier import SceneIdentifier
+
+SCENE = SceneIdentifier(episode_id="ep010")
+
+
+@pytest.fixture
+def work(tmp_path: Path) -> Path:
+    """Create a work directory with plot, summary and style guide files."""
+    for sub in ("_plot", "_summary", "_style_guides"):
+        (tmp_path / sub).mkdir()
+    (tmp_path / "_plot" / "l1_theme.md").write_text("テーマ", encoding="utf-8")
+    (tmp_path / "_plot" / "l3_ep010.md").write_text("シーン10", encoding="utf-8")
+    (tmp_path / "_summary" / "l1_overall.md").write_text("全体", encoding="utf-8")
+    (tmp_path / "_style_guides" / "default.md").write_text("文体", encoding="utf-8")
+    return tmp_path
+
+
+class RecordingHook(BuildHook):
+    """Hook that records every event."""
+
+    def __init__(self) -> None:
+        self.stages: list[str] = []
+        self.collectors: list[str] = []
+        self.files: list[tuple[str, int]] = []
+        self.completed: list[BuildMetrics] = []
+
+    def on_stage(self, scene: SceneIdentifier, stage: str, elapsed_ms: float) -> None:
+        self.stages.append(stage)
+
+    def on_collector(
+        self, scene: SceneIdentifier, collector: str, elapsed_ms: float
+    ) -> None:
+        self.collectors.append(collector)
+
+    def on_file_read(self, scene: SceneIdentifier, identifier: str, size: int) -> None:
+        self.files.append((identifier, size))
+
+    def on_build_complete(self, scene: SceneIdentifier, metrics: BuildMetrics) -> None:
+        self.completed.append(metrics)
+
+
+class TestBuildMetrics:
+    """Tests for the BuildMetrics data class and recording helpers."""
+
+    def test_helpers_are_noop_outside_build(self) -> None:
+        """Recording outside record_build() does nothing."""
+        with measure_stage(STAGE_INTEGRATION):
+            pass
+        record_cache_hit()
+        record_file_read("a.md", 10)
+
+    def test_record_build_accumulates(self) -> None:
+        """Stage time, files and cache counters accumulate per build."""
+        with record_build(SCENE) as metrics:
+            with measure_stage(STAGE_INTEGRATION):
+                record_file_read("a.md", 10)
+                record_file_read("b.md", 5)
+            record_cache_hit()
+
+        assert metrics.total_ms >= metrics.stages_ms[STAGE_INTEGRATION] >= 0
+        assert metrics.files_read == 2
+        assert metrics.bytes_read == 15
+        assert metrics.cache_hits == 1
+
+    def test_failing_hook_does_not_break_build(self) -> None:
+        """Hook exceptions are logged and ignored."""
+
+        class FailingHook(BuildHook):
+            def on_stage(
+                self, scene: SceneIdentifier, stage: str, elapsed_ms: float
+            ) -> None:
+                raise RuntimeError("boom")
+
+        with record_build(SCENE, [FailingHook()]) as metrics:
+            with measure_stage(STAGE_INTEGRATION):
+                pass
+
+        assert STAGE_INTEGRATION in metrics.stages_ms
+
+    def test_format_breakdown(self) -> None:
+        """The breakdown lists stages, collectors and I/O counters."""
+        metrics = BuildMetrics(
+            total_ms=3.0,
+            stages_ms={STAGE_INTEGRATION: 2.0},
+            collectors_ms={"plot": 1.5},
+            files_read=2,
+            bytes_read=30,
+        )
+
+        text = metrics.format_breakdown()
+
+        assert "integration: 2.00 ms" in text
+        assert "plot: 1.50 ms" in text
+        assert "files read: 2 (30 bytes)" in text
+
+
+class TestContextBuilderMetrics:
+    """Tests for ContextBuilder(collect_metrics=..., hooks=...)."""
+
+    def test_metrics_absent_by_default(self, work: Path) -> None:
+        """Metrics are opt-in."""
+        result = ContextBuilder(vault_root=work).build_context(SCENE)
+
+        assert result.metrics is None
+
+    def test_metrics_cover_stages_and_collectors(self, work: Path) -> None:
+        """Every stage that ran and every collector is timed."""
+        result = ContextBuilder(vault_root=work, collect_metrics=True).build_context(
+            SCENE
+        )
+
+        metrics = result.metrics
+        assert metrics is not None
+        assert set(metrics.stages_ms) <= set(BUILD_STAGES)
+        assert STAGE_INTEGRATION in metrics.stages_ms
+        assert set(metrics.collectors_ms) == {
+            "plot",
+            "summary",
+            "character",
+            "world",
+            "style",
+        }
+        assert metrics.files_read == 4
+        assert metrics.bytes_read == sum(
+            len(text.encode("utf-8")) for text in ("テーマ", "シーン10", "全体", "文体")
+        )
+        assert metrics.cache_misses > 0
+
+    def test_second_build_hits_cache(self, work: Path) -> None:
+        """Files are served from the loader cache on the next build."""
+        builder = ContextBuilder(vault_root=work, collect_metrics=True)
+        builder.build_context(SCENE)
+
+        metrics = builder.build_context(SCENE).metrics
+
+        assert metrics is not None
+        assert metrics.files_read == 0
+        assert metrics.cache_hits >= 4
+
+    def test_metrics_do_not_affect_equality(self, work: Path) -> None:
+        """Results with and without metrics compare equal."""
+        plain = ContextBuilder(vault_root=work).build_context(SCENE)
+        measured = ContextBuilder(vault_root=work, collect_metrics=True).build_context(
+            SCENE
+        )
+
+        assert plain == measured
+
+    def test_result_with_metrics_copies_and_pickles(self, work: Path) -> None:
+        """Metrics survive deepcopy (batch duplicates) and pickling (process pool)."""
+        result = ContextBuilder(vault_root=work, collect_metrics=True).build_context(
+            SCENE
+        )
+
+        assert copy.deepcopy(result).metrics == result.metrics
+        assert pickle.loads(pickle.dumps(result)).metrics == result.metrics
+
+    def test_hooks_receive_events(self, work: Path) -> None:
+        """Hooks fire without collect_metrics, and results stay metric-free."""
+        hook = RecordingHook()
+        builder = ContextBuilder(vault_root=work, hooks=[hook])
+
+        result = builder.build_context(SCENE)
+
+        assert result.metrics is None
+        assert STAGE_INTEGRATION in hook.stages
+        assert "plot" in hook.collectors
+        assert ("_plot/l1_theme.md", len("テーマ".encode())) in hook.files
+        assert len(hook.completed) == 1
+
+    def test_add_hook(self, work: Path) -> None:
+        """Hooks can be registered after construction."""
+        hook = RecordingHook()
+        builder = ContextBuilder(vault_root=work)
+        builder.add_hook(hook)
+
+        builder.build_context(SCENE)
+
+        assert len(hook.completed) == 1
+
+    def test_parallel_collectors_are_recorded(self, work: Path) -> None:
+        """Collectors running on worker threads report to the calling build."""
+        builder = ContextBuilder(vault_root=work, collect_metrics=True)
+        builder._integrator = ContextIntegratorImpl(work, parallel=True)
+
+        metrics = builder.build_context(SCENE).metrics
+
+        assert metrics is not None
+        assert "plot" in metrics.collectors_ms
+        assert metrics.files_read == 4
+
+    def test_async_builds_are_isolated(self, work: Path) -> None:
+        """Concurrent async builds record their own metrics."""
+        builder = ContextBuilder(vault_root=work, collect_metrics=True)
+        scenes = [SCENE, SceneIdentifier(episode_id="ep011")]
+
+        async def run() -> list[BuildMetrics | None]:
+            async with AsyncContextBuilder(builder) as async_builder:
+                results = await async_builder.abuild_context_batch(scenes)
+            return [r.metrics for r in results]
+
+        first, second = asyncio.run(run())
+
+        assert first is not None and second is not None
+        assert first is not second
+        assert STAGE_INTEGRATION in first.stages_ms
+        assert STAGE_INTEGRATION in second.stages_ms
+        assert first.files_read + second.files_read >= 4
@@ -0,0 +1,231 @@
+"""Tests for batch, multi-process and async context building."""
+
+import asyncio
+import functools
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src.core.context.async_builder import AsyncContextBuilder
+from src.core.context.context_builder import ContextBuilder, ContextBuildResult
+from src.core.context.process_batch import ProcessPoolContextBuilder
+from src.core.context.scene_identifier import SceneIdentifier
+from src.core.models.foreshadowing import ForeshadowingStatus
+from src.core.repositories.foreshadowing import ForeshadowingRepository
+
+from .conftest import create_foreshadowing
+
+
+@pytest.fixture
+def batch_vault(foreshadow_vault: Path) -> Path:
+    """Create a work directory with shared inputs and two episodes."""
+    work = foreshadow_vault / "test_work"
+    for sub in ("_plot", "_summary", "_style_guides", "_ai_control"):
+        (work / sub).mkdir()
+    (work / "_plot" / "l1_theme.md").write_text("テーマ", encoding="utf-8")
+    (work / "_plot" / "l3_ep010.md").write_text("シーン10", encoding="utf-8")
+    (work / "_plot" / "l3_ep011.md").write_text("シーン11", encoding="utf-8")
+    (work / "_summary" / "l1_overall.md").write_text("全体", encoding="utf-8")
+    (work / "_style_guides" / "default.md").write_text("文体", encoding="utf-8")
+    (work / "_ai_control" / "visibility.yaml").write_text(
+        "global_forbidden_keywords:\n  - 禁句\n", encoding="utf-8"
+    )
+
+    repo = ForeshadowingRepository(foreshadow_vault, "test_work")
+    repo.create(
+        create_foreshadowing(
+            "FS-010-secret", ForeshadowingStatus.REGISTERED, plant_episode="ep010"
+        )
+    )
+    return work
+
+
+def _make_builder(batch_vault: Path) -> ContextBuilder:
+    """Module-level (picklable) builder factory."""
+    return ContextBuilder(
+        vault_root=batch_vault,
+        work_name="test_work",
+        foreshadowing_reader=ForeshadowingRepository(batch_vault.parent, "test_work"),
+    )
+
+
+SCENES = [
+    SceneIdentifier(episode_id="ep010"),
+    SceneIdentifier(episode_id="ep011"),
+    SceneIdentifier(episode_id="ep010"),
+]
+
+
+class TestBuildContextBatch:
+    """Tests for build_context_batch() method."""
+
+    def test_results_match_sequential_in_order(self, batch_vault: Path) -> None:
+        """Batch results equal build_context() results, in input order."""
+        expected = [_make_builder(batch_vault).build_context(s) for s in SCENES]
+
+        results = _make_builder(batch_vault).build_context_batch(SCENES)
+
+        assert results == expected
+        assert results[0].context.plot_l3 == "シーン10"
+        assert results[1].context.plot_l3 == "シーン11"
+
+    def test_empty_batch(self, builder: ContextBuilder) -> None:
+        """Empty input returns empty list."""
+        assert builder.build_context_batch([]) == []
+
+    def test_duplicate_scenes_are_independent(self, batch_vault: Path) -> None:
+        """Duplicate scenes are built once but returned as separate objects."""
+        results = _make_builder(batch_vault).build_context_batch(SCENES)
+
+        assert results[0] == results[2]
+        assert results[0] is not results[2]
+        results[2].warnings.append("changed")
+        assert "changed" not in results[0].warnings
+
+    def test_registry_read_once(self, batch_vault: Path) -> None:
+        """The foreshadowing registry is read once for the whole batch."""
+        builder = _make_builder(batch_vault)
+
+        with patch.object(
+            ForeshadowingRepository,
+            "_load_registry",
+            autospec=True,
+            side_effect=ForeshadowingRepository._load_registry,
+        ) as mock_load:
+            builder.build_context_batch(SCENES)
+
+        assert mock_load.call_count == 1
+
+    def test_shared_files_loaded_once(self, batch_vault: Path) -> None:
+        """Files shared by all scenes are stat'ed and read once per batch."""
+        builder = _make_builder(batch_vault)
+
+        with patch.object(
+            builder._loader, "_load", wraps=builder._loader._load
+        ) as mock_load:
+            builder.build_context_batch(SCENES)
+
+        loaded = [call.args[0] for call in mock_load.call_args_list]
+        assert loaded.count("_plot/l1_theme.md") == 1
+        assert loaded.count("_ai_control/visibility.yaml") == 1
+
+    def test_reads_fresh_data_after_batch(self, batch_vault: Path) -> None:
+        """The snapshot only lasts for the batch."""
+        builder = _make_builder(batch_vault)
+        builder.build_context_batch(SCENES[:1])
+
+        (batch_vault / "_plot" / "l1_theme.md").write_text(
+            "新テーマ（更新）", encoding="utf-8"
+        )
+        builder.clear_all_caches()
+        results = builder.build_context_batch(SCENES[:1])
+
+        assert results[0].context.plot_l1 == "新テーマ（更新）"
+
+
+class TestProcessPoolContextBuilder:
+    """Tests for ProcessPoolContextBuilder."""
+
+    def test_results_match_sequential(self, batch_vault: Path) -> None:
+        """Multi-process results equal the sequential batch, in order."""
+        scenes = SCENES + [SceneIdentifier(episode_id=f"ep{n:03d}") for n in range(12, 20)]
+        expected = _make_builder(batch_vault).build_context_batch(scenes)
+
+        factory = functools.partial(_make_builder, batch_vault)
+        with ProcessPoolContextBuilder(factory, max_workers=2, chunk_size=3) as pool:
+            results = pool.build_context_batch(scenes)
+            # Second batch reuses the warm workers
+            again = pool.build_context_batch(scenes[:2])
+
+        assert results == expected
+        assert again == expected[:2]
+        assert results[0] is not results[2]
+
+    def test_empty_batch_does_not_start_pool(self, batch_vault: Path) -> None:
+        """Empty input returns empty list without starting workers."""
+        pool = ProcessPoolContextBuilder(functools.partial(_make_builder, batch_vault))
+
+        assert pool.build_context_batch([]) == []
+        assert pool._executor is None
+
+    def test_invalid_arguments(self, batch_vault: Path) -> None:
+        """max_workers and chunk_size must be positive."""
+        factory = functools.partial(_make_builder, batch_vault)
+        with pytest.raises(ValueError):
+            ProcessPoolContextBuilder(factory, max_workers=0)
+        with pytest.raises(ValueError):
+            ProcessPoolContextBuilder(factory, chunk_size=0)
+
+
+class TestAsyncContextBuilder:
+    """Tests for AsyncContextBuilder."""
+
+    def test_abuild_context_matches_sync(self, batch_vault: Path) -> None:
+        """abuild_context() returns the same result as build_context()."""
+        expected = _make_builder(batch_vault).build_context(SCENES[0])
+
+        async def run() -> ContextBuildResult:
+            async with AsyncContextBuilder(_make_builder(batch_vault)) as builder:
+                return await builder.abuild_context(SCENES[0])
+
+        assert asyncio.run(run()) == expected
+
+    def test_batch_concurrency_is_bounded(self, batch_vault: Path) -> None:
+        """Batch results keep input order; builds in flight and threads are bounded."""
+        scenes = [SceneIdentifier(episode_id=f"ep{n:03d}") for n in range(10, 30)]
+        expected = _make_builder(batch_vault).build_context_batch(scenes)
+        async_builder = AsyncContextBuilder(
+            _make_builder(batch_vault), max_concurrency=3, io_workers=2
+        )
+
+        in_flight = 0
+        peak = 0
+        original = async_builder.prefetch
+
+        async def tracking_prefetch(scene: SceneIdentifier) -> None:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            await original(scene)
+            in_flight -= 1
+
+        async_builder.prefetch = tracking_prefetch  # type: ignore[method-assign]
+
+        async def run() -> list[ContextBuildResult]:
+            try:
+                return await async_builder.abuild_context_batch(scenes)
+            finally:
+                threads = async_builder._get_executor()._max_workers
+                assert threads == 2
+                async_builder.close()
+
+        assert asyncio.run(run()) == expected
+        assert peak == 3
+
+    def test_prefetch_uses_public_builder_hooks(self, batch_vault: Path) -> None:
+        """prefetch() preloads exactly the files listed by scene_files()."""
+        builder = _make_builder(batch_vault)
+        files = builder.scene_files(SCENES[0])
+
+        async def run() -> None:
+            async with AsyncContextBuilder(builder) as async_builder:
+                await async_builder.prefetch(SCENES[0])
+
+        with patch.object(builder, "preload", wraps=builder.preload) as mock_preload:
+            asyncio.run(run())
+
+        assert "_plot/l3_ep010.md" in files
+        assert files[-2:] == [
+            "_ai_control/visibility.yaml",
+            "_ai_control/forbidden_keywords.txt",
+        ]
+        assert sorted(c.args[0] for c in mock_preload.call_args_list) == sorted(files)
+
+    def test_invalid_arguments(self, builder: ContextBuilder) -> None:
+        """max_concurrency and io_workers must be positive."""
+        with pytest.raises(ValueError):
+            AsyncContextBuilder(builder, max_concurrency=0)
+        with pytest.raises(ValueError):
+            AsyncContextBuilder(builder, io_workers=0)
@@ -132,6 +132,22 @@ class TestIsTextClean:
         )
 
 
+class TestCreateForbiddenKeywordStream:
+    """Tests for create_forbidden_keyword_stream()."""
+
+    def test_stream_detects_split_keyword(self, builder_with_forbidden, scene) -> None:
+        """The stream uses the scene's forbidden keywords across chunks."""
+        stream = builder_with_forbidden.create_forbidden_keyword_stream(scene)
+
+        assert stream.feed("彼女は秘密") == []
+        matches = stream.feed("の力を持っている")
+
+        assert [m.keyword for m in matches] == ["秘密の力"]
+        assert set(stream.matcher.keywords) == set(
+            builder_with_forbidden.get_forbidden_keywords(scene)
+        )
+
+
 class TestClearForbiddenCache:
     """Tests for clear_forbidden_cache() and clear_all_caches()."""
 
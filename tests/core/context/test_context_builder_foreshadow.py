@@ -1,5 +1,8 @@
 """Tests for ContextBuilder foreshadow instruction methods (L3-7-1c)."""
 
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 from src.core.context.foreshadow_instruction import (
     ForeshadowInstruction,
@@ -144,3 +147,30 @@ class TestClearInstructionCache:
         # New call should return different object
         result2 = builder.get_foreshadow_instructions(scene)
         assert result1 is not result2
+
+
+class TestConcurrentCacheMisses:
+    """Tests for single-flight generation under concurrent builds."""
+
+    def test_concurrent_misses_generate_once(self, builder, scene) -> None:
+        """Concurrent requests for one scene wait for a single generation."""
+        calls: list[str] = []
+
+        class SlowGenerator:
+            def generate(self, _scene):  # type: ignore[no-untyped-def]
+                calls.append(_scene.episode_id)
+                time.sleep(0.05)
+                return ForeshadowInstructions()
+
+        builder._instruction_generator = SlowGenerator()
+        barrier = threading.Barrier(6)
+
+        def request(_: int) -> ForeshadowInstructions:
+            barrier.wait()
+            return builder.get_foreshadow_instructions(scene)
+
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            results = list(executor.map(request, range(6)))
+
+        assert len(calls) == 1
+        assert all(r is results[0] for r in results)
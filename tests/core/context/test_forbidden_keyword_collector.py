@@ -411,6 +411,41 @@ entities:
         assert "独自キーワード" in result.keywords
 
 
+class TestForbiddenKeywordCollectorPolicy:
+    """Tests for the compiled visibility policy."""
+
+    def test_policy_shared_per_content(
+        self, vault_with_files: Path, scene: SceneIdentifier
+    ) -> None:
+        """Collectors reading the same visibility.yaml share one policy."""
+        first = ForbiddenKeywordCollector(
+            vault_with_files, FileLazyLoader(vault_with_files)
+        )
+        second = ForbiddenKeywordCollector(
+            vault_with_files, FileLazyLoader(vault_with_files)
+        )
+
+        first.collect(scene)
+        second.collect(scene)
+
+        assert first._load_policy() is second._load_policy()
+
+    def test_policy_recompiled_on_change(
+        self, vault_with_files: Path, scene: SceneIdentifier
+    ) -> None:
+        """A modified visibility.yaml is recompiled."""
+        loader = FileLazyLoader(vault_with_files)
+        collector = ForbiddenKeywordCollector(vault_with_files, loader)
+        assert "新しい禁句" not in collector.collect(scene).keywords
+
+        (vault_with_files / "_ai_control" / "visibility.yaml").write_text(
+            "global_forbidden_keywords:\n  - 新しい禁句\n", encoding="utf-8"
+        )
+        loader.clear_cache()
+
+        assert "新しい禁句" in collector.collect(scene).keywords
+
+
 class TestForbiddenKeywordCollectorEmptyVault:
     """Tests for empty vault scenarios."""
 
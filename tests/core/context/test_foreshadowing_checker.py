@@ -4,6 +4,7 @@
 """
 
 from datetime import date
+from pathlib import Path
 from unittest.mock import Mock
 
 import pytest
@@ -15,6 +16,7 @@ from src.core.context.foreshadowing_checker import (
     AlertSeverity,
     AlertType,
     ForeshadowingAlert,
+    ForeshadowingAudit,
     PayoffApproaching,
     PlantSuggestion,
     ReinforceSuggestion,
@@ -36,6 +38,9 @@ from src.core.models.foreshadowing import (
     TimelineEntry,
     TimelineInfo,
 )
+from src.core.repositories.foreshadowing import ForeshadowingRepository
+
+from .conftest import create_foreshadowing
 
 
 class TestPlantSuggestion:
@@ -261,8 +266,9 @@ class TestSceneForeshadowingChecker:
 
     @pytest.fixture
     def mock_reader(self):
-        """Create a mock ForeshadowingReader."""
+        """Create a mock ForeshadowingReader (read_many delegates to read)."""
         reader = Mock()
+        reader.read_many.side_effect = lambda ids: {i: reader.read(i) for i in ids}
         return reader
 
     @pytest.fixture
@@ -506,3 +512,204 @@ class TestSceneForeshadowingChecker:
         assert result.alerts == []
         assert not result.has_suggestions
         assert not result.has_alerts
+
+
+class _CountingReader:
+    """Reader wrapper counting calls to the underlying repository."""
+
+    def __init__(self, repository: ForeshadowingRepository) -> None:
+        self.repository = repository
+        self.calls: dict[str, int] = {}
+
+    def _count(self, name: str) -> None:
+        self.calls[name] = self.calls.get(name, 0) + 1
+
+    def list_all(self) -> list[Foreshadowing]:
+        self._count("list_all")
+        return self.repository.list_all()
+
+    def read(self, identifier: str) -> Foreshadowing:
+        self._count("read")
+        return self.repository.read(identifier)
+
+    def read_many(self, identifiers: list[str]) -> dict[str, Foreshadowing]:
+        self._count("read_many")
+        return self.repository.read_many(identifiers)
+
+
+class TestSceneForeshadowingCheckerSnapshot:
+    """Tests for the shared per-check registry snapshot."""
+
+    def test_one_registry_load_per_check(self, tmp_path: Path) -> None:
+        """from_reader() components share one snapshot per check() call."""
+        repository = ForeshadowingRepository(tmp_path, "test_work")
+        repository.create(
+            create_foreshadowing("FS-010-plant", ForeshadowingStatus.REGISTERED)
+        )
+        repository.create(
+            create_foreshadowing(
+                "FS-005-reinforce",
+                ForeshadowingStatus.PLANTED,
+                reinforce_episodes=["010"],
+            )
+        )
+        repository.create(
+            create_foreshadowing(
+                "FS-003-hint",
+                ForeshadowingStatus.PLANTED,
+                related_characters=["Hero"],
+            )
+        )
+        reader = _CountingReader(repository)
+        checker = SceneForeshadowingChecker.from_reader(reader)
+
+        result = checker.check(
+            SceneIdentifier(episode_id="010"), appearing_characters=["Hero"]
+        )
+
+        assert [s.foreshadowing_id for s in result.should_plant] == ["FS-010-plant"]
+        assert [s.foreshadowing_id for s in result.should_reinforce] == [
+            "FS-005-reinforce",
+            "FS-003-hint",
+        ]
+        assert len(result.active_instructions) == 3
+        assert reader.calls == {"list_all": 1}
+
+        checker.check(SceneIdentifier(episode_id="010"))
+
+        assert reader.calls == {"list_all": 2}
+
+
+class TestSceneForeshadowingCheckerAudit:
+    """Tests for the series-wide audit_range() sweep."""
+
+    @pytest.fixture
+    def repository(self, tmp_path: Path) -> ForeshadowingRepository:
+        """Repository with foreshadowing spread over episodes 1-20."""
+        repository = ForeshadowingRepository(tmp_path, "test_work")
+        repository.create(
+            create_foreshadowing(
+                "FS-008-plant",
+                ForeshadowingStatus.REGISTERED,
+                reveal_episode="EP-015",
+            )
+        )
+        repository.create(
+            create_foreshadowing(
+                "FS-002-silent",
+                ForeshadowingStatus.PLANTED,
+                reinforce_episodes=["004"],
+                reveal_episode="012",
+            )
+        )
+        repository.create(
+            create_foreshadowing(
+                "FS-003-hint",
+                ForeshadowingStatus.PLANTED,
+                reinforce_episodes=["006", "ep009"],
+                related_characters=["Hero"],
+                reveal_episode="010",
+            )
+        )
+        repository.create(
+            create_foreshadowing(
+                "FS-001-revealed",
+                ForeshadowingStatus.REVEALED,
+                reveal_episode="005",
+            )
+        )
+        return repository
+
+    def test_matches_per_episode_check(
+        self, repository: ForeshadowingRepository
+    ) -> None:
+        """Each episode report equals check() for that episode."""
+        checker = SceneForeshadowingChecker.from_reader(repository)
+        characters = {"007": ["Hero"], "ep012": ["Hero"]}
+
+        audit = checker.audit_range(
+            "001", "020", appearing_characters=characters, payoff_threshold=4
+        )
+
+        assert [e.episode_id for e in audit.episodes] == [
+            f"{n:03d}" for n in range(1, 21)
+        ]
+        for episode in audit.episodes:
+            number = int(episode.episode_id)
+            expected = checker.check(
+                SceneIdentifier(episode_id=episode.episode_id),
+                appearing_characters=["Hero"] if number in (7, 12) else None,
+                payoff_threshold=4,
+            )
+            assert episode.plant == expected.should_plant
+            assert sorted(
+                episode.reinforce + episode.hint, key=lambda s: s.foreshadowing_id
+            ) == sorted(expected.should_reinforce, key=lambda s: s.foreshadowing_id)
+            assert episode.payoff == expected.approaching_payoff
+            assert episode.silence == expected.alerts
+
+    def test_reports_by_category(self, repository: ForeshadowingRepository) -> None:
+        """Plant, hint, payoff and silence reports land in their episodes."""
+        checker = SceneForeshadowingChecker.from_reader(repository)
+
+        audit = checker.audit_range(
+            "ep007", "EP-010", appearing_characters={"7": ["Hero"]}
+        )
+
+        assert audit.start_episode == "007"
+        assert audit.end_episode == "010"
+        seventh = audit.get("007")
+        assert seventh is not None
+        assert [s.foreshadowing_id for s in seventh.hint] == ["FS-003-hint"]
+        assert [p.foreshadowing_id for p in seventh.payoff] == ["FS-003-hint"]
+        eighth = audit.get("008")
+        assert eighth is not None
+        assert [s.foreshadowing_id for s in eighth.plant] == ["FS-008-plant"]
+        tenth = audit.get("010")
+        assert tenth is not None
+        assert [a.foreshadowing_id for a in tenth.silence] == ["FS-002-silent"]
+        assert tenth.silence[0].data == {"episodes_since": 6}
+        assert audit.get("011") is None
+
+    def test_one_registry_load_per_audit(
+        self, repository: ForeshadowingRepository
+    ) -> None:
+        """The whole range is audited from one registry snapshot."""
+        reader = _CountingReader(repository)
+        checker = SceneForeshadowingChecker.from_reader(reader)
+
+        checker.audit_range("001", "050")
+
+        assert reader.calls == {"list_all": 1}
+
+    def test_to_dict(self, repository: ForeshadowingRepository) -> None:
+        """to_dict() serializes enums by value."""
+        checker = SceneForeshadowingChecker.from_reader(repository)
+
+        data = checker.audit_range("010", "010").to_dict()
+
+        assert data["start_episode"] == "010"
+        episode = data["episodes"][0]
+        assert episode["episode_id"] == "010"
+        assert episode["silence"][0]["alert_type"] == "long_silence"
+        assert episode["silence"][0]["severity"] == "warning"
+
+    def test_invalid_range(self, repository: ForeshadowingRepository) -> None:
+        """An empty range or invalid episode ID raises ValueError."""
+        checker = SceneForeshadowingChecker.from_reader(repository)
+
+        with pytest.raises(ValueError):
+            checker.audit_range("010", "009")
+        with pytest.raises(ValueError):
+            checker.audit_range("first", "010")
+
+    def test_empty_registry(self, tmp_path: Path) -> None:
+        """An empty registry yields empty reports for every episode."""
+        repository = ForeshadowingRepository(tmp_path, "empty_work")
+        checker = SceneForeshadowingChecker.from_reader(repository)
+
+        audit = checker.audit_range("001", "003")
+
+        assert isinstance(audit, ForeshadowingAudit)
+        assert len(audit.episodes) == 3
+        assert not any(e.has_reports for e in audit.episodes)
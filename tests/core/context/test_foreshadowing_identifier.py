@@ -1,5 +1,6 @@
 """Tests for foreshadowing identifier."""
 
+import random
 from pathlib import Path
 
 import pytest
@@ -8,9 +9,10 @@ from src.core.context.foreshadow_instruction import InstructionAction
 from src.core.context.foreshadowing_identifier import (
     ForeshadowingIdentifier,
     IdentifiedForeshadowing,
+    ScopedForeshadowingReader,
 )
 from src.core.context.scene_identifier import SceneIdentifier
-from src.core.models.foreshadowing import ForeshadowingStatus
+from src.core.models.foreshadowing import Foreshadowing, ForeshadowingStatus
 from src.core.repositories.foreshadowing import ForeshadowingRepository
 
 from .conftest import create_foreshadowing
@@ -284,3 +286,147 @@ class TestForeshadowingIdentifierHelpers:
         assert identifier._extract_episode_from_id("FS-003-mystery") == "003"
         assert identifier._extract_episode_from_id("FS-123-item") == "123"
         assert identifier._extract_episode_from_id("invalid-id") is None
+
+
+def _full_scan(
+    identifier: ForeshadowingIdentifier,
+    foreshadowings: list[Foreshadowing],
+    scene: SceneIdentifier,
+    appearing_characters: list[str] | None,
+) -> list[tuple[str, InstructionAction]]:
+    """Reference: the four full scans over the registry."""
+    results: list[tuple[str, InstructionAction]] = []
+    seen: set[str] = set()
+    for fs in foreshadowings:
+        if identifier._should_plant(fs, scene):
+            results.append((fs.id, InstructionAction.PLANT))
+            seen.add(fs.id)
+    for fs in foreshadowings:
+        if fs.id not in seen and identifier._should_reinforce(fs, scene):
+            results.append((fs.id, InstructionAction.REINFORCE))
+            seen.add(fs.id)
+    if appearing_characters:
+        for fs in foreshadowings:
+            if fs.id not in seen and identifier._should_hint(fs, appearing_characters):
+                results.append((fs.id, InstructionAction.HINT))
+                seen.add(fs.id)
+    for fs in foreshadowings:
+        if fs.id not in seen and identifier._is_reveal_episode(fs, scene):
+            results.append((fs.id, InstructionAction.REINFORCE))
+            seen.add(fs.id)
+    return results
+
+
+class _ListReader:
+    """Reader without registry_version() that counts list_all() calls."""
+
+    def __init__(self, foreshadowings: list[Foreshadowing]) -> None:
+        self.foreshadowings = foreshadowings
+        self.list_calls = 0
+
+    def list_all(self) -> list[Foreshadowing]:
+        self.list_calls += 1
+        return list(self.foreshadowings)
+
+    def read(self, identifier: str) -> Foreshadowing:
+        return next(fs for fs in self.foreshadowings if fs.id == identifier)
+
+
+class TestForeshadowingIdentifierIndex:
+    """Tests for the per-version lookup index."""
+
+    def test_matches_full_scan(self) -> None:
+        """Indexed identification equals the four-scan algorithm."""
+        rng = random.Random(21)
+        episodes = ["1", "01", "ep002", "3", "004"]
+        characters = ["Hero", "Villain", "Mentor"]
+        statuses = list(ForeshadowingStatus)
+        foreshadowings = [
+            create_foreshadowing(
+                fs_id=f"FS-{rng.choice(['001', '2', '03', '4'])}-item{i}",
+                status=rng.choice(statuses),
+                reinforce_episodes=rng.sample(episodes, rng.randint(0, 2)),
+                reveal_episode=rng.choice([None, *episodes]),
+                related_characters=rng.sample(characters, rng.randint(0, 2)),
+            )
+            for i in range(60)
+        ]
+        identifier = ForeshadowingIdentifier(_ListReader(foreshadowings))
+
+        for episode in ["001", "ep2", "3", "04", "005"]:
+            scene = SceneIdentifier(episode_id=episode)
+            for appearing in (None, [], ["Hero"], ["Villain", "Mentor"]):
+                results = identifier.identify(scene, appearing_characters=appearing)
+
+                assert [
+                    (r.foreshadowing_id, r.suggested_action) for r in results
+                ] == _full_scan(identifier, foreshadowings, scene, appearing)
+
+    def test_unversioned_reader_listed_each_call(self, scene_ep010: SceneIdentifier) -> None:
+        """Readers without registry_version() are listed on every call."""
+        reader = _ListReader(
+            [create_foreshadowing("FS-010-a", ForeshadowingStatus.REGISTERED)]
+        )
+        identifier = ForeshadowingIdentifier(reader)
+
+        identifier.identify(scene_ep010)
+        identifier.identify(scene_ep010)
+
+        assert reader.list_calls == 2
+
+    def test_index_reused_until_registry_changes(
+        self,
+        repository: ForeshadowingRepository,
+        scene_ep010: SceneIdentifier,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """The registry is listed once per version."""
+        repository.create(create_foreshadowing("FS-010-a", ForeshadowingStatus.REGISTERED))
+        identifier = ForeshadowingIdentifier(repository)
+        calls: list[int] = []
+        list_all = repository.list_all
+        monkeypatch.setattr(
+            repository, "list_all", lambda: calls.append(1) or list_all()
+        )
+
+        identifier.identify(scene_ep010)
+        identifier.identify(SceneIdentifier(episode_id="015"))
+        assert len(calls) == 1
+
+        repository.create(create_foreshadowing("FS-010-b", ForeshadowingStatus.REGISTERED))
+        results = identifier.identify(scene_ep010)
+
+        assert len(calls) == 2
+        assert [r.foreshadowing_id for r in results] == ["FS-010-a", "FS-010-b"]
+
+    def test_scoped_reader_version(self, repository: ForeshadowingRepository) -> None:
+        """A scope pins the version of its snapshot."""
+        repository.create(create_foreshadowing("FS-010-a", ForeshadowingStatus.REGISTERED))
+        scoped = ScopedForeshadowingReader(repository)
+
+        with scoped.scope():
+            pinned = scoped.registry_version()
+            repository.create(
+                create_foreshadowing("FS-010-b", ForeshadowingStatus.REGISTERED)
+            )
+            assert scoped.registry_version() == pinned
+            assert len(scoped.list_all()) == 1
+
+        assert scoped.registry_version() == repository.registry_version() != pinned
+        assert ScopedForeshadowingReader(_ListReader([])).registry_version() is None
+
+    def test_scoped_read_many(self, repository: ForeshadowingRepository) -> None:
+        """read_many is served from the snapshot; unknown IDs are omitted."""
+        repository.create(create_foreshadowing("FS-010-a", ForeshadowingStatus.REGISTERED))
+        repository.create(create_foreshadowing("FS-011-b", ForeshadowingStatus.REGISTERED))
+        scoped = ScopedForeshadowingReader(repository)
+
+        with scoped.scope():
+            scoped.list_all()
+            repository.create(
+                create_foreshadowing("FS-012-c", ForeshadowingStatus.REGISTERED)
+            )
+            found = scoped.read_many(["FS-012-c", "FS-011-b", "missing", "FS-010-a"])
+
+        assert list(found) == ["FS-012-c", "FS-011-b", "FS-010-a"]
+        assert list(scoped.read_many(["FS-010-a"])) == ["FS-010-a"]
@@ -1,12 +1,18 @@
 """Tests for LazyLoader protocol and related classes."""
 
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
 from src.core.context.lazy_loader import (
     CacheEntry,
+    CacheValidation,
     ContentType,
     FileLazyLoader,
     GracefulLoader,
@@ -16,6 +22,7 @@ from src.core.context.lazy_loader import (
     LazyLoadResult,
     LoadPriority,
 )
+from src.core.vault.fingerprint import FileFingerprint
 
 
 class TestLoadPriority:
@@ -419,9 +426,194 @@ class TestFileLazyLoader:
         assert not loader.is_cached("test.md")
 
 
+class TestFileLazyLoaderValidation:
+    """Test stat-validated caching and the LRU byte bound."""
+
+    @pytest.fixture
+    def vault_root(self, tmp_path):
+        """テスト用vault."""
+        (tmp_path / "test.md").write_text("Test content", encoding="utf-8")
+        return tmp_path
+
+    def _touch_later(self, path: Path) -> None:
+        """mtime を確実に進める（ファイルシステムの時刻精度対策）."""
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    def test_default_validation_is_stat(self, vault_root) -> None:
+        """デフォルトは stat 検証."""
+        loader = FileLazyLoader(vault_root)
+        assert loader.validation == CacheValidation.STAT
+
+    def test_unchanged_file_is_cache_hit(self, vault_root) -> None:
+        """変更のないファイルは再読み込みしない."""
+        loader = FileLazyLoader(vault_root)
+        loader.load("test.md", LoadPriority.REQUIRED)
+        loader.load("test.md", LoadPriority.REQUIRED)
+
+        stats = loader.get_cache_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+    def test_edited_file_is_reloaded_immediately(self, vault_root) -> None:
+        """編集されたファイルは TTL 内でも即座に再読み込みされる."""
+        loader = FileLazyLoader(vault_root)
+        loader.load("test.md", LoadPriority.REQUIRED)
+
+        path = vault_root / "test.md"
+        path.write_text("Edited content!", encoding="utf-8")
+        self._touch_later(path)
+
+        result = loader.load("test.md", LoadPriority.REQUIRED)
+        assert result.data == "Edited content!"
+        assert loader.get_cache_stats()["invalidations"] == 1
+
+    def test_result_carries_fingerprint_of_its_content(self, vault_root) -> None:
+        """読み込み結果は内容と同じ版のフィンガープリントを持つ."""
+        loader = FileLazyLoader(vault_root)
+        path = vault_root / "test.md"
+        first = loader.load("test.md", LoadPriority.REQUIRED)
+        hit = loader.load("test.md", LoadPriority.REQUIRED)
+
+        path.write_text("Edited content!", encoding="utf-8")
+        self._touch_later(path)
+        edited = loader.load("test.md", LoadPriority.REQUIRED)
+
+        assert first.fingerprint is not None
+        assert hit.fingerprint == first.fingerprint
+        assert edited.fingerprint == FileFingerprint.of(path)
+        assert edited.fingerprint != first.fingerprint
+        ttl_loader = FileLazyLoader(vault_root, validation=CacheValidation.TTL)
+        assert ttl_loader.load("test.md", LoadPriority.REQUIRED).fingerprint is None
+
+    def test_replaced_file_is_reloaded(self, vault_root) -> None:
+        """rename による置き換えを検出する."""
+        loader = FileLazyLoader(vault_root)
+        loader.load("test.md", LoadPriority.REQUIRED)
+
+        tmp = vault_root / "test.md.tmp"
+        tmp.write_text("Replaced", encoding="utf-8")
+        tmp.replace(vault_root / "test.md")
+
+        result = loader.load("test.md", LoadPriority.REQUIRED)
+        assert result.data == "Replaced"
+
+    def test_deleted_file_drops_cache(self, vault_root) -> None:
+        """削除されたファイルはキャッシュから除去される."""
+        loader = FileLazyLoader(vault_root)
+        loader.load("test.md", LoadPriority.REQUIRED)
+        (vault_root / "test.md").unlink()
+
+        result = loader.load("test.md", LoadPriority.REQUIRED)
+        assert not result.success
+        assert not loader.is_cached("test.md")
+
+    def test_ttl_mode_serves_cached_content(self, vault_root) -> None:
+        """TTL モードでは期限内のキャッシュを返す（従来の挙動）."""
+        loader = FileLazyLoader(vault_root, validation=CacheValidation.TTL)
+        loader.load("test.md", LoadPriority.REQUIRED)
+        (vault_root / "test.md").write_text("Edited", encoding="utf-8")
+
+        result = loader.load("test.md", LoadPriority.REQUIRED)
+        assert result.data == "Test content"
+
+    def test_lru_eviction_by_bytes(self, tmp_path) -> None:
+        """合計バイト数の上限を超えると最も古いエントリを追い出す."""
+        for name in ("a.md", "b.md", "c.md"):
+            (tmp_path / name).write_text("x" * 10, encoding="utf-8")
+        loader = FileLazyLoader(tmp_path, max_cache_bytes=25)
+
+        loader.load("a.md", LoadPriority.REQUIRED)
+        loader.load("b.md", LoadPriority.REQUIRED)
+        loader.load("a.md", LoadPriority.REQUIRED)  # a を最近使用に
+        loader.load("c.md", LoadPriority.REQUIRED)
+
+        assert loader.is_cached("a.md")
+        assert not loader.is_cached("b.md")
+        assert loader.is_cached("c.md")
+        stats = loader.get_cache_stats()
+        assert stats["evictions"] == 1
+        assert stats["bytes"] == 20
+
+    def test_entry_larger_than_budget_not_cached(self, tmp_path) -> None:
+        """上限より大きいファイルはキャッシュしない."""
+        (tmp_path / "big.md").write_text("x" * 100, encoding="utf-8")
+        loader = FileLazyLoader(tmp_path, max_cache_bytes=10)
+
+        result = loader.load("big.md", LoadPriority.REQUIRED)
+        assert result.data == "x" * 100
+        assert not loader.is_cached("big.md")
+
+
 # --- GracefulLoader テスト ---
 
 
+    def test_snapshot_pins_content(self, vault_root) -> None:
+        """snapshot 中は最初の読み込み結果を返し、終了後は最新を読む."""
+        loader = FileLazyLoader(vault_root)
+        path = vault_root / "test.md"
+
+        with loader.snapshot():
+            first = loader.load("test.md", LoadPriority.REQUIRED)
+            path.write_text("Edited content", encoding="utf-8")
+            self._touch_later(path)
+            pinned = loader.load("test.md", LoadPriority.REQUIRED)
+
+        after = loader.load("test.md", LoadPriority.REQUIRED)
+
+        assert pinned.data == first.data == "Test content"
+        assert after.data == "Edited content"
+
+    def test_snapshot_pins_missing_files(self, vault_root) -> None:
+        """snapshot 中は存在しないファイルの結果も再利用する."""
+        loader = FileLazyLoader(vault_root)
+
+        with loader.snapshot():
+            loader.load("missing.md", LoadPriority.OPTIONAL)
+            (vault_root / "missing.md").write_text("new", encoding="utf-8")
+            result = loader.load("missing.md", LoadPriority.OPTIONAL)
+
+        assert result.data is None
+        assert loader.load("missing.md", LoadPriority.OPTIONAL).data == "new"
+
+class TestFileLazyLoaderConcurrency:
+    """Test single-flight loading under concurrent access."""
+
+    def _slow_reads(self) -> tuple[list[Path], object]:
+        """読み込みを記録し、競合が起きるよう遅延させる read_text."""
+        reads: list[Path] = []
+        original = Path.read_text
+
+        def slow_read_text(path: Path, *args: object, **kwargs: object) -> str:
+            reads.append(path)
+            time.sleep(0.05)
+            return original(path, *args, **kwargs)  # type: ignore[arg-type]
+
+        return reads, slow_read_text
+
+    def test_concurrent_misses_read_file_once(self, tmp_path) -> None:
+        """同じファイルへの同時ミスは1回の読み込みを待ち合わせる."""
+        (tmp_path / "test.md").write_text("Test content", encoding="utf-8")
+        loader = FileLazyLoader(tmp_path)
+        reads, slow_read_text = self._slow_reads()
+        barrier = threading.Barrier(8)
+
+        def load() -> str | None:
+            barrier.wait()
+            return loader.load("test.md", LoadPriority.REQUIRED).data
+
+        with patch.object(Path, "read_text", slow_read_text), ThreadPoolExecutor(
+            max_workers=8
+        ) as executor:
+            results = list(executor.map(lambda _: load(), range(8)))
+
+        assert results == ["Test content"] * 8
+        assert len(reads) == 1
+        stats = loader.get_cache_stats()
+        assert stats["misses"] == 1
+        assert stats["hits"] == 7
+
+
 class TestGracefulLoadResult:
     """Test GracefulLoadResult data class."""
 
@@ -0,0 +1,74 @@
+"""Tests for the compiled reference scanner."""
+
+import copy
+import logging
+
+import pytest
+
+from src.core.context.reference_scanner import (
+    CHARACTER,
+    WORLD_SETTING,
+    Reference,
+    ReferenceScanner,
+)
+from src.core.context.scene_resolver import DEFAULT_REFERENCE_PATTERNS
+
+
+@pytest.fixture
+def scanner() -> ReferenceScanner:
+    """Scanner compiled from the default patterns."""
+    return ReferenceScanner.from_patterns(DEFAULT_REFERENCE_PATTERNS)
+
+
+class TestReferenceScanner:
+    """Tests for ReferenceScanner.scan()."""
+
+    def test_single_pass_finds_all_kinds(self, scanner: ReferenceScanner) -> None:
+        """Wikilinks, YAML lists and list headers of both kinds are found."""
+        content = """---
+characters:
+  - アイラ
+world_settings:
+  - 魔法体系
+---
+[[characters/ボブ|彼]]は[[world/地理/王都]]で[[_plot/l1]]を読んだ。
+
+登場人物:
+- [[キャロル]]
+
+関連設定:
+- [[world/ギルド]]
+"""
+        refs = scanner.scan(content)
+
+        assert refs == [
+            Reference(CHARACTER, "アイラ"),
+            Reference(WORLD_SETTING, "魔法体系"),
+            Reference(CHARACTER, "ボブ"),
+            Reference(WORLD_SETTING, "地理/王都"),
+            Reference(CHARACTER, "キャロル"),
+            Reference(WORLD_SETTING, "ギルド"),
+        ]
+
+    def test_duplicates_removed(self, scanner: ReferenceScanner) -> None:
+        """A name referenced several times is reported once."""
+        refs = scanner.scan("[[アイラ]]と[[characters/アイラ]]と[[アイラ|彼女]]")
+
+        assert refs == [Reference(CHARACTER, "アイラ")]
+
+    def test_only_first_block_per_pattern(self, scanner: ReferenceScanner) -> None:
+        """Only the first block of a list header is used, as before."""
+        content = "登場人物:\n- アイラ\n\n本文\n\n登場人物:\n- ボブ\n"
+
+        assert scanner.scan(content) == [Reference(CHARACTER, "アイラ")]
+
+    def test_invalid_pattern_skipped(self, caplog: pytest.LogCaptureFixture) -> None:
+        """Invalid configured patterns are logged and skipped."""
+        patterns = copy.deepcopy(DEFAULT_REFERENCE_PATTERNS)
+        patterns["world_patterns"]["wikilinks"].append({"pattern": r"\[\[(broken"})
+
+        with caplog.at_level(logging.WARNING):
+            scanner = ReferenceScanner.from_patterns(patterns)
+
+        assert "Invalid reference pattern" in caplog.text
+        assert scanner.scan("[[world/王都]]") == [Reference(WORLD_SETTING, "王都")]
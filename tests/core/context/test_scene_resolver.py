@@ -768,3 +768,66 @@ world_patterns:
         assert "Hero" in refs
         assert "Villain" in refs
         assert "Support" in refs
+
+
+class TestReferenceScannerCache:
+    """Test the compiled reference scanner of SceneResolver."""
+
+    @pytest.fixture
+    def vault_root(self, tmp_path: Path) -> Path:
+        """Create test vault with characters and world settings."""
+        (tmp_path / "_settings").mkdir()
+        (tmp_path / "characters").mkdir()
+        (tmp_path / "world").mkdir()
+        for name in ("Hero", "Villain"):
+            (tmp_path / "characters" / f"{name}.md").write_text(f"name: {name}")
+        (tmp_path / "world" / "Castle.md").write_text("name: Castle")
+        return tmp_path
+
+    def test_scanner_reused_while_config_unchanged(self, vault_root: Path) -> None:
+        """The scanner is compiled once while the config file is unchanged."""
+        resolver = SceneResolver(vault_root)
+
+        assert resolver.get_reference_scanner() is resolver.get_reference_scanner()
+
+    def test_scanner_recompiled_when_config_changes(self, vault_root: Path) -> None:
+        """Changing the config file recompiles the scanner."""
+        resolver = SceneResolver(vault_root)
+        first = resolver.get_reference_scanner()
+        assert resolver._extract_character_references("出演者:\n- Hero\n") == []
+
+        config_path = vault_root / "_settings" / "reference_patterns.yaml"
+        config_path.write_text("character_patterns:\n  list_headers: ['出演者']\n")
+
+        assert resolver.get_reference_scanner() is not first
+        refs = resolver._extract_character_references("出演者:\n- Hero\n")
+        assert refs == ["Hero"]
+
+    def test_configured_wikilink_patterns_used(self, vault_root: Path) -> None:
+        """Wikilink patterns come from the config file."""
+        config_path = vault_root / "_settings" / "reference_patterns.yaml"
+        config_path.write_text(
+            "world_patterns:\n"
+            "  wikilinks:\n"
+            "    - pattern: '\\{\\{place:([^}]+)\\}\\}'\n"
+        )
+        resolver = SceneResolver(vault_root)
+
+        refs = resolver._extract_world_references("{{place:Castle}} [[world/Town]]")
+
+        assert refs == ["Castle"]
+
+    def test_identify_references_in_one_pass(self, vault_root: Path) -> None:
+        """Characters and world settings are identified in order of appearance."""
+        resolver = SceneResolver(vault_root)
+        scene = SceneIdentifier(episode_id="010")
+
+        characters, worlds = resolver.identify_references(
+            scene, "[[Villain]]は[[world/Castle]]にいる。", "[[Hero]]と[[Villain]]"
+        )
+
+        assert characters == [
+            vault_root / "characters" / "Villain.md",
+            vault_root / "characters" / "Hero.md",
+        ]
+        assert worlds == [vault_root / "world" / "Castle.md"]
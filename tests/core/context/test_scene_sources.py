@@ -0,0 +1,106 @@
+"""Tests for the per-build scene source bundle."""
+
+from collections import Counter
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src.core.context.context_builder import ContextBuilder
+from src.core.context.lazy_loader import FileLazyLoader, LoadPriority
+from src.core.context.scene_identifier import SceneIdentifier
+from src.core.context.scene_resolver import SceneResolver
+from src.core.context.scene_sources import SceneSources
+
+SCENE = SceneIdentifier(episode_id="ep010", current_phase="initial")
+
+
+@pytest.fixture
+def vault(tmp_path: Path) -> Path:
+    """Create a vault whose episode and L3 plot reference entities."""
+    for sub in ("episodes", "_plot", "characters", "world"):
+        (tmp_path / sub).mkdir()
+    (tmp_path / "episodes" / "ep010.md").write_text(
+        "---\ntitle: 第10話\n---\n[[アイラ]]は[[world/王都]]へ向かった。\n",
+        encoding="utf-8",
+    )
+    (tmp_path / "_plot" / "l3_ep010.md").write_text(
+        "# 構成\n\n[[characters/ボブ]]が待つ。\n", encoding="utf-8"
+    )
+    for name in ("アイラ", "ボブ"):
+        (tmp_path / "characters" / f"{name}.md").write_text(
+            f"---\nname: {name}\ncreated: 2026-01-01\nupdated: 2026-01-01\n---\n",
+            encoding="utf-8",
+        )
+    (tmp_path / "world" / "王都.md").write_text(
+        "---\nname: 王都\ncategory: Geography\n---\n\n## 概要\n王国の首都\n",
+        encoding="utf-8",
+    )
+    return tmp_path
+
+
+class TestSceneSources:
+    """Tests for SceneSources.load()."""
+
+    def test_load_reads_and_scans_sources(self, vault: Path) -> None:
+        """Texts and references of the episode and L3 plot are bundled."""
+        sources = SceneSources.load(
+            SCENE, SceneResolver(vault), FileLazyLoader(vault)
+        )
+
+        assert sources.paths.episode == vault / "episodes" / "ep010.md"
+        assert sources.episode_text is not None
+        assert "[[アイラ]]" in sources.episode_text
+        assert sources.plot_l3_text is not None
+        assert sorted(p.stem for p in sources.character_paths) == ["アイラ", "ボブ"]
+        assert sources.world_setting_paths == [vault / "world" / "王都.md"]
+
+    def test_missing_sources(self, tmp_path: Path) -> None:
+        """A scene without episode or plot has empty texts and references."""
+        sources = SceneSources.load(
+            SCENE, SceneResolver(tmp_path), FileLazyLoader(tmp_path)
+        )
+
+        assert sources.episode_text is None
+        assert sources.plot_l3_text is None
+        assert sources.character_paths == []
+
+    def test_plot_l3_is_required(self, vault: Path) -> None:
+        """The L3 plot is loaded as REQUIRED, the episode as OPTIONAL."""
+        loader = FileLazyLoader(vault)
+
+        with patch.object(loader, "load", wraps=loader.load) as mock_load:
+            SceneSources.load(SCENE, SceneResolver(vault), loader)
+
+        priorities = {call.args[0]: call.args[1] for call in mock_load.call_args_list}
+        assert priorities == {
+            "episodes/ep010.md": LoadPriority.OPTIONAL,
+            "_plot/l3_ep010.md": LoadPriority.REQUIRED,
+        }
+
+
+class TestBuildWithSceneSources:
+    """Tests for the bundle in ContextBuilder.build_context()."""
+
+    def test_each_source_read_once_per_build(self, vault: Path) -> None:
+        """Episode and L3 plot are loaded once for all collectors."""
+        builder = ContextBuilder(vault_root=vault)
+
+        with patch.object(
+            builder._loader, "load", wraps=builder._loader.load
+        ) as mock_load:
+            result = builder.build_context(SCENE)
+
+        loaded = Counter(call.args[0] for call in mock_load.call_args_list)
+        assert loaded["episodes/ep010.md"] == 1
+        assert loaded["_plot/l3_ep010.md"] == 1
+        assert result.context.plot_l3 is not None
+        assert set(result.context.characters) == {"アイラ", "ボブ"}
+
+    def test_world_settings_referenced_by_scene_are_collected(
+        self, vault: Path
+    ) -> None:
+        """World settings linked from the episode reach the context."""
+        result = ContextBuilder(vault_root=vault).build_context(SCENE)
+
+        assert "王都" in result.context.world_settings
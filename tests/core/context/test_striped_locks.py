@@ -0,0 +1,38 @@
+"""Tests for striped per-key locks."""
+
+import pytest
+
+from src.core.context.striped_locks import StripedLocks
+
+
+class TestStripedLocks:
+    """Tests for StripedLocks."""
+
+    def test_equal_keys_share_a_lock(self) -> None:
+        """Equal keys always map to the same lock."""
+        locks = StripedLocks(stripes=4)
+
+        assert len(locks) == 4
+        assert locks.lock_for("episodes/ep010.md") is locks.lock_for(
+            "episodes/ep010.md"
+        )
+
+    def test_keys_spread_over_stripes(self) -> None:
+        """Different keys are spread over several locks."""
+        locks = StripedLocks(stripes=8)
+
+        distinct = {id(locks.lock_for(f"characters/c{i}.md")) for i in range(64)}
+
+        assert len(distinct) > 1
+
+    def test_locks_are_reentrant(self) -> None:
+        """A thread may re-acquire the lock of its own stripe."""
+        locks = StripedLocks(stripes=1)
+
+        with locks.lock_for("a"), locks.lock_for("b"):
+            pass
+
+    def test_rejects_non_positive_stripes(self) -> None:
+        """Zero stripes is rejected."""
+        with pytest.raises(ValueError):
+            StripedLocks(stripes=0)
@@ -27,6 +27,7 @@ from src.core.repositories.character import CharacterRepository
 from src.core.repositories.foreshadowing import ForeshadowingRepository
 from src.core.repositories.world_setting import WorldSettingRepository
 from src.core.services.foreshadowing_manager import ForeshadowingManager
+from src.core.services.timeline_index import TimelineIndex
 
 if TYPE_CHECKING:
     pass
@@ -345,6 +346,41 @@ def test_add_foreshadowing_event_creates_timeline(tmp_path: Path) -> None:
     assert len(updated.timeline.events) == 1
 
 
+def test_add_foreshadowing_event_updates_timeline_index(tmp_path: Path) -> None:
+    """Test adding event keeps a configured TimelineIndex in sync."""
+    fs_repo = ForeshadowingRepository(tmp_path, work_name="test_work")
+    fs = Foreshadowing(
+        id="FS-01-test",
+        title="Test Foreshadow",
+        fs_type=ForeshadowingType.CHARACTER_SECRET,
+        status=ForeshadowingStatus.PLANTED,
+        subtlety_level=5,
+    )
+    fs_repo.create(fs)
+    timeline_index = TimelineIndex.build(fs_repo.list_all())
+
+    facade = WriteFacade(
+        vault_root=tmp_path,
+        work_name="test_work",
+        foreshadowing_repository=fs_repo,
+        timeline_index=timeline_index,
+    )
+    event = TimelineEntry(
+        episode="EP-03",
+        type=ForeshadowingStatus.REINFORCED,
+        date=date.today(),
+        expression="A mysterious hint",
+        subtlety=7,
+    )
+
+    facade.add_foreshadowing_event("FS-01-test", event)
+
+    assert [e.foreshadowing_id for e in timeline_index.get_events_for_episode("ep003")] == [
+        "FS-01-test"
+    ]
+    assert timeline_index.last_mention == {"FS-01-test": "EP-03"}
+
+
 # --- save_character tests ---
 
 
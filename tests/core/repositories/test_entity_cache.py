@@ -0,0 +1,172 @@
+"""Tests for EntityCache."""
+
+import os
+from datetime import date
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src.core.models.character import Character
+from src.core.repositories.character import CharacterRepository
+from src.core.repositories.entity_cache import (
+    CHARACTER_NAMESPACE,
+    EntityCache,
+    get_entity_cache,
+)
+from src.core.vault.fingerprint import FileFingerprint
+
+
+def _bump_mtime(path: Path) -> None:
+    """mtime を確実に進める（ファイルシステムの時刻精度対策）."""
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+class TestEntityCache:
+    """EntityCache のテスト."""
+
+    @pytest.fixture
+    def cache(self) -> EntityCache:
+        """テスト用キャッシュ."""
+        return EntityCache(max_entries=2)
+
+    @pytest.fixture
+    def sample_file(self, tmp_path: Path) -> Path:
+        """テスト用ファイル."""
+        path = tmp_path / "a.md"
+        path.write_text("content", encoding="utf-8")
+        return path
+
+    def _character(self, name: str = "アイラ") -> Character:
+        return Character(name=name, created=date(2026, 1, 1), updated=date(2026, 1, 1))
+
+    def test_get_or_load_parses_once(self, cache: EntityCache, sample_file: Path) -> None:
+        """同じファイルバージョンは1回だけパースする."""
+        calls: list[Path] = []
+
+        def load(path: Path) -> Character:
+            calls.append(path)
+            return self._character()
+
+        first = cache.get_or_load("ns", sample_file, load)
+        second = cache.get_or_load("ns", sample_file, load)
+
+        assert first is second
+        assert len(calls) == 1
+        assert cache.get_stats()["hits"] == 1
+
+    def test_changed_file_is_reparsed(self, cache: EntityCache, sample_file: Path) -> None:
+        """ファイルが変更されると再パースする."""
+        cache.get_or_load("ns", sample_file, lambda p: self._character("旧"))
+        sample_file.write_text("changed content", encoding="utf-8")
+        _bump_mtime(sample_file)
+
+        result = cache.get_or_load("ns", sample_file, lambda p: self._character("新"))
+
+        assert result.name == "新"
+
+    def test_copy_returns_independent_model(
+        self, cache: EntityCache, sample_file: Path
+    ) -> None:
+        """copy=True では変更してもキャッシュに影響しない."""
+        copy = cache.get_or_load(
+            "ns", sample_file, lambda p: self._character(), copy=True
+        )
+        copy.tags.append("changed")
+
+        cached = cache.get_or_load("ns", sample_file, lambda p: self._character())
+        assert cached.tags == []
+
+    def test_namespaces_are_separate(self, cache: EntityCache, sample_file: Path) -> None:
+        """名前空間ごとに別エントリ."""
+        fp = FileFingerprint.of(sample_file)
+        cache.put("a", sample_file, fp, self._character("A"))
+
+        assert cache.get("b", sample_file, fp) is None
+        assert cache.get("a", sample_file, fp).name == "A"
+
+    def test_invalidate_removes_all_namespaces(
+        self, cache: EntityCache, sample_file: Path
+    ) -> None:
+        """invalidate は全名前空間のエントリを削除する."""
+        fp = FileFingerprint.of(sample_file)
+        cache.put("a", sample_file, fp, self._character())
+        cache.put("b", sample_file, fp, self._character())
+
+        cache.invalidate(sample_file)
+
+        assert cache.get("a", sample_file, fp) is None
+        assert cache.get("b", sample_file, fp) is None
+
+    def test_lru_bound(self, cache: EntityCache, tmp_path: Path) -> None:
+        """最大エントリ数を超えると最も古いエントリを追い出す."""
+        paths = []
+        for name in ("a", "b", "c"):
+            path = tmp_path / f"{name}.md"
+            path.write_text(name, encoding="utf-8")
+            paths.append(path)
+            cache.put("ns", path, FileFingerprint.of(path), self._character(name))
+
+        assert cache.get_stats()["total"] == 2
+        assert cache.get("ns", paths[0], FileFingerprint.of(paths[0])) is None
+
+    def test_none_fingerprint_not_cached(
+        self, cache: EntityCache, sample_file: Path
+    ) -> None:
+        """フィンガープリントがない場合はキャッシュしない."""
+        cache.put("ns", sample_file, None, self._character())
+
+        assert cache.get_stats()["total"] == 0
+
+
+class TestRepositoryEntityCache:
+    """BaseRepository と EntityCache の統合テスト."""
+
+    @pytest.fixture
+    def repo(self, tmp_path: Path) -> CharacterRepository:
+        """テスト用リポジトリ."""
+        (tmp_path / "characters").mkdir()
+        repo = CharacterRepository(tmp_path)
+        repo.create(
+            Character(name="アイラ", created=date(2026, 1, 1), updated=date(2026, 1, 1))
+        )
+        return repo
+
+    def test_read_parses_once_per_file_version(self, repo: CharacterRepository) -> None:
+        """同じファイルバージョンの read はパースを再実行しない."""
+        with patch.object(
+            CharacterRepository, "_read", wraps=repo._read
+        ) as mock_read:
+            repo.read("アイラ")
+            repo.read("アイラ")
+            repo.list_all()
+
+        assert mock_read.call_count == 1
+
+    def test_read_returns_mutable_copy(self, repo: CharacterRepository) -> None:
+        """read の結果を変更してもキャッシュに影響しない."""
+        char = repo.read("アイラ")
+        char.tags.append("changed")
+
+        assert repo.read("アイラ").tags == []
+
+    def test_update_invalidates(self, repo: CharacterRepository) -> None:
+        """update 後は新しい内容が読み込まれる."""
+        char = repo.read("アイラ")
+        char.tags = ["updated"]
+        repo.update(char)
+
+        assert repo.read("アイラ").tags == ["updated"]
+
+    def test_shared_with_collector_namespace(self, repo: CharacterRepository) -> None:
+        """CharacterCollector と同じ名前空間でパース結果を共有する."""
+        repo.read("アイラ")
+        path = repo._get_path("アイラ")
+
+        cached = get_entity_cache().get(
+            CHARACTER_NAMESPACE, path, FileFingerprint.of(path)
+        )
+
+        assert isinstance(cached, Character)
+        assert cached.name == "アイラ"
@@ -1,6 +1,8 @@
 """Tests for Foreshadowing repository."""
 
+from datetime import date
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -9,6 +11,7 @@ from src.core.models.foreshadowing import (
     ForeshadowingSeed,
     ForeshadowingStatus,
     ForeshadowingType,
+    TimelineEntry,
 )
 from src.core.repositories.base import EntityExistsError, EntityNotFoundError
 from src.core.repositories.foreshadowing import ForeshadowingRepository
@@ -162,3 +165,175 @@ class TestForeshadowingRepository:
 
         with pytest.raises(EntityExistsError):
             repo.create(sample_foreshadowing)
+
+
+class TestForeshadowingRepositoryIndex:
+    """ForeshadowingRepository の索引・ジャーナルのテスト."""
+
+    @pytest.fixture
+    def repo(self, tmp_path: Path) -> ForeshadowingRepository:
+        """テスト用リポジトリを作成する."""
+        return ForeshadowingRepository(tmp_path, "テスト作品")
+
+    @staticmethod
+    def _make(fs_id: str, status: ForeshadowingStatus) -> Foreshadowing:
+        return Foreshadowing(
+            id=fs_id,
+            title="テスト",
+            fs_type=ForeshadowingType.PLOT_TWIST,
+            status=status,
+            subtlety_level=5,
+        )
+
+    @staticmethod
+    def _event(episode: str) -> TimelineEntry:
+        return TimelineEntry(
+            episode=episode,
+            type=ForeshadowingStatus.REINFORCED,
+            date=date(2026, 1, 1),
+            expression="さりげない描写",
+            subtlety=5,
+        )
+
+    def test_registry_parsed_once(self, repo: ForeshadowingRepository) -> None:
+        """ファイルが変わらない限りレジストリを再パースしない."""
+        repo.create(self._make("FS-01-a", ForeshadowingStatus.PLANTED))
+        reader = ForeshadowingRepository(repo.vault_root, repo.work_name)
+
+        with patch.object(
+            ForeshadowingRepository,
+            "_load_registry",
+            autospec=True,
+            side_effect=ForeshadowingRepository._load_registry,
+        ) as mock_load:
+            reader.read("FS-01-a")
+            reader.exists("FS-01-a")
+            reader.list_by_status(ForeshadowingStatus.PLANTED)
+
+        assert mock_load.call_count == 1
+
+    def test_detects_external_change(self, repo: ForeshadowingRepository) -> None:
+        """他のインスタンスによる書き込みを検出する."""
+        repo.create(self._make("FS-01-a", ForeshadowingStatus.PLANTED))
+        other = ForeshadowingRepository(repo.vault_root, repo.work_name)
+        assert other.exists("FS-01-a")
+
+        repo.create(self._make("FS-02-b", ForeshadowingStatus.PLANTED))
+
+        assert other.exists("FS-02-b")
+
+    def test_read_many(self, repo: ForeshadowingRepository) -> None:
+        """指定順に読み込み、存在しない ID・重複は除く."""
+        repo.create(self._make("FS-01-a", ForeshadowingStatus.PLANTED))
+        repo.create(self._make("FS-02-b", ForeshadowingStatus.REGISTERED))
+
+        found = repo.read_many(["FS-02-b", "FS-99-x", "FS-01-a", "FS-02-b"])
+
+        assert list(found) == ["FS-02-b", "FS-01-a"]
+        assert found["FS-01-a"].status == ForeshadowingStatus.PLANTED
+        assert repo.read_many([]) == {}
+
+    def test_registry_version(self, repo: ForeshadowingRepository) -> None:
+        """版は書き込み・他インスタンスの変更で変わり、読み込みでは変わらない."""
+        repo.create(self._make("FS-01-a", ForeshadowingStatus.PLANTED))
+        other = ForeshadowingRepository(repo.vault_root, repo.work_name)
+        version = other.registry_version()
+        other.list_all()
+        assert other.registry_version() == version
+
+        repo.append_event("FS-01-a", self._event("ep002"))
+        assert other.registry_version() != version
+
+        version = other.registry_version()
+        other.delete("FS-01-a")
+        assert other.registry_version() != version
+
+    def test_secondary_indexes(self, repo: ForeshadowingRepository) -> None:
+        """ステータス・エピソード索引が書き込みに追従する（レジストリ順）."""
+        repo.create(self._make("FS-01-a", ForeshadowingStatus.REGISTERED))
+        repo.create(self._make("FS-02-b", ForeshadowingStatus.PLANTED))
+        repo.create(self._make("FS-03-c", ForeshadowingStatus.REGISTERED))
+
+        updated = repo.read("FS-01-a")
+        updated.status = ForeshadowingStatus.PLANTED
+        repo.update(updated)
+        repo.append_event("FS-02-b", self._event("ep003"))
+
+        planted = repo.list_by_status(ForeshadowingStatus.PLANTED)
+        assert [fs.id for fs in planted] == ["FS-01-a", "FS-02-b"]
+        assert [fs.id for fs in repo.list_by_episode("3")] == ["FS-02-b", "FS-03-c"]
+        assert repo.list_by_episode("ep099") == []
+
+    def test_append_event_writes_journal(self, repo: ForeshadowingRepository) -> None:
+        """append_event はレジストリを書き直さずジャーナルに追記する."""
+        repo.create(self._make("FS-01-a", ForeshadowingStatus.PLANTED))
+        registry = repo._get_registry_path()
+        before = registry.read_text(encoding="utf-8")
+
+        updated = repo.append_event("FS-01-a", self._event("ep002"))
+        repo.append_event("FS-01-a", self._event("ep003"))
+
+        assert updated.timeline is not None
+        assert [e.episode for e in updated.timeline.events] == ["ep002"]
+        assert registry.read_text(encoding="utf-8") == before
+        assert len(repo._get_journal_path().read_text(encoding="utf-8").splitlines()) == 2
+
+        # 新しいインスタンスはジャーナルを再生する
+        reloaded = ForeshadowingRepository(repo.vault_root, repo.work_name).read("FS-01-a")
+        assert reloaded.timeline is not None
+        assert [e.episode for e in reloaded.timeline.events] == ["ep002", "ep003"]
+
+    def test_journal_compaction(self, repo: ForeshadowingRepository) -> None:
+        """しきい値に達するとジャーナルがレジストリへ統合される."""
+        repo.JOURNAL_COMPACT_THRESHOLD = 3
+        repo.create(self._make("FS-01-a", ForeshadowingStatus.PLANTED))
+
+        for n in range(3):
+            repo.append_event("FS-01-a", self._event(f"ep{n:03d}"))
+
+        assert not repo._get_journal_path().exists()
+        fs = ForeshadowingRepository(repo.vault_root, repo.work_name).read("FS-01-a")
+        assert fs.timeline is not None
+        assert len(fs.timeline.events) == 3
+
+    def test_interrupted_compaction_does_not_duplicate(
+        self, repo: ForeshadowingRepository
+    ) -> None:
+        """統合済みのジャーナルが残っていてもイベントは二重に適用されない."""
+        repo.create(self._make("FS-01-a", ForeshadowingStatus.PLANTED))
+        repo.append_event("FS-01-a", self._event("ep002"))
+        journal = repo._get_journal_path().read_text(encoding="utf-8")
+
+        repo.compact()
+        # rename 後・ジャーナル削除前に中断した状態を再現（書きかけの行も含む）
+        repo._get_journal_path().write_text(journal + '{"seq": 2, "id"', encoding="utf-8")
+
+        fs = ForeshadowingRepository(repo.vault_root, repo.work_name).read("FS-01-a")
+        assert fs.timeline is not None
+        assert len(fs.timeline.events) == 1
+
+    def test_batch_writes_once(self, repo: ForeshadowingRepository) -> None:
+        """batch() 内の書き込みはブロック終了時に1回だけ保存する."""
+        with patch.object(
+            repo, "_write_registry", wraps=repo._write_registry
+        ) as mock_write:
+            with repo.batch():
+                for n in range(5):
+                    repo.create(self._make(f"FS-0{n}-x", ForeshadowingStatus.PLANTED))
+                repo.append_event("FS-00-x", self._event("ep001"))
+                assert not repo._get_registry_path().exists()
+
+        assert mock_write.call_count == 1
+        assert len(ForeshadowingRepository(repo.vault_root, repo.work_name).list_all()) == 5
+
+    def test_batch_discarded_on_error(self, repo: ForeshadowingRepository) -> None:
+        """batch() が例外で終了した場合は変更を保存しない."""
+        repo.create(self._make("FS-01-a", ForeshadowingStatus.PLANTED))
+
+        with pytest.raises(EntityExistsError), repo.batch():
+            repo.create(self._make("FS-02-b", ForeshadowingStatus.PLANTED))
+            repo.create(self._make("FS-01-a", ForeshadowingStatus.PLANTED))
+
+        assert not repo.exists("FS-02-b")
+        assert [fs.id for fs in repo.list_all()] == ["FS-01-a"]
+        assert not list(repo._get_registry_path().parent.glob("*.tmp"))
@@ -0,0 +1,179 @@
+"""Tests for keyword matcher.
+
+Aho-Corasick 複数キーワードマッチャーのテスト。
+"""
+
+import random
+
+from src.core.services.keyword_matcher import (
+    KeywordMatch,
+    KeywordMatcher,
+    clear_matcher_cache,
+    compile_keywords,
+    keyword_set_digest,
+)
+
+
+def _naive_find_all(text: str, keywords: list[str]) -> dict[str, list[int]]:
+    """str.find によるリファレンス実装."""
+    hits: dict[str, list[int]] = {}
+    for keyword in keywords:
+        if not keyword:
+            continue
+        positions = []
+        start = 0
+        while (pos := text.find(keyword, start)) != -1:
+            positions.append(pos)
+            start = pos + 1
+        if positions:
+            hits[keyword] = positions
+    return hits
+
+
+class TestKeywordMatcher:
+    """KeywordMatcher のテスト."""
+
+    def test_find_single_keyword(self) -> None:
+        """単一キーワードの位置を検出できる."""
+        matcher = KeywordMatcher(["王族"])
+
+        assert matcher.find_all("彼女は王族の血筋だった。") == {"王族": [3]}
+
+    def test_find_overlapping_keywords(self) -> None:
+        """接頭辞・接尾辞を共有するキーワードを全て検出できる."""
+        matcher = KeywordMatcher(["he", "she", "his", "hers"])
+
+        hits = matcher.find_all("ushers")
+
+        assert hits == {"she": [1], "he": [2], "hers": [2]}
+
+    def test_find_self_overlapping_occurrences(self) -> None:
+        """自己重複する出現も全て検出する（str.find と同じ挙動）."""
+        matcher = KeywordMatcher(["ああ"])
+
+        assert matcher.find_all("あああ") == {"ああ": [0, 1]}
+
+    def test_empty_keywords_ignored(self) -> None:
+        """空文字キーワードは無視される."""
+        matcher = KeywordMatcher(["", "王族", "王族"])
+
+        assert matcher.keywords == ["王族"]
+        assert len(matcher) == 1
+
+    def test_empty_text(self) -> None:
+        """空テキストでは何も検出しない."""
+        matcher = KeywordMatcher(["王族"])
+
+        assert matcher.find_all("") == {}
+
+    def test_find_keywords(self) -> None:
+        """出現キーワードの集合を返す."""
+        matcher = KeywordMatcher(["王族", "血筋", "高貴"])
+
+        assert matcher.find_keywords("王族の血筋") == {"王族", "血筋"}
+
+    def test_matches_naive_scan(self) -> None:
+        """ランダムな入力で str.find による結果と一致する."""
+        rng = random.Random(42)
+        alphabet = "あいうえお王族血"
+        for _ in range(50):
+            keywords = [
+                "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 4)))
+                for _ in range(rng.randint(1, 15))
+            ]
+            text = "".join(rng.choice(alphabet) for _ in range(200))
+
+            assert KeywordMatcher(keywords).find_all(text) == _naive_find_all(
+                text, keywords
+            )
+
+
+class TestKeywordStream:
+    """KeywordStream のテスト."""
+
+    def test_match_across_chunk_boundary(self) -> None:
+        """チャンク境界をまたぐキーワードを、最後の文字が届いた時点で検出する."""
+        stream = KeywordMatcher(["王族の血"]).stream()
+
+        assert stream.feed("彼は王") == []
+        assert stream.feed("族") == []
+        assert stream.feed("の血を引く") == [KeywordMatch("王族の血", 2)]
+        assert stream.position == 9
+
+    def test_matches_accumulate(self) -> None:
+        """検出済みのキーワードを保持し、reset で初期化する."""
+        stream = KeywordMatcher(["王族", "血筋"]).stream()
+        stream.feed("王族")
+        stream.feed("と血筋")
+
+        assert stream.has_match is True
+        assert [(m.keyword, m.start, m.end) for m in stream.matches] == [
+            ("王族", 0, 2),
+            ("血筋", 3, 5),
+        ]
+
+        stream.reset()
+
+        assert stream.has_match is False
+        assert stream.position == 0
+        assert stream.feed("族") == []
+
+    def test_streams_are_independent(self) -> None:
+        """同じマッチャーから生成したストリームは状態を共有しない."""
+        matcher = KeywordMatcher(["王族"])
+        first = matcher.stream()
+        second = matcher.stream()
+
+        first.feed("王")
+
+        assert second.feed("族") == []
+        assert first.feed("族") == [KeywordMatch("王族", 0)]
+
+    def test_matches_find_all_for_any_chunking(self) -> None:
+        """任意のチャンク分割で、連結テキストへの find_all と同じ結果になる."""
+        rng = random.Random(7)
+        alphabet = "あいうえお王族血"
+        for _ in range(50):
+            keywords = [
+                "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 4)))
+                for _ in range(rng.randint(1, 15))
+            ]
+            text = "".join(rng.choice(alphabet) for _ in range(200))
+            matcher = KeywordMatcher(keywords)
+            stream = matcher.stream()
+            pos = 0
+            while pos < len(text):
+                size = rng.randint(0, 6)
+                stream.feed(text[pos : pos + size])
+                pos += size
+
+            streamed: dict[str, list[int]] = {}
+            for match in stream.matches:
+                streamed.setdefault(match.keyword, []).append(match.start)
+            assert streamed == matcher.find_all(text)
+
+
+class TestCompileKeywords:
+    """compile_keywords のテスト."""
+
+    def test_same_content_returns_cached_matcher(self) -> None:
+        """順序・重複が異なっても同じ内容ならキャッシュを再利用する."""
+        clear_matcher_cache()
+
+        first = compile_keywords(["王族", "血筋"])
+        second = compile_keywords(["血筋", "王族", "王族"])
+
+        assert first is second
+
+    def test_different_content_builds_new_matcher(self) -> None:
+        """内容が異なる場合は別のマッチャーを構築する."""
+        clear_matcher_cache()
+
+        first = compile_keywords(["王族"])
+        second = compile_keywords(["王族", "血筋"])
+
+        assert first is not second
+
+    def test_digest_ignores_order_and_empty(self) -> None:
+        """内容ハッシュは順序と空文字に依存しない."""
+        assert keyword_set_digest(["a", "b", ""]) == keyword_set_digest(["b", "a"])
@@ -0,0 +1,144 @@
+"""Tests for secret leak detector.
+
+MinHash/LSH による秘密漏洩検出のテスト。
+"""
+
+import random
+
+import pytest
+
+from src.core.models.ai_visibility import AIVisibilityLevel
+from src.core.models.secret import Secret, SecretImportance
+from src.core.services.secret_leak_detector import (
+    SecretLeakDetector,
+    jaccard,
+    shingles,
+    split_passages,
+)
+
+ROYAL = Secret(
+    id="royal",
+    content="アイリスは滅んだ王家の最後の生き残りである",
+    importance=SecretImportance.CRITICAL,
+)
+
+
+class TestShingles:
+    """shingles / jaccard / split_passages のテスト."""
+
+    def test_ignores_punctuation_and_spaces(self) -> None:
+        """句読点・空白は n-gram に含めない."""
+        assert shingles("王家、 の血。") == shingles("王家の血")
+
+    def test_short_text(self) -> None:
+        """n 文字以下のテキストは全体を1要素とする."""
+        assert shingles("王家", 3) == frozenset(["王家"])
+        assert shingles("。", 3) == frozenset()
+
+    def test_jaccard(self) -> None:
+        """Jaccard 類似度を計算する."""
+        assert jaccard(frozenset("abc"), frozenset("bcd")) == 0.5
+        assert jaccard(frozenset(), frozenset("a")) == 0.0
+
+    def test_split_passages(self) -> None:
+        """文末記号・改行で分割し、開始位置を返す."""
+        text = "一文目。二文目！\n\n三文目"
+
+        assert split_passages(text) == [(0, "一文目。"), (4, "二文目！"), (10, "三文目")]
+
+
+class TestSecretLeakDetector:
+    """SecretLeakDetector のテスト."""
+
+    def test_detects_paraphrase(self) -> None:
+        """言い換えを含む文でも閾値以上なら検出する."""
+        detector = SecretLeakDetector([ROYAL])
+        text = "朝が来た。アイリスこそ滅んだ王家の最後の生き残りである。鳥が鳴いた。"
+
+        leaks = detector.detect(text)
+
+        assert [leak.secret_id for leak in leaks] == ["royal"]
+        assert leaks[0].start == 5
+        assert leaks[0].threshold == pytest.approx(0.55)
+        assert leaks[0].similarity >= leaks[0].threshold
+
+    def test_unrelated_text_not_flagged(self) -> None:
+        """無関係な文は検出しない."""
+        detector = SecretLeakDetector([ROYAL])
+
+        assert detector.detect("アイリスは市場でりんごを買った。") == []
+
+    def test_threshold_depends_on_importance(self) -> None:
+        """同じ類似度でも重要度が低い秘密は検出しない."""
+        passage = "実はアイリスは滅んだ王家の最後の生き残りだった"
+        critical = ROYAL.model_copy(update={"id": "critical"})
+        low = ROYAL.model_copy(update={"id": "low", "importance": SecretImportance.LOW})
+        similarity = jaccard(shingles(passage), shingles(ROYAL.content))
+        assert critical.get_similarity_threshold() <= similarity
+        assert similarity < low.get_similarity_threshold()
+
+        leaks = SecretLeakDetector([critical, low]).check_passage(passage)
+
+        assert [leak.secret_id for leak in leaks] == ["critical"]
+
+    def test_use_level_secrets_skipped(self) -> None:
+        """可視性 USE の秘密は検査対象外."""
+        usable = ROYAL.model_copy(update={"visibility": AIVisibilityLevel.USE})
+
+        detector = SecretLeakDetector([usable])
+
+        assert len(detector) == 0
+        assert detector.detect(ROYAL.content) == []
+
+    def test_candidates_are_sublinear(self) -> None:
+        """多数の秘密があっても候補は類似した秘密に絞られる."""
+        rng = random.Random(20)
+        alphabet = "あいうえおかきくけこさしすせそたちつてと"
+        secrets = [
+            Secret(
+                id=f"noise-{i}",
+                content="".join(rng.choice(alphabet) for _ in range(30)),
+            )
+            for i in range(300)
+        ]
+        detector = SecretLeakDetector([*secrets, ROYAL])
+
+        candidates = detector.candidates(ROYAL.content)
+
+        assert len(detector) == 301
+        assert 300 in candidates
+        assert len(candidates) < 10
+
+    def test_matches_brute_force(self) -> None:
+        """LSH の結果が全秘密との総当たり判定と一致する."""
+        rng = random.Random(7)
+        alphabet = "王家血筋秘密アイリス"
+        secrets = [
+            Secret(
+                id=f"s{i}",
+                content="".join(rng.choice(alphabet) for _ in range(12)),
+                importance=rng.choice(list(SecretImportance)),
+            )
+            for i in range(40)
+        ]
+        detector = SecretLeakDetector(secrets)
+        for _ in range(100):
+            base = rng.choice(secrets).content
+            passage = "".join(
+                c if rng.random() > 0.1 else rng.choice(alphabet) for c in base
+            )
+            expected = [
+                s.id
+                for s in secrets
+                if jaccard(shingles(passage), shingles(s.content))
+                >= s.get_similarity_threshold()
+            ]
+
+            found = [leak.secret_id for leak in detector.check_passage(passage)]
+
+            assert found == expected
+
+    def test_invalid_parameters(self) -> None:
+        """不正なパラメータは ValueError."""
+        with pytest.raises(ValueError):
+            SecretLeakDetector([ROYAL], bands=0)
@@ -0,0 +1,190 @@
+"""Test TimelineColumns (columnar timeline analytics)."""
+
+import random
+from datetime import date
+
+import pytest
+
+from src.core.models.foreshadowing import ForeshadowingStatus, TimelineEntry
+from src.core.services.timeline_columns import GapStats, TimelineColumns, _load_numpy
+from src.core.services.timeline_index import TimelineIndex
+
+from .test_timeline_index import make_foreshadowing
+
+PLANTED = ForeshadowingStatus.PLANTED
+REINFORCED = ForeshadowingStatus.REINFORCED
+REVEALED = ForeshadowingStatus.REVEALED
+
+# NumPy がある環境では両方の実装を検証する
+BACKENDS = [False] + ([True] if _load_numpy() is not None else [])
+
+
+def entry(episode: str, event_type: ForeshadowingStatus, subtlety: int) -> TimelineEntry:
+    """Create a timeline entry."""
+    return TimelineEntry(
+        episode=episode,
+        type=event_type,
+        date=date(2024, 1, 1),
+        expression="expression",
+        subtlety=subtlety,
+    )
+
+
+@pytest.fixture
+def index() -> TimelineIndex:
+    """Timeline index with two foreshadowings over episodes 1-9."""
+    return TimelineIndex.build(
+        [
+            make_foreshadowing(
+                fs_id="FS-01-ring",
+                events=[
+                    entry("ep001", PLANTED, 8),
+                    entry("004", REINFORCED, 6),
+                    entry("009", REINFORCED, 4),
+                ],
+            ),
+            make_foreshadowing(
+                fs_id="FS-02-letter",
+                events=[
+                    entry("002", PLANTED, 7),
+                    entry("004", REINFORCED, 5),
+                    entry("006", REVEALED, 1),
+                ],
+            ),
+        ]
+    )
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+class TestTimelineColumns:
+    """TimelineColumns の集計クエリのテスト."""
+
+    def test_columns(self, index: TimelineIndex, use_numpy: bool) -> None:
+        """エピソード番号順の数値列に変換する."""
+        columns = TimelineColumns.from_index(index, use_numpy=use_numpy)
+
+        assert len(columns) == 6
+        assert columns.uses_numpy is use_numpy
+        assert list(columns.episodes) == [1, 2, 4, 4, 6, 9]
+        assert list(columns.subtleties) == [8, 7, 6, 5, 1, 4]
+        assert list(columns.foreshadowing_indices) == [0, 1, 0, 1, 1, 0]
+        assert columns.foreshadowing_ids == ["FS-01-ring", "FS-02-letter"]
+
+    def test_episode_histogram(self, index: TimelineIndex, use_numpy: bool) -> None:
+        """エピソードごとのイベント数を返す."""
+        columns = TimelineColumns.from_index(index, use_numpy=use_numpy)
+
+        assert columns.episode_histogram() == [1, 1, 0, 2, 0, 1, 0, 0, 1]
+        assert columns.episode_histogram("ep003", 6) == [0, 2, 0, 1]
+        reinforced = columns.episode_histogram(3, 10, event_types=[REINFORCED])
+        assert reinforced == [0, 2, 0, 0, 0, 0, 1, 0]
+        assert columns.episode_histogram(5, 4) == []
+
+    def test_rolling_counts(self, index: TimelineIndex, use_numpy: bool) -> None:
+        """直近 window エピソードのイベント数を返す."""
+        columns = TimelineColumns.from_index(index, use_numpy=use_numpy)
+
+        assert columns.rolling_counts(3, 1, 6) == [1, 2, 2, 3, 2, 3]
+        assert columns.rolling_counts(1, 1, 4) == [1, 1, 0, 2]
+        with pytest.raises(ValueError):
+            columns.rolling_counts(0)
+
+    def test_subtlety_trend(self, index: TimelineIndex, use_numpy: bool) -> None:
+        """微細度の平均の推移を返す（イベントがなければ None）."""
+        columns = TimelineColumns.from_index(index, use_numpy=use_numpy)
+
+        assert columns.subtlety_trend(1, 5) == [8.0, 7.0, None, 5.5, None]
+        assert columns.subtlety_trend(1, 4, window=2) == [8.0, 7.5, 7.0, 5.5]
+
+    def test_type_counts(self, index: TimelineIndex, use_numpy: bool) -> None:
+        """イベント種別ごとのイベント数を返す."""
+        columns = TimelineColumns.from_index(index, use_numpy=use_numpy)
+
+        counts = columns.type_counts()
+
+        assert counts[PLANTED] == 2
+        assert counts[REINFORCED] == 3
+        assert counts[REVEALED] == 1
+        assert counts[ForeshadowingStatus.REGISTERED] == 0
+        assert columns.type_counts(4, 4)[REINFORCED] == 2
+
+    def test_gap_stats(self, index: TimelineIndex, use_numpy: bool) -> None:
+        """設置・強化の間隔を伏線ごとに集計する."""
+        columns = TimelineColumns.from_index(index, use_numpy=use_numpy)
+
+        assert columns.gap_stats() == {
+            "FS-01-ring": GapStats(count=2, mean=4.0, minimum=3, maximum=5),
+            "FS-02-letter": GapStats(count=1, mean=2.0, minimum=2, maximum=2),
+        }
+        assert columns.gap_stats(event_types=None)["FS-02-letter"] == GapStats(
+            count=2, mean=2.0, minimum=2, maximum=2
+        )
+        assert columns.gap_stats(event_types=[REVEALED]) == {}
+
+    def test_empty(self, use_numpy: bool) -> None:
+        """イベントがない場合は空の結果."""
+        columns = TimelineColumns.from_index(TimelineIndex(), use_numpy=use_numpy)
+
+        assert len(columns) == 0
+        assert columns.episode_histogram() == []
+        assert columns.episode_histogram(1, 3) == [0, 0, 0]
+        assert columns.subtlety_trend(1, 2) == [None, None]
+        assert columns.gap_stats() == {}
+
+    def test_matches_event_objects(self, use_numpy: bool) -> None:
+        """集計結果が TimelineEvent から直接求めた値と一致する."""
+        rng = random.Random(24)
+        foreshadowings = [
+            make_foreshadowing(
+                fs_id=f"FS-{i:02d}-fs",
+                events=[
+                    entry(
+                        f"{rng.randint(1, 40):03d}",
+                        rng.choice([PLANTED, REINFORCED, REVEALED]),
+                        rng.randint(1, 10),
+                    )
+                    for _ in range(rng.randint(0, 8))
+                ],
+            )
+            for i in range(30)
+        ]
+        index = TimelineIndex.build(foreshadowings)
+        events = list(index.iter_events())
+
+        columns = TimelineColumns.from_index(index, use_numpy=use_numpy)
+
+        assert columns.episode_histogram(1, 40, event_types=[REINFORCED]) == [
+            sum(1 for e in events if int(e.episode) == n and e.event_type == REINFORCED)
+            for n in range(1, 41)
+        ]
+        expected_trend: list[float | None] = []
+        for n in range(1, 41):
+            window = [e.subtlety for e in events if n - 4 < int(e.episode) <= n]
+            expected_trend.append(sum(window) / len(window) if window else None)
+        assert columns.subtlety_trend(1, 40, window=4) == expected_trend
+        for fs in foreshadowings:
+            mentions = sorted(
+                int(e.episode)
+                for e in events
+                if e.foreshadowing_id == fs.id and e.event_type in (PLANTED, REINFORCED)
+            )
+            gaps = [b - a for a, b in zip(mentions, mentions[1:], strict=False)]
+            stats = columns.gap_stats().get(fs.id)
+            if gaps:
+                assert stats == GapStats(
+                    count=len(gaps),
+                    mean=sum(gaps) / len(gaps),
+                    minimum=min(gaps),
+                    maximum=max(gaps),
+                )
+            else:
+                assert stats is None
+
+
+def test_use_numpy_requires_numpy() -> None:
+    """use_numpy=True は NumPy がなければ ImportError."""
+    if _load_numpy() is not None:
+        assert TimelineColumns.from_index(TimelineIndex(), use_numpy=True).uses_numpy
+    else:
+        with pytest.raises(ImportError):
+            TimelineColumns.from_index(TimelineIndex(), use_numpy=True)
@@ -14,7 +14,6 @@ from src.core.services.timeline_index import (
     TimelineEvent,
     TimelineIndex,
     _episode_number,
-    _episodes_match,
 )
 
 
@@ -247,6 +246,78 @@ class TestTimelineIndexGetEventsForEpisode:
         assert result1[0].foreshadowing_id == result2[0].foreshadowing_id
 
 
+def make_entry(episode: str) -> TimelineEntry:
+    """Create a test timeline entry for the given episode."""
+    return TimelineEntry(
+        episode=episode,
+        type=ForeshadowingStatus.REINFORCED,
+        date=date(2024, 1, 15),
+        expression="Test",
+        subtlety=5,
+    )
+
+
+class TestTimelineIndexRangeAndIncremental:
+    """Test range queries and incremental updates."""
+
+    def test_get_events_in_range(self) -> None:
+        """Range query returns events in episode order, inclusive."""
+        fs1 = make_foreshadowing(
+            fs_id="FS-03-a", events=[make_entry("ep012"), make_entry("ep003")]
+        )
+        fs2 = make_foreshadowing(
+            fs_id="FS-05-b", events=[make_entry("010"), make_entry("ep020")]
+        )
+        index = TimelineIndex.build([fs1, fs2])
+
+        result = index.get_events_in_range("ep010", "20")
+
+        assert [e.episode for e in result] == ["010", "ep012", "ep020"]
+        assert index.get_events_in_range("ep013", "ep019") == []
+
+    def test_add_event_matches_rebuild(self) -> None:
+        """add_event gives the same answers as a full rebuild."""
+        fs = make_foreshadowing(events=[make_entry("ep010")])
+        index = TimelineIndex.build([fs])
+
+        index.add_event(fs, make_entry("ep005"))
+        index.add_event(fs, make_entry("ep015"))
+        rebuilt = TimelineIndex.build(
+            [
+                make_foreshadowing(
+                    events=[make_entry("ep010"), make_entry("ep005"), make_entry("ep015")]
+                )
+            ]
+        )
+
+        assert index.events_by_episode == rebuilt.events_by_episode
+        assert index.last_mention == rebuilt.last_mention == {"FS-03-test": "ep015"}
+        assert index.get_events_in_range("1", "99") == rebuilt.get_events_in_range(
+            "1", "99"
+        )
+        assert index.total_events == 3
+
+    def test_remove_foreshadowing(self) -> None:
+        """remove_foreshadowing drops only that foreshadowing's events."""
+        fs1 = make_foreshadowing(
+            fs_id="FS-03-a", events=[make_entry("ep010"), make_entry("ep012")]
+        )
+        fs2 = make_foreshadowing(fs_id="FS-05-b", events=[make_entry("ep010")])
+        index = TimelineIndex.build([fs1, fs2])
+
+        assert index.remove_foreshadowing("FS-03-a") == 2
+        assert index.remove_foreshadowing("FS-99-none") == 0
+
+        assert [e.foreshadowing_id for e in index.get_events_for_episode("10")] == [
+            "FS-05-b"
+        ]
+        assert index.get_events_for_episode("ep012") == []
+        assert index.get_events_in_range("1", "99") == index.get_events_for_episode("10")
+        assert "FS-03-a" not in index.last_mention
+        assert index.total_events == 1
+        assert index.episode_count == 1
+
+
 class TestTimelineIndexGetSilentForeshadowings:
     """Test TimelineIndex.get_silent_foreshadowings() method."""
 
@@ -454,10 +525,3 @@ class TestHelperFunctions:
         """_episode_number returns 0 for invalid input."""
         assert _episode_number("invalid") == 0
         assert _episode_number("") == 0
-
-    def test_episodes_match(self) -> None:
-        """_episodes_match compares episode IDs correctly."""
-        assert _episodes_match("ep010", "010")
-        assert _episodes_match("ep010", "10")
-        assert _episodes_match("010", "10")
-        assert not _episodes_match("ep010", "ep011")
@@ -332,6 +332,34 @@ class TestVisibilityController:
         assert "config_keyword" in controller.forbidden_keywords
         assert "direct_keyword" in controller.forbidden_keywords
 
+    def test_filter_uses_entity_section_config(self) -> None:
+        """エンティティ指定時はポリシーのセクション設定でヒントを作る."""
+        config = VisibilityConfig(
+            entities=[
+                EntityVisibilityConfig(
+                    entity_type="character",
+                    entity_name="アイラ",
+                    sections=[
+                        SectionVisibility(
+                            section_name="秘密",
+                            level=AIVisibilityLevel.KNOW,
+                            forbidden_keywords=["王族"],
+                            allowed_expressions=["気品のある仕草"],
+                        ),
+                    ],
+                ),
+            ]
+        )
+        controller = VisibilityController(config=config)
+        content = "## 秘密\n<!-- ai_visibility: 2 -->\n王家の生まれ"
+
+        result = controller.filter(content, entity_type="character", entity_name="アイラ")
+        plain = controller.filter(content)
+
+        assert controller.policy is not None
+        assert any("気品のある仕草" in hint for hint in result.hints)
+        assert not any("気品のある仕草" in hint for hint in plain.hints)
+
 
 class TestTemplateGeneration:
     """Template generation functions のテスト."""
@@ -0,0 +1,135 @@
+"""Test VisibilityPolicy (compiled visibility.yaml)."""
+
+from src.core.models.ai_visibility import (
+    AIVisibilityLevel,
+    EntityVisibilityConfig,
+    SectionVisibility,
+    VisibilityConfig,
+)
+from src.core.services.visibility_policy import (
+    VisibilityPolicy,
+    clear_policy_cache,
+    compile_visibility_policy,
+)
+
+VISIBILITY_YAML = """default_visibility: 1
+global_forbidden_keywords:
+  - 真の名前
+  - ""
+entities:
+  - entity_type: character
+    entity_name: アイラ
+    default_level: 2
+    sections:
+      - section_name: 秘密の出自
+        level: 0
+        forbidden_keywords: [王族, 王女]
+      - section_name: 表の顔
+        level: 3
+        allowed_expressions: [気品のある仕草]
+  - entity_type: world_setting
+    entity_name: 魔法体系
+    sections:
+      - section_name: 禁忌
+        level: 2
+        forbidden_keywords: [闇の魔法, 王族]
+"""
+
+
+class TestCompileVisibilityPolicy:
+    """compile_visibility_policy のテスト."""
+
+    def test_keywords(self) -> None:
+        """global / エンティティの禁止キーワードを記載順に保持する."""
+        policy = compile_visibility_policy(VISIBILITY_YAML)
+
+        assert policy.global_keywords == ("真の名前",)
+        assert policy.entity_keywords == ("王族", "王女", "闇の魔法", "王族")
+        assert policy.forbidden_keywords == {"真の名前", "王族", "王女", "闇の魔法"}
+        assert policy.entity_forbidden_keywords("character", "アイラ") == {
+            "王族",
+            "王女",
+        }
+        assert policy.entity_forbidden_keywords("character", "不明") == frozenset()
+
+    def test_section_levels(self) -> None:
+        """セクションのレベルはセクション → エンティティ → 全体の順に決まる."""
+        policy = compile_visibility_policy(VISIBILITY_YAML)
+
+        assert policy.section_levels("character", "アイラ") == {
+            "秘密の出自": AIVisibilityLevel.HIDDEN,
+            "表の顔": AIVisibilityLevel.USE,
+        }
+        assert policy.section_level("character", "アイラ", "趣味") == (
+            AIVisibilityLevel.KNOW
+        )
+        assert policy.section_level("character", "不明", "趣味") == (
+            AIVisibilityLevel.AWARE
+        )
+
+    def test_allowed_expressions(self) -> None:
+        """セクションの許可表現を返す."""
+        policy = compile_visibility_policy(VISIBILITY_YAML)
+
+        assert policy.allowed_expressions("character", "アイラ", "表の顔") == [
+            "気品のある仕草"
+        ]
+        assert policy.allowed_expressions("character", "アイラ", "秘密の出自") == []
+
+    def test_cached_by_content(self) -> None:
+        """同じ内容は同じポリシーを返し、内容が変われば再構築する."""
+        clear_policy_cache()
+        policy = compile_visibility_policy(VISIBILITY_YAML)
+
+        assert compile_visibility_policy(VISIBILITY_YAML) is policy
+        assert compile_visibility_policy(VISIBILITY_YAML + "\n") is not policy
+
+    def test_lenient_entities(self) -> None:
+        """VisibilityConfig として不正な設定でも禁止キーワードは収集する."""
+        policy = compile_visibility_policy(
+            """entities:
+  - entity_name: Alice
+    sections:
+      - name: 秘密
+        level: 0
+        forbidden_keywords: [王族]
+"""
+        )
+
+        assert policy.entity_keywords == ("王族",)
+        assert policy.section_configs("character", "Alice") == {}
+
+    def test_invalid_yaml(self) -> None:
+        """空・不正な YAML は空のポリシー."""
+        assert compile_visibility_policy("").forbidden_keywords == frozenset()
+        assert compile_visibility_policy("[: invalid").forbidden_keywords == frozenset()
+        assert compile_visibility_policy("- a\n- b").entity_keywords == ()
+
+
+class TestVisibilityPolicyFromConfig:
+    """VisibilityPolicy.from_config のテスト."""
+
+    def test_matches_config_keywords(self) -> None:
+        """VisibilityConfig.collect_forbidden_keywords と同じ禁止キーワード."""
+        config = VisibilityConfig(
+            entities=[
+                EntityVisibilityConfig(
+                    entity_type="character",
+                    entity_name="アイラ",
+                    sections=[
+                        SectionVisibility(
+                            section_name="秘密",
+                            level=AIVisibilityLevel.KNOW,
+                            forbidden_keywords=["王族", "血筋"],
+                        ),
+                    ],
+                ),
+            ]
+        )
+
+        policy = VisibilityPolicy.from_config(config)
+
+        assert policy.forbidden_keywords == set(config.collect_forbidden_keywords())
+        assert policy.section_configs("character", "アイラ")["秘密"].level == (
+            AIVisibilityLevel.KNOW
+        )
@@ -0,0 +1,140 @@
+"""Tests for the span tracer."""
+
+import json
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from src.core.context.context_builder import ContextBuilder
+from src.core.context.context_integrator import ContextIntegratorImpl
+from src.core.context.scene_identifier import SceneIdentifier
+from src.core.parsers.frontmatter import parse_frontmatter
+from src.core.tracing import (
+    Tracer,
+    disable_tracing,
+    enable_tracing,
+    get_tracer,
+    span,
+    traced,
+    tracing,
+)
+
+
+@pytest.fixture(autouse=True)
+def _reset_tracer() -> Iterator[None]:
+    """テスト間でトレーサーの状態を持ち越さない."""
+    disable_tracing()
+    yield
+    disable_tracing()
+
+
+def _spans(tracer: Tracer) -> list[dict]:  # type: ignore[type-arg]
+    """完了イベント（ph == "X"）のみを返す."""
+    return [e for e in tracer.to_chrome_trace()["traceEvents"] if e["ph"] == "X"]
+
+
+class TestTracer:
+    """Tracer のテスト."""
+
+    def test_disabled_by_default(self) -> None:
+        """既定ではトレース無効で、span() は何も記録しない."""
+        assert get_tracer() is None
+        with span("noop", "test", value=1):
+            pass
+
+    def test_span_records_complete_event(self) -> None:
+        """スパンは Chrome trace-event の完了イベントとして記録される."""
+        tracer = enable_tracing()
+
+        with span("outer", "test", key="value"):
+            with span("inner", "test"):
+                pass
+
+        inner, outer = _spans(tracer)
+        assert outer["name"] == "outer"
+        assert outer["args"] == {"key": "value"}
+        assert outer["ts"] <= inner["ts"]
+        assert inner["ts"] + inner["dur"] <= outer["ts"] + outer["dur"]
+        assert "args" not in inner
+
+    def test_span_records_error(self) -> None:
+        """例外で終了したスパンも例外型名付きで記録される."""
+        tracer = enable_tracing()
+
+        with pytest.raises(ValueError), span("failing", "test"):
+            raise ValueError("boom")
+
+        assert _spans(tracer)[0]["args"] == {"error": "ValueError"}
+
+    def test_traced_decorator(self) -> None:
+        """traced() は関数呼び出しを __qualname__ のスパンとして記録する."""
+
+        @traced("test")
+        def work(x: int) -> int:
+            return x * 2
+
+        assert work(2) == 4  # 無効時は記録しない
+        tracer = enable_tracing()
+        assert work(3) == 6
+
+        (event,) = _spans(tracer)
+        assert event["name"].endswith("work")
+        assert event["cat"] == "test"
+
+    def test_threads_have_own_tracks(self) -> None:
+        """スレッドごとに tid とスレッド名のメタデータが出力される."""
+        tracer = enable_tracing()
+
+        def worker() -> None:
+            with span("in-thread", "test"):
+                pass
+
+        thread = threading.Thread(target=worker, name="worker-1")
+        thread.start()
+        thread.join()
+        with span("in-main", "test"):
+            pass
+
+        events = tracer.to_chrome_trace()["traceEvents"]
+        names = {e["args"]["name"] for e in events if e["ph"] == "M"}
+        assert "worker-1" in names
+        assert len({e["tid"] for e in events if e["ph"] == "X"}) == 2
+
+    def test_tracing_writes_file_and_restores(self, tmp_path: Path) -> None:
+        """tracing() は終了時に JSON を書き出し、トレースを無効に戻す."""
+        output = tmp_path / "trace.json"
+
+        with tracing(output):
+            parse_frontmatter("---\nname: a\n---\nbody")
+
+        assert get_tracer() is None
+        data = json.loads(output.read_text(encoding="utf-8"))
+        assert data["displayTimeUnit"] == "ms"
+        assert any(e["name"] == "parse_frontmatter" for e in data["traceEvents"])
+
+
+class TestPipelineInstrumentation:
+    """L3 パイプラインの計装のテスト."""
+
+    def test_build_context_spans(self, tmp_path: Path) -> None:
+        """ビルド・コレクター・ファイル読み込みがスパンとして記録される."""
+        (tmp_path / "_plot").mkdir()
+        (tmp_path / "_plot" / "l1_theme.md").write_text("テーマ", encoding="utf-8")
+        builder = ContextBuilder(vault_root=tmp_path)
+        builder._integrator = ContextIntegratorImpl(tmp_path, parallel=True)
+
+        with tracing() as tracer:
+            builder.build_context(SceneIdentifier(episode_id="ep010"))
+
+        spans = _spans(tracer)
+        names = {e["name"] for e in spans}
+        assert "ContextBuilder.build_context" in names
+        assert "PlotCollector.collect" in names
+        assert "CharacterCollector.collect" in names
+        loads = [e for e in spans if e["name"] == "FileLazyLoader.load"]
+        assert {"identifier": "_plot/l1_theme.md"} in [e["args"] for e in loads]
+        # 並列モードのコレクターはワーカースレッドで記録される
+        collector_tids = {e["tid"] for e in spans if e["cat"] == "collector"}
+        assert threading.get_ident() not in collector_tids
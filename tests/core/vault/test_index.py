@@ -0,0 +1,312 @@
+"""Tests for VaultIndex."""
+
+import os
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src.core.context.scene_identifier import SceneIdentifier
+from src.core.context.scene_resolver import SceneResolver
+from src.core.models.plot import PlotL1, PlotL2, PlotL3
+from src.core.repositories.plot import PlotRepository
+from src.core.vault.index import (
+    INDEX_DIRECTORY,
+    INDEX_FILENAME,
+    VaultIndex,
+    VaultIndexError,
+)
+
+
+def _bump_mtime(path: Path) -> None:
+    """mtime を確実に進める（ファイルシステムの時刻精度対策）."""
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+class TestVaultIndex:
+    """VaultIndex のテスト."""
+
+    @pytest.fixture
+    def vault(self, tmp_path: Path) -> Path:
+        """テスト用 Vault."""
+        (tmp_path / "characters").mkdir()
+        (tmp_path / "world" / "地理").mkdir(parents=True)
+        (tmp_path / "episodes").mkdir()
+        (tmp_path / "characters" / "アイラ.md").write_text(
+            "---\nname: アイラ\naliases:\n  - 姫\ntags:\n  - '#主要'\n---\n\n"
+            "[[characters/ボブ]]と[[world/地理/王都|王都]]へ。\n",
+            encoding="utf-8",
+        )
+        (tmp_path / "characters" / "ボブ.md").write_text(
+            "---\nname: ボブ\n---\n\n本文\n", encoding="utf-8"
+        )
+        (tmp_path / "world" / "地理" / "王都.md").write_text(
+            "---\nname: 王都\n---\n\n本文\n", encoding="utf-8"
+        )
+        (tmp_path / "episodes" / "ep_0001.md").write_text(
+            "[[アイラ]]が登場。\n", encoding="utf-8"
+        )
+        return tmp_path
+
+    @pytest.fixture
+    def index(self, vault: Path) -> Iterator[VaultIndex]:
+        """テスト用索引."""
+        with VaultIndex(vault) as index:
+            yield index
+
+    def test_default_location(self, vault: Path) -> None:
+        """索引は _settings/.index に作成される."""
+        with VaultIndex(vault) as index:
+            index.refresh()
+
+        assert (vault / INDEX_DIRECTORY / INDEX_FILENAME).exists()
+
+    def test_records_entity_metadata(self, index: VaultIndex) -> None:
+        """種別・名前・エイリアス・タグ・リンクを記録する."""
+        entry = index.get_entry("characters/アイラ.md")
+
+        assert entry is not None
+        assert entry.entity_type == "character"
+        assert entry.name == "アイラ"
+        assert entry.aliases == ["姫"]
+        assert entry.tags == ["主要"]
+        assert entry.links == ["characters/ボブ", "world/地理/王都"]
+        assert len(entry.digest) == 64
+
+    def test_queries(self, index: VaultIndex, vault: Path) -> None:
+        """索引クエリで検索できる."""
+        assert index.find_by_path("characters/ボブ.md") == vault / "characters/ボブ.md"
+        assert index.find_by_path("characters/存在しない.md") is None
+        assert index.find_by_alias("姫", "character") == [vault / "characters/アイラ.md"]
+        assert index.find_by_tag("#主要") == [vault / "characters/アイラ.md"]
+        assert index.find_backlinks("アイラ") == [vault / "episodes/ep_0001.md"]
+        assert index.list_by_type("world_setting") == [vault / "world/地理/王都.md"]
+
+    def test_list_directory_depth(self, index: VaultIndex, vault: Path) -> None:
+        """list_directory は階層を指定して列挙できる."""
+        assert index.list_directory("world") == []
+        assert index.list_directory("world", depth=1) == [vault / "world/地理/王都.md"]
+        assert index.list_directory("characters") == [
+            vault / "characters/アイラ.md",
+            vault / "characters/ボブ.md",
+        ]
+
+    def test_refresh_rescans_only_changed_files(self, vault: Path) -> None:
+        """再起動後の refresh は変更されたファイルのみ再スキャンする."""
+        with VaultIndex(vault) as index:
+            first = index.refresh()
+        assert first.scanned == 4
+
+        changed = vault / "characters" / "ボブ.md"
+        changed.write_text("---\nname: ボブ\ntags: [脇役]\n---\n", encoding="utf-8")
+        _bump_mtime(changed)
+        (vault / "episodes" / "ep_0001.md").unlink()
+
+        with VaultIndex(vault) as index:
+            stats = index.refresh()
+            assert index.find_by_tag("脇役") == [changed]
+
+        assert stats.scanned == 1
+        assert stats.unchanged == 2
+        assert stats.removed == 1
+
+    def test_update_path(self, index: VaultIndex, vault: Path) -> None:
+        """update_path で1ファイルの追加・削除を反映できる."""
+        index.refresh()
+        new_file = vault / "characters" / "カイ.md"
+        new_file.write_text("---\nname: カイ\n---\n", encoding="utf-8")
+
+        index.update_path(new_file)
+        assert index.find_by_path("characters/カイ.md") == new_file
+
+        new_file.unlink()
+        index.update_path(new_file)
+        assert index.find_by_path("characters/カイ.md") is None
+
+    def test_queries_pick_up_added_and_deleted_files(
+        self, index: VaultIndex, vault: Path
+    ) -> None:
+        """長寿命のインスタンスでもファイルの追加・削除が次の batch() に反映される."""
+        with index.batch():
+            assert index.find_by_path("characters/カイ.md") is None
+        new_file = vault / "characters" / "カイ.md"
+        new_file.write_text("---\nname: カイ\n---\n", encoding="utf-8")
+        _bump_mtime(vault / "characters")
+
+        with index.batch():
+            assert index.find_by_path("characters/カイ.md") == new_file
+
+        (vault / "characters" / "ボブ.md").unlink()
+        _bump_mtime(vault / "characters")
+
+        with index.batch():
+            assert index.list_directory("characters") == [
+                vault / "characters/アイラ.md",
+                new_file,
+            ]
+
+    def test_batch_checks_freshness_once(self, index: VaultIndex, vault: Path) -> None:
+        """batch() 内では鮮度確認をブロックごとに1回だけ行う."""
+        index.refresh()
+        with patch.object(
+            index, "_directory_fingerprint", wraps=index._directory_fingerprint
+        ) as fingerprint:
+            with index.batch():
+                index.find_by_path("characters/ボブ.md")
+                with index.batch():
+                    index.list_directory("characters")
+                index.find_by_alias("姫")
+            assert fingerprint.call_count == 1
+
+            with index.batch():
+                index.find_by_path("characters/ボブ.md")
+            assert fingerprint.call_count == 2
+
+    def test_freshness_ttl_outside_batch(self, vault: Path) -> None:
+        """batch() の外では freshness_ttl 秒に1回だけ鮮度を確認する."""
+        with VaultIndex(vault) as cached, VaultIndex(vault, freshness_ttl=0) as eager:
+            for index in (cached, eager):
+                index.refresh()
+            with patch.object(
+                cached, "_directory_fingerprint", wraps=cached._directory_fingerprint
+            ) as cached_fp, patch.object(
+                eager, "_directory_fingerprint", wraps=eager._directory_fingerprint
+            ) as eager_fp:
+                for index in (cached, eager):
+                    index.find_by_path("characters/ボブ.md")
+                    index.list_directory("characters")
+
+        assert cached_fp.call_count == 0
+        assert eager_fp.call_count == 2
+
+    def test_unchanged_vault_is_not_rescanned(self, index: VaultIndex) -> None:
+        """ディレクトリ構成が変わらなければクエリ時に refresh しない."""
+        index.refresh()
+        with patch.object(index, "refresh", wraps=index.refresh) as refresh:
+            index.find_by_path("characters/ボブ.md")
+            index.list_by_type("character")
+
+        assert refresh.call_count == 0
+
+    def test_corrupt_index_file_is_rebuilt(self, vault: Path) -> None:
+        """SQLite として読めない索引ファイルは作り直す."""
+        index_path = vault / INDEX_DIRECTORY / INDEX_FILENAME
+        index_path.parent.mkdir(parents=True)
+        index_path.write_bytes(b"not a database" * 100)
+
+        with VaultIndex(vault) as index:
+            assert index.find_by_path("characters/ボブ.md") == vault / "characters/ボブ.md"
+
+        with VaultIndex(vault) as index:
+            assert index.refresh().unchanged == 4
+
+    def test_unavailable_index_raises(self, vault: Path, tmp_path: Path) -> None:
+        """索引を開けない場合は VaultIndexError を送出する."""
+        blocker = tmp_path / "blocker"
+        blocker.write_text("", encoding="utf-8")
+
+        with VaultIndex(vault, blocker / INDEX_FILENAME) as index:
+            with pytest.raises(VaultIndexError):
+                index.find_by_path("characters/ボブ.md")
+            with pytest.raises(VaultIndexError):
+                index.update_path(vault / "characters" / "ボブ.md")
+
+    def test_invalid_frontmatter_is_indexed(self, index: VaultIndex, vault: Path) -> None:
+        """frontmatter が不正なファイルもファイル名で索引化される."""
+        broken = vault / "characters" / "壊れ.md"
+        broken.write_text("---\nname: [unclosed\n---\n", encoding="utf-8")
+        index.update_path(broken)
+
+        entry = index.get_entry("characters/壊れ.md")
+        assert entry is not None
+        assert entry.name == "壊れ"
+
+
+class TestIndexedLookups:
+    """SceneResolver / PlotRepository の索引利用テスト."""
+
+    @pytest.fixture
+    def vault(self, tmp_path: Path) -> Path:
+        """テスト用 Vault."""
+        (tmp_path / "characters").mkdir()
+        (tmp_path / "world" / "地理").mkdir(parents=True)
+        (tmp_path / "characters" / "アイラ.md").write_text("アイラ", encoding="utf-8")
+        (tmp_path / "world" / "魔法.md").write_text("魔法", encoding="utf-8")
+        (tmp_path / "world" / "地理" / "王都.md").write_text("王都", encoding="utf-8")
+        return tmp_path
+
+    def test_resolver_matches_filesystem(self, vault: Path) -> None:
+        """索引ありでも filesystem 版と同じパスを返す."""
+        content = (
+            "[[アイラ]] [[不明]] [[world/魔法]] [[world/地理/王都]]\n"
+            "関連設定:\n- 王都\n- 存在しない\n"
+        )
+        scene = SceneIdentifier(episode_id="ep_0001")
+        plain = SceneResolver(vault)
+
+        with VaultIndex(vault) as index:
+            indexed = SceneResolver(vault, index)
+            indexed.get_reference_patterns()
+            index.refresh()
+            with patch.object(Path, "exists", side_effect=AssertionError):
+                characters = indexed.identify_characters(scene, content)
+                settings = indexed.identify_world_settings(scene, content)
+
+        assert sorted(characters) == sorted(plain.identify_characters(scene, content))
+        assert sorted(settings) == sorted(
+            plain.identify_world_settings(scene, content)
+        )
+        assert vault / "world" / "地理" / "王都.md" in settings
+
+    def test_resolver_checks_freshness_once_per_call(self, vault: Path) -> None:
+        """identify_references は索引の鮮度確認を1回にまとめる."""
+        content = "[[アイラ]] [[不明]] [[world/魔法]] [[world/地理/王都]]"
+        scene = SceneIdentifier(episode_id="ep_0001")
+
+        with VaultIndex(vault, freshness_ttl=0) as index:
+            resolver = SceneResolver(vault, index)
+            resolver.get_reference_patterns()
+            index.refresh()
+            with patch.object(
+                index, "_directory_fingerprint", wraps=index._directory_fingerprint
+            ) as fingerprint:
+                characters, settings = resolver.identify_references(scene, content)
+
+        assert fingerprint.call_count == 1
+        assert characters == [vault / "characters" / "アイラ.md"]
+        assert len(settings) == 2
+
+    def test_plot_repository_list_all(self, tmp_path: Path) -> None:
+        """索引ありの list_all は L1, L2, L3 をすべて返し、書き込みに追従する."""
+        (tmp_path / "_plot" / "L3_sequences" / "01_First").mkdir(parents=True)
+        with VaultIndex(tmp_path) as index:
+            repo = PlotRepository(tmp_path, index)
+            repo.create(PlotL1(work="w", logline="l"))
+            repo.create(PlotL2(work="w", chapter_number=1, chapter_name="First"))
+            repo.create(PlotL3(work="w", chapter_number=1, sequence_number=1))
+
+            levels = [p.level for p in repo.list_all()]
+
+        assert levels == ["L1", "L2", "L3"]
+
+    def test_unavailable_index_falls_back_to_filesystem(self, vault: Path) -> None:
+        """索引を開けない場合、SceneResolver と PlotRepository はファイルシステムを使う."""
+        (vault / "_plot").mkdir()
+        (vault / "_plot" / "L1_overall.md").write_text(
+            "---\nwork: w\nlogline: l\n---\n", encoding="utf-8"
+        )
+        blocker = vault / "blocker"
+        blocker.write_text("", encoding="utf-8")
+        scene = SceneIdentifier(episode_id="ep_0001")
+
+        with VaultIndex(vault, blocker / INDEX_FILENAME) as index:
+            resolver = SceneResolver(vault, index)
+            characters = resolver.identify_characters(scene, "[[アイラ]]")
+            repo = PlotRepository(vault, index)
+            levels = [p.level for p in repo.list_all()]
+
+        assert characters == [vault / "characters" / "アイラ.md"]
+        assert resolver.index is None
+        assert levels == ["L1"]